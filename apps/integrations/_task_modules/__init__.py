@@ -7,6 +7,7 @@ This package contains domain-focused task modules:
 - jira_sync: Jira project and user sync tasks
 - slack: Slack surveys, reveals, leaderboards
 - copilot: GitHub Copilot metrics sync
+- webhooks: Coalesced GitHub webhook event processing
 
 All tasks are re-exported here for Celery autodiscover compatibility.
 """
@@ -48,15 +49,21 @@ from apps.integrations._task_modules.metrics import (
     aggregate_all_teams_weekly_metrics_task,
     aggregate_team_weekly_metrics_task,
     queue_llm_analysis_batch_task,
+    rebuild_all_teams_reviewer_correlations_task,
+    rebuild_team_reviewer_correlations_task,
+    update_all_teams_reviewer_correlations_task,
+    update_team_reviewer_correlations_task,
 )
 
 # PR data tasks
 from apps.integrations._task_modules.pr_data import (
     _fetch_pr_core_data_with_graphql_or_rest,
     fetch_pr_complete_data_task,
+    fetch_pr_data_batch_task,
     post_survey_comment_task,
     refresh_all_repo_languages_task,
     refresh_repo_languages_task,
+    requeue_stale_pr_data_fetches_task,
     update_pr_description_survey_task,
 )
 
@@ -69,6 +76,12 @@ from apps.integrations._task_modules.slack import (
     sync_slack_users_task,
 )
 
+# Webhook tasks
+from apps.integrations._task_modules.webhooks import (
+    process_pending_webhook_events_task,
+    process_webhook_events_task,
+)
+
 __all__ = [
     # GitHub sync tasks
     "sync_repository_task",
@@ -90,9 +103,15 @@ __all__ = [
     # Metrics tasks
     "aggregate_team_weekly_metrics_task",
     "aggregate_all_teams_weekly_metrics_task",
+    "update_team_reviewer_correlations_task",
+    "update_all_teams_reviewer_correlations_task",
+    "rebuild_team_reviewer_correlations_task",
+    "rebuild_all_teams_reviewer_correlations_task",
     "queue_llm_analysis_batch_task",
     # PR data tasks
     "fetch_pr_complete_data_task",
+    "fetch_pr_data_batch_task",
+    "requeue_stale_pr_data_fetches_task",
     "post_survey_comment_task",
     "update_pr_description_survey_task",
     "refresh_repo_languages_task",
@@ -112,4 +131,7 @@ __all__ = [
     # Copilot tasks
     "sync_copilot_metrics_task",
     "sync_all_copilot_metrics",
+    # Webhook tasks
+    "process_webhook_events_task",
+    "process_pending_webhook_events_task",
 ]
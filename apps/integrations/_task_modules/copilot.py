@@ -8,6 +8,7 @@ import logging
 
 from celery import shared_task
 from celery.exceptions import Retry
+from django.db.models import F
 
 from apps.integrations.models import GitHubIntegration
 from apps.integrations.services.copilot_metrics import (
@@ -17,7 +18,10 @@ from apps.integrations.services.copilot_metrics import (
     map_copilot_to_ai_usage,
     parse_metrics_response,
 )
+from apps.integrations.services.copilot_pr_correlation import correlate_prs_with_copilot_usage
 from apps.integrations.services.integration_flags import COPILOT_FEATURE_FLAGS
+from apps.integrations.services.sync_scheduler import COPILOT_SYNC_SPREAD_SECONDS, plan_dispatch
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.teams.models import Team
 from apps.utils.errors import sanitize_error
 
@@ -86,8 +90,10 @@ def sync_copilot_metrics_task(self, team_id: int) -> dict:
         team_id: ID of the Team to sync Copilot metrics for
 
     Returns:
-        Dict with sync results (metrics_synced) or error/skip status
+        Dict with sync results (metrics_synced, prs_correlated) or error/skip status
     """
+    from datetime import date
+
     from apps.metrics.models import AIUsageDaily, TeamMember
 
     # Get Team by id
@@ -124,6 +130,10 @@ def sync_copilot_metrics_task(self, team_id: int) -> dict:
         parsed_metrics = parse_metrics_response(raw_metrics)
 
         metrics_synced = 0
+        # Per-member usage written by this sync; org-level rows are attributed to an
+        # arbitrary member, so they must not mark that member's PRs as Copilot-assisted
+        per_member_dates = set()
+        per_member_ids = set()
 
         # Batch fetch all TeamMembers for per-user data (fix N+1 query)
         all_usernames = set()
@@ -173,6 +183,8 @@ def sync_copilot_metrics_task(self, team_id: int) -> dict:
                         },
                     )
                     metrics_synced += 1
+                    per_member_dates.add(mapped_data["date"])
+                    per_member_ids.add(member.id)
             else:
                 # Org-level data - store with first available team member
                 members = TeamMember.objects.filter(team=team).first()
@@ -199,14 +211,23 @@ def sync_copilot_metrics_task(self, team_id: int) -> dict:
 
         logger.info(f"Successfully synced {metrics_synced} Copilot metrics for team {team.name}")
 
+        # Only re-correlate PRs of members with per-member usage, created on the days just synced
+        prs_correlated = 0
+        if per_member_dates:
+            days = [date.fromisoformat(str(day)) for day in per_member_dates]
+            prs_correlated = correlate_prs_with_copilot_usage(
+                team, start_date=min(days), end_date=max(days), member_ids=per_member_ids
+            )
+
         # Update team status on successful sync
         from django.utils import timezone
 
         team.copilot_consecutive_failures = 0
         team.copilot_last_sync_at = timezone.now()
         team.save(update_fields=["copilot_consecutive_failures", "copilot_last_sync_at"])
+        bump_team_data_version(team.id)
 
-        return {"metrics_synced": metrics_synced}
+        return {"metrics_synced": metrics_synced, "prs_correlated": prs_correlated}
 
     except InsufficientLicensesError as exc:
         # 422 error - org has fewer than 5 Copilot licenses
@@ -323,6 +344,9 @@ def sync_all_copilot_metrics() -> dict:
     1. copilot_status == "connected" (team has active Copilot connection)
     2. Has GitHubIntegration with valid organization_slug
 
+    Least recently synced teams go first; dispatches are staggered over
+    COPILOT_SYNC_SPREAD_SECONDS so the org API calls don't all start at once.
+
     Returns:
         Dict with counts and duration:
         - teams_dispatched: Number of sync tasks dispatched
@@ -340,28 +364,38 @@ def sync_all_copilot_metrics() -> dict:
 
     logger.info("Starting Copilot metrics sync for connected teams")
 
-    # Only sync teams with copilot_status="connected"
-    teams = Team.objects.filter(copilot_status="connected")  # noqa: TEAM001 - System job iterating all teams
+    # Only sync teams with copilot_status="connected", least recently synced first
+    teams = Team.objects.filter(copilot_status="connected").order_by(  # noqa: TEAM001 - System job iterating all teams
+        F("copilot_last_sync_at").asc(nulls_first=True)
+    )
+    org_slugs = dict(
+        GitHubIntegration.objects.filter(team__copilot_status="connected").values_list(  # noqa: TEAM001 - System job
+            "team_id", "organization_slug"
+        )
+    )
 
     teams_dispatched = 0
     teams_skipped = 0
 
-    # Dispatch sync task for each connected team
+    eligible = []
     for team in teams:
-        try:
-            integration = GitHubIntegration.objects.get(team=team)  # noqa: TEAM001 - System job
-            if integration.organization_slug:
-                sync_copilot_metrics_task.delay(team.id)
-                teams_dispatched += 1
-            else:
-                teams_skipped += 1
-                logger.debug(f"Skipping team {team.name}: no organization_slug")
-        except GitHubIntegration.DoesNotExist:
+        if team.id not in org_slugs:
             teams_skipped += 1
             logger.debug(f"Skipping team {team.name}: no GitHubIntegration")
+        elif not org_slugs[team.id]:
+            teams_skipped += 1
+            logger.debug(f"Skipping team {team.name}: no organization_slug")
+        else:
+            eligible.append(team)
+
+    # Dispatch sync task for each connected team, staggered over the sync window
+    for planned in plan_dispatch(eligible, COPILOT_SYNC_SPREAD_SECONDS):
+        try:
+            sync_copilot_metrics_task.apply_async(args=(planned.item.id,), countdown=planned.countdown)
+            teams_dispatched += 1
         except Exception as e:
             # Log dispatch errors and continue with remaining teams
-            logger.error(f"Failed to dispatch Copilot sync task for team {team.id}: {e}")
+            logger.error(f"Failed to dispatch Copilot sync task for team {planned.item.id}: {e}")
             teams_skipped += 1
             continue
 
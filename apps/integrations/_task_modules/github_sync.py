@@ -15,8 +15,12 @@ from celery.exceptions import Retry
 
 from apps.integrations.models import GitHubIntegration, TrackedRepository
 from apps.integrations.services import github_webhooks
+from apps.integrations.services.github_graphql import GitHubGraphQLBudgetExhaustedError
+from apps.integrations.services.github_graphql_budget import get_shared_rate_limit_budget
 from apps.integrations.services.github_sync import get_repository_pull_requests, sync_repository_incremental
 from apps.integrations.services.member_sync import sync_github_members
+from apps.integrations.services.sync_scheduler import plan_repository_syncs, select_repositories_to_sync
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.utils.errors import sanitize_error
 
 logger = logging.getLogger(__name__)
@@ -81,7 +85,29 @@ def _mark_installation_inactive_for_repo(tracked_repo) -> None:
         )
 
 
-def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int = 0) -> dict:
+def _defer_sync_if_budget_exhausted(task, tracked_repo, exc: Exception) -> dict | None:
+    """Re-dispatch a sync task for after the rate limit reset when the shared GraphQL budget is spent.
+
+    Unlike self.retry(), this neither sleeps the worker nor uses up the task's
+    retries. The repository keeps its syncing status until the task runs again.
+
+    Args:
+        task: Bound Celery task to re-dispatch with its original arguments
+        tracked_repo: TrackedRepository being synced
+        exc: Exception raised by the sync
+
+    Returns:
+        Result dict of the deferred run, or None if exc is another error
+    """
+    if not isinstance(exc, GitHubGraphQLBudgetExhaustedError):
+        return None
+
+    task.apply_async(args=task.request.args, kwargs=task.request.kwargs, countdown=exc.retry_after)
+    logger.info(f"GraphQL budget exhausted for {tracked_repo.full_name}, rescheduled in {exc.retry_after}s: {exc}")
+    return {"deferred": True, "retry_after": exc.retry_after}
+
+
+def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int = 0, rate_limit_budget=None) -> dict:
     """Sync repository using GraphQL or REST API based on feature flags.
 
     Uses GraphQL API if enabled for initial_sync operation, falling back to REST
@@ -95,9 +121,13 @@ def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int =
         tracked_repo: TrackedRepository instance to sync
         days_back: Number of days of history to sync
         skip_recent: Skip PRs from the most recent N days (default 0)
+        rate_limit_budget: GraphQL rate limit budget for the repository's token (optional)
 
     Returns:
         Dict with sync results (prs_synced, reviews_synced, etc.)
+
+    Raises:
+        GitHubGraphQLBudgetExhaustedError: When a shared budget is spent (no REST fallback)
     """
     from asgiref.sync import async_to_sync
     from django.conf import settings
@@ -119,14 +149,14 @@ def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int =
                 logger.info(f"Using Search API for accurate progress: {tracked_repo.full_name}")
                 # Run async function in sync context using async_to_sync (NOT asyncio.run!)
                 result = async_to_sync(sync_repository_history_by_search)(
-                    tracked_repo, days_back=days_back, skip_recent=skip_recent
+                    tracked_repo, days_back=days_back, skip_recent=skip_recent, rate_limit_budget=rate_limit_budget
                 )
             else:
                 from apps.integrations.services.github_graphql_sync import sync_repository_history_graphql
 
                 # Run async function in sync context using async_to_sync (NOT asyncio.run!)
                 result = async_to_sync(sync_repository_history_graphql)(
-                    tracked_repo, days_back=days_back, skip_recent=skip_recent
+                    tracked_repo, days_back=days_back, skip_recent=skip_recent, rate_limit_budget=rate_limit_budget
                 )
 
             # Check if GraphQL sync had errors
@@ -137,6 +167,9 @@ def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int =
                 raise Exception(f"GraphQL sync errors: {result['errors']}")
 
             return result
+        except GitHubGraphQLBudgetExhaustedError:
+            # Deferred by the task rather than repeated over REST
+            raise
         except Exception as e:
             if fallback_to_rest:
                 logger.warning(f"GraphQL sync failed for {tracked_repo.full_name}: {e}, falling back to REST")
@@ -150,7 +183,7 @@ def _sync_with_graphql_or_rest(tracked_repo, days_back: int, skip_recent: int =
     return sync_repository_history(tracked_repo, days_back=days_back)
 
 
-def _sync_incremental_with_graphql_or_rest(tracked_repo) -> dict:
+def _sync_incremental_with_graphql_or_rest(tracked_repo, rate_limit_budget=None) -> dict:
     """Sync repository incrementally using GraphQL or REST API based on feature flags.
 
     Uses GraphQL API if enabled for incremental_sync operation, falling back to REST
@@ -158,9 +191,13 @@ def _sync_incremental_with_graphql_or_rest(tracked_repo) -> dict:
 
     Args:
         tracked_repo: TrackedRepository instance to sync
+        rate_limit_budget: GraphQL rate limit budget for the repository's token (optional)
 
     Returns:
         Dict with sync results (prs_synced, reviews_synced, etc.)
+
+    Raises:
+        GitHubGraphQLBudgetExhaustedError: When a shared budget is spent (no REST fallback)
     """
     from asgiref.sync import async_to_sync
     from django.conf import settings
@@ -177,7 +214,9 @@ def _sync_incremental_with_graphql_or_rest(tracked_repo) -> dict:
             from apps.integrations.services.github_graphql_sync import sync_repository_incremental_graphql
 
             # Run async function in sync context using async_to_sync (NOT asyncio.run!)
-            result = async_to_sync(sync_repository_incremental_graphql)(tracked_repo)
+            result = async_to_sync(sync_repository_incremental_graphql)(
+                tracked_repo, rate_limit_budget=rate_limit_budget
+            )
 
             # Check if GraphQL sync had errors
             if result.get("errors") and fallback_to_rest:
@@ -188,6 +227,9 @@ def _sync_incremental_with_graphql_or_rest(tracked_repo) -> dict:
                 raise Exception(f"GraphQL sync errors: {result['errors']}")
 
             return result
+        except GitHubGraphQLBudgetExhaustedError:
+            # Deferred by the task rather than repeated over REST
+            raise
         except Exception as e:
             if fallback_to_rest:
                 logger.warning(
@@ -338,16 +380,23 @@ def sync_repository_task(self, repo_id: int) -> dict:
     # Sync the repository
     logger.info(f"Starting sync for repository: {tracked_repo.full_name}")
     try:
-        result = _sync_incremental_with_graphql_or_rest(tracked_repo)
+        result = _sync_incremental_with_graphql_or_rest(
+            tracked_repo, rate_limit_budget=get_shared_rate_limit_budget(tracked_repo)
+        )
         logger.info(f"Successfully synced repository: {tracked_repo.full_name}")
 
         # Set status to complete and clear error
         tracked_repo.sync_status = TrackedRepository.SYNC_STATUS_COMPLETE
         tracked_repo.last_sync_error = None
         tracked_repo.save(update_fields=["sync_status", "last_sync_error"])
+        bump_team_data_version(tracked_repo.team_id)
 
         return result
     except Exception as exc:
+        deferred = _defer_sync_if_budget_exhausted(self, tracked_repo, exc)
+        if deferred is not None:
+            return deferred
+
         # Edge case #5 & #15: Check if this is a permanent auth failure (401 or deactivated)
         # If so, fail immediately without retry
         if is_permanent_github_auth_failure(exc):
@@ -510,13 +559,16 @@ def sync_repository_initial_task(self, repo_id: int, days_back: int = 30) -> dic
     # Sync repository history
     logger.info(f"Starting initial sync for repository: {tracked_repo.full_name} (days_back={days_back})")
     try:
-        result = _sync_with_graphql_or_rest(tracked_repo, days_back=days_back)
+        result = _sync_with_graphql_or_rest(
+            tracked_repo, days_back=days_back, rate_limit_budget=get_shared_rate_limit_budget(tracked_repo)
+        )
         logger.info(f"Successfully synced repository history: {tracked_repo.full_name}")
 
         # Set status to complete and clear error
         tracked_repo.sync_status = TrackedRepository.SYNC_STATUS_COMPLETE
         tracked_repo.last_sync_error = None
         tracked_repo.save(update_fields=["sync_status", "last_sync_error"])
+        bump_team_data_version(tracked_repo.team_id)
 
         # Dispatch weekly metrics aggregation for the team
         aggregate_team_weekly_metrics_task.delay(tracked_repo.team_id)
@@ -526,6 +578,10 @@ def sync_repository_initial_task(self, repo_id: int, days_back: int = 30) -> dic
 
         return result
     except Exception as exc:
+        deferred = _defer_sync_if_budget_exhausted(self, tracked_repo, exc)
+        if deferred is not None:
+            return deferred
+
         # Calculate exponential backoff
         countdown = self.default_retry_delay * (2**self.request.retries)
 
@@ -590,6 +646,7 @@ def sync_repository_manual_task(repo_id: int) -> dict:
         tracked_repo.last_sync_error = None
         tracked_repo.last_sync_at = timezone.now()
         tracked_repo.save(update_fields=["sync_status", "last_sync_error", "last_sync_at"])
+        bump_team_data_version(tracked_repo.team_id)
 
         return result
     except Exception as exc:
@@ -608,27 +665,30 @@ def sync_repository_manual_task(repo_id: int) -> dict:
 
 @shared_task
 def sync_all_repositories_task() -> dict:
-    """Dispatch sync tasks for all active tracked repositories.
+    """Dispatch sync tasks for active tracked repositories, staggered over the sync window.
+
+    Repositories are ordered by staleness and webhook activity and dispatched
+    with countdowns spread over REPO_SYNC_SPREAD_SECONDS, spacing the syncs of
+    each installation and team (see sync_scheduler).
 
     Returns:
-        Dict with counts: repos_dispatched, repos_skipped
+        Dict with counts: repos_dispatched, repos_skipped (inactive)
     """
     logger.info("Starting sync for all repositories")
 
-    # Query all tracked repositories with optimized counts
-    active_repos = TrackedRepository.objects.filter(is_active=True)  # noqa: TEAM001 - System job iterating all repos
+    repos = select_repositories_to_sync()
     repos_skipped = TrackedRepository.objects.filter(is_active=False).count()  # noqa: TEAM001 - System job
 
     repos_dispatched = 0
 
-    # Dispatch sync task for each active repo
-    for repo in active_repos:
+    # Dispatch sync task for each repo at its planned time
+    for planned in plan_repository_syncs(repos):
         try:
-            sync_repository_task.delay(repo.id)
+            sync_repository_task.apply_async(args=(planned.item.id,), countdown=planned.countdown)
             repos_dispatched += 1
         except Exception as e:
             # Log dispatch errors and continue with remaining repos
-            logger.error(f"Failed to dispatch sync task for repository {repo.full_name}: {e}")
+            logger.error(f"Failed to dispatch sync task for repository {planned.item.full_name}: {e}")
             continue
 
     logger.info(f"Finished dispatching sync tasks. Dispatched: {repos_dispatched}, Skipped: {repos_skipped}")
@@ -894,6 +954,7 @@ def sync_quick_data_task(self, repo_id: int) -> dict:
         tracked_repo.sync_status = TrackedRepository.SYNC_STATUS_COMPLETE
         tracked_repo.last_sync_error = None
         tracked_repo.save(update_fields=["sync_status", "last_sync_error"])
+        bump_team_data_version(tracked_repo.team_id)
 
         # Dispatch metrics aggregation for immediate dashboard data
         aggregate_team_weekly_metrics_task.delay(tracked_repo.team_id)
@@ -947,6 +1008,7 @@ def sync_quick_data_task(self, repo_id: int) -> dict:
                 tracked_repo.sync_status = TrackedRepository.SYNC_STATUS_COMPLETE
                 tracked_repo.last_sync_error = None
                 tracked_repo.save(update_fields=["sync_status", "last_sync_error"])
+                bump_team_data_version(tracked_repo.team_id)
 
                 # Queue full history sync
                 sync_full_history_task.delay(repo_id)
@@ -1011,13 +1073,16 @@ def sync_full_history_task(self, repo_id: int, days_back: int = 90) -> dict:
     # Sync repository with full history
     logger.info(f"Starting full history sync for repository: {tracked_repo.full_name} (days_back={days_back})")
     try:
-        result = _sync_with_graphql_or_rest(tracked_repo, days_back=days_back)
+        result = _sync_with_graphql_or_rest(
+            tracked_repo, days_back=days_back, rate_limit_budget=get_shared_rate_limit_budget(tracked_repo)
+        )
         logger.info(f"Successfully completed full history sync for repository: {tracked_repo.full_name}")
 
         # Set status to complete and clear error
         tracked_repo.sync_status = TrackedRepository.SYNC_STATUS_COMPLETE
         tracked_repo.last_sync_error = None
         tracked_repo.save(update_fields=["sync_status", "last_sync_error"])
+        bump_team_data_version(tracked_repo.team_id)
 
         # Dispatch weekly metrics aggregation for the team
         aggregate_team_weekly_metrics_task.delay(tracked_repo.team_id)
@@ -1027,6 +1092,10 @@ def sync_full_history_task(self, repo_id: int, days_back: int = 90) -> dict:
             "reviews_synced": result.get("reviews_synced", 0),
         }
     except Exception as exc:
+        deferred = _defer_sync_if_budget_exhausted(self, tracked_repo, exc)
+        if deferred is not None:
+            return deferred
+
         # Calculate exponential backoff
         countdown = self.default_retry_delay * (2**self.request.retries)
 
@@ -1159,7 +1228,7 @@ def sync_historical_data_task(
 
     sync_logger = get_sync_logger(__name__)
 
-    for idx, repo in enumerate(sorted_repos, 1):
+    def start_repo(idx, repo):
         logger.info(f"[SYNC_TASK] Starting sync for repo {idx}/{total_repos}: {repo.full_name} (id={repo.id})")
 
         # Log sync.repo.started
@@ -1177,124 +1246,187 @@ def sync_historical_data_task(
         repo.sync_started_at = timezone.now()
         repo.save(update_fields=["sync_status", "sync_started_at"])
 
-        # Report overall progress to celery-progress endpoint (A-020 fix)
-        # Guard: only update if we have a task ID (not when called directly in tests)
+    def complete_repo(repo, result, repo_sync_start_time):
+        prs_synced = result.get("prs_synced", 0)
+
+        # Calculate duration
+        repo_sync_duration = time.time() - repo_sync_start_time
+
+        # Mark as completed
+        repo.sync_status = "completed"
+        repo.last_sync_at = timezone.now()
+        repo.last_sync_error = None
+        repo.save(update_fields=["sync_status", "last_sync_at", "last_sync_error"])
+        bump_team_data_version(team_id)
+
+        # Send repository sync completed signal
+        repository_sync_completed.send(
+            sender=sync_historical_data_task,
+            team_id=team_id,
+            repo_id=repo.id,
+            prs_synced=prs_synced,
+        )
+
+        # Log sync.repo.completed
+        sync_logger.info(
+            "sync.repo.completed",
+            extra={
+                "team_id": team_id,
+                "repo_id": repo.id,
+                "prs_synced": prs_synced,
+                "duration_seconds": repo_sync_duration,
+            },
+        )
+
+        logger.info(f"[SYNC_TASK] Completed sync for {repo.full_name}: {prs_synced} PRs synced")
+        return prs_synced
+
+    def fail_repo(repo, e):
+        logger.error(f"[SYNC_TASK] Failed to sync {repo.full_name}: {type(e).__name__}: {e}")
+
+        # Log sync.repo.failed
+        sync_logger.error(
+            "sync.repo.failed",
+            extra={
+                "team_id": team_id,
+                "repo_id": repo.id,
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+            },
+        )
+
+        # Mark as failed
+        repo.sync_status = "failed"
+        repo.last_sync_error = str(e)
+        repo.save(update_fields=["sync_status", "last_sync_error"])
+
+    if total_repos > 1 and OnboardingSyncService.MAX_CONCURRENT_REPOS > 1:
+        # Several repos: sync them concurrently, sharing each installation's rate limit.
+        # Per-PR progress is still written to TrackedRepository by the GraphQL sync.
+        for idx, repo in enumerate(sorted_repos, 1):
+            start_repo(idx, repo)
+
         if self.request.id:
             self.update_state(
                 state="PROGRESS",
                 meta={
-                    "current": idx,
+                    "current": 0,
                     "total": total_repos,
-                    "description": f"Syncing {repo.full_name}...",
+                    "description": f"Syncing {total_repos} repositories...",
                 },
             )
 
-        repo_sync_start_time = time.time()
+        repos_done = 0
+
+        # Called in this thread as each repository finishes, so the counter needs no lock
+        def repo_done_callback(repo, outcome, _task=self):
+            nonlocal repos_done
+            repos_done += 1
+            if _task.request.id:
+                _task.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": repos_done,
+                        "total": total_repos,
+                        "description": f"Synced {repos_done}/{total_repos} repositories ({repo.full_name})",
+                    },
+                )
 
+        sync_start_time = time.time()
         try:
-            # Define progress callback for celery_progress
-            # Use default argument to capture current repo value (avoids B023 closure issue)
-            # Also capture sync_logger, self, idx, total_repos to avoid closure issues
-            def progress_callback(
-                prs_completed: int,
-                prs_total: int,
-                message: str,
-                current_repo=repo,
-                _sync_logger=sync_logger,
-                _task=self,
-                _repo_idx=idx,
-                _total_repos=total_repos,
-            ):
-                # Update repo progress
-                if prs_total > 0:
-                    current_repo.sync_progress = int((prs_completed / prs_total) * 100)
-                    current_repo.sync_prs_completed = prs_completed
-                    current_repo.sync_prs_total = prs_total
-                    current_repo.save(update_fields=["sync_progress", "sync_prs_completed", "sync_prs_total"])
-
-                    # Report to celery-progress for main progress bar (A-020 fix)
-                    # Guard: only update if we have a task ID (not when called directly in tests)
-                    pct = int((prs_completed / prs_total) * 100)
-                    if _task.request.id:
-                        _task.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "current": prs_completed,
-                                "total": prs_total,
-                                "description": f"Syncing {current_repo.full_name}: {pct}%",
-                            },
-                        )
-
-                    # Log sync.repo.progress
-                    _sync_logger.info(
-                        "sync.repo.progress",
-                        extra={
-                            "prs_done": prs_completed,
-                            "prs_total": prs_total,
-                            "pct": pct,
-                            "repo_id": current_repo.id,
-                        },
-                    )
-
-            # Sync the repository with date range parameters
-            result = service.sync_repository(
-                repo=repo,
-                progress_callback=progress_callback,
+            outcomes = service.sync_repositories_concurrently(
+                sorted_repos,
                 days_back=days_back,
                 skip_recent=skip_recent,
+                repo_done_callback=repo_done_callback,
             )
-            prs_synced = result.get("prs_synced", 0)
-            total_prs += prs_synced
-
-            # Calculate duration
-            repo_sync_duration = time.time() - repo_sync_start_time
-
-            # Mark as completed
-            repo.sync_status = "completed"
-            repo.last_sync_at = timezone.now()
-            repo.last_sync_error = None
-            repo.save(update_fields=["sync_status", "last_sync_at", "last_sync_error"])
-
-            # Send repository sync completed signal
-            repository_sync_completed.send(
-                sender=sync_historical_data_task,
-                team_id=team_id,
-                repo_id=repo.id,
-                prs_synced=prs_synced,
-            )
-
-            # Log sync.repo.completed
-            sync_logger.info(
-                "sync.repo.completed",
-                extra={
-                    "team_id": team_id,
-                    "repo_id": repo.id,
-                    "prs_synced": prs_synced,
-                    "duration_seconds": repo_sync_duration,
-                },
-            )
+        except Exception as e:
+            outcomes = dict.fromkeys((repo.id for repo in sorted_repos), e)
+
+        for repo in sorted_repos:
+            outcome = outcomes.get(repo.id)
+            if outcome is None:
+                outcome = RuntimeError("No sync result returned")
+            if isinstance(outcome, Exception):
+                failed_repos += 1
+                fail_repo(repo, outcome)
+            else:
+                total_prs += complete_repo(repo, outcome, sync_start_time)
+    else:
+        for idx, repo in enumerate(sorted_repos, 1):
+            start_repo(idx, repo)
+
+            # Report overall progress to celery-progress endpoint (A-020 fix)
+            # Guard: only update if we have a task ID (not when called directly in tests)
+            if self.request.id:
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "current": idx,
+                        "total": total_repos,
+                        "description": f"Syncing {repo.full_name}...",
+                    },
+                )
 
-            logger.info(f"[SYNC_TASK] Completed sync for {repo.full_name}: {prs_synced} PRs synced")
+            repo_sync_start_time = time.time()
 
-        except Exception as e:
-            logger.error(f"[SYNC_TASK] Failed to sync {repo.full_name}: {type(e).__name__}: {e}")
-            failed_repos += 1
+            try:
+                # Define progress callback for celery_progress
+                # Use default argument to capture current repo value (avoids B023 closure issue)
+                # Also capture sync_logger, self, idx, total_repos to avoid closure issues
+                def progress_callback(
+                    prs_completed: int,
+                    prs_total: int,
+                    message: str,
+                    current_repo=repo,
+                    _sync_logger=sync_logger,
+                    _task=self,
+                    _repo_idx=idx,
+                    _total_repos=total_repos,
+                ):
+                    # Update repo progress
+                    if prs_total > 0:
+                        current_repo.sync_progress = int((prs_completed / prs_total) * 100)
+                        current_repo.sync_prs_completed = prs_completed
+                        current_repo.sync_prs_total = prs_total
+                        current_repo.save(update_fields=["sync_progress", "sync_prs_completed", "sync_prs_total"])
+
+                        # Report to celery-progress for main progress bar (A-020 fix)
+                        # Guard: only update if we have a task ID (not when called directly in tests)
+                        pct = int((prs_completed / prs_total) * 100)
+                        if _task.request.id:
+                            _task.update_state(
+                                state="PROGRESS",
+                                meta={
+                                    "current": prs_completed,
+                                    "total": prs_total,
+                                    "description": f"Syncing {current_repo.full_name}: {pct}%",
+                                },
+                            )
+
+                        # Log sync.repo.progress
+                        _sync_logger.info(
+                            "sync.repo.progress",
+                            extra={
+                                "prs_done": prs_completed,
+                                "prs_total": prs_total,
+                                "pct": pct,
+                                "repo_id": current_repo.id,
+                            },
+                        )
 
-            # Log sync.repo.failed
-            sync_logger.error(
-                "sync.repo.failed",
-                extra={
-                    "team_id": team_id,
-                    "repo_id": repo.id,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-            )
+                # Sync the repository with date range parameters
+                result = service.sync_repository(
+                    repo=repo,
+                    progress_callback=progress_callback,
+                    days_back=days_back,
+                    skip_recent=skip_recent,
+                )
+                total_prs += complete_repo(repo, result, repo_sync_start_time)
 
-            # Mark as failed
-            repo.sync_status = "failed"
-            repo.last_sync_error = str(e)
-            repo.save(update_fields=["sync_status", "last_sync_error"])
+            except Exception as e:
+                failed_repos += 1
+                fail_repo(repo, e)
 
     # Send sync completed signal
     repos_synced = total_repos - failed_repos
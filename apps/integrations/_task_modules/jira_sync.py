@@ -11,6 +11,7 @@ from celery.exceptions import Retry
 from apps.integrations.models import JiraIntegration, TrackedJiraProject
 from apps.integrations.services.jira_sync import sync_project_issues
 from apps.integrations.services.jira_user_matching import sync_jira_users
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.teams.models import Team
 from apps.utils.errors import sanitize_error
 
@@ -56,6 +57,7 @@ def sync_jira_project_task(self, project_id: int) -> dict:
         tracked_project.sync_status = TrackedJiraProject.SYNC_STATUS_COMPLETE
         tracked_project.last_sync_error = None
         tracked_project.save(update_fields=["sync_status", "last_sync_error"])
+        bump_team_data_version(tracked_project.team_id)
 
         return result
     except Exception as exc:
@@ -2,6 +2,7 @@
 
 This module contains tasks for metrics processing:
 - Weekly metrics aggregation
+- Incremental reviewer correlation updates
 - LLM batch analysis for PRs
 """
 
@@ -10,9 +11,12 @@ import logging
 from celery import shared_task
 
 from apps.integrations.models import GitHubIntegration
+from apps.integrations.services.github_sync import calculate_reviewer_correlations
 from apps.integrations.services.groq_batch import GroqBatchProcessor
 from apps.metrics.models import PullRequest
+from apps.metrics.prompts.constants import PROMPT_VERSION
 from apps.metrics.services.aggregation_service import aggregate_team_weekly_metrics
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.teams.models import Team
 
 logger = logging.getLogger(__name__)
@@ -128,12 +132,105 @@ def aggregate_all_teams_weekly_metrics_task():
     return teams_processed
 
 
+@shared_task
+def update_team_reviewer_correlations_task(team_id: int):
+    """Update a team's reviewer correlations from reviews changed since the last run.
+
+    Args:
+        team_id: ID of the Team to update
+
+    Returns:
+        int: Count of ReviewerCorrelation records written, or None if the team is missing
+    """
+    try:
+        team = Team.objects.get(id=team_id)
+    except Team.DoesNotExist:
+        logger.warning(f"Team with id {team_id} not found")
+        return None
+
+    written = calculate_reviewer_correlations(team, incremental=True)
+    if written:
+        bump_team_data_version(team.id)
+    return written
+
+
+@shared_task
+def update_all_teams_reviewer_correlations_task():
+    """Dispatch update_team_reviewer_correlations_task for all teams with GitHub integration.
+
+    Returns:
+        int: Count of teams dispatched
+    """
+    team_ids = GitHubIntegration.objects.values_list("team_id", flat=True)  # noqa: TEAM001 - System job
+
+    teams_processed = 0
+    for team_id in team_ids:
+        try:
+            update_team_reviewer_correlations_task.delay(team_id)
+            teams_processed += 1
+        except Exception as e:
+            logger.error(f"Failed to dispatch reviewer correlation update for team {team_id}: {e}")
+
+    logger.info(f"Dispatched reviewer correlation updates for {teams_processed} teams")
+    return teams_processed
+
+
+@shared_task
+def rebuild_team_reviewer_correlations_task(team_id: int):
+    """Recompute every reviewer pair of a team.
+
+    Backstop for the incremental update, which only sees reviews whose
+    updated_at moved (e.g. not rows changed by raw SQL or restored backups).
+
+    Args:
+        team_id: ID of the Team to rebuild
+
+    Returns:
+        int: Count of ReviewerCorrelation records written, or None if the team is missing
+    """
+    try:
+        team = Team.objects.get(id=team_id)
+    except Team.DoesNotExist:
+        logger.warning(f"Team with id {team_id} not found")
+        return None
+
+    written = calculate_reviewer_correlations(team)
+    if written:
+        bump_team_data_version(team.id)
+    return written
+
+
+@shared_task
+def rebuild_all_teams_reviewer_correlations_task():
+    """Dispatch rebuild_team_reviewer_correlations_task for all teams with GitHub integration.
+
+    Returns:
+        int: Count of teams dispatched
+    """
+    team_ids = GitHubIntegration.objects.values_list("team_id", flat=True)  # noqa: TEAM001 - System job
+
+    teams_processed = 0
+    for team_id in team_ids:
+        try:
+            rebuild_team_reviewer_correlations_task.delay(team_id)
+            teams_processed += 1
+        except Exception as e:
+            logger.error(f"Failed to dispatch reviewer correlation rebuild for team {team_id}: {e}")
+
+    logger.info(f"Dispatched reviewer correlation rebuilds for {teams_processed} teams")
+    return teams_processed
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=60, soft_time_limit=900, time_limit=960)
 def queue_llm_analysis_batch_task(
     self, team_id: int, batch_size: int = 50, requeue_depth: int = 0, days_back: int | None = None
 ) -> dict:
     """Process PRs missing LLM analysis in batches.
 
+    Picks PRs without llm_summary or with an older llm_summary_version. PRs whose
+    llm_input_hash still matches get_llm_input_hash() are not re-submitted;
+    their llm_summary_version is just marked current.
+
     Time limits increased to 15/16 min to handle batch API polling + retry:
     - First batch submission + polling (~5-10 min)
     - Retry batch for failures (~5 min)
@@ -171,8 +268,10 @@ def queue_llm_analysis_batch_task(
         prs_without_body.update(llm_summary={"skipped": True, "reason": "no_body"})
         logger.info(f"Marked {no_body_count} PRs without body as skipped for team {team.name}")
 
-    # Find PRs with body missing llm_summary for this team
-    qs = PullRequest.objects.filter(team=team, llm_summary__isnull=True).exclude(body="")
+    # Find PRs with body missing llm_summary, or with one from an older prompt version
+    pending = PullRequest.objects.filter(team=team).exclude(body="")
+    pending = pending.filter(llm_summary__isnull=True) | pending.exclude(llm_summary_version=PROMPT_VERSION)
+    qs = pending
     if days_back:
         from datetime import timedelta
 
@@ -190,38 +289,51 @@ def queue_llm_analysis_batch_task(
         _advance_llm_pipeline_status(team)
         return {"prs_processed": 0, "message": "No PRs need processing"}
 
-    logger.info(f"Starting LLM batch analysis for {len(prs_to_process)} PRs for team {team.name}")
-
-    # Process with LLM using GroqBatchProcessor
-    # Wrap in try/except to catch time limit and other errors
     processor = GroqBatchProcessor()
-    try:
-        results, stats = processor.submit_batch_with_fallback(prs_to_process)
-        logger.info(f"Batch completed for team {team.name}: stats={stats}")
-    except SoftTimeLimitExceeded:
-        logger.error(f"LLM batch task timed out for team {team.name}")
-        if self.request.retries < self.max_retries:
-            logger.info(
-                f"Retrying LLM batch for team {team.name} (attempt {self.request.retries + 1}/{self.max_retries})"
-            )
-            raise self.retry(countdown=60) from None
-        else:
-            # Max retries exhausted - advance pipeline with partial results
-            logger.warning(f"LLM batch max retries exhausted for team {team.name}, advancing pipeline")
-            _advance_llm_pipeline_status(team)
-            return {"error": "timeout_max_retries", "prs_processed": 0}
-    except Exception as e:
-        logger.exception(f"LLM batch failed for team {team.name}: {e}")
-        if self.request.retries < self.max_retries:
-            logger.info(
-                f"Retrying LLM batch for team {team.name} (attempt {self.request.retries + 1}/{self.max_retries})"
-            )
-            raise self.retry(exc=e, countdown=60) from None
-        else:
-            # Max retries exhausted - advance pipeline with partial results
-            logger.warning(f"LLM batch max retries exhausted for team {team.name}, advancing pipeline")
-            _advance_llm_pipeline_status(team)
-            return {"error": str(e), "prs_processed": 0}
+
+    # Same input as the stored summary: the response would not change
+    unchanged = [pr for pr in prs_to_process if pr.llm_summary and pr.llm_input_hash == processor.input_hash(pr)]
+    if unchanged:
+        for pr in unchanged:
+            pr.llm_summary_version = PROMPT_VERSION
+        PullRequest.objects.bulk_update(unchanged, ["llm_summary_version"])  # noqa: TEAM001 - team-scoped instances
+        logger.info(f"Skipped {len(unchanged)} PRs with unchanged LLM input for team {team.name}")
+        unchanged_ids = {pr.id for pr in unchanged}
+        prs_to_process = [pr for pr in prs_to_process if pr.id not in unchanged_ids]
+
+    results = []
+    if prs_to_process:
+        logger.info(f"Starting LLM batch analysis for {len(prs_to_process)} PRs for team {team.name}")
+
+        # Process with LLM using GroqBatchProcessor
+        # Wrap in try/except to catch time limit and other errors
+        try:
+            results, stats = processor.submit_batch_with_fallback(prs_to_process)
+            logger.info(f"Batch completed for team {team.name}: stats={stats}")
+        except SoftTimeLimitExceeded:
+            logger.error(f"LLM batch task timed out for team {team.name}")
+            if self.request.retries < self.max_retries:
+                logger.info(
+                    f"Retrying LLM batch for team {team.name} (attempt {self.request.retries + 1}/{self.max_retries})"
+                )
+                raise self.retry(countdown=60) from None
+            else:
+                # Max retries exhausted - advance pipeline with partial results
+                logger.warning(f"LLM batch max retries exhausted for team {team.name}, advancing pipeline")
+                _advance_llm_pipeline_status(team)
+                return {"error": "timeout_max_retries", "prs_processed": 0}
+        except Exception as e:
+            logger.exception(f"LLM batch failed for team {team.name}: {e}")
+            if self.request.retries < self.max_retries:
+                logger.info(
+                    f"Retrying LLM batch for team {team.name} (attempt {self.request.retries + 1}/{self.max_retries})"
+                )
+                raise self.retry(exc=e, countdown=60) from None
+            else:
+                # Max retries exhausted - advance pipeline with partial results
+                logger.warning(f"LLM batch max retries exhausted for team {team.name}, advancing pipeline")
+                _advance_llm_pipeline_status(team)
+                return {"error": str(e), "prs_processed": 0}
 
     # Update PRs with results
     prs_updated = 0
@@ -234,18 +346,18 @@ def queue_llm_analysis_batch_task(
             pr = PullRequest.objects.get(id=result.pr_id)  # noqa: TEAM001 - ID from LLM batch result
             pr.llm_summary = result.llm_summary
             pr.llm_summary_version = result.prompt_version
-            pr.save(update_fields=["llm_summary", "llm_summary_version"])
+            pr.llm_input_hash = result.input_hash
+            pr.save(update_fields=["llm_summary", "llm_summary_version", "llm_input_hash"])
             prs_updated += 1
         except PullRequest.DoesNotExist:
             logger.warning(f"PR {result.pr_id} not found when updating LLM results")
 
     logger.info(f"Successfully updated {prs_updated} PRs with LLM analysis for team {team.name}")
+    if prs_updated:
+        bump_team_data_version(team.id)
 
     # Check if there are more PRs to process
-    remaining_prs = PullRequest.objects.filter(
-        team=team,
-        llm_summary__isnull=True,
-    ).count()
+    remaining_prs = pending.count()
 
     if remaining_prs > 0:
         # Check if we've exceeded max requeue depth
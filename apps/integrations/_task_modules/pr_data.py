@@ -1,7 +1,8 @@
 """PR data Celery tasks.
 
 This module contains tasks for PR data operations:
-- Fetching complete PR data (commits, files, check runs, comments)
+- Fetching complete PR data (commits, files, check runs, comments), per PR or
+  in per-repository batches of merged PRs
 - Posting survey comments to GitHub PRs
 - Updating PR descriptions with survey links
 - Refreshing repository language data
@@ -16,6 +17,7 @@ from github import GithubException
 from apps.integrations.models import GitHubIntegration, TrackedRepository
 from apps.integrations.services import github_comments, github_pr_description, github_sync
 from apps.metrics.models import PullRequest
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.metrics.services.survey_service import create_pr_survey
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,15 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+def _use_graphql_for_pr_complete_data() -> bool:
+    """Whether GraphQL is enabled for the pr_complete_data operation."""
+    from django.conf import settings
+
+    github_config = getattr(settings, "GITHUB_API_CONFIG", {})
+    graphql_ops = github_config.get("GRAPHQL_OPERATIONS", {})
+    return github_config.get("USE_GRAPHQL", False) and graphql_ops.get("pr_complete_data", True)
+
+
 def _fetch_pr_core_data_with_graphql_or_rest(pr, tracked_repo, access_token, errors: list) -> dict:
     """Fetch PR commits, files, and reviews using GraphQL or REST.
 
@@ -45,12 +56,9 @@ def _fetch_pr_core_data_with_graphql_or_rest(pr, tracked_repo, access_token, err
     from django.conf import settings
 
     github_config = getattr(settings, "GITHUB_API_CONFIG", {})
-    use_graphql = github_config.get("USE_GRAPHQL", False)
-    graphql_ops = github_config.get("GRAPHQL_OPERATIONS", {})
-    pr_complete_enabled = graphql_ops.get("pr_complete_data", True)
     fallback_to_rest = github_config.get("FALLBACK_TO_REST", True)
 
-    if use_graphql and pr_complete_enabled:
+    if _use_graphql_for_pr_complete_data():
         logger.info(f"Using GraphQL API for PR complete data: {pr.github_repo}#{pr.github_pr_id}")
         try:
             from apps.integrations.services.github_graphql_sync import fetch_pr_complete_data_graphql
@@ -95,6 +103,76 @@ def _fetch_pr_core_data_with_graphql_or_rest(pr, tracked_repo, access_token, err
     }
 
 
+def _fetch_pr_rest_only_data(pr, access_token, errors: list) -> dict:
+    """Fetch PR check runs and comments via REST, then calculate iteration metrics.
+
+    These always use REST (not supported by our GraphQL queries yet).
+
+    Args:
+        pr: PullRequest model instance
+        access_token: GitHub access token
+        errors: List to append errors to
+
+    Returns:
+        dict with check_runs_synced, issue_comments_synced, review_comments_synced counts
+    """
+    check_runs_synced = github_sync.sync_pr_check_runs(
+        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
+    )
+
+    issue_comments_synced = github_sync.sync_pr_issue_comments(
+        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
+    )
+
+    review_comments_synced = github_sync.sync_pr_review_comments(
+        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
+    )
+
+    # Calculate iteration metrics after all data is synced
+    github_sync.calculate_pr_iteration_metrics(pr)
+
+    return {
+        "check_runs_synced": check_runs_synced,
+        "issue_comments_synced": issue_comments_synced,
+        "review_comments_synced": review_comments_synced,
+    }
+
+
+def _fetch_prs_core_data_batched(prs: list, tracked_repo, access_token, errors: dict[int, list]) -> None:
+    """Fetch commits, files, and reviews of several PRs of one repository.
+
+    With GraphQL enabled, PRs are fetched together with aliased multi-PR
+    queries; PRs the batch couldn't fetch go through the per-PR
+    GraphQL/REST path. Per-PR failures are appended to errors[pr.id].
+
+    Args:
+        prs: PullRequest model instances belonging to tracked_repo
+        tracked_repo: TrackedRepository model instance
+        access_token: GitHub access token
+        errors: Error lists per PullRequest id
+    """
+    from asgiref.sync import async_to_sync
+
+    remaining = prs
+    if _use_graphql_for_pr_complete_data():
+        from apps.integrations.services.github_graphql_sync import fetch_prs_complete_data_graphql
+
+        try:
+            results = async_to_sync(fetch_prs_complete_data_graphql)(prs, tracked_repo)
+        except Exception as e:
+            logger.warning(f"Batched GraphQL PR data fetch failed for {tracked_repo.full_name}: {e}")
+            results = {}
+        remaining = [pr for pr in prs if pr.id not in results or results[pr.id].get("errors")]
+        if remaining:
+            logger.info(f"Fetching {len(remaining)} of {len(prs)} PRs in {tracked_repo.full_name} one by one")
+
+    for pr in remaining:
+        try:
+            _fetch_pr_core_data_with_graphql_or_rest(pr, tracked_repo, access_token, errors[pr.id])
+        except Exception as e:
+            errors[pr.id].append(f"Failed to fetch data for PR #{pr.github_pr_id}: {type(e).__name__}: {e}")
+
+
 # =============================================================================
 # PR Data Fetch Tasks
 # =============================================================================
@@ -145,34 +223,103 @@ def fetch_pr_complete_data_task(self, pr_id: int) -> dict:
     commits_synced = core_data["commits_synced"]
     files_synced = core_data["files_synced"]
 
-    # These always use REST (not supported by our GraphQL queries yet)
-    check_runs_synced = github_sync.sync_pr_check_runs(
-        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
-    )
-
-    issue_comments_synced = github_sync.sync_pr_issue_comments(
-        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
-    )
-
-    review_comments_synced = github_sync.sync_pr_review_comments(
-        pr, pr.github_pr_id, access_token, pr.github_repo, pr.team, errors
-    )
-
-    # Calculate iteration metrics after all data is synced
-    github_sync.calculate_pr_iteration_metrics(pr)
+    rest_data = _fetch_pr_rest_only_data(pr, access_token, errors)
+    bump_team_data_version(pr.team_id)
 
     logger.info(f"Completed data fetch for PR {pr.github_pr_id}")
 
     return {
         "commits_synced": commits_synced,
         "files_synced": files_synced,
-        "check_runs_synced": check_runs_synced,
-        "issue_comments_synced": issue_comments_synced,
-        "review_comments_synced": review_comments_synced,
+        **rest_data,
         "errors": errors,
     }
 
 
+@shared_task(soft_time_limit=540, time_limit=600)
+def fetch_pr_data_batch_task(tracked_repo_id: int) -> dict:
+    """Fetch complete data for the merged PRs queued for one repository.
+
+    Claims queued PRs CLAIM_BATCH_SIZE at a time until none are left. Commits,
+    files and reviews come from aliased multi-PR GraphQL queries; check runs
+    and comments still use REST per PR. If a batch fails as a whole, its PRs
+    are released for the sweep to retry.
+
+    Args:
+        tracked_repo_id: ID of the TrackedRepository whose queued PRs to fetch
+
+    Returns:
+        Dict with fetched, with-errors and failed (released for retry) PR counts
+    """
+    from apps.integrations.services.pr_data_queue import (
+        claim_pr_data_fetches,
+        complete_pr_data_fetches,
+        release_pr_data_fetches,
+    )
+
+    try:
+        tracked_repo = TrackedRepository.objects.select_related("integration__credential").get(  # noqa: TEAM001
+            id=tracked_repo_id
+        )
+    except TrackedRepository.DoesNotExist:
+        logger.warning(f"TrackedRepository with id {tracked_repo_id} not found")
+        return {"error": f"TrackedRepository with id {tracked_repo_id} not found"}
+
+    access_token = tracked_repo.integration.credential.access_token
+    fetched = with_errors = failed = 0
+
+    while fetches := claim_pr_data_fetches(tracked_repo_id):
+        prs = [fetch.pull_request for fetch in fetches]
+        errors: dict[int, list] = {pr.id: [] for pr in prs}
+        logger.info(f"Fetching complete data for {len(prs)} merged PRs in {tracked_repo.full_name}")
+
+        try:
+            _fetch_prs_core_data_batched(prs, tracked_repo, access_token, errors)
+            for pr in prs:
+                try:
+                    _fetch_pr_rest_only_data(pr, access_token, errors[pr.id])
+                except GithubException as e:
+                    errors[pr.id].append(f"GitHub API error for PR #{pr.github_pr_id}: {e}")
+        except Exception as e:
+            logger.exception(f"PR data batch failed for {tracked_repo.full_name}")
+            release_pr_data_fetches(fetches, f"{type(e).__name__}: {e}")
+            failed += len(fetches)
+            break
+        finally:
+            # Once per batch, after its writes (a failed batch may have written some PRs)
+            bump_team_data_version(tracked_repo.team_id)
+
+        # Like fetch_pr_complete_data_task, per-PR errors are reported, not retried
+        complete_pr_data_fetches(fetches)
+        fetched += len(fetches)
+        for pr in prs:
+            if errors[pr.id]:
+                with_errors += 1
+                logger.warning(f"Errors fetching data for {pr.github_repo}#{pr.github_pr_id}: {errors[pr.id]}")
+
+    return {
+        "repo": tracked_repo.full_name,
+        "prs_fetched": fetched,
+        "prs_with_errors": with_errors,
+        "prs_failed": failed,
+    }
+
+
+@shared_task
+def requeue_stale_pr_data_fetches_task() -> dict:
+    """Reschedule PR data batches whose task was lost or whose worker died.
+
+    Returns:
+        Dict with count of repositories rescheduled
+    """
+    from apps.integrations.services.pr_data_queue import requeue_stale_pr_data_fetches
+
+    rescheduled = requeue_stale_pr_data_fetches()
+    if rescheduled:
+        logger.info(f"Rescheduled PR data batches for {rescheduled} repositories")
+    return {"repos_rescheduled": rescheduled}
+
+
 # =============================================================================
 # Survey Tasks (GitHub PR integration)
 # =============================================================================
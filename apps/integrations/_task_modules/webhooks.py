@@ -0,0 +1,47 @@
+"""Webhook event processing Celery tasks.
+
+This module contains tasks that drain the GitHub webhook event queue:
+- Per-PR coalesced processing, scheduled by the webhook view
+- Periodic sweep for events whose task was lost, plus retention cleanup
+"""
+
+import logging
+
+from celery import shared_task
+
+from apps.integrations.services.webhook_queue import (
+    process_pending_webhook_events,
+    process_webhook_events,
+    purge_processed_webhook_events,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(soft_time_limit=120, time_limit=180)
+def process_webhook_events_task(team_id: int, github_repo: str, github_pr_id: int | None) -> dict:
+    """Apply all pending webhook events for one PR.
+
+    Args:
+        team_id: ID of the Team the events belong to
+        github_repo: Repository full name (owner/repo)
+        github_pr_id: pull_request.id from the payloads
+
+    Returns:
+        Dict with processed event count
+    """
+    return {"processed": process_webhook_events(team_id, github_repo, github_pr_id)}
+
+
+@shared_task
+def process_pending_webhook_events_task() -> dict:
+    """Drain stale pending webhook events and purge old processed ones.
+
+    Returns:
+        Dict with processed and purged event counts
+    """
+    processed = process_pending_webhook_events()
+    purged = purge_processed_webhook_events()
+    if processed or purged:
+        logger.info(f"Webhook sweep: processed {processed} stale events, purged {purged}")
+    return {"processed": processed, "purged": purged}
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class IntegrationsConfig(AppConfig):
@@ -7,10 +8,15 @@ class IntegrationsConfig(AppConfig):
     verbose_name = "Integrations"
 
     def ready(self):
-        """Register signal receivers when app is ready."""
+        """Register signal receivers and GitHub conditional requests when app is ready."""
         # Import receivers to register signal handlers
         # Import pipeline signals for status-based task dispatch
         from apps.integrations import (
             pipeline_signals,  # noqa: F401
             receivers,  # noqa: F401
         )
+
+        if settings.GITHUB_API_CONFIG.get("CONDITIONAL_REQUESTS", True):
+            from apps.integrations.services.github_http_cache import install_conditional_requests
+
+            install_conditional_requests()
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-16 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0023_add_revocation_fields_to_credential'),
+        ('teams', '0012_add_copilot_price_tier'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitHubWebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('delivery_id', models.CharField(help_text='X-GitHub-Delivery header (deduplicates redeliveries)', max_length=100, unique=True, verbose_name='Delivery ID')),
+                ('event_type', models.CharField(help_text='X-GitHub-Event header (e.g., pull_request)', max_length=50, verbose_name='Event type')),
+                ('action', models.CharField(blank=True, default='', help_text='Payload action (e.g., synchronize, closed)', max_length=50, verbose_name='Action')),
+                ('github_repo', models.CharField(help_text='Repository full name (owner/repo)', max_length=255, verbose_name='GitHub repo')),
+                ('github_pr_id', models.BigIntegerField(blank=True, help_text='pull_request.id from the payload; events are coalesced per PR', null=True, verbose_name='GitHub PR ID')),
+                ('payload', models.JSONField(help_text='Raw webhook payload', verbose_name='Payload')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processed', 'Processed'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='Failed processing attempts', verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Last error')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Processed at')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='teams.team', verbose_name='Team')),
+            ],
+            options={
+                'verbose_name': 'GitHub Webhook Event',
+                'verbose_name_plural': 'GitHub Webhook Events',
+                'db_table': 'integrations_github_webhook_event',
+                'indexes': [models.Index(fields=['status', 'team', 'github_repo', 'github_pr_id'], name='webhook_event_pending_pr_idx'), models.Index(fields=['status', 'created_at'], name='webhook_event_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-16 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0024_githubwebhookevent'),
+        ('metrics', '0046_pullrequest_derived_file_review_fields'),
+        ('teams', '0012_add_copilot_price_tier'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingPRDataFetch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('claimed_at', models.DateTimeField(blank=True, help_text='When a worker started fetching this PR (null while waiting)', null=True, verbose_name='Claimed at')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='Failed fetch attempts', verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Last error')),
+                ('pull_request', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='metrics.pullrequest', verbose_name='Pull request')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='teams.team', verbose_name='Team')),
+                ('tracked_repository', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_pr_data_fetches', to='integrations.trackedrepository', verbose_name='Tracked repository')),
+            ],
+            options={
+                'verbose_name': 'Pending PR Data Fetch',
+                'verbose_name_plural': 'Pending PR Data Fetches',
+                'db_table': 'integrations_pending_pr_data_fetch',
+                'indexes': [models.Index(fields=['tracked_repository', 'claimed_at'], name='pr_data_fetch_repo_claim_idx')],
+            },
+        ),
+    ]
@@ -5,6 +5,8 @@ This package contains models for external integrations:
 - github.py: GitHubIntegration, GitHubAppInstallation, TrackedRepository
 - jira.py: JiraIntegration, TrackedJiraProject
 - slack.py: SlackIntegration
+- webhooks.py: GitHubWebhookEvent
+- pr_data.py: PendingPRDataFetch
 
 All models are re-exported here for backward compatibility.
 External imports should use:
@@ -14,7 +16,9 @@ External imports should use:
 from .credentials import IntegrationCredential
 from .github import GitHubAppInstallation, GitHubIntegration, TrackedRepository
 from .jira import JiraIntegration, TrackedJiraProject
+from .pr_data import PendingPRDataFetch
 from .slack import SlackIntegration
+from .webhooks import GitHubWebhookEvent
 
 __all__ = [
     "IntegrationCredential",
@@ -24,4 +28,6 @@ __all__ = [
     "JiraIntegration",
     "TrackedJiraProject",
     "SlackIntegration",
+    "GitHubWebhookEvent",
+    "PendingPRDataFetch",
 ]
@@ -0,0 +1,60 @@
+"""Post-merge PR data fetch queue models.
+
+Contains:
+- PendingPRDataFetch: Merged PRs whose commits, files, check runs and comments still need fetching
+"""
+
+from django.db import models
+
+from apps.teams.models import BaseTeamModel
+
+from .github import TrackedRepository
+
+
+class PendingPRDataFetch(BaseTeamModel):
+    """
+    A merged PR queued for the post-merge data fetch.
+
+    Rows are drained per repository in batches (see
+    apps.integrations.services.pr_data_queue) and deleted once fetched.
+    """
+
+    pull_request = models.OneToOneField(
+        "metrics.PullRequest",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Pull request",
+    )
+    tracked_repository = models.ForeignKey(
+        TrackedRepository,
+        on_delete=models.CASCADE,
+        related_name="pending_pr_data_fetches",
+        verbose_name="Tracked repository",
+    )
+    claimed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Claimed at",
+        help_text="When a worker started fetching this PR (null while waiting)",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Attempts",
+        help_text="Failed fetch attempts",
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="Last error",
+    )
+
+    class Meta:
+        db_table = "integrations_pending_pr_data_fetch"
+        verbose_name = "Pending PR Data Fetch"
+        verbose_name_plural = "Pending PR Data Fetches"
+        indexes = [
+            models.Index(fields=["tracked_repository", "claimed_at"], name="pr_data_fetch_repo_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"PR data fetch for PR {self.pull_request_id}"
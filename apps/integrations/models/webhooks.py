@@ -0,0 +1,98 @@
+"""Webhook event queue models.
+
+Contains:
+- GitHubWebhookEvent: Verified GitHub webhook deliveries awaiting processing
+"""
+
+from django.db import models
+
+from apps.teams.models import BaseTeamModel
+
+
+class GitHubWebhookEvent(BaseTeamModel):
+    """
+    A verified GitHub webhook delivery queued for background processing.
+
+    The webhook view only stores the raw event; workers drain pending events
+    per PR and apply each burst with a single upsert (see
+    apps.integrations.services.webhook_queue).
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSED = "processed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PROCESSED, "Processed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    delivery_id = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name="Delivery ID",
+        help_text="X-GitHub-Delivery header (deduplicates redeliveries)",
+    )
+    event_type = models.CharField(
+        max_length=50,
+        verbose_name="Event type",
+        help_text="X-GitHub-Event header (e.g., pull_request)",
+    )
+    action = models.CharField(
+        max_length=50,
+        blank=True,
+        default="",
+        verbose_name="Action",
+        help_text="Payload action (e.g., synchronize, closed)",
+    )
+    github_repo = models.CharField(
+        max_length=255,
+        verbose_name="GitHub repo",
+        help_text="Repository full name (owner/repo)",
+    )
+    github_pr_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="GitHub PR ID",
+        help_text="pull_request.id from the payload; events are coalesced per PR",
+    )
+    payload = models.JSONField(
+        verbose_name="Payload",
+        help_text="Raw webhook payload",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name="Status",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Attempts",
+        help_text="Failed processing attempts",
+    )
+    last_error = models.TextField(
+        blank=True,
+        default="",
+        verbose_name="Last error",
+    )
+    processed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Processed at",
+    )
+
+    class Meta:
+        db_table = "integrations_github_webhook_event"
+        verbose_name = "GitHub Webhook Event"
+        verbose_name_plural = "GitHub Webhook Events"
+        indexes = [
+            models.Index(
+                fields=["status", "team", "github_repo", "github_pr_id"],
+                name="webhook_event_pending_pr_idx",
+            ),
+            models.Index(fields=["status", "created_at"], name="webhook_event_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type}.{self.action} {self.github_repo} ({self.delivery_id})"
@@ -8,6 +8,8 @@ from decimal import Decimal
 import requests
 from django.conf import settings
 
+from apps.integrations.services.github_http_cache import conditional_get
+
 logger = logging.getLogger(__name__)
 
 # GitHub API constants
@@ -80,7 +82,7 @@ def _make_github_api_request(url, headers, params=None, error_prefix="GitHub API
     from apps.integrations.exceptions import TokenRevokedError
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = conditional_get(url, headers=headers, params=params, timeout=30)
 
         # Edge case #16: Check for 401 (token revoked) before other errors
         if response.status_code == 401:
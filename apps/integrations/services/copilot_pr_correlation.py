@@ -3,65 +3,109 @@ Copilot PR Correlation Service.
 
 Correlates daily Copilot usage (AIUsageDaily) with Pull Requests to mark
 PRs as AI-assisted when the author had Copilot activity on the PR creation date.
+
+The correlation is a single set-based UPDATE: PRs are joined to AIUsageDaily
+on (author, creation date) with an EXISTS subquery, optionally restricted to
+the date window that just received Copilot data, so a sync only pays for the
+days it wrote.
 """
 
+from collections.abc import Iterable
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Case, Exists, F, Func, JSONField, OuterRef, Q, Value, When
+from django.db.models.functions import TruncDate
+
 from apps.metrics.models import AIUsageDaily, PullRequest
+from apps.metrics.models.pull_requests import EFFECTIVE_SOURCE_FIELDS, RESOLVED_FIELDS
+from apps.metrics.services.pr_daily_facts import fact_key_for, refresh_daily_facts
 from apps.teams.models import Team
+from apps.utils.date_utils import end_of_day, start_of_day
 
+COPILOT_TOOL = "copilot"
 
-def correlate_prs_with_copilot_usage(team: Team, min_suggestions: int = 1) -> int:
+
+def correlate_prs_with_copilot_usage(
+    team: Team,
+    min_suggestions: int = 1,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    member_ids: Iterable[int] | None = None,
+) -> int:
     """Correlate PRs with Copilot usage for a team.
 
-    For each PR in the team, check if the author had Copilot usage on the day
-    the PR was created. If so, mark the PR as AI-assisted and add 'copilot'
-    to ai_tools_detected.
+    Every PR whose author had Copilot usage on the day the PR was created is
+    marked as AI-assisted and gets 'copilot' added to ai_tools_detected.
 
     Args:
         team: The team to correlate PRs for.
         min_suggestions: Minimum suggestions_shown to count as active usage.
             Defaults to 1 (any activity counts).
+        start_date: Only PRs created on or after this date (None for no lower bound).
+        end_date: Only PRs created on or before this date (None for no upper bound).
+        member_ids: Only usage of these members (None for all). Sync passes the
+            members it wrote per-member rows for, leaving out org-level totals.
 
     Returns:
         Number of PRs updated.
     """
-    # Get all PRs that haven't been marked yet or could have copilot added
-    prs = PullRequest.objects.filter(team=team).select_related("author")
-
-    # Get all Copilot usage dates per member for this team
-    copilot_usage = AIUsageDaily.objects.filter(
+    usage = AIUsageDaily.objects.filter(
         team=team,
-        source="copilot",
+        source=COPILOT_TOOL,
         suggestions_shown__gte=min_suggestions,
-    ).values_list("member_id", "date")
-
-    # Build a set of (member_id, date) tuples for fast lookup
-    usage_lookup = {(member_id, usage_date) for member_id, usage_date in copilot_usage}
+        member_id=OuterRef("author_id"),
+        date=OuterRef("created_date"),
+    )
+    prs = PullRequest.objects.filter(team=team, author__isnull=False, pr_created_at__isnull=False)
+    if member_ids is not None:
+        prs = prs.filter(author_id__in=list(member_ids))
+    if start_date is not None:
+        prs = prs.filter(pr_created_at__gte=start_of_day(start_date))
+    if end_date is not None:
+        prs = prs.filter(pr_created_at__lte=end_of_day(end_date))
+
+    has_copilot = Q(ai_tools_detected__contains=[COPILOT_TOOL])
+    pr_ids = list(
+        prs.filter(~Q(is_ai_assisted=True) | ~has_copilot)
+        .annotate(created_date=TruncDate("pr_created_at"))
+        .filter(Exists(usage))
+        .values_list("id", flat=True)
+    )
+    if not pr_ids:
+        return 0
+
+    with transaction.atomic():
+        updated_count = PullRequest.objects.filter(id__in=pr_ids).update(  # noqa: TEAM001 - ids scoped to team
+            is_ai_assisted=True,
+            ai_tools_detected=Case(
+                When(has_copilot, then=F("ai_tools_detected")),
+                default=Func(
+                    F("ai_tools_detected"),
+                    Value([COPILOT_TOOL], output_field=JSONField()),
+                    template="%(expressions)s",
+                    arg_joiner=" || ",
+                    output_field=JSONField(),
+                ),
+            ),
+        )
+        _refresh_derived_rows(team.id, pr_ids)
 
-    updated_count = 0
-    for pr in prs:
-        if pr.author_id is None or pr.pr_created_at is None:
-            continue
-
-        pr_date = pr.pr_created_at.date()
-        lookup_key = (pr.author_id, pr_date)
-
-        if lookup_key in usage_lookup:
-            # This PR was created on a day the author used Copilot
-            needs_update = False
-
-            # Mark as AI assisted if not already set
-            if pr.is_ai_assisted is None or pr.is_ai_assisted is False:
-                pr.is_ai_assisted = True
-                needs_update = True
+    return updated_count
 
-            # Add copilot to ai_tools_detected if not already present
-            current_tools = pr.ai_tools_detected or []
-            if "copilot" not in current_tools:
-                pr.ai_tools_detected = list(current_tools) + ["copilot"]
-                needs_update = True
 
-            if needs_update:
-                pr.save(update_fields=["is_ai_assisted", "ai_tools_detected"])
-                updated_count += 1
+def _refresh_derived_rows(team_id: int, pr_ids: list[int]) -> None:
+    """Recompute resolved_* columns and DailyPRFact rows for PRs updated in bulk.
 
-    return updated_count
+    QuerySet.update() bypasses PullRequest.save(), which normally keeps both
+    in sync with is_ai_assisted and ai_tools_detected.
+    """
+    prs = list(
+        PullRequest.objects.filter(id__in=pr_ids).only(  # noqa: TEAM001 - ids scoped to team
+            "id", "team", "github_repo", "state", "merged_at", "author", *EFFECTIVE_SOURCE_FIELDS, *RESOLVED_FIELDS
+        )
+    )
+    changed = [pr for pr in prs if pr.refresh_resolved_fields()]
+    if changed:
+        PullRequest.objects.bulk_update(changed, RESOLVED_FIELDS, batch_size=500)  # noqa: TEAM001
+    refresh_daily_facts(team_id, [fact_key_for(pr.github_repo, pr.state, pr.merged_at, pr.author_id) for pr in prs])
@@ -1,6 +1,7 @@
 """GitHub GraphQL API client service."""
 
 import asyncio
+import functools
 import logging
 import time
 from datetime import datetime
@@ -34,13 +35,17 @@ def _get_sync_logger():
 # - See: https://docs.github.com/en/graphql/overview/rate-limits-and-node-limits-for-the-graphql-api
 #
 # Query cost: ~1 point + (10 PRs * 0.1) = ~2 points per page
-# Fetches 10 PRs with up to 25 reviews, 50 commits, 50 files each
-# Reduced from 25 to 10 PRs per page to prevent timeouts on heavy repos
+# Fetches $pageSize PRs (default 10) with up to 25 reviews, 50 commits, 50 files each.
+# GraphQLPagePlanner adapts $pageSize to the observed cost and latency; nested
+# connections report pageInfo so overflowing PRs can be completed with the
+# FETCH_PR_*_PAGE_QUERY follow-ups instead of raising the limits for every PR.
 FETCH_PRS_BULK_QUERY = gql(
     """
-    query($owner: String!, $repo: String!, $cursor: String, $states: [PullRequestState!]) {
+    query($owner: String!, $repo: String!, $cursor: String, $states: [PullRequestState!], $pageSize: Int = 10) {
       repository(owner: $owner, name: $repo) {
-        pullRequests(first: 10, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+        pullRequests(
+          first: $pageSize, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: DESC}
+        ) {
           nodes {
             databaseId
             number
@@ -87,6 +92,10 @@ FETCH_PRS_BULK_QUERY = gql(
                   login
                 }
               }
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
             }
             commits(first: 50) {
               nodes {
@@ -103,6 +112,10 @@ FETCH_PRS_BULK_QUERY = gql(
                   }
                 }
               }
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
             }
             files(first: 50) {
               nodes {
@@ -111,6 +124,10 @@ FETCH_PRS_BULK_QUERY = gql(
                 deletions
                 changeType
               }
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
             }
           }
           totalCount
@@ -122,12 +139,117 @@ FETCH_PRS_BULK_QUERY = gql(
       }
       rateLimit {
         remaining
+        cost
+        resetAt
+      }
+    }
+    """
+)
+
+# Follow-up queries for PRs whose nested connections overflowed the bulk page
+# Query cost: ~1 point per page of 100 nodes
+FETCH_PR_REVIEWS_PAGE_QUERY = gql(
+    """
+    query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+      repository(owner: $owner, name: $repo) {
+        pullRequest(number: $number) {
+          reviews(first: 100, after: $cursor) {
+            nodes {
+              databaseId
+              state
+              body
+              submittedAt
+              author {
+                login
+              }
+            }
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+          }
+        }
+      }
+      rateLimit {
+        remaining
+        cost
         resetAt
       }
     }
     """
 )
 
+FETCH_PR_COMMITS_PAGE_QUERY = gql(
+    """
+    query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+      repository(owner: $owner, name: $repo) {
+        pullRequest(number: $number) {
+          commits(first: 100, after: $cursor) {
+            nodes {
+              commit {
+                oid
+                message
+                additions
+                deletions
+                author {
+                  date
+                  user {
+                    login
+                  }
+                }
+              }
+            }
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+          }
+        }
+      }
+      rateLimit {
+        remaining
+        cost
+        resetAt
+      }
+    }
+    """
+)
+
+FETCH_PR_FILES_PAGE_QUERY = gql(
+    """
+    query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+      repository(owner: $owner, name: $repo) {
+        pullRequest(number: $number) {
+          files(first: 100, after: $cursor) {
+            nodes {
+              path
+              additions
+              deletions
+              changeType
+            }
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+          }
+        }
+      }
+      rateLimit {
+        remaining
+        cost
+        resetAt
+      }
+    }
+    """
+)
+
+# Nested PR connection -> follow-up query for its remaining pages
+PR_CONNECTION_QUERIES = {
+    "reviews": FETCH_PR_REVIEWS_PAGE_QUERY,
+    "commits": FETCH_PR_COMMITS_PAGE_QUERY,
+    "files": FETCH_PR_FILES_PAGE_QUERY,
+}
+
 # Query cost: ~1 point + (10 PRs * 0.1) = ~2 points per page
 # Fetches 10 PRs ordered by UPDATED_AT for incremental sync
 # Uses same reduced limits as bulk query for consistency
@@ -311,6 +433,121 @@ FETCH_SINGLE_PR_QUERY = gql(
     """
 )
 
+# Same PR fields as FETCH_SINGLE_PR_QUERY, plus pageInfo on the nested
+# connections so overflowing ones can be completed with follow-up queries
+PR_DETAILS_FRAGMENT = """
+    fragment PRDetails on PullRequest {
+      databaseId
+      number
+      title
+      body
+      state
+      createdAt
+      mergedAt
+      additions
+      deletions
+      isDraft
+      author {
+        login
+      }
+      labels(first: 10) {
+        nodes {
+          name
+          color
+        }
+      }
+      milestone {
+        title
+        number
+        dueOn
+      }
+      assignees(first: 10) {
+        nodes {
+          login
+        }
+      }
+      closingIssuesReferences(first: 5) {
+        nodes {
+          number
+          title
+        }
+      }
+      reviews(first: 50) {
+        nodes {
+          databaseId
+          state
+          body
+          submittedAt
+          author {
+            login
+          }
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+      commits(first: 100) {
+        nodes {
+          commit {
+            oid
+            message
+            additions
+            deletions
+            author {
+              date
+              user {
+                login
+              }
+            }
+          }
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+      files(first: 100) {
+        nodes {
+          path
+          additions
+          deletions
+          changeType
+        }
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+      }
+    }
+"""
+
+
+@functools.cache
+def _prs_by_number_query(count: int):
+    """Aliased query for `count` PRs of one repository (pr0: pullRequest(number: $n0), pr1: ...).
+
+    Query cost: ~1 point per 10 PRs; cached per count since gql() parses the document.
+    """
+    variables = "".join(f", $n{i}: Int!" for i in range(count))
+    aliases = "\n".join(f"        pr{i}: pullRequest(number: $n{i}) {{ ...PRDetails }}" for i in range(count))
+    return gql(
+        f"""
+    query($owner: String!, $repo: String!{variables}) {{
+      repository(owner: $owner, name: $repo) {{
+{aliases}
+      }}
+      rateLimit {{
+        remaining
+        cost
+        resetAt
+      }}
+    }}
+    {PR_DETAILS_FRAGMENT}
+    """
+    )
+
+
 # Query cost: ~1 point + (100 members * 0.1) = ~11 points per page
 FETCH_ORG_MEMBERS_QUERY = gql(
     """
@@ -458,6 +695,7 @@ SEARCH_PRS_BY_DATE_QUERY = gql(
       }
       rateLimit {
         remaining
+        cost
         resetAt
       }
     }
@@ -467,6 +705,17 @@ SEARCH_PRS_BY_DATE_QUERY = gql(
 # Rate limit threshold - raise error if remaining points drop below this
 RATE_LIMIT_THRESHOLD = 100
 
+# PRs per aliased fetch_prs_by_number query (each carries up to 250 nested nodes)
+PR_DETAILS_BATCH_SIZE = 10
+
+# Bulk PR page size bounds for GraphQLPagePlanner
+PR_PAGE_SIZE_DEFAULT = 10
+PR_PAGE_SIZE_MIN = 2
+PR_PAGE_SIZE_MAX = 50
+# Pages slower than this (well under DEFAULT_TIMEOUT_SECONDS) or costlier than this shrink the page size
+PAGE_LATENCY_TARGET_SECONDS = 20
+PAGE_COST_LIMIT = 10
+
 
 class GitHubGraphQLError(Exception):
     """Base exception for GitHub GraphQL errors."""
@@ -480,6 +729,17 @@ class GitHubGraphQLRateLimitError(GitHubGraphQLError):
     pass
 
 
+class GitHubGraphQLBudgetExhaustedError(GitHubGraphQLRateLimitError):
+    """Exception raised when a shared rate limit budget turns a query away.
+
+    Callers should retry after retry_after seconds instead of waiting for the reset.
+    """
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class GitHubGraphQLTimeoutError(GitHubGraphQLError):
     """Exception raised when GitHub GraphQL request times out."""
 
@@ -500,6 +760,121 @@ class GitHubGraphQLPermissionError(GitHubGraphQLError):
     pass
 
 
+class GraphQLRateLimitBudget:
+    """Rate limit points shared by clients that use the same access token.
+
+    GitHub's GraphQL quota belongs to the token, so concurrent repository syncs
+    for one installation draw from a single pool. Clients report the rateLimit
+    block of every response via update(); acquire() reserves the expected cost of
+    the next query and waits for resetAt when the pool would drop below the
+    threshold.
+    """
+
+    # Budgets that raise GitHubGraphQLBudgetExhaustedError instead of waiting set this
+    defers_when_exhausted = False
+
+    def __init__(
+        self,
+        threshold: int = RATE_LIMIT_THRESHOLD,
+        max_wait_seconds: int = DEFAULT_MAX_WAIT_SECONDS,
+    ) -> None:
+        self.threshold = threshold
+        self.max_wait_seconds = max_wait_seconds
+        self.remaining: int | None = None
+        self.reset_at: str | None = None
+        self.cost_estimate = 1
+        self._reserved = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> int | None:
+        """Points left after in-flight reservations, or None before the first response."""
+        if self.remaining is None:
+            return None
+        return self.remaining - self._reserved
+
+    async def acquire(self, operation: str) -> None:
+        """Reserve points for a query, waiting for the reset if the pool is exhausted.
+
+        Raises:
+            GitHubGraphQLRateLimitError: When the reset is further away than max_wait_seconds
+        """
+        from apps.integrations.services.github_rate_limit import wait_for_rate_limit_reset_async
+
+        # The lock makes concurrent callers queue behind a single reset wait
+        async with self._lock:
+            available = self.available
+            if available is not None and available - self.cost_estimate < self.threshold:
+                if not self.reset_at or not await wait_for_rate_limit_reset_async(self.reset_at, self.max_wait_seconds):
+                    raise GitHubGraphQLRateLimitError(
+                        f"Shared GitHub GraphQL budget exhausted before {operation}: "
+                        f"{available} points available (resets at {self.reset_at})"
+                    )
+                self.remaining = None
+                self._reserved = 0
+            self._reserved += self.cost_estimate
+
+    def release(self) -> None:
+        """Return the reservation of a query that produced no rateLimit data."""
+        self._reserved = max(0, self._reserved - self.cost_estimate)
+
+    def update(self, rate_limit: dict) -> None:
+        """Record the rateLimit block of a response and release its reservation."""
+        self.release()
+        if rate_limit.get("cost"):
+            self.cost_estimate = rate_limit["cost"]
+        remaining = rate_limit.get("remaining")
+        if remaining is None:
+            return
+        reset_at = rate_limit.get("resetAt")
+        # Responses can arrive out of order; within one window the lowest count is the latest
+        if self.remaining is None or reset_at != self.reset_at:
+            self.remaining = remaining
+            self.reset_at = reset_at
+        else:
+            self.remaining = min(self.remaining, remaining)
+
+
+class GraphQLPagePlanner:
+    """Chooses the bulk PR page size from the cost and latency of previous pages.
+
+    Nested reviews, commits and files make the price of a page depend on the
+    repository: ten PRs of a heavy monorepo can time out while a small
+    repository returns fifty in a second. After every page the planner halves
+    the page size if the page was slower than target_seconds or cost more than
+    max_cost points, and grows it by half when a full page used less than half
+    of both. A timed-out page halves it as well.
+    """
+
+    def __init__(
+        self,
+        page_size: int = PR_PAGE_SIZE_DEFAULT,
+        min_page_size: int = PR_PAGE_SIZE_MIN,
+        max_page_size: int = PR_PAGE_SIZE_MAX,
+        target_seconds: float = PAGE_LATENCY_TARGET_SECONDS,
+        max_cost: int = PAGE_COST_LIMIT,
+    ) -> None:
+        self.page_size = page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_seconds = target_seconds
+        self.max_cost = max_cost
+
+    def record_page(self, page_size: int, cost: int, seconds: float, pr_count: int) -> None:
+        """Adjust the page size after a page of page_size PRs returned pr_count PRs."""
+        if seconds > self.target_seconds or cost > self.max_cost:
+            self.page_size = max(self.min_page_size, page_size // 2)
+        elif pr_count >= page_size and seconds * 2 < self.target_seconds and cost * 2 <= self.max_cost:
+            self.page_size = min(self.max_page_size, page_size + max(1, page_size // 2))
+
+    def record_timeout(self) -> bool:
+        """Halve the page size after a timeout; returns False if it is already at the minimum."""
+        if self.page_size <= self.min_page_size:
+            return False
+        self.page_size = max(self.min_page_size, self.page_size // 2)
+        return True
+
+
 def _is_permission_error(error: Exception) -> bool:
     """Check if an exception indicates a GitHub permission/access error.
 
@@ -539,6 +914,8 @@ class GitHubGraphQLClient:
         timeout: int = DEFAULT_TIMEOUT_SECONDS,
         wait_for_reset: bool = True,
         max_wait_seconds: int = DEFAULT_MAX_WAIT_SECONDS,
+        rate_limit_budget: GraphQLRateLimitBudget | None = None,
+        page_planner: GraphQLPagePlanner | None = None,
     ) -> None:
         """Initialize GitHub GraphQL client with access token.
 
@@ -547,6 +924,8 @@ class GitHubGraphQLClient:
             timeout: HTTP request timeout in seconds (default: 90)
             wait_for_reset: If True, wait when rate limit is low instead of raising error
             max_wait_seconds: Maximum seconds to wait for rate limit reset (default: 1 hour)
+            rate_limit_budget: Budget shared with other clients using the same token (optional)
+            page_planner: Adapts the fetch_prs_bulk page size (optional, fixed default size without it)
         """
         # Set 90-second timeout for complex queries with nested data
         client_timeout = aiohttp.ClientTimeout(total=timeout)
@@ -558,6 +937,8 @@ class GitHubGraphQLClient:
         )
         self.wait_for_reset = wait_for_reset
         self.max_wait_seconds = max_wait_seconds
+        self.rate_limit_budget = rate_limit_budget
+        self.page_planner = page_planner
         logger.debug(f"Initialized GitHubGraphQLClient with {timeout}s timeout, wait_for_reset={wait_for_reset}")
 
     async def _execute(self, query, variable_values: dict) -> dict:
@@ -604,6 +985,11 @@ class GitHubGraphQLClient:
         )
 
         if remaining < RATE_LIMIT_THRESHOLD:
+            if self.rate_limit_budget is not None and self.rate_limit_budget.defers_when_exhausted:
+                # The budget turns the next query away, so the caller can reschedule instead of sleeping
+                logger.info(f"{operation}: {remaining} rate limit points remaining, deferring to the budget")
+                return
+
             # Try to wait if enabled
             if self.wait_for_reset and reset_at != "unknown":
                 start_wait = time.time()
@@ -659,7 +1045,16 @@ class GitHubGraphQLClient:
         last_error = None
         for attempt in range(max_retries):
             try:
-                result = await self._execute(query, variable_values=variables)
+                if self.rate_limit_budget is not None:
+                    await self.rate_limit_budget.acquire(operation_name)
+                try:
+                    result = await self._execute(query, variable_values=variables)
+                except BaseException:
+                    if self.rate_limit_budget is not None:
+                        self.rate_limit_budget.release()
+                    raise
+                if self.rate_limit_budget is not None:
+                    self.rate_limit_budget.update(result.get("rateLimit", {}))
                 await self._check_rate_limit(result, operation_name)
                 return result
 
@@ -706,6 +1101,9 @@ class GitHubGraphQLClient:
     ) -> dict:
         """Fetch pull requests in bulk with pagination support and retry logic.
 
+        The page size comes from the client's page_planner, which also shrinks
+        it and retries the same cursor when a page times out.
+
         Args:
             owner: Repository owner (organization or user)
             repo: Repository name
@@ -724,19 +1122,27 @@ class GitHubGraphQLClient:
             GitHubGraphQLTimeoutError: When request times out after max retries
             GitHubGraphQLError: On any other GraphQL query errors
         """
-        logger.debug(f"Fetching PRs for {owner}/{repo} (cursor: {cursor})")
+        page_size = self.page_planner.page_size if self.page_planner is not None else PR_PAGE_SIZE_DEFAULT
+        logger.debug(f"Fetching {page_size} PRs for {owner}/{repo} (cursor: {cursor})")
 
         start_time = time.time()
-        variables = {"owner": owner, "repo": repo, "cursor": cursor}
+        variables = {"owner": owner, "repo": repo, "cursor": cursor, "pageSize": page_size}
         if states is not None:
             variables["states"] = states
 
-        result = await self._execute_with_retry(
-            query=FETCH_PRS_BULK_QUERY,
-            variables=variables,
-            operation_name=f"fetch_prs_bulk({owner}/{repo})",
-            max_retries=max_retries,
-        )
+        try:
+            result = await self._execute_with_retry(
+                query=FETCH_PRS_BULK_QUERY,
+                variables=variables,
+                operation_name=f"fetch_prs_bulk({owner}/{repo})",
+                max_retries=max_retries,
+            )
+        except GitHubGraphQLTimeoutError:
+            # Retry the same cursor with a smaller page while the planner can still shrink it
+            if self.page_planner is None or not self.page_planner.record_timeout():
+                raise
+            logger.warning(f"fetch_prs_bulk({owner}/{repo}) timed out, retrying with {self.page_planner.page_size} PRs")
+            return await self.fetch_prs_bulk(owner, repo, cursor=cursor, max_retries=max_retries, states=states)
         duration_ms = (time.time() - start_time) * 1000
 
         # Log GraphQL query timing
@@ -755,6 +1161,8 @@ class GitHubGraphQLClient:
         pr_nodes = result.get("repository", {}).get("pullRequests", {}).get("nodes", [])
         pr_count = len(pr_nodes)
         logger.info(f"Fetched {pr_count} PRs from {owner}/{repo}")
+        if self.page_planner is not None:
+            self.page_planner.record_page(page_size, points_cost or 0, duration_ms / 1000, pr_count)
 
         # Log detailed info about each PR's nested data for debugging
         for pr_data in pr_nodes:
@@ -802,6 +1210,83 @@ class GitHubGraphQLClient:
         logger.info(f"Fetched PR #{pr_number} from {owner}/{repo}")
         return result
 
+    async def fetch_prs_by_number(
+        self, owner: str, repo: str, pr_numbers: list[int], max_retries: int = DEFAULT_MAX_RETRIES
+    ) -> dict[int, dict | None]:
+        """Fetch several pull requests of one repository in a single aliased query.
+
+        Returns the same PR fields as fetch_single_pr, with pageInfo on reviews,
+        commits and files. Callers chunk pr_numbers by PR_DETAILS_BATCH_SIZE.
+
+        Args:
+            owner: Repository owner (organization or user)
+            repo: Repository name
+            pr_numbers: Pull request numbers (at least one)
+            max_retries: Maximum number of retry attempts on timeout (default: 3)
+
+        Returns:
+            dict: PR data per PR number (None if GitHub returned no PR)
+
+        Raises:
+            GitHubGraphQLRateLimitError: When rate limit remaining < 100 points
+            GitHubGraphQLTimeoutError: When request times out after max retries
+            GitHubGraphQLError: On any other GraphQL query errors (including unknown PR numbers)
+        """
+        if not pr_numbers:
+            raise ValueError("pr_numbers must not be empty")
+
+        variables = {"owner": owner, "repo": repo}
+        variables.update({f"n{i}": number for i, number in enumerate(pr_numbers)})
+        result = await self._execute_with_retry(
+            query=_prs_by_number_query(len(pr_numbers)),
+            variables=variables,
+            operation_name=f"fetch_prs_by_number({owner}/{repo}, {len(pr_numbers)} PRs)",
+            max_retries=max_retries,
+        )
+
+        repository = result.get("repository") or {}
+        logger.info(f"Fetched {len(pr_numbers)} PRs from {owner}/{repo} in one query")
+        return {number: repository.get(f"pr{i}") for i, number in enumerate(pr_numbers)}
+
+    async def fetch_pr_connection_page(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int,
+        connection: str,
+        cursor: str | None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> dict:
+        """Fetch the next page of a PR's reviews, commits or files.
+
+        Used to complete nested connections whose pageInfo.hasNextPage was set
+        in a fetch_prs_bulk page.
+
+        Args:
+            owner: Repository owner (organization or user)
+            repo: Repository name
+            pr_number: Pull request number
+            connection: "reviews", "commits" or "files"
+            cursor: endCursor of the previous page of the connection
+            max_retries: Maximum number of retry attempts on timeout (default: 3)
+
+        Returns:
+            dict: The connection with nodes and pageInfo (empty if the PR is gone)
+
+        Raises:
+            GitHubGraphQLRateLimitError: When rate limit remaining < 100 points
+            GitHubGraphQLTimeoutError: When request times out after max retries
+            GitHubGraphQLError: On any other GraphQL query errors
+        """
+        result = await self._execute_with_retry(
+            query=PR_CONNECTION_QUERIES[connection],
+            variables={"owner": owner, "repo": repo, "number": pr_number, "cursor": cursor},
+            operation_name=f"fetch_pr_{connection}({owner}/{repo}#{pr_number})",
+            max_retries=max_retries,
+        )
+        pull_request = (result.get("repository") or {}).get("pullRequest") or {}
+        return pull_request.get(connection) or {}
+
     async def fetch_org_members(
         self, org: str, cursor: str | None = None, max_retries: int = DEFAULT_MAX_RETRIES
     ) -> dict:
@@ -0,0 +1,180 @@
+"""GraphQL rate limit budget shared by every worker using an access token.
+
+GraphQLRateLimitBudget only coordinates clients inside one event loop. Scheduled
+syncs of one installation's repositories run in separate Celery workers, each
+unaware of what the others spend, and each sleeps through the reset once the
+quota runs low. SharedGraphQLRateLimitBudget keeps the pool in the Django cache
+(Redis in production) under a key per installation or OAuth integration:
+
+    state     remaining points, resetAt and the last query cost, from the
+              rateLimit block of the latest response
+    reserved  points held by queries in flight, changed with atomic incr/decr
+
+acquire() reserves the expected cost and, when the pool would drop below the
+threshold, raises GitHubGraphQLBudgetExhaustedError carrying the seconds until
+the reset. Sync tasks catch it and re-dispatch themselves with that countdown,
+freeing the worker instead of sleeping.
+
+The budget only throttles: if the cache is unreachable, queries go ahead and
+GitHub's own limit applies.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+from dateutil import parser as date_parser
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.integrations.services.github_graphql import (
+    RATE_LIMIT_THRESHOLD,
+    GitHubGraphQLBudgetExhaustedError,
+    GraphQLRateLimitBudget,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "github:graphql:budget"
+# Reservations of workers that died mid-query expire after this
+RESERVATION_TIMEOUT_SECONDS = 10 * 60
+# Added to the reset time so deferred tasks don't start before GitHub has reset the pool
+RESET_MARGIN_SECONDS = 5
+
+
+def budget_scope(tracked_repo) -> str:
+    """Scope of the access token a repository syncs with (App installation preferred)."""
+    if tracked_repo.app_installation_id:
+        return f"app_installation:{tracked_repo.app_installation_id}"
+    return f"integration:{tracked_repo.integration_id}"
+
+
+def get_shared_rate_limit_budget(tracked_repo) -> "SharedGraphQLRateLimitBudget | None":
+    """Shared budget for a repository's token, or None when turned off in settings."""
+    if not getattr(settings, "GITHUB_API_CONFIG", {}).get("SHARED_GRAPHQL_BUDGET", False):
+        return None
+    return SharedGraphQLRateLimitBudget(budget_scope(tracked_repo))
+
+
+class SharedGraphQLRateLimitBudget(GraphQLRateLimitBudget):
+    """Rate limit budget stored in the Django cache and shared across processes.
+
+    Same interface as GraphQLRateLimitBudget, so GitHubGraphQLClient uses either.
+    """
+
+    defers_when_exhausted = True
+
+    def __init__(self, scope: str, threshold: int = RATE_LIMIT_THRESHOLD) -> None:
+        super().__init__(threshold=threshold)
+        self.scope = scope
+        self._state_key = f"{CACHE_KEY_PREFIX}:{scope}:state"
+        self._reserved_key = f"{CACHE_KEY_PREFIX}:{scope}:reserved"
+        # Points this client holds in the shared reservation counter
+        self._held: list[int] = []
+
+    @property
+    def available(self) -> int | None:
+        """Points left after every worker's in-flight reservations, or None while unknown."""
+        state = self._load_state()
+        if state is None:
+            return None
+        try:
+            reserved = cache.get(self._reserved_key) or 0
+        except Exception as e:
+            logger.warning("GraphQL budget cache unavailable: %s", e)
+            return None
+        return state["remaining"] - max(0, reserved)
+
+    async def acquire(self, operation: str) -> None:
+        """Reserve points for a query, or raise if the shared pool is exhausted.
+
+        Raises:
+            GitHubGraphQLBudgetExhaustedError: When the pool would drop below the threshold
+        """
+        state = self._load_state()
+        cost = (state or {}).get("cost") or self.cost_estimate
+        reserved = self._reserve(cost)
+        if state is None or reserved is None:
+            return
+
+        available = state["remaining"] - reserved
+        if available < self.threshold:
+            self._unreserve(self._held.pop())
+            retry_after = _seconds_until(state["reset_at"]) + RESET_MARGIN_SECONDS
+            raise GitHubGraphQLBudgetExhaustedError(
+                f"Shared GitHub GraphQL budget for {self.scope} exhausted before {operation}: "
+                f"{available + cost} points available (resets at {state['reset_at']})",
+                retry_after=retry_after,
+            )
+
+    def release(self) -> None:
+        """Return the reservation of a query that produced no rateLimit data."""
+        if self._held:
+            self._unreserve(self._held.pop())
+
+    def update(self, rate_limit: dict) -> None:
+        """Record the rateLimit block of a response and release its reservation."""
+        self.release()
+        if rate_limit.get("cost"):
+            self.cost_estimate = rate_limit["cost"]
+        remaining = rate_limit.get("remaining")
+        reset_at = rate_limit.get("resetAt")
+        if remaining is None or not reset_at:
+            return
+
+        try:
+            state = cache.get(self._state_key)
+            # Responses can arrive out of order; within one window the lowest count is the latest.
+            # get/set isn't atomic, but the next response corrects any lost update.
+            if state is not None and state["reset_at"] == reset_at:
+                remaining = min(state["remaining"], remaining)
+            cache.set(
+                self._state_key,
+                {"remaining": remaining, "reset_at": reset_at, "cost": self.cost_estimate},
+                _seconds_until(reset_at) + RESET_MARGIN_SECONDS,
+            )
+        except Exception as e:
+            logger.warning("GraphQL budget cache unavailable: %s", e)
+
+    def _load_state(self) -> dict | None:
+        """Latest rateLimit state of the current window, or None if unknown or reset."""
+        try:
+            state = cache.get(self._state_key)
+        except Exception as e:
+            logger.warning("GraphQL budget cache unavailable: %s", e)
+            return None
+        if state is None or _seconds_until(state["reset_at"]) <= 0:
+            return None
+        return state
+
+    def _reserve(self, cost: int) -> int | None:
+        """Add cost to the shared reservations and return the new total (None if the cache failed)."""
+        try:
+            try:
+                reserved = cache.incr(self._reserved_key, cost)
+            except ValueError:
+                # First reservation (or the counter expired); another worker may create it first
+                if cache.add(self._reserved_key, cost, RESERVATION_TIMEOUT_SECONDS):
+                    reserved = cost
+                else:
+                    reserved = cache.incr(self._reserved_key, cost)
+        except Exception as e:
+            logger.warning("GraphQL budget cache unavailable: %s", e)
+            return None
+        self._held.append(cost)
+        return reserved
+
+    def _unreserve(self, cost: int) -> None:
+        """Subtract cost from the shared reservations (callers pop it from _held)."""
+        try:
+            cache.decr(self._reserved_key, cost)
+        except ValueError:
+            # The counter expired along with the reservation
+            pass
+        except Exception as e:
+            logger.warning("GraphQL budget cache unavailable: %s", e)
+
+
+def _seconds_until(reset_at_iso: str) -> int:
+    """Whole seconds until an ISO timestamp (0 if it has passed)."""
+    reset_at = date_parser.isoparse(reset_at_iso)
+    return max(0, int((reset_at - datetime.now(UTC)).total_seconds()))
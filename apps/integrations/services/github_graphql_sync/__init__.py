@@ -5,8 +5,9 @@ compared to REST (1 call per 50 PRs vs 6-7 calls per PR).
 
 This package contains domain-focused modules for GitHub sync:
 - history: Full historical sync functions
+- multi_repo: Concurrent history sync across repositories
 - incremental: Incremental (since last sync) functions
-- pr_data: Single PR data fetch
+- pr_data: Single and batched PR data fetch
 - members: Organization member sync
 
 All public functions are re-exported here for backward compatibility.
@@ -17,6 +18,7 @@ All public functions are re-exported here for backward compatibility.
 # Re-export GitHubGraphQLClient and exceptions for test mocking compatibility
 # Tests mock these at apps.integrations.services.github_graphql_sync.*
 from apps.integrations.services.github_graphql import (
+    GitHubGraphQLBudgetExhaustedError,
     GitHubGraphQLClient,
     GitHubGraphQLError,
     GitHubGraphQLPermissionError,
@@ -28,20 +30,24 @@ from ._utils import MemberSyncResult, SyncResult
 from .history import sync_repository_history_by_search, sync_repository_history_graphql
 from .incremental import sync_repository_incremental_graphql
 from .members import sync_github_members_graphql
-from .pr_data import fetch_pr_complete_data_graphql
+from .multi_repo import sync_repositories_history
+from .pr_data import fetch_pr_complete_data_graphql, fetch_prs_complete_data_graphql
 
 __all__ = [
     # Main sync functions
     "sync_repository_history_graphql",
     "sync_repository_history_by_search",
+    "sync_repositories_history",
     "sync_repository_incremental_graphql",
     "fetch_pr_complete_data_graphql",
+    "fetch_prs_complete_data_graphql",
     "sync_github_members_graphql",
     # Utility classes
     "SyncResult",
     "MemberSyncResult",
     # Re-exported for test mocking compatibility
     "GitHubGraphQLClient",
+    "GitHubGraphQLBudgetExhaustedError",
     "GitHubGraphQLError",
     "GitHubGraphQLPermissionError",
     "GitHubGraphQLRateLimitError",
@@ -0,0 +1,450 @@
+"""Page-level bulk writer for GitHub GraphQL sync.
+
+Persists a whole page of PRs (with reviews, commits and files) in a handful
+of statements per model inside a single transaction, instead of one or more
+update_or_create round-trips per row as in _processors.
+
+Writes bypass PullRequest.save(), so the writer recomputes the same side
+effects explicitly: AI detection, cycle/review timing, resolved_* columns, the
+stored file/review aggregates (tech_categories, reviewer stats) and the
+DailyPRFact rollup.
+
+If the bulk transaction fails, the page is replayed PR-by-PR through the
+per-row processors so a single bad row only fails its own PR.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.utils import timezone
+
+from apps.metrics.models import Commit, PRFile, PRReview, PullRequest
+from apps.metrics.models.pull_requests import RESOLVED_FIELDS, ROLLUP_SOURCE_FIELDS
+from apps.metrics.processors import _calculate_cycle_time_hours, _calculate_time_diff_hours
+from apps.metrics.services.ai_detector import PATTERNS_VERSION, AITextResult, detect_ai_in_texts
+from apps.metrics.services.member_resolver import TeamMemberResolver
+from apps.metrics.services.pr_daily_facts import fact_key_for, refresh_daily_facts
+from apps.metrics.services.pr_derived_fields import refresh_pr_derived_fields
+
+from ._processors import _detect_pr_ai_involvement, _pr_detection_text, _process_pr_from_search
+from ._utils import (
+    SyncResult,
+    _get_sync_logger,
+    _map_file_status,
+    _map_pr_state,
+    _map_review_state,
+    _parse_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+# PR columns written by the sync (everything else is owned by other writers)
+PR_SYNC_FIELDS = (
+    "title",
+    "body",
+    "state",
+    "pr_created_at",
+    "merged_at",
+    "additions",
+    "deletions",
+    "author",
+    "is_ai_assisted",
+    "ai_tools_detected",
+    "ai_detection_version",
+    "cycle_time_hours",
+    "first_review_at",
+    "review_time_hours",
+    *RESOLVED_FIELDS,
+)
+
+# bulk_update() skips auto_now, so updated_at is set explicitly; incremental reviewer
+# correlations select changed PRs by PRReview.updated_at.
+REVIEW_SYNC_FIELDS = ("state", "body", "submitted_at", "reviewer", "pull_request", "updated_at")
+COMMIT_SYNC_FIELDS = ("message", "committed_at", "additions", "deletions", "author", "pull_request", "github_repo")
+FILE_SYNC_FIELDS = ("status", "additions", "deletions", "changes", "file_category")
+
+
+@dataclass
+class _PageRow:
+    """One PR from the page with its parsed nested nodes."""
+
+    pr_data: dict
+    pr: PullRequest
+    reviews: list[dict] = field(default_factory=list)
+    commits: list[dict] = field(default_factory=list)
+    files: list[dict] = field(default_factory=list)
+
+
+def _node_list(pr_data: dict, key: str) -> list[dict]:
+    return (pr_data.get(key) or {}).get("nodes", []) or []
+
+
+def _pr_text(pr_data: dict) -> tuple[str, str]:
+    """(title, body) of a PR node, as stored by the sync."""
+    return pr_data.get("title", ""), pr_data.get("body", "") or ""
+
+
+def _build_pr(
+    team,
+    github_repo: str,
+    pr_data: dict,
+    members: TeamMemberResolver,
+    existing: PullRequest | None,
+    text_ai_result: AITextResult | None = None,
+) -> PullRequest:
+    """Build an unsaved PullRequest carrying the synced values for upsert."""
+    author_login = (pr_data.get("author") or {}).get("login")
+    title, body = _pr_text(pr_data)
+    is_ai_assisted, ai_tools = _detect_pr_ai_involvement(author_login, title, body, text_ai_result)
+
+    pr = PullRequest(
+        team=team,
+        github_pr_id=pr_data.get("number"),
+        github_repo=github_repo,
+        title=title,
+        body=body,
+        state=_map_pr_state(pr_data.get("state", "OPEN")),
+        pr_created_at=_parse_datetime(pr_data.get("createdAt")),
+        merged_at=_parse_datetime(pr_data.get("mergedAt")),
+        additions=pr_data.get("additions", 0),
+        deletions=pr_data.get("deletions", 0),
+        author=members.by_login(author_login),
+        is_ai_assisted=is_ai_assisted,
+        ai_tools_detected=ai_tools,
+        ai_detection_version=PATTERNS_VERSION,
+    )
+
+    if existing is not None:
+        # Columns not written by the sync still feed timing and resolved values
+        pr.llm_summary = existing.llm_summary
+        pr.labels = existing.labels
+        pr.cycle_time_hours = existing.cycle_time_hours
+        pr.first_review_at = existing.first_review_at
+        pr.review_time_hours = existing.review_time_hours
+
+    if pr.merged_at:
+        pr.cycle_time_hours = _calculate_cycle_time_hours(pr.pr_created_at, pr.merged_at)
+
+    submitted = [_parse_datetime(r.get("submittedAt")) for r in _node_list(pr_data, "reviews")]
+    earliest_review_at = min((s for s in submitted if s), default=None)
+    if earliest_review_at and (pr.first_review_at is None or earliest_review_at < pr.first_review_at):
+        pr.first_review_at = earliest_review_at
+        pr.review_time_hours = _calculate_time_diff_hours(pr.pr_created_at, earliest_review_at)
+
+    pr.refresh_resolved_fields()
+    return pr
+
+
+def _write_reviews(team, rows: list[_PageRow], members: TeamMemberResolver, result: SyncResult) -> None:
+    """Upsert reviews for the page.
+
+    unique_team_review is a partial index (github_review_id IS NOT NULL), which
+    ON CONFLICT cannot target, so existing reviews are matched with one lookup
+    and split into bulk_update/bulk_create. Reviews without a GitHub ID are rare
+    and keep the per-row path.
+    """
+    by_review_id: dict[int, PRReview] = {}
+    for row in rows:
+        for review_data in row.reviews:
+            reviewer_login = (review_data.get("author") or {}).get("login")
+            values = {
+                "state": _map_review_state(review_data.get("state", "COMMENTED")),
+                "body": review_data.get("body", "") or "",
+                "submitted_at": _parse_datetime(review_data.get("submittedAt")),
+                "reviewer": members.by_login(reviewer_login),
+                "pull_request": row.pr,
+            }
+            review_id = review_data.get("databaseId")
+            if review_id:
+                by_review_id[review_id] = PRReview(team=team, github_review_id=review_id, **values)
+            else:
+                PRReview.objects.update_or_create(
+                    team=team,
+                    pull_request=row.pr,
+                    reviewer=values["reviewer"],
+                    submitted_at=values["submitted_at"],
+                    defaults=values,
+                )
+            result.reviews_synced += 1
+
+    if not by_review_id:
+        return
+
+    existing_ids = dict(
+        PRReview.objects.filter(team=team, github_review_id__in=by_review_id).values_list("github_review_id", "id")
+    )
+    to_update = []
+    to_create = []
+    now = timezone.now()
+    for review_id, review in by_review_id.items():
+        if review_id in existing_ids:
+            review.pk = existing_ids[review_id]
+            review.updated_at = now
+            to_update.append(review)
+        else:
+            to_create.append(review)
+
+    start_time = time.time()
+    if to_update:
+        PRReview.objects.bulk_update(to_update, REVIEW_SYNC_FIELDS)  # noqa: TEAM001 - team-scoped instances
+    if to_create:
+        PRReview.objects.bulk_create(to_create)  # noqa: TEAM001 - team-scoped instances
+    _log_db_write("review", len(to_create), len(to_update), start_time)
+
+
+def _write_commits(
+    team, github_repo: str, rows: list[_PageRow], members: TeamMemberResolver, result: SyncResult
+) -> None:
+    """Upsert commits for the page with one INSERT ... ON CONFLICT."""
+    by_sha: dict[str, Commit] = {}
+    for row in rows:
+        for commit_node in row.commits:
+            commit_data = commit_node.get("commit") or {}
+            sha = commit_data.get("oid")
+            if not sha:
+                continue
+            author_data = commit_data.get("author") or {}
+            author_login = (author_data.get("user") or {}).get("login")
+            # Later PRs win when a commit appears in several PRs, as with sequential writes
+            by_sha[sha] = Commit(
+                team=team,
+                github_sha=sha,
+                github_repo=github_repo,
+                message=commit_data.get("message", ""),
+                committed_at=_parse_datetime(author_data.get("date")) if author_data else None,
+                additions=commit_data.get("additions", 0),
+                deletions=commit_data.get("deletions", 0),
+                author=members.by_login(author_login),
+                pull_request=row.pr,
+            )
+            result.commits_synced += 1
+
+    if by_sha:
+        start_time = time.time()
+        Commit.objects.bulk_create(  # noqa: TEAM001 - team-scoped instances
+            list(by_sha.values()),
+            update_conflicts=True,
+            unique_fields=["team", "github_sha"],
+            update_fields=list(COMMIT_SYNC_FIELDS),
+        )
+        _log_db_write("commit", len(by_sha), 0, start_time)
+
+
+def _write_files(team, rows: list[_PageRow], result: SyncResult) -> None:
+    """Upsert files for the page with one INSERT ... ON CONFLICT."""
+    sync_logger = _get_sync_logger()
+    by_key: dict[tuple, PRFile] = {}
+    for row in rows:
+        pr = row.pr
+        if not row.files and (pr.additions > 0 or pr.deletions > 0):
+            sync_logger.warning(
+                "sync.files.missing",
+                extra={
+                    "pr_id": pr.id,
+                    "pr_number": pr.github_pr_id,
+                    "additions": pr.additions,
+                    "deletions": pr.deletions,
+                    "hint": "PR has code changes but files array is empty",
+                },
+            )
+        for file_data in row.files:
+            filename = file_data.get("path")
+            if not filename:
+                continue
+            change_type = file_data.get("changeType") or file_data.get("status", "MODIFIED")
+            additions = file_data.get("additions", 0)
+            deletions = file_data.get("deletions", 0)
+            by_key[(pr.pk, filename)] = PRFile(
+                team=team,
+                pull_request=pr,
+                filename=filename,
+                status=_map_file_status(change_type),
+                additions=additions,
+                deletions=deletions,
+                changes=additions + deletions,
+                file_category=PRFile.categorize_file(filename),
+            )
+            result.files_synced += 1
+
+    if by_key:
+        start_time = time.time()
+        PRFile.objects.bulk_create(  # noqa: TEAM001 - team-scoped instances
+            list(by_key.values()),
+            update_conflicts=True,
+            unique_fields=["team", "pull_request", "filename"],
+            update_fields=list(FILE_SYNC_FIELDS),
+        )
+        _log_db_write("file", len(by_key), 0, start_time)
+
+
+def _log_db_write(entity_type: str, created: int, updated: int, start_time: float) -> None:
+    _get_sync_logger().info(
+        "sync.db.write",
+        extra={
+            "entity_type": entity_type,
+            "was_created": created,
+            "was_updated": updated,
+            "duration_ms": (time.time() - start_time) * 1000,
+        },
+    )
+
+
+def _write_page(team, github_repo: str, pr_nodes: list[dict], result: SyncResult, members: TeamMemberResolver) -> int:
+    """Persist validated PR nodes in one transaction. Returns PRs written."""
+    numbers = [pr_data.get("number") for pr_data in pr_nodes]
+    existing = {
+        pr.github_pr_id: pr
+        for pr in PullRequest.objects.filter(team=team, github_repo=github_repo, github_pr_id__in=numbers).only(
+            "id",
+            "github_pr_id",
+            "llm_summary",
+            "labels",
+            "cycle_time_hours",
+            "first_review_at",
+            "review_time_hours",
+            *ROLLUP_SOURCE_FIELDS,
+        )
+    }
+    text_ai_results = detect_ai_in_texts(_pr_detection_text(*_pr_text(pr_data)) for pr_data in pr_nodes)
+
+    # Duplicate PR numbers in one page would make ON CONFLICT touch a row twice
+    rows_by_number: dict[int, _PageRow] = {}
+    for pr_data, text_ai_result in zip(pr_nodes, text_ai_results, strict=True):
+        number = pr_data.get("number")
+        rows_by_number[number] = _PageRow(
+            pr_data=pr_data,
+            pr=_build_pr(team, github_repo, pr_data, members, existing.get(number), text_ai_result),
+            reviews=_node_list(pr_data, "reviews"),
+            commits=_node_list(pr_data, "commits"),
+            files=_node_list(pr_data, "files"),
+        )
+    rows = list(rows_by_number.values())
+
+    with transaction.atomic():
+        start_time = time.time()
+        PullRequest.objects.bulk_create(  # noqa: TEAM001 - team-scoped instances
+            [row.pr for row in rows],
+            update_conflicts=True,
+            unique_fields=["team", "github_pr_id", "github_repo"],
+            update_fields=list(PR_SYNC_FIELDS),
+        )
+        created = len(rows) - sum(1 for number in rows_by_number if number in existing)
+        _log_db_write("pull_request", created, len(rows) - created, start_time)
+
+        _write_reviews(team, rows, members, result)
+        _write_commits(team, github_repo, rows, members, result)
+        _write_files(team, rows, result)
+        refresh_pr_derived_fields(row.pr.pk for row in rows)
+
+        # Refresh rollup cells each PR moved out of (old values) and into (new values)
+        fact_keys = set()
+        for number, row in rows_by_number.items():
+            pr = row.pr
+            fact_keys.add(fact_key_for(pr.github_repo, pr.state, pr.merged_at, pr.author_id))
+            if number in existing:
+                old = existing[number]
+                fact_keys.add(fact_key_for(old.github_repo, old.state, old.merged_at, old.author_id))
+        refresh_daily_facts(team.id, fact_keys)
+
+    result.prs_synced += len(pr_nodes)
+    sync_logger = _get_sync_logger()
+    for row in rows:
+        sync_logger.info(
+            "sync.pr.processed",
+            extra={
+                "pr_id": row.pr.id,
+                "pr_number": row.pr.github_pr_id,
+                "reviews_count": len(row.reviews),
+                "commits_count": len(row.commits),
+                "files_count": len(row.files),
+            },
+        )
+    return len(pr_nodes)
+
+
+def persist_pr_page(
+    team,
+    github_repo: str,
+    pr_nodes: list[dict],
+    result: SyncResult,
+    cutoff_date=None,
+    skip_before_date=None,
+    members: TeamMemberResolver | None = None,
+) -> int:
+    """Persist a page of PRs from a GraphQL response in bulk.
+
+    Applies the same date filtering and validation as _process_pr: PRs outside
+    [cutoff_date, skip_before_date] are skipped and PRs without author data are
+    recorded in result.errors.
+
+    Args:
+        team: Team instance
+        github_repo: Repository full name (owner/repo)
+        pr_nodes: PR nodes from one GraphQL page
+        result: SyncResult whose counters and errors are updated
+        cutoff_date: Skip PRs created before this datetime (None = no limit)
+        skip_before_date: Skip PRs created after this datetime (None = no limit)
+        members: Resolver shared across the pages of one sync run (one is created if None)
+
+    Returns:
+        int: Number of PRs persisted
+    """
+    valid_nodes = []
+    for pr_data in pr_nodes:
+        created_at = _parse_datetime(pr_data.get("createdAt"))
+        if cutoff_date and created_at and created_at < cutoff_date:
+            continue
+        if skip_before_date and created_at and created_at > skip_before_date:
+            continue
+        if not pr_data.get("author"):
+            error_msg = f"Error processing PR #{pr_data.get('number', 'unknown')}: ValueError: PR has no author data"
+            logger.warning(error_msg)
+            result.errors.append(error_msg)
+            continue
+        valid_nodes.append(pr_data)
+
+    if not valid_nodes:
+        return 0
+
+    if members is None:
+        members = TeamMemberResolver(team.id)
+
+    counters = (result.prs_synced, result.reviews_synced, result.commits_synced, result.files_synced)
+    try:
+        return _write_page(team, github_repo, valid_nodes, result, members)
+    except Exception as e:
+        logger.warning(f"Bulk write failed for {github_repo} page, retrying PR-by-PR: {type(e).__name__}: {e}")
+
+    # The bulk transaction rolled back, so discard its counts and replay per PR
+    result.prs_synced, result.reviews_synced, result.commits_synced, result.files_synced = counters
+    persisted = 0
+    for pr_data in valid_nodes:
+        try:
+            with transaction.atomic():
+                _process_pr_from_search(team, github_repo, pr_data, result, members)
+            persisted += 1
+        except Exception as e:
+            error_msg = f"Error processing PR #{pr_data.get('number', 'unknown')}: {type(e).__name__}: {e}"
+            logger.warning(error_msg)
+            result.errors.append(error_msg)
+    return persisted
+
+
+@sync_to_async(thread_sensitive=False)
+def persist_pr_page_async(
+    team_id: int,
+    github_repo: str,
+    pr_nodes: list[dict],
+    result: SyncResult,
+    cutoff_date=None,
+    skip_before_date=None,
+    members: TeamMemberResolver | None = None,
+) -> int:
+    """Persist a page of PRs from a GraphQL response in bulk (async wrapper)."""
+    from apps.teams.models import Team
+
+    team = Team.objects.get(id=team_id)
+    return persist_pr_page(team, github_repo, pr_nodes, result, cutoff_date, skip_before_date, members)
@@ -10,7 +10,8 @@ from asgiref.sync import sync_to_async
 
 from apps.metrics.models import Commit, PRFile, PRReview, PullRequest, TeamMember
 from apps.metrics.processors import _calculate_cycle_time_hours, _calculate_time_diff_hours
-from apps.metrics.services.ai_detector import PATTERNS_VERSION, detect_ai_author, detect_ai_in_text
+from apps.metrics.services.ai_detector import PATTERNS_VERSION, AITextResult, detect_ai_author, detect_ai_in_text
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
 from ._utils import (
     MemberSyncResult,
@@ -26,19 +27,31 @@ from ._utils import (
 logger = logging.getLogger(__name__)
 
 
-def _detect_pr_ai_involvement(author_login: str | None, title: str, body: str) -> tuple[bool, list[str]]:
+def _pr_detection_text(title: str, body: str) -> str:
+    """Text scanned for AI signatures in a synced PR."""
+    return f"{title}\n{body}"
+
+
+def _detect_pr_ai_involvement(
+    author_login: str | None,
+    title: str,
+    body: str,
+    text_ai_result: AITextResult | None = None,
+) -> tuple[bool, list[str]]:
     """Detect AI involvement in a PR from author and text.
 
     Args:
         author_login: GitHub login of PR author
         title: PR title
         body: PR body text
+        text_ai_result: Precomputed detect_ai_in_texts() result for the PR text, if batched
 
     Returns:
         Tuple of (is_ai_assisted, ai_tools_detected)
     """
     author_ai_result = detect_ai_author(author_login)
-    text_ai_result = detect_ai_in_text(f"{title}\n{body}")
+    if text_ai_result is None:
+        text_ai_result = detect_ai_in_text(_pr_detection_text(title, body))
 
     # Combine AI detection results
     ai_tools = list(text_ai_result["ai_tools"])  # Copy to avoid mutation
@@ -65,6 +78,7 @@ def _process_reviews(
     pr: PullRequest,
     review_nodes: list[dict],
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> None:
     """Process PR reviews from GraphQL response."""
     earliest_review_at = None
@@ -72,7 +86,7 @@ def _process_reviews(
     for review_data in review_nodes:
         review_id = review_data.get("databaseId")
         reviewer_login = review_data.get("author", {}).get("login") if review_data.get("author") else None
-        reviewer = _get_team_member(team, reviewer_login)
+        reviewer = _get_team_member(team, reviewer_login, members)
 
         submitted_at = _parse_datetime(review_data.get("submittedAt"))
 
@@ -126,6 +140,7 @@ def _process_commits(
     github_repo: str,
     commit_nodes: list[dict],
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> None:
     """Process PR commits from GraphQL response."""
     for commit_node in commit_nodes:
@@ -137,7 +152,7 @@ def _process_commits(
         author_data = commit_data.get("author", {})
         author_user = author_data.get("user", {}) if author_data else {}
         author_login = author_user.get("login") if author_user else None
-        author = _get_team_member(team, author_login)
+        author = _get_team_member(team, author_login, members)
 
         commit_defaults = {
             "message": commit_data.get("message", ""),
@@ -243,6 +258,7 @@ def _process_pr(
     cutoff_date,
     skip_before_date,
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> bool:
     """Process a single PR from GraphQL response.
 
@@ -277,7 +293,7 @@ def _process_pr(
     if not author_data:
         raise ValueError("PR has no author data")
     author_login = author_data.get("login")
-    author = _get_team_member(team, author_login)
+    author = _get_team_member(team, author_login, members)
 
     # Map PR data to model fields (pr_number already extracted at start of function)
     title = pr_data.get("title", "")
@@ -350,14 +366,14 @@ def _process_pr(
     )
 
     try:
-        _process_reviews(team, pr, reviews_nodes, result)
+        _process_reviews(team, pr, reviews_nodes, result, members)
         logger.info(f"[SYNC_DEBUG] PR #{pr_number}: After _process_reviews, reviews_synced={result.reviews_synced}")
     except Exception as e:
         logger.error(f"[SYNC_DEBUG] PR #{pr_number}: _process_reviews FAILED: {type(e).__name__}: {e}")
         raise
 
     try:
-        _process_commits(team, pr, github_repo, commits_nodes, result)
+        _process_commits(team, pr, github_repo, commits_nodes, result, members)
         logger.info(f"[SYNC_DEBUG] PR #{pr_number}: After _process_commits, commits_synced={result.commits_synced}")
     except Exception as e:
         logger.error(f"[SYNC_DEBUG] PR #{pr_number}: _process_commits FAILED: {type(e).__name__}: {e}")
@@ -381,6 +397,7 @@ def _process_pr_async(
     cutoff_date,
     skip_before_date,
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> bool:
     """Process a single PR from GraphQL response (async wrapper).
 
@@ -399,7 +416,7 @@ def _process_pr_async(
         logger.error(f"[SYNC_DEBUG] _process_pr_async() Team NOT FOUND: {team_id}")
         raise
 
-    result_val = _process_pr(team, github_repo, pr_data, cutoff_date, skip_before_date, result)
+    result_val = _process_pr(team, github_repo, pr_data, cutoff_date, skip_before_date, result, members)
     logger.info(f"[SYNC_DEBUG] _process_pr_async() returned: {result_val}")
     return result_val
 
@@ -409,6 +426,7 @@ def _process_pr_incremental(
     github_repo: str,
     pr_data: dict,
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> None:
     """Process a single PR from GraphQL response for incremental sync.
 
@@ -421,7 +439,7 @@ def _process_pr_incremental(
     # Get author
     author_data = pr_data.get("author")
     author_login = author_data.get("login") if author_data else None
-    author = _get_team_member(team, author_login)
+    author = _get_team_member(team, author_login, members)
 
     # Map PR data to model fields
     pr_number = pr_data.get("number")
@@ -459,13 +477,19 @@ def _process_pr_incremental(
     _update_pr_timing_metrics(pr)
 
     # Process nested data
-    _process_reviews(team, pr, pr_data.get("reviews", {}).get("nodes", []), result)
-    _process_commits(team, pr, github_repo, pr_data.get("commits", {}).get("nodes", []), result)
+    _process_reviews(team, pr, pr_data.get("reviews", {}).get("nodes", []), result, members)
+    _process_commits(team, pr, github_repo, pr_data.get("commits", {}).get("nodes", []), result, members)
     _process_files(team, pr, pr_data.get("files", {}).get("nodes", []), result)
 
 
 @sync_to_async
-def _process_pr_incremental_async(team_id: int, github_repo: str, pr_data: dict, result: SyncResult) -> None:
+def _process_pr_incremental_async(
+    team_id: int,
+    github_repo: str,
+    pr_data: dict,
+    result: SyncResult,
+    members: TeamMemberResolver | None = None,
+) -> None:
     """Process a single PR from GraphQL response for incremental sync (async wrapper).
 
     Unlike full sync, incremental sync does not filter by date - it processes all PRs
@@ -474,7 +498,7 @@ def _process_pr_incremental_async(team_id: int, github_repo: str, pr_data: dict,
     from apps.teams.models import Team
 
     team = Team.objects.get(id=team_id)
-    _process_pr_incremental(team, github_repo, pr_data, result)
+    _process_pr_incremental(team, github_repo, pr_data, result, members)
 
 
 def _process_pr_from_search(
@@ -482,6 +506,7 @@ def _process_pr_from_search(
     github_repo: str,
     pr_data: dict,
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> bool:
     """Process a single PR from Search API response.
 
@@ -502,7 +527,7 @@ def _process_pr_from_search(
     if not author_data:
         raise ValueError("PR has no author data")
     author_login = author_data.get("login")
-    author = _get_team_member(team, author_login)
+    author = _get_team_member(team, author_login, members)
 
     # Map PR data to model fields
     title = pr_data.get("title", "")
@@ -569,8 +594,8 @@ def _process_pr_from_search(
     )
 
     # Process nested data
-    _process_reviews(team, pr, reviews_nodes, result)
-    _process_commits(team, pr, github_repo, commits_nodes, result)
+    _process_reviews(team, pr, reviews_nodes, result, members)
+    _process_commits(team, pr, github_repo, commits_nodes, result, members)
     _process_files(team, pr, files_nodes, result)
 
     return True
@@ -582,6 +607,7 @@ def _process_pr_from_search_async(
     github_repo: str,
     pr_data: dict,
     result: SyncResult,
+    members: TeamMemberResolver | None = None,
 ) -> bool:
     """Process a single PR from Search API response (async wrapper).
 
@@ -603,7 +629,7 @@ def _process_pr_from_search_async(
         logger.error(f"[SYNC_DEBUG] _process_pr_from_search_async() Team NOT FOUND: {team_id}")
         raise
 
-    return _process_pr_from_search(team, github_repo, pr_data, result)
+    return _process_pr_from_search(team, github_repo, pr_data, result, members)
 
 
 def _process_member(team, member_data: dict, result: MemberSyncResult) -> None:
@@ -655,8 +681,9 @@ def _process_pr_nested_data_async(team_id: int, pr, github_repo: str, pr_data: d
     from apps.teams.models import Team
 
     team = Team.objects.get(id=team_id)
+    members = TeamMemberResolver(team_id)
 
     # Process nested data using existing helpers
-    _process_reviews(team, pr, pr_data.get("reviews", {}).get("nodes", []), result)
-    _process_commits(team, pr, github_repo, pr_data.get("commits", {}).get("nodes", []), result)
+    _process_reviews(team, pr, pr_data.get("reviews", {}).get("nodes", []), result, members)
+    _process_commits(team, pr, github_repo, pr_data.get("commits", {}).get("nodes", []), result, members)
     _process_files(team, pr, pr_data.get("files", {}).get("nodes", []), result)
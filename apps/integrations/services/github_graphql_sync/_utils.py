@@ -13,6 +13,7 @@ from django.utils import timezone
 
 from apps.integrations.models import TrackedRepository
 from apps.metrics.models import TeamMember
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
 logger = logging.getLogger(__name__)
 
@@ -117,10 +118,15 @@ def _map_file_status(graphql_change_type: str) -> str:
     return status_mapping.get(graphql_change_type, "modified")
 
 
-def _get_team_member(team, github_login: str | None) -> TeamMember | None:
-    """Get TeamMember by GitHub login, or None if not found."""
+def _get_team_member(team, github_login: str | None, members: TeamMemberResolver | None = None) -> TeamMember | None:
+    """Get TeamMember by GitHub login, or None if not found.
+
+    Looks up in members (the sync run's resolver) when given, else queries.
+    """
     if not github_login:
         return None
+    if members is not None:
+        return members.by_login(github_login)
     try:
         return TeamMember.objects.get(team=team, github_username=github_login)
     except TeamMember.DoesNotExist:
@@ -206,7 +212,7 @@ def _set_prs_total(tracked_repo_id: int, total: int) -> None:
 
 
 @sync_to_async
-def _increment_prs_processed(tracked_repo_id: int) -> None:
+def _increment_prs_processed(tracked_repo_id: int, count: int = 1) -> None:
     """Increment sync_prs_completed on TrackedRepository (async-safe).
 
     Uses F() expression for atomic increment.
@@ -214,7 +220,7 @@ def _increment_prs_processed(tracked_repo_id: int) -> None:
     from django.db.models import F
 
     TrackedRepository.objects.filter(id=tracked_repo_id).update(  # noqa: TEAM001
-        sync_prs_completed=F("sync_prs_completed") + 1
+        sync_prs_completed=F("sync_prs_completed") + count
     )
 
 
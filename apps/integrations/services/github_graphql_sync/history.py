@@ -1,8 +1,18 @@
 """Full history sync functions for GitHub GraphQL sync.
 
 Contains sync_repository_history_graphql and sync_repository_history_by_search.
+
+Both functions prefetch the next page while the current one is persisted, so
+network latency and database writes overlap.
+
+sync_repository_history_graphql pages through PRs newest first with a page
+size chosen by GraphQLPagePlanner, stops once the rest of the history is older
+than the cutoff, and completes nested reviews/commits/files that overflowed
+the bulk page with targeted follow-up queries.
 """
 
+import asyncio
+import contextlib
 import logging
 from datetime import timedelta
 from typing import Any
@@ -12,12 +22,19 @@ from django.utils import timezone
 # Import the parent package to enable test mocking at the package level
 # Tests mock apps.integrations.services.github_graphql_sync.GitHubGraphQLClient
 from apps.integrations.services import github_graphql_sync as _pkg
+from apps.integrations.services.github_graphql import (
+    PR_CONNECTION_QUERIES,
+    GraphQLPagePlanner,
+    GraphQLRateLimitBudget,
+)
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
-from ._processors import _process_pr_async, _process_pr_from_search_async
+from ._bulk_writer import persist_pr_page_async
 from ._utils import (
     SyncResult,
     _get_access_token,
     _increment_prs_processed,
+    _parse_datetime,
     _set_prs_total,
     _update_sync_complete,
     _update_sync_progress,
@@ -26,16 +43,88 @@ from ._utils import (
 
 logger = logging.getLogger(__name__)
 
+# Follow-up queries for overflowing PR connections in flight at once
+MAX_CONCURRENT_CONNECTION_QUERIES = 4
+
+
+async def _cancel_prefetch(task: asyncio.Task | None) -> None:
+    """Cancel a prefetched page request that will not be consumed."""
+    if task is None or task.done():
+        return
+    task.cancel()
+    with contextlib.suppress(BaseException):
+        await task
+
+
+def _in_sync_window(pr_data: dict, cutoff_date, skip_before_date) -> bool:
+    """Whether a PR node was created inside [cutoff_date, skip_before_date]."""
+    created_at = _parse_datetime(pr_data.get("createdAt"))
+    if created_at is None:
+        return True
+    if cutoff_date and created_at < cutoff_date:
+        return False
+    return not (skip_before_date and created_at > skip_before_date)
+
+
+def _page_reaches_cutoff(pr_nodes: list[dict], cutoff_date) -> bool:
+    """Whether a CREATED_AT DESC page ends before cutoff_date, so later pages are entirely older."""
+    if not pr_nodes:
+        return False
+    created_at = _parse_datetime(pr_nodes[-1].get("createdAt"))
+    return created_at is not None and created_at < cutoff_date
+
+
+async def _fetch_overflowing_connections(client, owner: str, repo: str, pr_nodes: list[dict]) -> int:
+    """Complete nested connections that reported hasNextPage in a bulk page.
+
+    Remaining reviews/commits/files are fetched page by page and appended to
+    the PR node in place, so the page is persisted with complete data. At most
+    MAX_CONCURRENT_CONNECTION_QUERIES connections are completed at once.
+
+    Returns:
+        Number of follow-up queries sent
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTION_QUERIES)
+
+    async def complete(pr_data: dict, connection: str) -> int:
+        data = pr_data[connection]
+        page_info = data.get("pageInfo") or {}
+        queries = 0
+        async with semaphore:
+            while page_info.get("hasNextPage"):
+                page = await client.fetch_pr_connection_page(
+                    owner, repo, pr_data["number"], connection, page_info.get("endCursor")
+                )
+                data.setdefault("nodes", []).extend(page.get("nodes", []))
+                page_info = page.get("pageInfo") or {}
+                queries += 1
+        data["pageInfo"] = page_info
+        return queries
+
+    overflowing = [
+        (pr_data, connection)
+        for pr_data in pr_nodes
+        for connection in PR_CONNECTION_QUERIES
+        if ((pr_data.get(connection) or {}).get("pageInfo") or {}).get("hasNextPage")
+    ]
+    if not overflowing:
+        return 0
+    counts = await asyncio.gather(*(complete(pr_data, connection) for pr_data, connection in overflowing))
+    logger.info(f"Completed {len(overflowing)} overflowing PR connections in {owner}/{repo} with {sum(counts)} queries")
+    return sum(counts)
+
 
 async def sync_repository_history_graphql(
     tracked_repo,
     days_back: int = 90,
     skip_recent: int = 0,
+    rate_limit_budget: GraphQLRateLimitBudget | None = None,
 ) -> dict[str, Any]:
     """Sync repository PR history using GraphQL API.
 
     Fetches all PRs (with reviews, commits, files) in bulk using GraphQL pagination.
-    Much faster than REST API for historical sync.
+    Much faster than REST API for historical sync. Pagination stops at the first
+    page ending before the cutoff, since PRs are ordered by creation date.
 
     Supports two-phase onboarding:
     - Phase 1: days_back=30, skip_recent=0 (sync recent 30 days)
@@ -45,6 +134,7 @@ async def sync_repository_history_graphql(
         tracked_repo: TrackedRepository instance to sync
         days_back: Only sync PRs created within this many days (default 90)
         skip_recent: Skip PRs from the most recent N days (default 0)
+        rate_limit_budget: Rate limit budget shared with concurrent syncs on the same token
 
     Returns:
         Dict with sync results:
@@ -84,15 +174,27 @@ async def sync_repository_history_graphql(
     cutoff_date = now - timedelta(days=days_back)
     skip_before_date = now - timedelta(days=skip_recent) if skip_recent > 0 else None
 
-    # Create GraphQL client
-    client = _pkg.GitHubGraphQLClient(access_token)
+    # Create GraphQL client; the planner sizes each page from the previous ones
+    client = _pkg.GitHubGraphQLClient(
+        access_token, rate_limit_budget=rate_limit_budget, page_planner=GraphQLPagePlanner()
+    )
 
     # Update sync status to syncing
     await _update_sync_status(tracked_repo_id, "syncing")
 
+    # Authors/reviewers are resolved from one query for the whole run
+    members = TeamMemberResolver(team_id)
+
+    async def fetch_page(cursor: str | None) -> dict:
+        response = await client.fetch_prs_bulk(owner=owner, repo=repo, cursor=cursor)
+        pr_nodes = response.get("repository", {}).get("pullRequests", {}).get("nodes", [])
+        # Only PRs that will be persisted are worth completing
+        in_window = [pr_data for pr_data in pr_nodes if _in_sync_window(pr_data, cutoff_date, skip_before_date)]
+        await _fetch_overflowing_connections(client, owner, repo, in_window)
+        return response
+
+    next_page = None
     try:
-        cursor = None
-        has_more = True
         prs_processed = 0
 
         # Get accurate PR count for date range using Search API
@@ -114,10 +216,14 @@ async def sync_repository_history_graphql(
         if total_prs > 0:
             await _update_sync_progress(tracked_repo_id, 0, total_prs)
 
-        while has_more:
-            # Fetch page of PRs
+        next_page = asyncio.create_task(fetch_page(None))
+        while next_page is not None:
+            # Wait for the page that was prefetched while the previous one was persisted
             try:
-                response = await client.fetch_prs_bulk(owner=owner, repo=repo, cursor=cursor)
+                response = await next_page
+            except _pkg.GitHubGraphQLBudgetExhaustedError:
+                # The task reschedules the sync; PRs persisted so far are kept
+                raise
             except _pkg.GitHubGraphQLRateLimitError as e:
                 result.errors.append(f"Rate limit exceeded: {e}")
                 await _update_sync_status(tracked_repo_id, "error")
@@ -152,41 +258,35 @@ async def sync_repository_history_graphql(
                 # Initialize progress with total count
                 await _update_sync_progress(tracked_repo_id, 0, total_prs)
 
-            # Process each PR
-            logger.info(f"[SYNC_DEBUG] About to process {len(pr_nodes)} PRs from this page")
-            for pr_data in pr_nodes:
-                pr_num = pr_data.get("number", "?")
-                logger.info(f"[SYNC_DEBUG] CALLING _process_pr_async for PR #{pr_num}")
-                try:
-                    was_processed = await _process_pr_async(
-                        team_id, full_name, pr_data, cutoff_date, skip_before_date, result
-                    )
-                    logger.info(f"[SYNC_DEBUG] _process_pr_async returned {was_processed} for PR #{pr_num}")
-                    if was_processed:
-                        prs_processed += 1
-                except Exception as e:
-                    pr_number = pr_data.get("number", "unknown")
-                    error_msg = f"Error processing PR #{pr_number}: {type(e).__name__}: {e}"
-                    logger.warning(error_msg)
-                    result.errors.append(error_msg)
-                    # Don't increment prs_processed on error - PR wasn't successfully synced
+            # Start fetching the next page before persisting this one
+            next_page = None
+            if _page_reaches_cutoff(pr_nodes, cutoff_date):
+                logger.info(f"Reached PRs created before {cutoff_date.date()} in {owner}/{repo}, stopping pagination")
+            elif page_info.get("hasNextPage", False):
+                next_page = asyncio.create_task(fetch_page(page_info.get("endCursor")))
+
+            # Persist the whole page in bulk (skips PRs outside the date range)
+            logger.info(f"[SYNC_DEBUG] About to persist {len(pr_nodes)} PRs from this page")
+            prs_processed += await persist_pr_page_async(
+                team_id, full_name, pr_nodes, result, cutoff_date, skip_before_date, members
+            )
 
             # Update progress after each batch
             await _update_sync_progress(tracked_repo_id, prs_processed, total_prs)
 
-            # Check pagination
-            has_more = page_info.get("hasNextPage", False)
-            cursor = page_info.get("endCursor")
-
         # Update sync status to complete (also sets progress to 100%)
         await _update_sync_progress(tracked_repo_id, total_prs, total_prs)
         await _update_sync_complete(tracked_repo_id)
 
+    except _pkg.GitHubGraphQLBudgetExhaustedError:
+        raise
     except Exception as e:
         error_msg = f"Unexpected error during sync: {type(e).__name__}: {e}"
         logger.error(error_msg)
         result.errors.append(error_msg)
         await _update_sync_status(tracked_repo_id, "error")
+    finally:
+        await _cancel_prefetch(next_page)
 
     return result.to_dict()
 
@@ -195,6 +295,7 @@ async def sync_repository_history_by_search(
     tracked_repo,
     days_back: int = 90,
     skip_recent: int = 0,
+    rate_limit_budget: GraphQLRateLimitBudget | None = None,
 ) -> dict[str, Any]:
     """Sync repository PR history using GitHub Search API.
 
@@ -212,6 +313,7 @@ async def sync_repository_history_by_search(
         tracked_repo: TrackedRepository instance to sync
         days_back: Only sync PRs created within this many days (default 90)
         skip_recent: Skip PRs from the most recent N days (default 0)
+        rate_limit_budget: Rate limit budget shared with concurrent syncs on the same token
 
     Returns:
         Dict with sync results:
@@ -254,27 +356,38 @@ async def sync_repository_history_by_search(
     until_date = now - timedelta(days=skip_recent) if skip_recent > 0 else None
 
     # Create GraphQL client
-    client = _pkg.GitHubGraphQLClient(access_token)
+    client = _pkg.GitHubGraphQLClient(access_token, rate_limit_budget=rate_limit_budget)
 
     # Update sync status to syncing
     await _update_sync_status(tracked_repo_id, "syncing")
 
+    # Authors/reviewers are resolved from one query for the whole run
+    members = TeamMemberResolver(team_id)
+
+    def fetch_page(cursor: str | None) -> asyncio.Task:
+        return asyncio.create_task(
+            client.search_prs_by_date_range(
+                owner=owner,
+                repo=repo,
+                since=since_date,
+                until=until_date,
+                cursor=cursor,
+            )
+        )
+
+    next_page = None
     try:
-        cursor = None
-        has_more = True
         prs_processed = 0
         total_prs = 0
 
-        while has_more:
-            # Fetch page of PRs using Search API
+        next_page = fetch_page(None)
+        while next_page is not None:
+            # Wait for the page that was prefetched while the previous one was persisted
             try:
-                response = await client.search_prs_by_date_range(
-                    owner=owner,
-                    repo=repo,
-                    since=since_date,
-                    until=until_date,
-                    cursor=cursor,
-                )
+                response = await next_page
+            except _pkg.GitHubGraphQLBudgetExhaustedError:
+                # The task reschedules the sync; PRs persisted so far are kept
+                raise
             except _pkg.GitHubGraphQLRateLimitError as e:
                 result.errors.append(f"Rate limit exceeded: {e}")
                 await _update_sync_status(tracked_repo_id, "error")
@@ -308,38 +421,30 @@ async def sync_repository_history_by_search(
                 # Also update TrackedRepository.prs_total
                 await _set_prs_total(tracked_repo_id, total_prs)
 
-            # Process each PR - no date filtering needed, Search API handles it
-            for pr_data in pr_nodes:
-                pr_num = pr_data.get("number", "?")
-                logger.info(f"[SYNC_DEBUG] Processing PR #{pr_num} from Search API")
-                try:
-                    # Process without cutoff_date/skip_before_date - Search API already filtered
-                    was_processed = await _process_pr_from_search_async(team_id, full_name, pr_data, result)
-                    if was_processed:
-                        prs_processed += 1
-                        # Update prs_processed on TrackedRepository
-                        await _increment_prs_processed(tracked_repo_id)
-                except Exception as e:
-                    pr_number = pr_data.get("number", "unknown")
-                    error_msg = f"Error processing PR #{pr_number}: {type(e).__name__}: {e}"
-                    logger.warning(error_msg)
-                    result.errors.append(error_msg)
+            # Start fetching the next page before persisting this one
+            next_page = fetch_page(response.get("end_cursor")) if response.get("has_next_page", False) else None
+
+            # Persist the whole page in bulk - no date filtering needed, Search API handles it
+            page_processed = await persist_pr_page_async(team_id, full_name, pr_nodes, result, members=members)
+            if page_processed:
+                prs_processed += page_processed
+                await _increment_prs_processed(tracked_repo_id, page_processed)
 
             # Update progress after each batch
             await _update_sync_progress(tracked_repo_id, prs_processed, total_prs)
 
-            # Check pagination
-            has_more = response.get("has_next_page", False)
-            cursor = response.get("end_cursor")
-
         # Update sync status to complete (also sets progress to 100%)
         await _update_sync_progress(tracked_repo_id, total_prs, total_prs)
         await _update_sync_complete(tracked_repo_id)
 
+    except _pkg.GitHubGraphQLBudgetExhaustedError:
+        raise
     except Exception as e:
         error_msg = f"Unexpected error during search-based sync: {type(e).__name__}: {e}"
         logger.error(error_msg)
         result.errors.append(error_msg)
         await _update_sync_status(tracked_repo_id, "error")
+    finally:
+        await _cancel_prefetch(next_page)
 
     return result.to_dict()
@@ -6,8 +6,12 @@ Contains sync_repository_incremental_graphql for syncing only recently updated P
 import logging
 from typing import Any
 
+from apps.integrations.services.github_graphql import GraphQLRateLimitBudget
+
 # Import the parent package to enable test mocking at the package level
 # Tests mock apps.integrations.services.github_graphql_sync.GitHubGraphQLClient
+from apps.metrics.services.member_resolver import TeamMemberResolver
+
 from ._processors import _process_pr_incremental_async
 from ._utils import (
     SyncResult,
@@ -21,7 +25,10 @@ from ._utils import (
 logger = logging.getLogger(__name__)
 
 
-async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
+async def sync_repository_incremental_graphql(
+    tracked_repo,
+    rate_limit_budget: GraphQLRateLimitBudget | None = None,
+) -> dict[str, Any]:
     """Sync repository PRs updated since last sync using GraphQL API.
 
     Fetches only PRs that have been updated since the last sync, making it
@@ -29,6 +36,7 @@ async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
 
     Args:
         tracked_repo: TrackedRepository instance to sync (must have last_sync_at set)
+        rate_limit_budget: Rate limit budget shared with concurrent syncs on the same token
 
     Returns:
         Dict with sync results:
@@ -67,11 +75,14 @@ async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
     # Tests mock apps.integrations.services.github_graphql_sync.GitHubGraphQLClient
     from apps.integrations.services import github_graphql_sync as _pkg
 
-    client = _pkg.GitHubGraphQLClient(access_token)
+    client = _pkg.GitHubGraphQLClient(access_token, rate_limit_budget=rate_limit_budget)
 
     # Update sync status to syncing
     await _update_sync_status(tracked_repo_id, "syncing")
 
+    # Authors/reviewers are resolved from one query for the whole run
+    members = TeamMemberResolver(team_id)
+
     try:
         cursor = None
         has_more = True
@@ -84,6 +95,9 @@ async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
             # Fetch page of updated PRs
             try:
                 response = await client.fetch_prs_updated_since(owner=owner, repo=repo, since=since, cursor=cursor)
+            except _pkg.GitHubGraphQLBudgetExhaustedError:
+                # The task reschedules the sync; PRs persisted so far are kept
+                raise
             except _pkg.GitHubGraphQLRateLimitError as e:
                 result.errors.append(f"Rate limit exceeded: {e}")
                 await _update_sync_status(tracked_repo_id, "error")
@@ -115,7 +129,7 @@ async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
                 all_older_than_since = False
 
                 try:
-                    await _process_pr_incremental_async(team_id, full_name, pr_data, result)
+                    await _process_pr_incremental_async(team_id, full_name, pr_data, result, members)
                     prs_processed += 1
                 except Exception as e:
                     pr_number = pr_data.get("number", "unknown")
@@ -142,6 +156,8 @@ async def sync_repository_incremental_graphql(tracked_repo) -> dict[str, Any]:
         await _update_sync_progress(tracked_repo_id, prs_processed, prs_processed)
         await _update_sync_complete(tracked_repo_id)
 
+    except _pkg.GitHubGraphQLBudgetExhaustedError:
+        raise
     except Exception as e:
         error_msg = f"Unexpected error during incremental sync: {type(e).__name__}: {e}"
         logger.error(error_msg)
@@ -0,0 +1,106 @@
+"""Concurrent history sync across repositories.
+
+Contains sync_repositories_history, which syncs several repositories at once.
+Repositories that share a GitHub App installation (or OAuth integration) use
+the same access token and therefore the same GraphQL quota, so each group gets
+one GraphQLRateLimitBudget and a bounded number of concurrent syncs.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from asgiref.sync import sync_to_async
+
+from apps.integrations.services.github_graphql import GraphQLRateLimitBudget
+
+from .history import sync_repository_history_by_search, sync_repository_history_graphql
+
+logger = logging.getLogger(__name__)
+
+# Repositories synced at once per installation
+DEFAULT_MAX_CONCURRENT_REPOS = 4
+
+
+def _token_group_key(tracked_repo) -> tuple[str, int | None]:
+    """Key of the access token a repository syncs with (App installation preferred)."""
+    if tracked_repo.app_installation_id:
+        return ("app_installation", tracked_repo.app_installation_id)
+    return ("integration", tracked_repo.integration_id)
+
+
+async def sync_repositories_history(
+    tracked_repos: Iterable,
+    days_back: int = 90,
+    skip_recent: int = 0,
+    use_search_api: bool = False,
+    max_concurrent_repos: int = DEFAULT_MAX_CONCURRENT_REPOS,
+    on_repo_done: Callable[[Any, dict[str, Any] | Exception], None] | None = None,
+) -> dict[int, dict[str, Any] | Exception]:
+    """Sync PR history for several repositories concurrently.
+
+    Each repository runs through sync_repository_history_by_search (or
+    sync_repository_history_graphql) unchanged. Repositories are started in the
+    given order, so callers can pass them already prioritized.
+
+    Args:
+        tracked_repos: TrackedRepository instances to sync
+        days_back: Only sync PRs created within this many days (default 90)
+        skip_recent: Skip PRs from the most recent N days (default 0)
+        use_search_api: Use the Search API based sync instead of pullRequests
+        max_concurrent_repos: Maximum repositories syncing at once per installation
+        on_repo_done: Optional sync callback invoked as each repository finishes,
+            with the repository and its result dict or exception
+
+    Returns:
+        Dict mapping TrackedRepository ID to its sync result dict, or to the
+        exception that aborted its sync.
+    """
+    sync_fn = sync_repository_history_by_search if use_search_api else sync_repository_history_graphql
+
+    budgets: dict[tuple, GraphQLRateLimitBudget] = {}
+    semaphores: dict[tuple, asyncio.Semaphore] = {}
+    repos = list(tracked_repos)
+    for tracked_repo in repos:
+        key = _token_group_key(tracked_repo)
+        if key not in budgets:
+            budgets[key] = GraphQLRateLimitBudget()
+            semaphores[key] = asyncio.Semaphore(max(1, max_concurrent_repos))
+
+    async def sync_one(tracked_repo) -> dict[str, Any]:
+        key = _token_group_key(tracked_repo)
+        async with semaphores[key]:
+            logger.info(f"Starting concurrent history sync for {tracked_repo.full_name}")
+            try:
+                result = await sync_fn(
+                    tracked_repo,
+                    days_back=days_back,
+                    skip_recent=skip_recent,
+                    rate_limit_budget=budgets[key],
+                )
+            except Exception as e:
+                await _notify_repo_done(tracked_repo, e)
+                raise
+        await _notify_repo_done(tracked_repo, result)
+        return result
+
+    async def _notify_repo_done(tracked_repo, outcome) -> None:
+        if on_repo_done is None:
+            return
+        try:
+            await sync_to_async(on_repo_done)(tracked_repo, outcome)
+        except Exception as e:
+            # Progress reporting must never fail the sync itself
+            logger.warning(f"on_repo_done callback failed for {tracked_repo.full_name}: {e}")
+
+    outcomes = await asyncio.gather(*(sync_one(repo) for repo in repos), return_exceptions=True)
+
+    results: dict[int, dict[str, Any] | Exception] = {}
+    for tracked_repo, outcome in zip(repos, outcomes, strict=True):
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, Exception):
+            logger.error(f"Concurrent history sync failed for {tracked_repo.full_name}: {outcome}")
+        results[tracked_repo.id] = outcome
+    return results
@@ -1,15 +1,22 @@
-"""Single PR data fetch functions for GitHub GraphQL sync.
+"""PR data fetch functions for GitHub GraphQL sync.
 
-Contains fetch_pr_complete_data_graphql for fetching complete data for a single PR.
+Contains fetch_pr_complete_data_graphql for fetching complete data for a single PR,
+and fetch_prs_complete_data_graphql for several PRs of one repository with
+aliased multi-PR queries.
 """
 
 import logging
 from typing import Any
 
+from apps.integrations.services.github_graphql import PR_DETAILS_BATCH_SIZE
+from apps.metrics.services.member_resolver import TeamMemberResolver
+
 # Import the parent package to enable test mocking at the package level
 # Tests mock apps.integrations.services.github_graphql_sync.GitHubGraphQLClient
+from ._bulk_writer import persist_pr_page_async
 from ._processors import _process_pr_nested_data_async
 from ._utils import SyncResult, _get_access_token
+from .history import _fetch_overflowing_connections
 
 logger = logging.getLogger(__name__)
 
@@ -82,3 +89,79 @@ async def fetch_pr_complete_data_graphql(pr, tracked_repo) -> dict[str, Any]:
         result.errors.append(error_msg)
 
     return result.to_dict()
+
+
+async def fetch_prs_complete_data_graphql(prs: list, tracked_repo) -> dict[int, dict[str, Any]]:
+    """Fetch and sync complete data for several PRs of one repository.
+
+    PRs are fetched PR_DETAILS_BATCH_SIZE at a time with one aliased query,
+    overflowing reviews/commits/files are completed with follow-up queries, and
+    each batch is persisted together with the page-level bulk writer.
+
+    Note: Does not fetch check_runs or comments (use REST for those).
+
+    Args:
+        prs: PullRequest model instances belonging to tracked_repo
+        tracked_repo: TrackedRepository model instance
+
+    Returns:
+        dict: Per PullRequest id, sync counts with keys commits_synced, files_synced,
+        reviews_synced, errors. PRs that could not be fetched or persisted have errors.
+    """
+    results = {pr.id: SyncResult() for pr in prs}
+    full_name = tracked_repo.full_name
+    owner, repo = full_name.split("/")
+
+    access_token = await _get_access_token(tracked_repo.id)
+    if not access_token:
+        for result in results.values():
+            result.errors.append("No access token available for repository")
+        return {pr_id: result.to_dict() for pr_id, result in results.items()}
+
+    # Late import to access GitHubGraphQLClient through the package for test mocking
+    from apps.integrations.services import github_graphql_sync as _pkg
+
+    client = _pkg.GitHubGraphQLClient(access_token)
+    members = TeamMemberResolver(tracked_repo.team_id)
+
+    for start in range(0, len(prs), PR_DETAILS_BATCH_SIZE):
+        batch = prs[start : start + PR_DETAILS_BATCH_SIZE]
+        try:
+            nodes = await client.fetch_prs_by_number(owner, repo, [pr.github_pr_id for pr in batch])
+            await _fetch_overflowing_connections(client, owner, repo, [node for node in nodes.values() if node])
+        except Exception as e:
+            # Includes unknown PR numbers, which fail the whole aliased query
+            error_msg = f"GraphQL error fetching {len(batch)} PRs from {full_name}: {type(e).__name__}: {e}"
+            logger.warning(error_msg)
+            for pr in batch:
+                results[pr.id].errors.append(error_msg)
+            continue
+
+        found = []
+        for pr in batch:
+            pr_data = nodes.get(pr.github_pr_id)
+            if not pr_data:
+                results[pr.id].errors.append(f"PR #{pr.github_pr_id} not found in GraphQL response")
+            elif not pr_data.get("author"):
+                results[pr.id].errors.append(f"PR #{pr.github_pr_id} has no author data")
+            else:
+                found.append((pr, pr_data))
+        if not found:
+            continue
+
+        batch_result = SyncResult()
+        await persist_pr_page_async(
+            tracked_repo.team_id, full_name, [pr_data for _, pr_data in found], batch_result, members=members
+        )
+        for pr, pr_data in found:
+            # persist_pr_page reports per-PR failures as "Error processing PR #<number>: ..."
+            failed = [error for error in batch_result.errors if f"PR #{pr.github_pr_id}:" in error]
+            result = results[pr.id]
+            if failed:
+                result.errors.extend(failed)
+                continue
+            result.reviews_synced = len((pr_data.get("reviews") or {}).get("nodes") or [])
+            result.commits_synced = len((pr_data.get("commits") or {}).get("nodes") or [])
+            result.files_synced = len((pr_data.get("files") or {}).get("nodes") or [])
+
+    return {pr_id: result.to_dict() for pr_id, result in results.items()}
@@ -0,0 +1,208 @@
+"""Conditional requests for GitHub REST calls.
+
+GitHub answers a GET carrying If-None-Match or If-Modified-Since with an
+empty 304 when the resource hasn't changed, and an authorized 304 does not
+count against the primary rate limit. Scheduled syncs re-read many unchanged
+resources (repository languages, PR reviews and files, Copilot seats), so
+responses with an ETag or Last-Modified are kept in the Django cache (Redis
+in production) and their body is replayed when GitHub answers 304.
+
+Entries are keyed by a hash of the Authorization header, the Accept header
+and the full URL: GitHub varies responses on both headers, and scoping by
+token keeps one team's response from ever being replayed to another.
+
+Two entry points share the store:
+
+    conditional_get()               drop-in for requests.get() (Copilot client)
+    install_conditional_requests()  PyGithub clients send GETs through
+                                    ConditionalRequestAdapter
+
+get_conditional_request_stats() returns the counters: GETs sent with a
+validator, 304s replayed from the cache (requests saved) and responses stored.
+"""
+
+import hashlib
+import logging
+
+import requests
+from django.core.cache import cache
+from github.Requester import HTTPSRequestsConnectionClass, Requester
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "github:http"
+CACHE_TIMEOUT_SECONDS = 7 * 24 * 60 * 60
+# Large listings are rarely unchanged and would bloat Redis
+MAX_CACHED_BODY_BYTES = 1024 * 1024
+
+STAT_CONDITIONAL = "conditional"
+STAT_NOT_MODIFIED = "not_modified"
+STAT_STORED = "stored"
+_STATS = (STAT_CONDITIONAL, STAT_NOT_MODIFIED, STAT_STORED)
+
+# Headers describing the transfer rather than the body (stored bodies are already decoded)
+_TRANSFER_HEADERS = frozenset({"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding"})
+
+
+def cache_key(url: str, headers) -> str:
+    """Cache key of a GET to url, scoped to its token and Accept header."""
+    scope = "\n".join((headers.get("Authorization") or "", headers.get("Accept") or "", url))
+    return f"{CACHE_KEY_PREFIX}:{hashlib.sha256(scope.encode()).hexdigest()}"
+
+
+def get_conditional_request_stats() -> dict[str, int]:
+    """Counters since the cache was last flushed.
+
+    Returns:
+        dict with conditional (GETs sent with a validator), not_modified
+        (304s replayed from the cache, i.e. requests saved) and stored
+    """
+    keys = {name: _stat_key(name) for name in _STATS}
+    try:
+        values = cache.get_many(list(keys.values()))
+    except Exception as e:
+        logger.warning("Could not read GitHub HTTP cache stats: %s", e)
+        values = {}
+    return {name: values.get(key, 0) for name, key in keys.items()}
+
+
+def conditional_get(url: str, headers: dict | None = None, params: dict | None = None, **kwargs) -> requests.Response:
+    """requests.get() that revalidates cached GitHub responses.
+
+    Returns the cached body as a 200 response when GitHub answers 304.
+    """
+    headers = dict(headers or {})
+    key = cache_key(requests.Request("GET", url, params=params).prepare().url, headers)
+    entry = _prepare(key, headers)
+    response = requests.get(url, headers=headers, params=params, **kwargs)
+    return _complete(key, entry, response)
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """Transport adapter that revalidates cached GitHub GET responses.
+
+    Requests that already carry a validator (PyGithub's own update() calls)
+    are sent unchanged so that their caller still sees the 304.
+    """
+
+    def send(self, request, **kwargs):
+        if request.method != "GET" or _has_validator(request.headers):
+            return super().send(request, **kwargs)
+        key = cache_key(request.url, request.headers)
+        entry = _prepare(key, request.headers)
+        return _complete(key, entry, super().send(request, **kwargs))
+
+
+class ConditionalHTTPSConnection(HTTPSRequestsConnectionClass):
+    """PyGithub HTTPS connection whose session sends requests through ConditionalRequestAdapter."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.adapter = ConditionalRequestAdapter(
+            max_retries=self.retry, pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        self.session.mount("https://", self.adapter)
+
+
+def install_conditional_requests() -> None:
+    """Use ConditionalHTTPSConnection for every PyGithub client created from now on."""
+    # Requester.injectConnectionClasses() would also turn off connection reuse, so set the class directly
+    Requester._Requester__httpsConnectionClass = ConditionalHTTPSConnection
+
+
+def _has_validator(headers) -> bool:
+    return "If-None-Match" in headers or "If-Modified-Since" in headers
+
+
+def _prepare(key: str, headers) -> dict | None:
+    """Load the cached entry for key and add its validators to headers."""
+    try:
+        entry = cache.get(key)
+    except Exception as e:
+        logger.warning("GitHub HTTP cache unavailable: %s", e)
+        return None
+    if entry is None:
+        return None
+    if entry["etag"]:
+        headers["If-None-Match"] = entry["etag"]
+    if entry["last_modified"]:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    _count(STAT_CONDITIONAL)
+    return entry
+
+
+def _complete(key: str, entry: dict | None, response: requests.Response) -> requests.Response:
+    """Replay entry on a 304, store a cacheable 200, return anything else unchanged."""
+    if response.status_code == 304 and entry is not None:
+        _count(STAT_NOT_MODIFIED)
+        try:
+            cache.touch(key, CACHE_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.warning("GitHub HTTP cache unavailable: %s", e)
+        return _replay(entry, response)
+
+    if response.status_code == 200:
+        new_entry = _entry_from_response(response)
+        if new_entry is not None:
+            try:
+                cache.set(key, new_entry, CACHE_TIMEOUT_SECONDS)
+                _count(STAT_STORED)
+            except Exception as e:
+                logger.warning("GitHub HTTP cache unavailable: %s", e)
+    return response
+
+
+def _entry_from_response(response: requests.Response) -> dict | None:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    etag = etag if isinstance(etag, str) else None
+    last_modified = last_modified if isinstance(last_modified, str) else None
+    content = response.content
+    if (etag is None and last_modified is None) or not isinstance(content, bytes):
+        return None
+    if len(content) > MAX_CACHED_BODY_BYTES:
+        return None
+    return {
+        "etag": etag,
+        "last_modified": last_modified,
+        "status": response.status_code,
+        "headers": {name: value for name, value in response.headers.items() if name.lower() not in _TRANSFER_HEADERS},
+        "content": content,
+        "encoding": response.encoding,
+    }
+
+
+def _replay(entry: dict, not_modified: requests.Response) -> requests.Response:
+    """Cached response with the 304's headers (rate limit, date, validators) on top."""
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.headers.update(
+        {name: value for name, value in not_modified.headers.items() if name.lower() not in _TRANSFER_HEADERS}
+    )
+    response._content = entry["content"]
+    response.encoding = entry["encoding"]
+    response.url = not_modified.url
+    response.request = not_modified.request
+    response.elapsed = not_modified.elapsed
+    response.connection = getattr(not_modified, "connection", None)
+    return response
+
+
+def _stat_key(name: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:stats:{name}"
+
+
+def _count(name: str) -> None:
+    key = _stat_key(name)
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Counter doesn't exist yet (or expired with a flush)
+            cache.add(key, 1, timeout=None)
+    except Exception as e:
+        logger.warning("Could not update GitHub HTTP cache stats: %s", e)
@@ -105,77 +105,25 @@ def calculate_pr_iteration_metrics(pr: PullRequest) -> None:
     pr.save(update_fields=["total_comments", "commits_after_first_review", "review_rounds", "avg_fix_response_hours"])
 
 
-def calculate_reviewer_correlations(team) -> int:
+def calculate_reviewer_correlations(team, incremental: bool = False) -> int:
     """Calculate reviewer correlation statistics for a team.
 
     Analyzes PRReview records to find pairs of reviewers who reviewed the same PRs
-    and calculates their agreement/disagreement statistics.
+    and calculates their agreement/disagreement statistics. Pairs are computed
+    set-based in SQL; see apps.metrics.services.reviewer_correlations.
 
     Args:
         team: Team instance to calculate correlations for
+        incremental: Only recompute pairs affected by reviews changed since the last run
 
     Returns:
         Number of correlation records created/updated
     """
-    from collections import defaultdict
-    from itertools import combinations
-
-    from apps.metrics.models import PRReview, ReviewerCorrelation
-
-    # Get all reviews with definitive states (approved or changes_requested)
-    reviews = (
-        PRReview.objects.filter(team=team, state__in=["approved", "changes_requested"])
-        .select_related("pull_request", "reviewer")
-        .values("pull_request_id", "reviewer_id", "state")
+    from apps.metrics.services.reviewer_correlations import (
+        rebuild_reviewer_correlations,
+        update_reviewer_correlations,
     )
 
-    # Group reviews by PR
-    pr_reviews = defaultdict(dict)  # {pr_id: {reviewer_id: state}}
-    for review in reviews:
-        pr_id = review["pull_request_id"]
-        reviewer_id = review["reviewer_id"]
-        state = review["state"]
-        # If multiple reviews by same reviewer on same PR, take the last one
-        pr_reviews[pr_id][reviewer_id] = state
-
-    # Count agreements/disagreements for each pair
-    pair_stats = defaultdict(lambda: {"prs_reviewed_together": 0, "agreements": 0, "disagreements": 0})
-
-    for _pr_id, reviewers in pr_reviews.items():
-        # Get all reviewer pairs who reviewed this PR
-        reviewer_ids = list(reviewers.keys())
-        if len(reviewer_ids) < 2:
-            continue
-
-        for r1_id, r2_id in combinations(reviewer_ids, 2):
-            # Ensure consistent ordering (smaller ID first)
-            if r1_id > r2_id:
-                r1_id, r2_id = r2_id, r1_id
-
-            pair_key = (r1_id, r2_id)
-            pair_stats[pair_key]["prs_reviewed_together"] += 1
-
-            # Check agreement
-            r1_state = reviewers[r1_id]
-            r2_state = reviewers[r2_id]
-            if r1_state == r2_state:
-                pair_stats[pair_key]["agreements"] += 1
-            else:
-                pair_stats[pair_key]["disagreements"] += 1
-
-    # Clear existing correlations for this team and create fresh ones
-    ReviewerCorrelation.objects.filter(team=team).delete()
-
-    correlations_created = 0
-    for (r1_id, r2_id), stats in pair_stats.items():
-        ReviewerCorrelation.objects.create(
-            team=team,
-            reviewer_1_id=r1_id,
-            reviewer_2_id=r2_id,
-            prs_reviewed_together=stats["prs_reviewed_together"],
-            agreements=stats["agreements"],
-            disagreements=stats["disagreements"],
-        )
-        correlations_created += 1
-
-    return correlations_created
+    if incremental:
+        return update_reviewer_correlations(team.id)
+    return rebuild_reviewer_correlations(team.id)
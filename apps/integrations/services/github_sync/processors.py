@@ -14,6 +14,7 @@ from apps.integrations.services.github_sync.client import get_pull_request_revie
 
 if TYPE_CHECKING:
     from apps.metrics.models import PullRequest
+    from apps.metrics.services.member_resolver import TeamMemberResolver
 
 
 def sync_pr_reviews(
@@ -23,6 +24,7 @@ def sync_pr_reviews(
     repo_full_name: str,
     team,
     errors: list,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Sync reviews for a single pull request.
 
@@ -33,6 +35,7 @@ def sync_pr_reviews(
         repo_full_name: Repository full name (owner/repo)
         team: Team instance
         errors: List to append error messages to
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of reviews successfully synced
@@ -60,7 +63,7 @@ def sync_pr_reviews(
                     github_review_id=review_data["id"],
                     defaults={
                         "pull_request": pr,
-                        "reviewer": _get_team_member_by_github_id(team, str(review_data["user"]["id"])),
+                        "reviewer": _get_team_member_by_github_id(team, str(review_data["user"]["id"]), members),
                         "state": review_data["state"].lower(),
                         "submitted_at": _parse_github_timestamp(review_data["submitted_at"]),
                     },
@@ -99,6 +102,7 @@ def sync_pr_commits(
     repo_full_name: str,
     team,
     errors: list,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Sync commits for a single pull request.
 
@@ -109,6 +113,7 @@ def sync_pr_commits(
         repo_full_name: Repository full name (owner/repo)
         team: Team instance
         errors: List to append error messages to
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of commits successfully synced
@@ -137,7 +142,7 @@ def sync_pr_commits(
                 # Look up author by github_id (may be None)
                 author = None
                 if commit.author is not None:
-                    author = _get_team_member_by_github_id(team, str(commit.author.id))
+                    author = _get_team_member_by_github_id(team, str(commit.author.id), members)
 
                 # Create or update commit record
                 Commit.objects.update_or_create(
@@ -323,6 +328,7 @@ def _sync_pr_comments(
     errors: list,
     comment_type: str,
     get_comments_method: str,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Generic helper to sync PR comments from GitHub.
 
@@ -335,6 +341,7 @@ def _sync_pr_comments(
         errors: List to append error messages to
         comment_type: Type of comment ("issue" or "review")
         get_comments_method: PyGithub PR method name to call ("get_issue_comments" or "get_review_comments")
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of comments successfully synced
@@ -359,7 +366,7 @@ def _sync_pr_comments(
                 # Map author to TeamMember
                 author = None
                 if comment.user:
-                    author = _get_team_member_by_github_id(team, str(comment.user.id))
+                    author = _get_team_member_by_github_id(team, str(comment.user.id), members)
 
                 # Build defaults dict with common fields
                 defaults = {
@@ -410,6 +417,7 @@ def sync_pr_issue_comments(
     repo_full_name: str,
     team,
     errors: list,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Sync issue comments (general PR comments) from GitHub.
 
@@ -420,6 +428,7 @@ def sync_pr_issue_comments(
         repo_full_name: Repository full name (owner/repo)
         team: Team instance
         errors: List to append error messages to
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of issue comments successfully synced
@@ -433,6 +442,7 @@ def sync_pr_issue_comments(
         errors=errors,
         comment_type="issue",
         get_comments_method="get_issue_comments",
+        members=members,
     )
 
 
@@ -443,6 +453,7 @@ def sync_pr_review_comments(
     repo_full_name: str,
     team,
     errors: list,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Sync review comments (inline code comments) from GitHub.
 
@@ -453,6 +464,7 @@ def sync_pr_review_comments(
         repo_full_name: Repository full name (owner/repo)
         team: Team instance
         errors: List to append error messages to
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of review comments successfully synced
@@ -466,6 +478,7 @@ def sync_pr_review_comments(
         errors=errors,
         comment_type="review",
         get_comments_method="get_review_comments",
+        members=members,
     )
 
 
@@ -474,6 +487,7 @@ def sync_repository_deployments(
     access_token: str,
     team,
     errors: list,
+    members: TeamMemberResolver | None = None,
 ) -> int:
     """Sync deployments from a GitHub repository.
 
@@ -482,6 +496,7 @@ def sync_repository_deployments(
         access_token: GitHub OAuth access token
         team: Team instance
         errors: List to append error messages to
+        members: Per-sync resolver for author lookups (queries per lookup if None)
 
     Returns:
         Number of deployments successfully synced
@@ -514,7 +529,7 @@ def sync_repository_deployments(
                 # Map creator to TeamMember if present
                 creator = None
                 if deployment.creator:
-                    creator = _get_team_member_by_github_id(team, str(deployment.creator.id))
+                    creator = _get_team_member_by_github_id(team, str(deployment.creator.id), members)
 
                 # Create or update deployment record
                 Deployment.objects.update_or_create(
@@ -27,6 +27,7 @@ from apps.integrations.services.github_sync.processors import (
     sync_pr_reviews,
     sync_repository_deployments,
 )
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
 if TYPE_CHECKING:
     from apps.integrations.models import TrackedRepository
@@ -36,6 +37,7 @@ def _process_prs(
     prs_data,
     tracked_repo: TrackedRepository,
     access_token: str,
+    members: TeamMemberResolver | None = None,
 ) -> dict:
     """Process PR data and sync to database.
 
@@ -43,6 +45,7 @@ def _process_prs(
         prs_data: Iterable of PR dictionaries from GitHub API (list or generator)
         tracked_repo: TrackedRepository instance to sync
         access_token: Decrypted GitHub access token
+        members: Resolver for author/reviewer lookups, shared across the sync run
 
     Returns:
         Dict with sync stats for PRs, reviews, commits, check_runs, files, comments, rate_limited
@@ -53,6 +56,10 @@ def _process_prs(
     # Create Github client for rate limit checks
     github = Github(access_token)
 
+    # Resolve authors and reviewers from memory instead of one query per lookup
+    if members is None:
+        members = TeamMemberResolver(tracked_repo.team_id)
+
     prs_synced = 0
     reviews_synced = 0
     commits_synced = 0
@@ -69,7 +76,7 @@ def _process_prs(
             pr_number = pr_data["number"]
 
             # Map GitHub data to model fields
-            pr_fields = _map_github_pr_to_fields(tracked_repo.team, pr_data)
+            pr_fields = _map_github_pr_to_fields(tracked_repo.team, pr_data, members)
 
             # Create or update the PR record
             pr, created = PullRequest.objects.update_or_create(
@@ -88,6 +95,7 @@ def _process_prs(
                 repo_full_name=tracked_repo.full_name,
                 team=tracked_repo.team,
                 errors=errors,
+                members=members,
             )
 
             # Sync commits for this PR
@@ -98,6 +106,7 @@ def _process_prs(
                 repo_full_name=tracked_repo.full_name,
                 team=tracked_repo.team,
                 errors=errors,
+                members=members,
             )
 
             # Sync check runs for this PR
@@ -128,6 +137,7 @@ def _process_prs(
                 repo_full_name=tracked_repo.full_name,
                 team=tracked_repo.team,
                 errors=errors,
+                members=members,
             )
             comments_synced += sync_pr_review_comments(
                 pr=pr,
@@ -136,6 +146,7 @@ def _process_prs(
                 repo_full_name=tracked_repo.full_name,
                 team=tracked_repo.team,
                 errors=errors,
+                members=members,
             )
 
             # Calculate iteration metrics after all data is synced
@@ -192,7 +203,8 @@ def sync_repository_history(
     prs_data = get_repository_pull_requests(access_token, tracked_repo.full_name, days_back=days_back)
 
     # Process PRs and sync all related data (iterates generator one PR at a time)
-    result = _process_prs(prs_data, tracked_repo, access_token)
+    members = TeamMemberResolver(tracked_repo.team_id)
+    result = _process_prs(prs_data, tracked_repo, access_token, members)
 
     # Sync deployments for this repository
     result["deployments_synced"] = sync_repository_deployments(
@@ -200,6 +212,7 @@ def sync_repository_history(
         access_token=access_token,
         team=tracked_repo.team,
         errors=result["errors"],
+        members=members,
     )
 
     # Only update last_sync_at if sync completed fully (not rate limited)
@@ -231,7 +244,8 @@ def sync_repository_incremental(tracked_repo: TrackedRepository) -> dict:
     prs_data = get_updated_pull_requests(access_token, tracked_repo.full_name, tracked_repo.last_sync_at)
 
     # Process PRs and sync all related data
-    result = _process_prs(prs_data, tracked_repo, access_token)
+    members = TeamMemberResolver(tracked_repo.team_id)
+    result = _process_prs(prs_data, tracked_repo, access_token, members)
 
     # Sync deployments for this repository
     result["deployments_synced"] = sync_repository_deployments(
@@ -239,6 +253,7 @@ def sync_repository_incremental(tracked_repo: TrackedRepository) -> dict:
         access_token=access_token,
         team=tracked_repo.team,
         errors=result["errors"],
+        members=members,
     )
 
     # Only update last_sync_at if sync completed fully (not rate limited)
@@ -28,12 +28,14 @@ from groq import Groq
 
 if TYPE_CHECKING:
     from apps.metrics.models import PullRequest
+    from apps.metrics.services.llm_executor import LLMExecutor
 
 # Import prompts from source of truth
 from apps.metrics.services.llm_prompts import (
     PR_ANALYSIS_SYSTEM_PROMPT,
     PROMPT_VERSION,
     build_llm_pr_context,
+    get_llm_input_hash,
 )
 
 
@@ -270,6 +272,9 @@ class BatchResult:
     # Raw LLM response for storage
     llm_summary: dict = field(default_factory=dict)
     prompt_version: str = PROMPT_VERSION
+    # Request fingerprint (stored as PullRequest.llm_input_hash); set when the
+    # processor knows the PRs, empty for results downloaded by batch ID alone
+    input_hash: str = ""
 
     @classmethod
     def from_response(cls, custom_id: str, response_body: dict) -> BatchResult:
@@ -471,44 +476,116 @@ class GroqBatchProcessor:
                 if not pr.body:
                     continue
 
-                # Format PR with unified context builder (includes all PR data)
-                pr_context = build_llm_pr_context(pr)
-
-                # Choose response format based on mode
-                if self.use_json_schema_mode:
-                    # Strict JSON Schema mode - guarantees schema compliance
-                    # Only works with GPT-OSS 20B/120B models
-                    response_format = {
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": "pr_analysis",
-                            "strict": True,
-                            "schema": get_strict_schema(),
-                        },
-                    }
-                else:
-                    # Standard JSON Object mode - valid JSON but no schema enforcement
-                    response_format = {"type": "json_object"}
-
                 request = {
                     "custom_id": f"pr-{pr.id}",
                     "method": "POST",
                     "url": "/v1/chat/completions",
-                    "body": {
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": str(self.system_prompt)},
-                            {"role": "user", "content": pr_context},
-                        ],
-                        "response_format": response_format,
-                        "temperature": 0,
-                        "max_tokens": 1500,
-                    },
+                    "body": self._build_request_body(pr),
                 }
                 f.write(json.dumps(request) + "\n")
 
         return path
 
+    def _build_request_body(self, pr: PullRequest) -> dict:
+        """Build the chat completion request body for one PR.
+
+        Shared by batch files and real-time calls so both send identical requests.
+        """
+        # Format PR with unified context builder (includes all PR data)
+        pr_context = build_llm_pr_context(pr)
+
+        # Choose response format based on mode
+        if self.use_json_schema_mode:
+            # Strict JSON Schema mode - guarantees schema compliance
+            # Only works with GPT-OSS 20B/120B models
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "pr_analysis",
+                    "strict": True,
+                    "schema": get_strict_schema(),
+                },
+            }
+        else:
+            # Standard JSON Object mode - valid JSON but no schema enforcement
+            response_format = {"type": "json_object"}
+
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": str(self.system_prompt)},
+                {"role": "user", "content": pr_context},
+            ],
+            "response_format": response_format,
+            "temperature": 0,
+            "max_tokens": 1500,
+        }
+
+    @staticmethod
+    def _fingerprint(body: dict) -> str:
+        """LLM input hash of a request body (independent of the model it is sent to)."""
+        system, user = (message["content"] for message in body["messages"])
+        return get_llm_input_hash(user, system)
+
+    def input_hash(self, pr: PullRequest) -> str:
+        """Fingerprint of the request this processor would send for a PR."""
+        return self._fingerprint(self._build_request_body(pr))
+
+    def _attach_input_hashes(self, results: list[BatchResult], prs: list[PullRequest]) -> None:
+        """Set input_hash on results for the PRs this processor submitted."""
+        hashes = {pr.id: self.input_hash(pr) for pr in prs if pr.body}
+        for result in results:
+            result.input_hash = hashes.get(result.pr_id, result.input_hash)
+
+    def process_realtime(
+        self,
+        prs: list[PullRequest],
+        executor: LLMExecutor | None = None,
+    ) -> list[BatchResult]:
+        """Process PRs with real-time API calls instead of a batch job.
+
+        Calls run concurrently under the executor's rate limiter. Useful when a
+        second batch would take longer than the handful of calls it contains.
+        Does not get the batch discount.
+
+        Args:
+            prs: List of PullRequest objects to process (PRs without body are skipped)
+            executor: LLMExecutor to run calls on (defaults to LLMExecutor.from_settings())
+
+        Returns:
+            List of BatchResult objects, one per PR with a body
+        """
+        from apps.metrics.services.llm_executor import LLMExecutor, estimate_prompt_tokens
+
+        executor = executor or LLMExecutor.from_settings()
+        # Build request bodies up front: building reads prefetched relations,
+        # which must not be touched from worker threads.
+        bodies = {pr.id: self._build_request_body(pr) for pr in prs if pr.body}
+
+        def call(pr_id: int):
+            # Raw response: its rate-limit headers keep the executor's limiter in step
+            return self.client.chat.completions.with_raw_response.create(**bodies[pr_id])
+
+        def parse(response) -> dict:
+            return {"choices": [{"message": {"content": response.choices[0].message.content}}]}
+
+        def estimate_tokens(pr_id: int) -> int:
+            messages = bodies[pr_id]["messages"]
+            return estimate_prompt_tokens(*(m["content"] for m in messages), max_tokens=bodies[pr_id]["max_tokens"])
+
+        outcomes = executor.run(bodies, call, parse=parse, estimate_tokens=estimate_tokens)
+
+        results = []
+        for outcome in outcomes:
+            custom_id = f"pr-{outcome.item}"
+            if outcome.ok:
+                result = BatchResult.from_response(custom_id, outcome.value)
+            else:
+                result = BatchResult.from_response(custom_id, {"error": {"message": str(outcome.error)}})
+            result.input_hash = self._fingerprint(bodies[outcome.item])
+            results.append(result)
+        return results
+
     def upload_file(self, file_path: str | Path) -> str:
         """Upload batch file to Groq.
 
@@ -731,6 +808,8 @@ class GroqBatchProcessor:
         prs: list[PullRequest],
         poll_interval: int = 30,
         on_progress: callable | None = None,
+        realtime_retry: bool = False,
+        executor: LLMExecutor | None = None,
     ) -> tuple[list[BatchResult], dict]:
         """Submit batch with automatic retry of failures using better model.
 
@@ -738,12 +817,16 @@ class GroqBatchProcessor:
         1. First pass: Use cheap DEFAULT_MODEL (openai/gpt-oss-20b)
         2. Second pass: Retry failures with FALLBACK_MODEL (llama-3.3-70b-versatile)
 
-        Both passes use Batch API for 50% cost savings.
+        Both passes use Batch API for 50% cost savings, unless realtime_retry is
+        set, in which case the (usually small) second pass runs as concurrent
+        real-time calls via process_realtime.
 
         Args:
             prs: List of PullRequest objects to process
             poll_interval: Seconds between status checks (default 30)
             on_progress: Optional callback(status) for progress updates
+            realtime_retry: Retry failures with real-time calls instead of a second batch
+            executor: LLMExecutor for real-time retries (defaults to LLMExecutor.from_settings())
 
         Returns:
             Tuple of (results, stats) where stats contains:
@@ -768,6 +851,7 @@ class GroqBatchProcessor:
             poll_interval,
             on_progress,
         )
+        self._attach_input_hashes(first_results, prs)
 
         # Count failures - check error file for actual failures
         # Note: Errors in r.error are parse errors, error file has request failures
@@ -793,12 +877,19 @@ class GroqBatchProcessor:
             system_prompt=self.system_prompt,
         )
 
+        if realtime_retry:
+            retry_results = retry_processor.process_realtime(failed_prs, executor=executor)
+            merged_results = self._merge_results(first_results, retry_results, failed_pr_ids)
+            stats["final_failures"] = len({r.pr_id for r in merged_results if r.error})
+            return merged_results, stats
+
         stats["retry_batch_id"] = retry_processor.submit_batch(failed_prs)
         retry_results = retry_processor._wait_for_completion(
             stats["retry_batch_id"],
             poll_interval,
             on_progress,
         )
+        retry_processor._attach_input_hashes(retry_results, failed_prs)
 
         # Merge results - pass failed_pr_ids to include API-level failures
         merged_results = self._merge_results(first_results, retry_results, failed_pr_ids)
@@ -1,6 +1,5 @@
 """Jira issue sync service for syncing issues to local database."""
 
-import contextlib
 from datetime import datetime
 from decimal import Decimal
 
@@ -9,7 +8,8 @@ from django.utils import timezone
 
 from apps.integrations.models import TrackedJiraProject
 from apps.integrations.services.jira_client import get_project_issues
-from apps.metrics.models import JiraIssue, TeamMember
+from apps.metrics.models import JiraIssue
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
 __all__ = [
     "JiraSyncError",
@@ -141,16 +141,14 @@ def sync_project_issues(tracked_project: TrackedJiraProject, full_sync: bool = F
     try:
         # Fetch issues from Jira
         issues_data = get_project_issues(credential, project_key, since=since)
+        members = TeamMemberResolver(team.id)
 
         for issue_data in issues_data:
             try:
                 converted = _convert_jira_issue_to_dict(issue_data)
 
                 # Look up assignee by jira_account_id
-                assignee = None
-                if converted["assignee_account_id"]:
-                    with contextlib.suppress(TeamMember.DoesNotExist):
-                        assignee = TeamMember.objects.get(team=team, jira_account_id=converted["assignee_account_id"])
+                assignee = members.by_jira_account_id(converted["assignee_account_id"])
 
                 # Create or update JiraIssue
                 issue, created = JiraIssue.objects.update_or_create(
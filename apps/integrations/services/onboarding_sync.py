@@ -14,6 +14,7 @@ from asgiref.sync import async_to_sync
 from django.conf import settings
 
 from apps.integrations.services.github_graphql_sync import (
+    sync_repositories_history,
     sync_repository_history_by_search,
     sync_repository_history_graphql,
 )
@@ -42,6 +43,7 @@ class OnboardingSyncService:
     HISTORY_MONTHS = SYNC_CONFIG.get("HISTORY_MONTHS", 12)
     LLM_BATCH_SIZE = SYNC_CONFIG.get("LLM_BATCH_SIZE", 100)
     GRAPHQL_PAGE_SIZE = SYNC_CONFIG.get("GRAPHQL_PAGE_SIZE", 25)
+    MAX_CONCURRENT_REPOS = SYNC_CONFIG.get("MAX_CONCURRENT_REPOS", 4)
 
     def __init__(self, team: Team, github_token: str | None = None):
         """
@@ -142,6 +144,62 @@ class OnboardingSyncService:
                 progress_callback(0, 0, f"Error: {e}")
             raise
 
+    def sync_repositories_concurrently(
+        self,
+        repos: list[TrackedRepository],
+        days_back: int | None = None,
+        skip_recent: int = 0,
+        repo_done_callback: Callable[[TrackedRepository, dict | Exception], None] | None = None,
+    ) -> dict[int, dict | Exception]:
+        """
+        Sync several repositories at once, bounded per GitHub installation.
+
+        Repositories sharing an installation share one rate limit budget, so the
+        concurrency only uses quota that the installation actually has.
+
+        Args:
+            repos: TrackedRepository objects to sync, in priority order
+            days_back: How many days of history to sync (default: from config)
+            skip_recent: Skip PRs from the most recent N days (default: 0)
+            repo_done_callback: Optional callback(repo, result_or_exception), called
+                                as each repository finishes
+
+        Returns:
+            Dict mapping repo ID to the same result dict as sync_repository,
+            or to the exception that aborted that repository's sync
+        """
+        if days_back is None:
+            days_back = self._calculate_days_back()
+
+        github_config = getattr(settings, "GITHUB_API_CONFIG", {})
+        use_search_api = github_config.get("GRAPHQL_OPERATIONS", {}).get("use_search_api", False)
+
+        logger.info(
+            f"Syncing {len(repos)} repositories for team {self.team.name} "
+            f"(max {self.MAX_CONCURRENT_REPOS} concurrent per installation)"
+        )
+        outcomes = async_to_sync(sync_repositories_history)(
+            repos,
+            days_back=days_back,
+            skip_recent=skip_recent,
+            use_search_api=use_search_api,
+            max_concurrent_repos=self.MAX_CONCURRENT_REPOS,
+            on_repo_done=repo_done_callback,
+        )
+
+        results = {}
+        for repo_id, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                results[repo_id] = outcome
+                continue
+            results[repo_id] = {
+                "prs_synced": outcome.get("prs_synced", 0),
+                "reviews_synced": outcome.get("reviews_synced", 0),
+                "commits_synced": outcome.get("commits_synced", 0),
+                "errors": outcome.get("errors", []),
+            }
+        return results
+
     def sync_all_repositories(
         self,
         repos: list[TrackedRepository],
@@ -0,0 +1,151 @@
+"""Per-repository batching for the post-merge PR data fetch.
+
+Every merged PR used to dispatch its own fetch_pr_complete_data_task, paying
+Celery task overhead and a GraphQL round-trip per PR. Busy repositories merge
+hundreds of PRs a day, so the fetch is now batched per repository:
+
+1. queue_pr_data_fetch() stores a PendingPRDataFetch row and, once the
+   transaction commits, schedules one fetch_pr_data_batch_task per repository,
+   delayed by BATCH_WINDOW_SECONDS. PRs merged inside the window ride along.
+2. The task claims pending rows (SKIP LOCKED, CLAIM_BATCH_SIZE at a time),
+   fetches their commits, files and reviews with aliased multi-PR GraphQL
+   queries and deletes the rows once done. If a batch fails as a whole, its
+   rows are released for a retry, up to MAX_ATTEMPTS.
+3. requeue_stale_pr_data_fetches() (scheduled sweep) releases rows whose
+   worker died and reschedules repositories whose task was lost.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.integrations.models import PendingPRDataFetch, TrackedRepository
+from apps.metrics.models import PullRequest
+
+logger = logging.getLogger(__name__)
+
+# Delay before fetching a repository's queued PRs, so merges in a burst share queries
+BATCH_WINDOW_SECONDS = 30
+
+# PRs claimed per pass of the batch task
+CLAIM_BATCH_SIZE = 50
+
+# Claims older than this belong to a worker that died (batch task time_limit is 10 minutes)
+STALE_CLAIM_SECONDS = 15 * 60
+
+# Failed attempts before a PR is dropped (the next repository sync fills in its data)
+MAX_ATTEMPTS = 3
+
+
+def _batch_cache_key(tracked_repo_id: int) -> str:
+    return f"pr_data:batch:{tracked_repo_id}"
+
+
+def queue_pr_data_fetch(pr: PullRequest) -> PendingPRDataFetch | None:
+    """Queue the post-merge data fetch for a PR and schedule its repository's batch.
+
+    Returns:
+        The queued fetch, or None if the PR's repository isn't actively tracked
+    """
+    tracked_repo = TrackedRepository.objects.filter(team=pr.team, full_name=pr.github_repo, is_active=True).first()
+    if tracked_repo is None:
+        logger.info(f"Not queueing PR data fetch for {pr.github_repo}#{pr.github_pr_id}: repository not tracked")
+        return None
+
+    fetch, _ = PendingPRDataFetch.objects.get_or_create(
+        pull_request=pr,
+        defaults={"team": pr.team, "tracked_repository": tracked_repo},
+    )
+    transaction.on_commit(lambda: schedule_pr_data_batch(tracked_repo.id))
+    return fetch
+
+
+def schedule_pr_data_batch(tracked_repo_id: int) -> None:
+    """Schedule one delayed batch per repository per window.
+
+    Dispatch failures are logged, not raised: the row is already stored and
+    the periodic sweep will reschedule it.
+    """
+    from apps.integrations.tasks import fetch_pr_data_batch_task
+
+    # cache.add() is atomic; only the first PR of a window schedules a task
+    key = _batch_cache_key(tracked_repo_id)
+    if not cache.add(key, True, BATCH_WINDOW_SECONDS * 4):
+        return
+
+    try:
+        fetch_pr_data_batch_task.apply_async(args=[tracked_repo_id], countdown=BATCH_WINDOW_SECONDS)
+    except Exception as e:
+        cache.delete(key)
+        logger.warning(f"Failed to schedule PR data batch for repository {tracked_repo_id}: {e}")
+
+
+def claim_pr_data_fetches(tracked_repo_id: int, limit: int = CLAIM_BATCH_SIZE) -> list[PendingPRDataFetch]:
+    """Claim up to `limit` waiting fetches of a repository, oldest first.
+
+    Rows locked or claimed by another worker are skipped.
+    """
+    # PRs queued from now on schedule a fresh batch
+    cache.delete(_batch_cache_key(tracked_repo_id))
+
+    with transaction.atomic():
+        fetches = list(
+            PendingPRDataFetch.objects.select_for_update(skip_locked=True, of=("self",))
+            .select_related("pull_request", "pull_request__team")
+            .filter(tracked_repository_id=tracked_repo_id, claimed_at__isnull=True)
+            .order_by("id")[:limit]
+        )
+        if fetches:
+            PendingPRDataFetch.objects.filter(id__in=[f.id for f in fetches]).update(  # noqa: TEAM001 - claimed rows
+                claimed_at=timezone.now()
+            )
+    return fetches
+
+
+def complete_pr_data_fetches(fetches: list[PendingPRDataFetch]) -> None:
+    """Remove fetched PRs from the queue."""
+    PendingPRDataFetch.objects.filter(id__in=[f.id for f in fetches]).delete()  # noqa: TEAM001 - claimed rows
+
+
+def release_pr_data_fetches(fetches: list[PendingPRDataFetch], error: str) -> None:
+    """Return failed fetches to the queue, dropping those out of attempts."""
+    exhausted = []
+    for fetch in fetches:
+        fetch.attempts += 1
+        fetch.last_error = error[:1000]
+        fetch.claimed_at = None
+        if fetch.attempts >= MAX_ATTEMPTS:
+            exhausted.append(fetch)
+
+    if exhausted:
+        logger.error(f"Dropping {len(exhausted)} PR data fetches after {MAX_ATTEMPTS} attempts: {error}")
+        complete_pr_data_fetches(exhausted)
+    retry = [fetch for fetch in fetches if fetch.attempts < MAX_ATTEMPTS]
+    PendingPRDataFetch.objects.bulk_update(retry, ["attempts", "last_error", "claimed_at"])  # noqa: TEAM001
+
+
+def requeue_stale_pr_data_fetches() -> int:
+    """Release dead workers' claims and reschedule repositories with waiting PRs.
+
+    Returns:
+        Number of repositories rescheduled
+    """
+    now = timezone.now()
+    PendingPRDataFetch.objects.filter(  # noqa: TEAM001 - Sweep across all teams
+        claimed_at__lt=now - timedelta(seconds=STALE_CLAIM_SECONDS)
+    ).update(claimed_at=None)
+
+    repo_ids = list(
+        PendingPRDataFetch.objects.filter(  # noqa: TEAM001 - Sweep across all teams
+            claimed_at__isnull=True,
+            created_at__lte=now - timedelta(seconds=BATCH_WINDOW_SECONDS * 2),
+        )
+        .values_list("tracked_repository_id", flat=True)
+        .distinct()
+    )
+    for repo_id in repo_ids:
+        schedule_pr_data_batch(repo_id)
+    return len(repo_ids)
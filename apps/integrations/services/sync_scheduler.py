@@ -0,0 +1,140 @@
+"""Staggered dispatch for the scheduled sync fan-out tasks.
+
+sync_all_repositories_task and sync_all_copilot_metrics used to call .delay()
+for every repository/team at the beat tick, so workers, each installation's
+GitHub quota and Postgres were all hit at the same moment. They now plan the
+dispatch with plan_dispatch():
+
+- candidates are ordered most urgent first and spread evenly over a period,
+  each with random jitter inside its share of the period;
+- a candidate can belong to groups (installation, team) with a limit; the
+  countdowns are spaced so that at most `limit` tasks of a group start within
+  any `task_seconds` window, pushing a large installation past the period
+  instead of starting all of its syncs at once. This is spacing based on an
+  estimated run time, not a concurrency limit: a task that runs longer than
+  the estimate still overlaps the ones planned after it.
+
+select_repositories_to_sync() orders the active repositories: never-synced
+first, then those with webhook activity since their last sync, then the
+stalest. None are skipped: webhooks only cover pull_request and
+pull_request_review events, while the incremental sync also pulls
+deployments, check runs, comments and commits.
+"""
+
+import heapq
+import logging
+import random
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.integrations.models import GitHubWebhookEvent, TrackedRepository
+
+logger = logging.getLogger(__name__)
+
+# Repository syncs: spread over 45 minutes (4:00-4:45 UTC, before the 5 AM LLM batch)
+REPO_SYNC_SPREAD_SECONDS = 45 * 60
+# Typical incremental sync duration used to space syncs of one installation/team
+REPO_SYNC_ESTIMATE_SECONDS = 120
+# Syncs of one installation/team planned to start within REPO_SYNC_ESTIMATE_SECONDS
+REPO_SYNCS_PER_INSTALLATION = 4
+REPO_SYNCS_PER_TEAM = 6
+
+# Copilot syncs: one per team, spread over 10 minutes (4:45-4:55 UTC)
+COPILOT_SYNC_SPREAD_SECONDS = 10 * 60
+
+
+@dataclass
+class PlannedTask:
+    """A candidate and the countdown (seconds) to dispatch it with."""
+
+    item: Any
+    countdown: int
+
+
+def plan_dispatch(
+    items: Sequence,
+    period_seconds: int,
+    task_seconds: int = 0,
+    groups: Callable[[Any], list[tuple[Hashable, int]]] | None = None,
+    rng: random.Random | None = None,
+) -> list[PlannedTask]:
+    """Spread items over period_seconds in order, spacing the starts of each group.
+
+    Args:
+        items: Candidates, most urgent first
+        period_seconds: Period to spread the dispatch over
+        task_seconds: Expected run time of one task (for the group spacing)
+        groups: Returns the (group key, limit) pairs an item belongs to
+        rng: Random source for the jitter (seeded in tests)
+
+    Returns:
+        One PlannedTask per item, in the order of items
+    """
+    if not items:
+        return []
+    rng = rng or random.Random()
+    share = period_seconds / len(items)
+    # Per group, a min-heap of the times its planned tasks are expected to finish
+    running: dict[Hashable, list[float]] = {}
+
+    planned = []
+    for index, item in enumerate(items):
+        start = index * share + rng.uniform(0, share)
+        item_groups = groups(item) if groups else []
+        for key, limit in item_groups:
+            finishing = running.setdefault(key, [])
+            if len(finishing) >= limit:
+                start = max(start, finishing[0])
+        for key, limit in item_groups:
+            finishing = running[key]
+            if len(finishing) >= limit:
+                heapq.heapreplace(finishing, start + task_seconds)
+            else:
+                heapq.heappush(finishing, start + task_seconds)
+        planned.append(PlannedTask(item=item, countdown=int(start)))
+    return planned
+
+
+def select_repositories_to_sync(now: datetime | None = None) -> list[TrackedRepository]:
+    """Active repositories, most urgent first."""
+    now = now or timezone.now()
+    events_since_sync = (
+        GitHubWebhookEvent.objects.filter(  # noqa: TEAM001 - team matched via OuterRef
+            team_id=OuterRef("team_id"),
+            github_repo=OuterRef("full_name"),
+            created_at__gt=OuterRef("last_sync_at"),
+        )
+        .order_by()
+        .values("team_id")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    repos = TrackedRepository.objects.filter(is_active=True).annotate(  # noqa: TEAM001 - System job iterating all repos
+        webhook_events=Coalesce(Subquery(events_since_sync, output_field=IntegerField()), 0)
+    )
+
+    return sorted(repos, key=lambda repo: _sync_priority(repo, now), reverse=True)
+
+
+def plan_repository_syncs(repos: Sequence[TrackedRepository], rng: random.Random | None = None) -> list[PlannedTask]:
+    """Plan sync_repository_task countdowns, spacing the syncs of each installation and team."""
+
+    def groups(repo: TrackedRepository) -> list[tuple[Hashable, int]]:
+        if repo.app_installation_id:
+            installation = ("app_installation", repo.app_installation_id)
+        else:
+            installation = ("integration", repo.integration_id)
+        return [(installation, REPO_SYNCS_PER_INSTALLATION), (("team", repo.team_id), REPO_SYNCS_PER_TEAM)]
+
+    return plan_dispatch(repos, REPO_SYNC_SPREAD_SECONDS, REPO_SYNC_ESTIMATE_SECONDS, groups=groups, rng=rng)
+
+
+def _sync_priority(repo: TrackedRepository, now: datetime) -> tuple:
+    staleness = (now - repo.last_sync_at).total_seconds() if repo.last_sync_at else float("inf")
+    return (repo.last_sync_at is None, repo.webhook_events > 0, staleness)
@@ -0,0 +1,189 @@
+"""Durable queue for GitHub webhook events with per-PR coalescing.
+
+The webhook view verifies the signature, stores the raw event as a
+GitHubWebhookEvent row and returns 202. Processing happens in Celery:
+
+1. enqueue_webhook_event() inserts the row (the unique delivery ID makes
+   redeliveries no-ops) and, once the transaction commits, schedules one
+   process_webhook_events_task per PR, delayed by COALESCE_WINDOW_SECONDS.
+   Further events for the same PR inside the window ride along.
+2. process_webhook_events() locks the PR's pending rows and applies them in
+   one go: a single PullRequest upsert from the newest payload, then each
+   review once.
+3. process_pending_webhook_events() (scheduled sweep) drains anything whose
+   task was lost, e.g. when the broker was unavailable at enqueue time.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from apps.integrations.models import GitHubWebhookEvent
+from apps.metrics import processors
+from apps.metrics.services.dashboard_cache import bump_team_data_version
+
+logger = logging.getLogger(__name__)
+
+# Events that create/update metrics data and go through the queue
+QUEUED_EVENT_TYPES = ("pull_request", "pull_request_review")
+
+# Delay before draining a PR's events, so bursts collapse into one upsert
+COALESCE_WINDOW_SECONDS = 5
+
+# Events still pending after this long are picked up by the sweep
+STALE_AFTER_SECONDS = 60
+
+# Failed attempts before an event is parked as failed
+MAX_ATTEMPTS = 5
+
+# Processed events are kept this long for debugging, then purged
+RETENTION_DAYS = 7
+
+
+def _coalesce_cache_key(team_id: int, github_repo: str, github_pr_id: int | None) -> str:
+    return f"webhook:coalesce:{team_id}:{github_repo}:{github_pr_id}"
+
+
+def enqueue_webhook_event(team, delivery_id: str, event_type: str, payload: dict) -> GitHubWebhookEvent | None:
+    """Store a verified webhook event and schedule processing for its PR.
+
+    Args:
+        team: Team the event belongs to (resolved from the signature)
+        delivery_id: X-GitHub-Delivery header
+        event_type: X-GitHub-Event header
+        payload: Parsed webhook payload
+
+    Returns:
+        The queued event, or None if this delivery was already queued
+    """
+    github_repo = payload.get("repository", {}).get("full_name") or ""
+    github_pr_id = payload.get("pull_request", {}).get("id")
+
+    try:
+        with transaction.atomic():
+            event = GitHubWebhookEvent.objects.create(
+                team=team,
+                delivery_id=delivery_id,
+                event_type=event_type,
+                action=payload.get("action") or "",
+                github_repo=github_repo,
+                github_pr_id=github_pr_id,
+                payload=payload,
+            )
+    except IntegrityError:
+        return None
+
+    transaction.on_commit(lambda: schedule_webhook_processing(team.id, github_repo, github_pr_id))
+    return event
+
+
+def schedule_webhook_processing(team_id: int, github_repo: str, github_pr_id: int | None) -> None:
+    """Schedule one delayed drain per PR per coalescing window.
+
+    Dispatch failures are logged, not raised: the event is already stored and
+    the periodic sweep will process it.
+    """
+    from apps.integrations.tasks import process_webhook_events_task
+
+    # cache.add() is atomic; only the first event of a burst schedules a task
+    key = _coalesce_cache_key(team_id, github_repo, github_pr_id)
+    if not cache.add(key, True, COALESCE_WINDOW_SECONDS * 4):
+        return
+
+    try:
+        process_webhook_events_task.apply_async(
+            args=[team_id, github_repo, github_pr_id],
+            countdown=COALESCE_WINDOW_SECONDS,
+        )
+    except Exception as e:
+        cache.delete(key)
+        logger.warning(f"Failed to schedule webhook processing for {github_repo} PR {github_pr_id}: {e}")
+
+
+def process_webhook_events(team_id: int, github_repo: str, github_pr_id: int | None) -> int:
+    """Apply all pending events for one PR.
+
+    Rows are locked with SKIP LOCKED, so concurrent workers never apply the
+    same event twice. On failure the events stay pending (up to MAX_ATTEMPTS)
+    for the sweep to retry.
+
+    Returns:
+        Number of events processed
+    """
+    # Events arriving from now on schedule a fresh drain
+    cache.delete(_coalesce_cache_key(team_id, github_repo, github_pr_id))
+
+    with transaction.atomic():
+        events = list(
+            GitHubWebhookEvent.objects.select_for_update(skip_locked=True)
+            .select_related("team")
+            .filter(
+                team_id=team_id,
+                github_repo=github_repo,
+                github_pr_id=github_pr_id,
+                status=GitHubWebhookEvent.STATUS_PENDING,
+            )
+            .order_by("id")
+        )
+        if not events:
+            return 0
+
+        team = events[0].team
+        try:
+            with transaction.atomic():
+                processors.handle_pull_request_events(
+                    team, [e.payload for e in events if e.event_type == "pull_request"]
+                )
+                processors.handle_pull_request_review_events(
+                    team, [e.payload for e in events if e.event_type == "pull_request_review"]
+                )
+        except Exception as e:
+            logger.exception(f"Failed to process {len(events)} webhook events for {github_repo} PR {github_pr_id}")
+            for event in events:
+                event.attempts += 1
+                event.last_error = str(e)[:1000]
+                if event.attempts >= MAX_ATTEMPTS:
+                    event.status = GitHubWebhookEvent.STATUS_FAILED
+            GitHubWebhookEvent.objects.bulk_update(events, ["attempts", "last_error", "status"])  # noqa: TEAM001
+            return 0
+
+        now = timezone.now()
+        for event in events:
+            event.status = GitHubWebhookEvent.STATUS_PROCESSED
+            event.processed_at = now
+        GitHubWebhookEvent.objects.bulk_update(events, ["status", "processed_at"])  # noqa: TEAM001
+
+    bump_team_data_version(team_id)
+    logger.info(f"Coalesced {len(events)} webhook events into one update for {github_repo} PR {github_pr_id}")
+    return len(events)
+
+
+def process_pending_webhook_events(older_than_seconds: int = STALE_AFTER_SECONDS) -> int:
+    """Drain every PR with pending events older than the given age.
+
+    Returns:
+        Number of events processed
+    """
+    cutoff = timezone.now() - timedelta(seconds=older_than_seconds)
+    groups = (
+        GitHubWebhookEvent.objects.filter(  # noqa: TEAM001 - Sweep across all teams
+            status=GitHubWebhookEvent.STATUS_PENDING,
+            created_at__lte=cutoff,
+        )
+        .values_list("team_id", "github_repo", "github_pr_id")
+        .distinct()
+    )
+    return sum(process_webhook_events(*group) for group in list(groups))
+
+
+def purge_processed_webhook_events(days: int = RETENTION_DAYS) -> int:
+    """Delete processed events older than the retention window. Returns rows deleted."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = GitHubWebhookEvent.objects.filter(  # noqa: TEAM001 - Retention cleanup across all teams
+        status=GitHubWebhookEvent.STATUS_PROCESSED,
+        processed_at__lt=cutoff,
+    ).delete()
+    return deleted
@@ -8,6 +8,7 @@ All tasks are organized into domain-focused modules in _task_modules/:
 - jira_sync: Jira project and user sync tasks
 - slack: Slack surveys, reveals, leaderboards
 - copilot: GitHub Copilot metrics sync
+- webhooks: Coalesced GitHub webhook event processing
 
 All tasks are re-exported here for backward compatibility.
 """
@@ -53,15 +54,21 @@ from apps.integrations._task_modules.metrics import (  # noqa: E402
     aggregate_all_teams_weekly_metrics_task,
     aggregate_team_weekly_metrics_task,
     queue_llm_analysis_batch_task,
+    rebuild_all_teams_reviewer_correlations_task,
+    rebuild_team_reviewer_correlations_task,
+    update_all_teams_reviewer_correlations_task,
+    update_team_reviewer_correlations_task,
 )
 
 # PR data tasks
 from apps.integrations._task_modules.pr_data import (  # noqa: E402
     _fetch_pr_core_data_with_graphql_or_rest,
     fetch_pr_complete_data_task,
+    fetch_pr_data_batch_task,
     post_survey_comment_task,
     refresh_all_repo_languages_task,
     refresh_repo_languages_task,
+    requeue_stale_pr_data_fetches_task,
     update_pr_description_survey_task,
 )
 
@@ -74,6 +81,12 @@ from apps.integrations._task_modules.slack import (  # noqa: E402
     sync_slack_users_task,
 )
 
+# Webhook tasks
+from apps.integrations._task_modules.webhooks import (  # noqa: E402
+    process_pending_webhook_events_task,
+    process_webhook_events_task,
+)
+
 # GitHub PR description module (for patch targets like github_pr_description.update_pr_description_with_survey)
 from apps.integrations.services import github_pr_description  # noqa: E402, F401
 
@@ -126,9 +139,15 @@ __all__ = [
     # Metrics tasks
     "aggregate_team_weekly_metrics_task",
     "aggregate_all_teams_weekly_metrics_task",
+    "update_team_reviewer_correlations_task",
+    "update_all_teams_reviewer_correlations_task",
+    "rebuild_team_reviewer_correlations_task",
+    "rebuild_all_teams_reviewer_correlations_task",
     "queue_llm_analysis_batch_task",
     # PR data tasks
     "fetch_pr_complete_data_task",
+    "fetch_pr_data_batch_task",
+    "requeue_stale_pr_data_fetches_task",
     "post_survey_comment_task",
     "update_pr_description_survey_task",
     "refresh_repo_languages_task",
@@ -147,4 +166,7 @@ __all__ = [
     # Copilot tasks
     "sync_copilot_metrics_task",
     "sync_all_copilot_metrics",
+    # Webhook tasks
+    "process_webhook_events_task",
+    "process_pending_webhook_events_task",
 ]
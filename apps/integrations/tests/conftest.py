@@ -8,6 +8,9 @@ Key isolation mechanisms:
 2. Use DummyCache to prevent Waffle flag state pollution
 3. Group tests on same xdist worker as additional safety measure
 
+Tests of cache-backed behaviour opt back into a real cache with the
+`use_locmem_cache` fixture.
+
 Note: Signal disconnection was moved to root conftest.py as a global mock
 of dispatch_pipeline_task. Tests that need real dispatch behavior should
 use the `enable_pipeline_dispatch` fixture.
@@ -36,3 +39,17 @@ def use_dummy_cache_for_waffle(settings):
     flag state can leak between tests causing flaky failures.
     """
     settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+@pytest.fixture
+def use_locmem_cache(use_dummy_cache_for_waffle, settings):
+    """Use a real (local memory) cache for tests of cache-backed behaviour.
+
+    Depends on use_dummy_cache_for_waffle so it is applied after it; a
+    class-level override_settings(CACHES=...) would be replaced by that
+    autouse fixture. Apply with @pytest.mark.usefixtures("use_locmem_cache").
+    """
+    from django.core.cache import cache
+
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
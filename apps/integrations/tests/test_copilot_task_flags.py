@@ -106,7 +106,7 @@ class TestSyncAllCopilotMetricsFlagGating(TestCase):
         result = sync_all_copilot_metrics()
 
         # Should not dispatch any tasks
-        mock_task.delay.assert_not_called()
+        mock_task.apply_async.assert_not_called()
 
         # Should return skip status
         self.assertEqual(result["status"], "skipped")
@@ -121,7 +121,7 @@ class TestSyncAllCopilotMetricsFlagGating(TestCase):
         result = sync_all_copilot_metrics()
 
         # Should dispatch tasks for both teams
-        self.assertEqual(mock_task.delay.call_count, 2)
+        self.assertEqual(mock_task.apply_async.call_count, 2)
 
         # Should return success with count
         self.assertIn("teams_dispatched", result)
@@ -137,6 +137,20 @@ class TestFetchPRCompleteDataTask(TestCase):
         self.assertIn("errors", result)
         self.assertIsInstance(result["errors"], list)
 
+    @patch("apps.integrations._task_modules.pr_data.bump_team_data_version")
+    @patch("apps.integrations._task_modules.pr_data._fetch_pr_rest_only_data")
+    @patch("apps.integrations._task_modules.pr_data._fetch_pr_core_data_with_graphql_or_rest")
+    def test_task_invalidates_dashboard_cache_after_writes(self, mock_core_fetch, mock_rest_fetch, mock_bump):
+        """Test that the team's dashboard cache is invalidated once, after the PR data is written."""
+        from apps.integrations.tasks import fetch_pr_complete_data_task
+
+        mock_core_fetch.return_value = {"commits_synced": 1, "files_synced": 1}
+        mock_rest_fetch.side_effect = lambda *args: mock_bump.assert_not_called() or {}
+
+        fetch_pr_complete_data_task(self.pr.id)
+
+        mock_bump.assert_called_once_with(self.team.id)
+
     def test_task_handles_missing_pull_request(self):
         """Test that task handles missing PullRequest gracefully without raising."""
         from apps.integrations.tasks import fetch_pr_complete_data_task
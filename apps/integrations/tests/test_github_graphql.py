@@ -15,6 +15,7 @@ from apps.integrations.services.github_graphql import (
     GitHubGraphQLPermissionError,
     GitHubGraphQLRateLimitError,
     GitHubGraphQLTimeoutError,
+    GraphQLPagePlanner,
     _is_permission_error,
 )
 
@@ -2162,3 +2163,59 @@ class TestFetcherDatabaseIdMapping(TestCase):
 
         self.assertEqual(pr.github_pr_id, 99)
         self.assertEqual(pr.number, 99)
+
+
+class TestGraphQLPagePlanner(TestCase):
+    """Tests for GraphQLPagePlanner page size adaptation."""
+
+    def test_grows_after_fast_cheap_full_page(self):
+        planner = GraphQLPagePlanner(page_size=10, target_seconds=20, max_cost=10)
+        planner.record_page(page_size=10, cost=1, seconds=2.0, pr_count=10)
+        self.assertEqual(planner.page_size, 15)
+
+    def test_does_not_grow_after_partial_page(self):
+        planner = GraphQLPagePlanner(page_size=10)
+        planner.record_page(page_size=10, cost=1, seconds=2.0, pr_count=4)
+        self.assertEqual(planner.page_size, 10)
+
+    def test_shrinks_after_slow_or_costly_page(self):
+        planner = GraphQLPagePlanner(page_size=20, target_seconds=20, max_cost=10)
+        planner.record_page(page_size=20, cost=1, seconds=30.0, pr_count=20)
+        self.assertEqual(planner.page_size, 10)
+        planner.record_page(page_size=10, cost=12, seconds=1.0, pr_count=10)
+        self.assertEqual(planner.page_size, 5)
+
+    def test_stays_within_bounds(self):
+        planner = GraphQLPagePlanner(page_size=40, min_page_size=2, max_page_size=50)
+        planner.record_page(page_size=40, cost=1, seconds=1.0, pr_count=40)
+        self.assertEqual(planner.page_size, 50)
+        planner = GraphQLPagePlanner(page_size=3, min_page_size=2)
+        self.assertTrue(planner.record_timeout())
+        self.assertEqual(planner.page_size, 2)
+        self.assertFalse(planner.record_timeout())
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("apps.integrations.services.github_graphql.Client")
+    @patch("apps.integrations.services.github_graphql.AIOHTTPTransport")
+    def test_fetch_prs_bulk_retries_timed_out_page_with_smaller_size(
+        self, mock_transport_class, mock_client_class, mock_sleep
+    ):
+        """A page that times out on every attempt is retried at half the size."""
+        import asyncio
+
+        success_response = {
+            "repository": {"pullRequests": {"nodes": [], "pageInfo": {}}},
+            "rateLimit": {"remaining": 5000, "cost": 1},
+        }
+        mock_client, mock_session = create_mock_client_context_manager()
+        mock_session.execute = AsyncMock(side_effect=[TimeoutError(), TimeoutError(), success_response])
+        mock_client_class.return_value = mock_client
+        planner = GraphQLPagePlanner(page_size=10)
+        client = GitHubGraphQLClient("test_token", page_planner=planner)
+
+        result = asyncio.run(client.fetch_prs_bulk("owner", "repo", cursor="abc", max_retries=2))
+
+        self.assertIn("repository", result)
+        page_sizes = [call[1]["variable_values"]["pageSize"] for call in mock_session.execute.call_args_list]
+        self.assertEqual(page_sizes, [10, 10, 5])
+        self.assertEqual(mock_session.execute.call_args[1]["variable_values"]["cursor"], "abc")
@@ -0,0 +1,112 @@
+"""Tests for the GraphQL rate limit budget shared across workers."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from apps.integrations.factories import GitHubIntegrationFactory, TrackedRepositoryFactory
+from apps.integrations.services.github_graphql import GitHubGraphQLBudgetExhaustedError, GitHubGraphQLClient
+from apps.integrations.services.github_graphql_budget import SharedGraphQLRateLimitBudget
+from apps.metrics.factories import TeamFactory
+
+
+def _reset_at(seconds: int) -> str:
+    return (datetime.now(UTC) + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@pytest.mark.usefixtures("use_locmem_cache")
+class TestSharedGraphQLRateLimitBudget(SimpleTestCase):
+    """Tests for SharedGraphQLRateLimitBudget."""
+
+    def test_reservations_are_shared_between_workers(self):
+        worker_a = SharedGraphQLRateLimitBudget("app_installation:1")
+        worker_b = SharedGraphQLRateLimitBudget("app_installation:1")
+        worker_a.update({"remaining": 1000, "cost": 10, "resetAt": _reset_at(600)})
+
+        asyncio.run(worker_a.acquire("op"))
+        asyncio.run(worker_b.acquire("op"))
+        self.assertEqual(worker_b.available, 980)
+
+        worker_a.update({"remaining": 990, "cost": 10, "resetAt": _reset_at(600)})
+        self.assertEqual(worker_b.available, 980)
+
+    def test_each_update_releases_exactly_one_reservation(self):
+        budget = SharedGraphQLRateLimitBudget("app_installation:1")
+        budget.update({"remaining": 1000, "cost": 10, "resetAt": _reset_at(600)})
+
+        asyncio.run(budget.acquire("op"))
+        asyncio.run(budget.acquire("op"))
+        self.assertEqual(cache.get(budget._reserved_key), 20)
+
+        budget.update({"remaining": 990, "cost": 10, "resetAt": _reset_at(600)})
+        self.assertEqual(cache.get(budget._reserved_key), 10)
+        budget.update({"remaining": 980, "cost": 10, "resetAt": _reset_at(600)})
+        self.assertEqual(cache.get(budget._reserved_key), 0)
+        self.assertEqual(budget.available, 980)
+
+    def test_acquire_raises_with_seconds_until_reset_when_exhausted(self):
+        budget = SharedGraphQLRateLimitBudget("app_installation:1", threshold=100)
+        budget.update({"remaining": 105, "cost": 10, "resetAt": _reset_at(120)})
+
+        with self.assertRaises(GitHubGraphQLBudgetExhaustedError) as ctx:
+            asyncio.run(budget.acquire("op"))
+
+        self.assertGreaterEqual(ctx.exception.retry_after, 115)
+        self.assertLessEqual(ctx.exception.retry_after, 130)
+        self.assertEqual(budget.available, 105)
+
+    def test_other_tokens_are_unaffected(self):
+        SharedGraphQLRateLimitBudget("app_installation:1").update({"remaining": 0, "resetAt": _reset_at(600)})
+
+        asyncio.run(SharedGraphQLRateLimitBudget("app_installation:2").acquire("op"))
+
+    def test_state_of_a_past_window_is_ignored(self):
+        budget = SharedGraphQLRateLimitBudget("app_installation:1")
+        budget.update({"remaining": 0, "resetAt": _reset_at(-60)})
+
+        asyncio.run(budget.acquire("op"))
+        self.assertIsNone(budget.available)
+
+    @patch("apps.integrations.services.github_graphql_budget.cache")
+    def test_cache_errors_let_queries_through(self, mock_cache):
+        mock_cache.get.side_effect = ConnectionError("redis down")
+        mock_cache.incr.side_effect = ConnectionError("redis down")
+        budget = SharedGraphQLRateLimitBudget("app_installation:1")
+
+        asyncio.run(budget.acquire("op"))
+        budget.update({"remaining": 50, "resetAt": _reset_at(600)})
+
+    @patch("apps.integrations.services.github_rate_limit.wait_for_rate_limit_reset_async", new_callable=AsyncMock)
+    def test_client_does_not_sleep_when_budget_defers(self, mock_wait):
+        client = GitHubGraphQLClient("token", rate_limit_budget=SharedGraphQLRateLimitBudget("app_installation:1"))
+
+        asyncio.run(client._check_rate_limit({"rateLimit": {"remaining": 10, "resetAt": _reset_at(600)}}, "op"))
+
+        mock_wait.assert_not_awaited()
+
+
+class TestSyncRepositoryTaskDeferral(TestCase):
+    """Tests for rescheduling sync tasks when the shared budget is spent."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        integration = GitHubIntegrationFactory(team=self.team)
+        self.tracked_repo = TrackedRepositoryFactory(team=self.team, integration=integration, is_active=True)
+
+    @patch("apps.integrations._task_modules.github_sync.sync_repository_task.apply_async")
+    @patch("apps.integrations._task_modules.github_sync._sync_incremental_with_graphql_or_rest")
+    def test_reschedules_instead_of_retrying(self, mock_sync, mock_apply_async):
+        from apps.integrations._task_modules.github_sync import sync_repository_task
+
+        mock_sync.side_effect = GitHubGraphQLBudgetExhaustedError("spent", retry_after=120)
+
+        result = sync_repository_task(self.tracked_repo.id)
+
+        self.assertEqual(result, {"deferred": True, "retry_after": 120})
+        mock_apply_async.assert_called_once()
+        self.assertEqual(mock_apply_async.call_args[1]["countdown"], 120)
+        self.assertEqual(list(mock_apply_async.call_args[1]["args"]), [self.tracked_repo.id])
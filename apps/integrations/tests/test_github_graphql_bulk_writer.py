@@ -0,0 +1,143 @@
+"""Tests for the page-level bulk writer used by GitHub GraphQL history sync."""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.integrations.services.github_graphql_sync._bulk_writer import persist_pr_page
+from apps.integrations.services.github_graphql_sync._utils import SyncResult
+from apps.integrations.tests.test_github_graphql_sync import create_graphql_pr_response
+from apps.metrics.factories import PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.models import Commit, PRFile, PRReview, PullRequest
+
+
+class TestPersistPRPage(TestCase):
+    """Tests for persist_pr_page."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        self.author = TeamMemberFactory(team=self.team, github_username="testuser")
+        self.reviewer = TeamMemberFactory(team=self.team, github_username="reviewer1")
+
+    def test_persists_page_with_nested_records(self):
+        pr_nodes = [create_graphql_pr_response(pr_number=n) for n in (1, 2, 3)]
+        result = SyncResult()
+
+        persisted = persist_pr_page(self.team, "owner/repo", pr_nodes, result)
+
+        self.assertEqual(persisted, 3)
+        self.assertEqual(result.prs_synced, 3)
+        self.assertEqual(result.reviews_synced, 3)
+        self.assertEqual(result.commits_synced, 3)
+        self.assertEqual(result.files_synced, 6)
+        self.assertEqual(PullRequest.objects.filter(team=self.team).count(), 3)
+        self.assertEqual(PRReview.objects.filter(team=self.team).count(), 3)
+        self.assertEqual(Commit.objects.filter(team=self.team).count(), 3)
+        self.assertEqual(PRFile.objects.filter(team=self.team).count(), 6)
+
+    def test_links_members_and_computes_timing(self):
+        result = SyncResult()
+
+        persist_pr_page(self.team, "owner/repo", [create_graphql_pr_response(pr_number=7)], result)
+
+        pr = PullRequest.objects.get(team=self.team, github_pr_id=7)
+        self.assertEqual(pr.author, self.author)
+        self.assertAlmostEqual(float(pr.cycle_time_hours), 24.0, places=1)
+        self.assertAlmostEqual(float(pr.review_time_hours), 12.0, places=1)
+        review = PRReview.objects.get(team=self.team, pull_request=pr)
+        self.assertEqual(review.reviewer, self.reviewer)
+        commit = Commit.objects.get(team=self.team, pull_request=pr)
+        self.assertEqual(commit.author, self.author)
+
+    def test_detects_ai_involvement(self):
+        pr_data = create_graphql_pr_response(pr_number=8)
+        pr_data["body"] = "Generated with [Claude Code](https://claude.com/claude-code)"
+        result = SyncResult()
+
+        persist_pr_page(self.team, "owner/repo", [pr_data], result)
+
+        pr = PullRequest.objects.get(team=self.team, github_pr_id=8)
+        self.assertTrue(pr.is_ai_assisted)
+        self.assertTrue(pr.ai_tools_detected)
+        self.assertTrue(pr.resolved_is_ai_assisted)
+
+    def test_updates_existing_rows_without_duplicates(self):
+        pr_data = create_graphql_pr_response(pr_number=9)
+        persist_pr_page(self.team, "owner/repo", [pr_data], SyncResult())
+
+        pr_data["title"] = "Renamed"
+        pr_data["reviews"]["nodes"][0]["body"] = "Changed my mind"
+        pr_data["files"]["nodes"][0]["additions"] = 1
+        persist_pr_page(self.team, "owner/repo", [pr_data], SyncResult())
+
+        pr = PullRequest.objects.get(team=self.team, github_pr_id=9)
+        self.assertEqual(pr.title, "Renamed")
+        self.assertEqual(PRReview.objects.get(team=self.team, pull_request=pr).body, "Changed my mind")
+        self.assertEqual(PRFile.objects.get(team=self.team, pull_request=pr, filename="src/app.py").additions, 1)
+        self.assertEqual(PRFile.objects.filter(team=self.team, pull_request=pr).count(), 2)
+        self.assertEqual(Commit.objects.filter(team=self.team).count(), 1)
+
+    def test_updated_reviews_get_a_new_updated_at(self):
+        pr_data = create_graphql_pr_response(pr_number=10)
+        persist_pr_page(self.team, "owner/repo", [pr_data], SyncResult())
+        PRReview.objects.filter(team=self.team).update(updated_at=timezone.now() - timedelta(days=1))
+
+        persist_pr_page(self.team, "owner/repo", [pr_data], SyncResult())
+
+        review = PRReview.objects.get(team=self.team, pull_request__github_pr_id=10)
+        self.assertGreater(review.updated_at, timezone.now() - timedelta(minutes=1))
+
+    def test_keeps_columns_not_owned_by_sync(self):
+        PullRequestFactory(
+            team=self.team,
+            github_repo="owner/repo",
+            github_pr_id=10,
+            author=self.author,
+            llm_summary={"ai": {"is_assisted": True, "tools": ["cursor"], "confidence": 0.9}},
+        )
+
+        persist_pr_page(self.team, "owner/repo", [create_graphql_pr_response(pr_number=10)], SyncResult())
+
+        pr = PullRequest.objects.get(team=self.team, github_pr_id=10)
+        self.assertEqual(pr.llm_summary["ai"]["tools"], ["cursor"])
+        self.assertTrue(pr.resolved_is_ai_assisted)
+
+    def test_skips_prs_outside_date_range(self):
+        now = timezone.now()
+        old_pr = create_graphql_pr_response(pr_number=11)
+        old_pr["createdAt"] = (now - timedelta(days=200)).isoformat()
+        recent_pr = create_graphql_pr_response(pr_number=12)
+        result = SyncResult()
+
+        persisted = persist_pr_page(
+            self.team, "owner/repo", [old_pr, recent_pr], result, cutoff_date=now - timedelta(days=90)
+        )
+
+        self.assertEqual(persisted, 1)
+        self.assertFalse(PullRequest.objects.filter(team=self.team, github_pr_id=11).exists())
+
+    def test_records_error_for_pr_without_author(self):
+        bad_pr = create_graphql_pr_response(pr_number=13)
+        bad_pr["author"] = None
+        result = SyncResult()
+
+        persisted = persist_pr_page(self.team, "owner/repo", [bad_pr, create_graphql_pr_response(pr_number=14)], result)
+
+        self.assertEqual(persisted, 1)
+        self.assertEqual(result.prs_synced, 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("#13", result.errors[0])
+
+    def test_writes_in_constant_queries_per_page(self):
+        small_page = [create_graphql_pr_response(pr_number=n) for n in range(100, 102)]
+        large_page = [create_graphql_pr_response(pr_number=n) for n in range(200, 220)]
+
+        with CaptureQueriesContext(connection) as small_ctx:
+            persist_pr_page(self.team, "owner/repo", small_page, SyncResult())
+        with CaptureQueriesContext(connection) as large_ctx:
+            persist_pr_page(self.team, "owner/repo", large_page, SyncResult())
+
+        self.assertEqual(len(small_ctx.captured_queries), len(large_ctx.captured_queries))
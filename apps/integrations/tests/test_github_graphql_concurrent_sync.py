@@ -0,0 +1,195 @@
+"""Tests for prefetching and concurrent GitHub GraphQL history sync."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase, TransactionTestCase
+
+from apps.integrations.factories import TrackedRepositoryFactory
+from apps.integrations.services.github_graphql import GitHubGraphQLRateLimitError, GraphQLRateLimitBudget
+from apps.integrations.services.github_graphql_sync import sync_repositories_history, sync_repository_history_graphql
+from apps.integrations.tests.test_github_graphql_sync import create_graphql_pr_response, create_mock_graphql_client
+from apps.metrics.factories import TeamFactory, TeamMemberFactory
+from apps.metrics.models import PullRequest
+
+
+class TestGraphQLRateLimitBudget(SimpleTestCase):
+    """Tests for GraphQLRateLimitBudget."""
+
+    def test_acquire_does_not_wait_before_first_response(self):
+        budget = GraphQLRateLimitBudget(threshold=100)
+
+        asyncio.run(budget.acquire("op"))
+
+        self.assertIsNone(budget.available)
+
+    def test_update_keeps_lowest_remaining_within_window(self):
+        budget = GraphQLRateLimitBudget()
+        budget.update({"remaining": 4000, "resetAt": "2025-01-01T00:00:00Z"})
+        budget.update({"remaining": 4200, "resetAt": "2025-01-01T00:00:00Z"})
+
+        self.assertEqual(budget.remaining, 4000)
+
+        budget.update({"remaining": 5000, "resetAt": "2025-01-01T01:00:00Z"})
+        self.assertEqual(budget.remaining, 5000)
+
+    def test_reservations_count_against_available_points(self):
+        budget = GraphQLRateLimitBudget()
+        budget.update({"remaining": 4000, "cost": 10, "resetAt": "2025-01-01T00:00:00Z"})
+
+        asyncio.run(budget.acquire("op"))
+        asyncio.run(budget.acquire("op"))
+        self.assertEqual(budget.available, 3980)
+
+        budget.release()
+        self.assertEqual(budget.available, 3990)
+
+    @patch("apps.integrations.services.github_rate_limit.wait_for_rate_limit_reset_async", new_callable=AsyncMock)
+    def test_acquire_waits_for_reset_when_exhausted(self, mock_wait):
+        mock_wait.return_value = True
+        budget = GraphQLRateLimitBudget(threshold=100)
+        budget.update({"remaining": 50, "resetAt": "2025-01-01T00:00:00Z"})
+
+        asyncio.run(budget.acquire("op"))
+
+        mock_wait.assert_awaited_once_with("2025-01-01T00:00:00Z", budget.max_wait_seconds)
+        self.assertIsNone(budget.remaining)
+
+    @patch("apps.integrations.services.github_rate_limit.wait_for_rate_limit_reset_async", new_callable=AsyncMock)
+    def test_acquire_raises_when_reset_too_far(self, mock_wait):
+        mock_wait.return_value = False
+        budget = GraphQLRateLimitBudget(threshold=100)
+        budget.update({"remaining": 50, "resetAt": "2025-01-01T00:00:00Z"})
+
+        with self.assertRaises(GitHubGraphQLRateLimitError):
+            asyncio.run(budget.acquire("op"))
+
+
+class TestSyncRepositoriesHistory(SimpleTestCase):
+    """Tests for sync_repositories_history concurrency and budget sharing."""
+
+    def _repo(self, repo_id, installation_id=None, integration_id=None):
+        return SimpleNamespace(
+            id=repo_id,
+            full_name=f"org/repo-{repo_id}",
+            app_installation_id=installation_id,
+            integration_id=integration_id,
+        )
+
+    def test_bounds_concurrency_and_shares_budget_per_installation(self):
+        running = 0
+        peak = 0
+        budgets = {}
+
+        async def fake_sync(tracked_repo, days_back, skip_recent, rate_limit_budget):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            budgets[tracked_repo.id] = rate_limit_budget
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"prs_synced": tracked_repo.id, "errors": []}
+
+        repos = [self._repo(i, installation_id=1) for i in range(1, 6)] + [self._repo(6, integration_id=9)]
+        with patch(
+            "apps.integrations.services.github_graphql_sync.multi_repo.sync_repository_history_graphql",
+            side_effect=fake_sync,
+        ):
+            results = asyncio.run(sync_repositories_history(repos, max_concurrent_repos=2))
+
+        self.assertEqual({repo_id: r["prs_synced"] for repo_id, r in results.items()}, {i: i for i in range(1, 7)})
+        # Two per installation plus one for the OAuth-only repo
+        self.assertLessEqual(peak, 3)
+        self.assertEqual(len({id(budgets[i]) for i in range(1, 6)}), 1)
+        self.assertIsNot(budgets[1], budgets[6])
+
+    def test_failed_repo_does_not_abort_others(self):
+        async def fake_sync(tracked_repo, **kwargs):
+            if tracked_repo.id == 1:
+                raise RuntimeError("boom")
+            return {"prs_synced": 3, "errors": []}
+
+        repos = [self._repo(1, installation_id=1), self._repo(2, installation_id=1)]
+        with patch(
+            "apps.integrations.services.github_graphql_sync.multi_repo.sync_repository_history_by_search",
+            side_effect=fake_sync,
+        ):
+            results = asyncio.run(sync_repositories_history(repos, use_search_api=True))
+
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2]["prs_synced"], 3)
+
+    def test_reports_each_repo_as_it_finishes(self):
+        async def fake_sync(tracked_repo, **kwargs):
+            # Repo 1 finishes last even though it starts first
+            await asyncio.sleep(0.02 if tracked_repo.id == 1 else 0)
+            if tracked_repo.id == 3:
+                raise RuntimeError("boom")
+            return {"prs_synced": 1, "errors": []}
+
+        done = []
+        repos = [self._repo(i, installation_id=1) for i in (1, 2, 3)]
+        with patch(
+            "apps.integrations.services.github_graphql_sync.multi_repo.sync_repository_history_graphql",
+            side_effect=fake_sync,
+        ):
+            asyncio.run(
+                sync_repositories_history(repos, on_repo_done=lambda repo, outcome: done.append((repo.id, outcome)))
+            )
+
+        self.assertEqual(done[-1][0], 1)
+        self.assertEqual(len(done), 3)
+        self.assertIsInstance(dict(done)[3], RuntimeError)
+
+
+class TestHistorySyncPrefetch(TransactionTestCase):
+    """Tests that history sync requests the next page before persisting the current one."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        self.tracked_repo = TrackedRepositoryFactory(team=self.team, full_name="owner/repo")
+        TeamMemberFactory(team=self.team, github_username="testuser")
+
+    @patch("apps.integrations.services.github_graphql_sync.GitHubGraphQLClient")
+    def test_next_page_is_fetched_before_current_page_is_persisted(self, mock_client_class):
+        mock_client = create_mock_graphql_client()
+        mock_client_class.return_value = mock_client
+        events = []
+
+        pages = [
+            {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [create_graphql_pr_response(pr_number=n)],
+                        "pageInfo": {"hasNextPage": n < 3, "endCursor": f"cursor{n}"},
+                    }
+                },
+                "rateLimit": {"remaining": 5000},
+            }
+            for n in (1, 2, 3)
+        ]
+
+        async def fetch_prs_bulk(owner, repo, cursor=None):
+            events.append(("fetch", cursor))
+            return pages[0 if cursor is None else int(cursor[-1])]
+
+        mock_client.fetch_prs_bulk = AsyncMock(side_effect=fetch_prs_bulk)
+
+        from apps.integrations.services.github_graphql_sync import history
+
+        original_persist = history.persist_pr_page_async
+
+        async def tracking_persist(team_id, github_repo, pr_nodes, *args):
+            # Give the prefetch task a chance to start before the write begins
+            await asyncio.sleep(0)
+            events.append(("persist", pr_nodes[0]["number"]))
+            return await original_persist(team_id, github_repo, pr_nodes, *args)
+
+        with patch.object(history, "persist_pr_page_async", side_effect=tracking_persist):
+            result = asyncio.run(sync_repository_history_graphql(self.tracked_repo, days_back=90))
+
+        self.assertEqual(result["prs_synced"], 3)
+        self.assertEqual(PullRequest.objects.filter(team=self.team).count(), 3)
+        self.assertLess(events.index(("fetch", "cursor1")), events.index(("persist", 1)))
+        self.assertLess(events.index(("fetch", "cursor2")), events.index(("persist", 2)))
@@ -1449,6 +1449,66 @@ class TestFetchPRCompleteDataGraphQLErrorHandling(TransactionTestCase):
         self.assertTrue(len(result["errors"]) > 0)
 
 
+class TestFetchPRsCompleteDataGraphQL(TransactionTestCase):
+    """Tests for the batched fetch_prs_complete_data_graphql."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from apps.metrics.factories import PullRequestFactory
+
+        self.team = TeamFactory()
+        self.author = TeamMemberFactory(team=self.team, github_username="testuser")
+        self.tracked_repo = TrackedRepositoryFactory(
+            team=self.team,
+            full_name="test-org/test-repo",
+            is_active=True,
+        )
+        self.prs = [
+            PullRequestFactory(team=self.team, author=self.author, github_repo="test-org/test-repo", github_pr_id=n)
+            for n in (41, 42)
+        ]
+
+    @patch("apps.integrations.services.github_graphql_sync.GitHubGraphQLClient")
+    def test_fetches_prs_in_one_query_and_persists_nested_data(self, mock_client_class):
+        """Test that the PRs of a repository share one aliased query."""
+        from apps.integrations.services.github_graphql_sync import fetch_prs_complete_data_graphql
+
+        mock_client = create_mock_graphql_client()
+        mock_client_class.return_value = mock_client
+        mock_client.fetch_prs_by_number = AsyncMock(
+            return_value={n: create_graphql_pr_response(pr_number=n) for n in (41, 42)}
+        )
+
+        results = asyncio.run(fetch_prs_complete_data_graphql(self.prs, self.tracked_repo))
+
+        mock_client.fetch_prs_by_number.assert_called_once_with("test-org", "test-repo", [41, 42])
+        for pr in self.prs:
+            self.assertEqual(results[pr.id]["errors"], [])
+            self.assertEqual(results[pr.id]["commits_synced"], 1)
+            self.assertEqual(Commit.objects.filter(team=self.team, pull_request=pr).count(), 1)
+            self.assertEqual(PRFile.objects.filter(team=self.team, pull_request=pr).count(), 2)
+
+    @patch("apps.integrations.services.github_graphql_sync.GitHubGraphQLClient")
+    def test_reports_missing_prs_and_query_failures_per_pr(self, mock_client_class):
+        """Test that PRs the batch couldn't fetch carry errors for the per-PR fallback."""
+        from apps.integrations.services.github_graphql_sync import fetch_prs_complete_data_graphql
+
+        mock_client = create_mock_graphql_client()
+        mock_client_class.return_value = mock_client
+        mock_client.fetch_prs_by_number = AsyncMock(return_value={41: create_graphql_pr_response(41), 42: None})
+
+        results = asyncio.run(fetch_prs_complete_data_graphql(self.prs, self.tracked_repo))
+
+        self.assertEqual(results[self.prs[0].id]["errors"], [])
+        self.assertIn("not found", results[self.prs[1].id]["errors"][0])
+
+        mock_client.fetch_prs_by_number = AsyncMock(side_effect=GitHubGraphQLError("Could not resolve"))
+
+        results = asyncio.run(fetch_prs_complete_data_graphql(self.prs, self.tracked_repo))
+
+        self.assertTrue(all(result["errors"] for result in results.values()))
+
+
 # =============================================================================
 # Phase 5: sync_github_members_graphql Tests
 # =============================================================================
@@ -2541,3 +2601,101 @@ class TestSyncRepositoryHistoryBySearch(TransactionTestCase):
         self.assertIn("commits_synced", result)
         self.assertIn("files_synced", result)
         self.assertIn("errors", result)
+
+
+class TestSyncRepositoryHistoryGraphQLPlanner(TransactionTestCase):
+    """Tests for early cutoff and overflow follow-ups in sync_repository_history_graphql."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.team = TeamFactory()
+        self.tracked_repo = TrackedRepositoryFactory(team=self.team, full_name="owner/repo")
+        self.author = TeamMemberFactory(team=self.team, github_username="testuser")
+        TeamMemberFactory(team=self.team, github_username="reviewer1")
+
+    @patch("apps.integrations.services.github_graphql_sync.GitHubGraphQLClient")
+    def test_stops_paginating_once_page_ends_before_cutoff(self, mock_client_class):
+        """Pages after one ending before days_back are never requested."""
+        mock_client = create_mock_graphql_client()
+        mock_client_class.return_value = mock_client
+
+        recent_pr = create_graphql_pr_response(pr_number=2)
+        old_pr = create_graphql_pr_response(pr_number=1)
+        old_pr["createdAt"] = (timezone.now() - timedelta(days=100)).isoformat()
+        mock_client.fetch_prs_bulk = AsyncMock(
+            return_value={
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [recent_pr, old_pr],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "cursor_older"},
+                    }
+                },
+                "rateLimit": {"remaining": 5000},
+            }
+        )
+
+        result = asyncio.run(sync_repository_history_graphql(self.tracked_repo, days_back=90))
+
+        self.assertEqual(mock_client.fetch_prs_bulk.call_count, 1)
+        self.assertEqual(result["prs_synced"], 1)
+
+    @patch("apps.integrations.services.github_graphql_sync.GitHubGraphQLClient")
+    def test_fetches_remaining_reviews_for_overflowing_prs_only(self, mock_client_class):
+        """Only connections reporting hasNextPage get follow-up queries."""
+        mock_client = create_mock_graphql_client()
+        mock_client_class.return_value = mock_client
+
+        busy_pr = create_graphql_pr_response(pr_number=1)
+        busy_pr["reviews"]["pageInfo"] = {"hasNextPage": True, "endCursor": "reviews_cursor"}
+        quiet_pr = create_graphql_pr_response(pr_number=2)
+        mock_client.fetch_prs_bulk = AsyncMock(
+            return_value={
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [busy_pr, quiet_pr],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                },
+                "rateLimit": {"remaining": 5000},
+            }
+        )
+        extra_review = dict(busy_pr["reviews"]["nodes"][0], databaseId=3000001, state="COMMENTED")
+        mock_client.fetch_pr_connection_page = AsyncMock(
+            return_value={"nodes": [extra_review], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+        )
+
+        asyncio.run(sync_repository_history_graphql(self.tracked_repo, days_back=90))
+
+        mock_client.fetch_pr_connection_page.assert_called_once_with("owner", "repo", 1, "reviews", "reviews_cursor")
+        self.assertEqual(PRReview.objects.filter(team=self.team, pull_request__github_pr_id=1).count(), 2)
+
+    def test_limits_concurrent_follow_up_queries(self):
+        """Overflowing connections are completed at most MAX_CONCURRENT_CONNECTION_QUERIES at a time."""
+        from apps.integrations.services.github_graphql_sync.history import (
+            MAX_CONCURRENT_CONNECTION_QUERIES,
+            _fetch_overflowing_connections,
+        )
+
+        pr_nodes = []
+        for number in range(1, 11):
+            pr_data = create_graphql_pr_response(pr_number=number)
+            pr_data["reviews"]["pageInfo"] = {"hasNextPage": True, "endCursor": "reviews_cursor"}
+            pr_nodes.append(pr_data)
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+        mock_client = MagicMock()
+        mock_client.fetch_pr_connection_page = fetch_page
+
+        queries = asyncio.run(_fetch_overflowing_connections(mock_client, "owner", "repo", pr_nodes))
+
+        self.assertEqual(queries, 10)
+        self.assertEqual(peak, MAX_CONCURRENT_CONNECTION_QUERIES)
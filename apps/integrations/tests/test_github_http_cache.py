@@ -0,0 +1,109 @@
+"""Tests for conditional GitHub REST requests."""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from django.test import TestCase
+from requests.adapters import HTTPAdapter
+
+from apps.integrations.services.github_http_cache import (
+    ConditionalRequestAdapter,
+    conditional_get,
+    get_conditional_request_stats,
+)
+
+URL = "https://api.github.com/repos/acme/api/languages"
+
+
+def _response(status_code, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = URL
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.usefixtures("use_locmem_cache")
+class TestConditionalGet(TestCase):
+    """Tests for conditional_get."""
+
+    def setUp(self):
+        self.headers = {"Authorization": "Bearer token-a", "Accept": "application/vnd.github+json"}
+
+    @patch("apps.integrations.services.github_http_cache.requests.get")
+    def test_replays_cached_body_on_304(self, mock_get):
+        mock_get.side_effect = [
+            _response(200, b'{"Python": 100}', {"ETag": '"abc"', "X-RateLimit-Remaining": "4999"}),
+            _response(304, headers={"ETag": '"abc"', "X-RateLimit-Remaining": "4999"}),
+        ]
+
+        first = conditional_get(URL, headers=self.headers, timeout=30)
+        second = conditional_get(URL, headers=self.headers, timeout=30)
+
+        self.assertEqual(first.json(), {"Python": 100})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), {"Python": 100})
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[0][1]["headers"])
+        self.assertEqual(mock_get.call_args_list[1][1]["headers"]["If-None-Match"], '"abc"')
+        self.assertEqual(get_conditional_request_stats(), {"conditional": 1, "not_modified": 1, "stored": 1})
+
+    @patch("apps.integrations.services.github_http_cache.requests.get")
+    def test_entries_are_scoped_to_the_token(self, mock_get):
+        mock_get.return_value = _response(200, b"{}", {"ETag": '"abc"'})
+
+        conditional_get(URL, headers=self.headers)
+        conditional_get(URL, headers={**self.headers, "Authorization": "Bearer token-b"})
+
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[1][1]["headers"])
+
+    @patch("apps.integrations.services.github_http_cache.requests.get")
+    def test_does_not_store_responses_without_validators(self, mock_get):
+        mock_get.return_value = _response(200, b"{}")
+
+        conditional_get(URL, headers=self.headers)
+        conditional_get(URL, headers=self.headers)
+
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[1][1]["headers"])
+        self.assertEqual(get_conditional_request_stats()["stored"], 0)
+
+
+@pytest.mark.usefixtures("use_locmem_cache")
+class TestConditionalRequestAdapter(TestCase):
+    """Tests for the adapter PyGithub sessions send requests through."""
+
+    def setUp(self):
+        self.session = requests.Session()
+        self.session.mount("https://", ConditionalRequestAdapter())
+
+    @patch.object(HTTPAdapter, "send")
+    def test_replays_cached_body_with_fresh_rate_limit_headers(self, mock_send):
+        mock_send.side_effect = [
+            _response(200, b"[1]", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT", "Link": "<next>; rel=next"}),
+            _response(304, headers={"X-RateLimit-Remaining": "4000"}),
+        ]
+
+        self.session.get(URL, headers={"Authorization": "token a"})
+        replayed = self.session.get(URL, headers={"Authorization": "token a"})
+
+        sent = mock_send.call_args_list[1][0][0]
+        self.assertEqual(sent.headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(replayed.status_code, 200)
+        self.assertEqual(replayed.json(), [1])
+        self.assertEqual(replayed.headers["Link"], "<next>; rel=next")
+        self.assertEqual(replayed.headers["X-RateLimit-Remaining"], "4000")
+
+    @patch.object(HTTPAdapter, "send")
+    def test_leaves_requests_with_their_own_validator_alone(self, mock_send):
+        mock_send.side_effect = [
+            _response(200, b"[1]", {"ETag": '"abc"'}),
+            _response(304),
+        ]
+
+        self.session.get(URL)
+        response = self.session.get(URL, headers={"If-None-Match": '"caller"'})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(mock_send.call_args_list[1][0][0].headers["If-None-Match"], '"caller"')
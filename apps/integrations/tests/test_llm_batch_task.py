@@ -7,8 +7,9 @@ The task should:
 1. Find PRs where llm_summary is NULL
 2. Process them in batches (configurable batch size)
 3. Update PRs with LLM results
-4. Skip PRs that already have llm_summary
+4. Skip PRs that already have a current llm_summary
 5. Respect team isolation - only process PRs for the specified team
+6. Re-submit outdated summaries only when the LLM input hash changed
 """
 
 from unittest.mock import MagicMock, patch
@@ -20,6 +21,7 @@ from apps.integrations.factories import (
     IntegrationCredentialFactory,
 )
 from apps.metrics.factories import PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.prompts.constants import PROMPT_VERSION
 
 
 class TestQueueLLMAnalysisBatchTask(TestCase):
@@ -64,6 +66,7 @@ class TestQueueLLMAnalysisBatchTask(TestCase):
             author=self.member,
             body="PR with LLM summary",
             llm_summary={"ai": {"is_assisted": True}},
+            llm_summary_version=PROMPT_VERSION,
             state="merged",
         )
 
@@ -187,6 +190,7 @@ class TestQueueLLMAnalysisBatchTask(TestCase):
                 "ai": {"is_assisted": False, "tools": [], "confidence": 0.1},
                 "tech": {"languages": ["python"], "categories": ["backend"]},
             },
+            llm_summary_version=PROMPT_VERSION,
             state="merged",
         )
 
@@ -205,6 +209,42 @@ class TestQueueLLMAnalysisBatchTask(TestCase):
                 processed_pr_ids = [pr.id for pr in processed_prs]
                 self.assertNotIn(pr_with_summary.id, processed_pr_ids)
 
+    def test_outdated_summary_with_unchanged_input_is_not_resubmitted(self):
+        """Outdated summaries whose input hash still matches are only marked current."""
+        from apps.integrations.tasks import queue_llm_analysis_batch_task
+
+        unchanged = PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            body="Unchanged PR",
+            llm_summary={"ai": {"is_assisted": False}},
+            llm_summary_version="0.0.1",
+            llm_input_hash="same",
+            state="merged",
+        )
+        changed = PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            body="Edited PR",
+            llm_summary={"ai": {"is_assisted": False}},
+            llm_summary_version="0.0.1",
+            llm_input_hash="stale",
+            state="merged",
+        )
+
+        with patch("apps.integrations._task_modules.metrics.GroqBatchProcessor") as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor_class.return_value = mock_processor
+            mock_processor.input_hash.return_value = "same"
+            mock_processor.submit_batch_with_fallback.return_value = ([], {})
+
+            queue_llm_analysis_batch_task(self.team.id)
+
+            processed_prs = mock_processor.submit_batch_with_fallback.call_args[0][0]
+            self.assertEqual([pr.id for pr in processed_prs], [changed.id])
+        unchanged.refresh_from_db()
+        self.assertEqual(unchanged.llm_summary_version, PROMPT_VERSION)
+
     def test_team_isolation(self):
         """Test that task only processes PRs for the specified team."""
         from apps.integrations.tasks import queue_llm_analysis_batch_task
@@ -311,6 +351,7 @@ class TestQueueLLMAnalysisBatchTask(TestCase):
             author=self.member,
             body="PR with summary",
             llm_summary={"ai": {"is_assisted": False}},
+            llm_summary_version=PROMPT_VERSION,
             state="merged",
         )
 
@@ -0,0 +1,150 @@
+"""Tests for the batched post-merge PR data fetch."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.integrations.factories import GitHubIntegrationFactory, IntegrationCredentialFactory, TrackedRepositoryFactory
+from apps.integrations.models import PendingPRDataFetch
+from apps.integrations.services.pr_data_queue import (
+    MAX_ATTEMPTS,
+    STALE_CLAIM_SECONDS,
+    claim_pr_data_fetches,
+    queue_pr_data_fetch,
+    release_pr_data_fetches,
+    requeue_stale_pr_data_fetches,
+)
+from apps.metrics.factories import PullRequestFactory, TeamFactory
+
+
+class PRDataQueueTestCase(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        credential = IntegrationCredentialFactory(team=self.team, provider="github", access_token="token")
+        integration = GitHubIntegrationFactory(team=self.team, credential=credential)
+        self.tracked_repo = TrackedRepositoryFactory(
+            team=self.team, integration=integration, full_name="acme/api", is_active=True
+        )
+
+    def _merged_pr(self, number):
+        return PullRequestFactory(team=self.team, github_repo="acme/api", github_pr_id=number, state="merged")
+
+
+@pytest.mark.usefixtures("use_locmem_cache")
+class TestQueuePRDataFetch(PRDataQueueTestCase):
+    """Tests for queue_pr_data_fetch (the batch task dedupe needs a real cache)."""
+
+    @patch("apps.integrations.tasks.fetch_pr_data_batch_task")
+    def test_merges_in_a_window_share_one_batch_task(self, mock_task):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_pr_data_fetch(self._merged_pr(1))
+            queue_pr_data_fetch(self._merged_pr(2))
+
+        self.assertEqual(PendingPRDataFetch.objects.filter(tracked_repository=self.tracked_repo).count(), 2)
+        mock_task.apply_async.assert_called_once()
+        self.assertEqual(mock_task.apply_async.call_args[1]["args"], [self.tracked_repo.id])
+
+    @patch("apps.integrations.tasks.fetch_pr_data_batch_task")
+    def test_requeueing_a_pr_is_a_no_op(self, mock_task):
+        pr = self._merged_pr(1)
+
+        first = queue_pr_data_fetch(pr)
+        second = queue_pr_data_fetch(pr)
+
+        self.assertEqual(first.id, second.id)
+
+    def test_skips_untracked_repositories(self):
+        pr = PullRequestFactory(team=self.team, github_repo="acme/other", state="merged")
+
+        self.assertIsNone(queue_pr_data_fetch(pr))
+
+
+@patch("apps.integrations.tasks.fetch_pr_data_batch_task")
+class TestClaimAndRelease(PRDataQueueTestCase):
+    """Tests for claiming, releasing and sweeping queued fetches."""
+
+    def test_claimed_fetches_are_not_claimed_again(self, mock_task):
+        for number in (1, 2, 3):
+            queue_pr_data_fetch(self._merged_pr(number))
+
+        first = claim_pr_data_fetches(self.tracked_repo.id, limit=2)
+        second = claim_pr_data_fetches(self.tracked_repo.id, limit=2)
+
+        self.assertEqual([f.pull_request.github_pr_id for f in first], [1, 2])
+        self.assertEqual([f.pull_request.github_pr_id for f in second], [3])
+
+    def test_release_drops_fetches_out_of_attempts(self, mock_task):
+        fetch = queue_pr_data_fetch(self._merged_pr(1))
+        fetch.attempts = MAX_ATTEMPTS - 1
+        fetch.save()
+
+        release_pr_data_fetches(claim_pr_data_fetches(self.tracked_repo.id), "boom")
+
+        self.assertFalse(PendingPRDataFetch.objects.filter(id=fetch.id).exists())
+
+    def test_sweep_releases_stale_claims_and_reschedules(self, mock_task):
+        fetch = queue_pr_data_fetch(self._merged_pr(1))
+        PendingPRDataFetch.objects.filter(id=fetch.id).update(
+            created_at=timezone.now() - timedelta(hours=1),
+            claimed_at=timezone.now() - timedelta(seconds=STALE_CLAIM_SECONDS + 60),
+        )
+
+        self.assertEqual(requeue_stale_pr_data_fetches(), 1)
+
+        fetch.refresh_from_db()
+        self.assertIsNone(fetch.claimed_at)
+        mock_task.apply_async.assert_called_with(args=[self.tracked_repo.id], countdown=30)
+
+
+@override_settings(GITHUB_API_CONFIG={"USE_GRAPHQL": True, "GRAPHQL_OPERATIONS": {"pr_complete_data": True}})
+@patch("apps.integrations.tasks.fetch_pr_data_batch_task")
+class TestFetchPRDataBatchTask(PRDataQueueTestCase):
+    """Tests for fetch_pr_data_batch_task."""
+
+    @patch("apps.integrations._task_modules.pr_data._fetch_pr_rest_only_data")
+    @patch("apps.integrations._task_modules.pr_data._fetch_pr_core_data_with_graphql_or_rest")
+    @patch("apps.integrations.services.github_graphql_sync.fetch_prs_complete_data_graphql", new_callable=AsyncMock)
+    def test_fetches_queued_prs_together_and_falls_back_per_pr(
+        self, mock_batch_fetch, mock_single_fetch, mock_rest_fetch, mock_task
+    ):
+        # The re-export in apps.integrations.tasks is patched to keep queue_pr_data_fetch from dispatching
+        from apps.integrations._task_modules.pr_data import fetch_pr_data_batch_task
+
+        prs = [self._merged_pr(number) for number in (1, 2)]
+        for pr in prs:
+            queue_pr_data_fetch(pr)
+        mock_batch_fetch.return_value = {
+            prs[0].id: {"commits_synced": 3, "errors": []},
+            prs[1].id: {"commits_synced": 0, "errors": ["PR #2 not found in GraphQL response"]},
+        }
+        mock_rest_fetch.return_value = {}
+
+        result = fetch_pr_data_batch_task(self.tracked_repo.id)
+
+        mock_batch_fetch.assert_called_once()
+        self.assertEqual([pr.id for pr in mock_batch_fetch.call_args[0][0]], [pr.id for pr in prs])
+        mock_single_fetch.assert_called_once()
+        self.assertEqual(mock_single_fetch.call_args[0][0].id, prs[1].id)
+        self.assertEqual(mock_rest_fetch.call_count, 2)
+        self.assertEqual(result["prs_fetched"], 2)
+        self.assertFalse(PendingPRDataFetch.objects.exists())
+
+    @patch("apps.integrations._task_modules.pr_data.bump_team_data_version")
+    @patch("apps.integrations._task_modules.pr_data._fetch_pr_rest_only_data")
+    @patch("apps.integrations._task_modules.pr_data._fetch_prs_core_data_batched")
+    def test_invalidates_dashboard_cache_once_per_batch_after_writes(
+        self, mock_core_fetch, mock_rest_fetch, mock_bump, mock_task
+    ):
+        from apps.integrations._task_modules.pr_data import fetch_pr_data_batch_task
+
+        for number in (1, 2, 3):
+            queue_pr_data_fetch(self._merged_pr(number))
+        mock_rest_fetch.side_effect = lambda *args: mock_bump.assert_not_called() or {}
+
+        fetch_pr_data_batch_task(self.tracked_repo.id)
+
+        self.assertEqual(mock_rest_fetch.call_count, 3)
+        mock_bump.assert_called_once_with(self.team.id)
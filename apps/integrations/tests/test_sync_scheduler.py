@@ -0,0 +1,100 @@
+"""Tests for the staggered sync dispatch planner."""
+
+import random
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.integrations.factories import GitHubIntegrationFactory, TrackedRepositoryFactory
+from apps.integrations.models import GitHubWebhookEvent
+from apps.integrations.services.sync_scheduler import (
+    plan_dispatch,
+    select_repositories_to_sync,
+)
+from apps.metrics.factories import TeamFactory
+
+
+class TestPlanDispatch(TestCase):
+    """Tests for plan_dispatch."""
+
+    def test_spreads_items_over_period_in_order(self):
+        planned = plan_dispatch(list(range(10)), period_seconds=600, rng=random.Random(1))
+
+        self.assertEqual([p.item for p in planned], list(range(10)))
+        for index, p in enumerate(planned):
+            self.assertGreaterEqual(p.countdown, index * 60)
+            self.assertLess(p.countdown, (index + 1) * 60)
+
+    def test_spaces_task_starts_per_group(self):
+        planned = plan_dispatch(
+            list(range(6)),
+            period_seconds=60,
+            task_seconds=100,
+            groups=lambda item: [("installation", 2)],
+            rng=random.Random(1),
+        )
+
+        starts = sorted(p.countdown for p in planned)
+        for start in starts:
+            running = [other for other in starts if start <= other < start + 99]
+            self.assertLessEqual(len(running), 2)
+        self.assertGreaterEqual(starts[-1], 200)
+
+    def test_separate_groups_do_not_wait_for_each_other(self):
+        planned = plan_dispatch(
+            ["a1", "b1", "a2", "b2"],
+            period_seconds=40,
+            task_seconds=1000,
+            groups=lambda item: [(item[0], 1)],
+            rng=random.Random(1),
+        )
+
+        countdowns = {p.item: p.countdown for p in planned}
+        self.assertLess(countdowns["b1"], 40)
+        self.assertGreaterEqual(countdowns["a2"], countdowns["a1"] + 999)
+
+    def test_empty(self):
+        self.assertEqual(plan_dispatch([], period_seconds=600), [])
+
+
+class TestSelectRepositoriesToSync(TestCase):
+    """Tests for select_repositories_to_sync."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        self.integration = GitHubIntegrationFactory(team=self.team)
+        self.now = timezone.now()
+
+    def _repo(self, **kwargs):
+        return TrackedRepositoryFactory(team=self.team, integration=self.integration, **kwargs)
+
+    def _webhook_event(self, repo, delivery_id):
+        return GitHubWebhookEvent.objects.create(
+            team=self.team,
+            delivery_id=delivery_id,
+            event_type="pull_request",
+            github_repo=repo.full_name,
+            payload={},
+        )
+
+    def test_syncs_webhook_repos_without_events(self):
+        """Webhooks don't cover deployments, check runs, comments or commits, so quiet repos still sync."""
+        quiet = self._repo(webhook_id=1, sync_status="complete", last_sync_at=self.now - timedelta(hours=2))
+        active = self._repo(webhook_id=2, sync_status="complete", last_sync_at=self.now - timedelta(hours=2))
+        self._webhook_event(active, "delivery-1")
+
+        repos = select_repositories_to_sync(self.now)
+
+        self.assertEqual([repo.id for repo in repos], [active.id, quiet.id])
+
+    def test_orders_never_synced_then_webhook_activity_then_staleness(self):
+        stale = self._repo(sync_status="complete", last_sync_at=self.now - timedelta(days=2))
+        fresh = self._repo(sync_status="complete", last_sync_at=self.now - timedelta(hours=1))
+        with_events = self._repo(sync_status="complete", last_sync_at=self.now - timedelta(minutes=30))
+        never = self._repo()
+        self._webhook_event(with_events, "delivery-1")
+
+        repos = select_repositories_to_sync(self.now)
+
+        self.assertEqual([repo.id for repo in repos], [never.id, with_events.id, stale.id, fresh.id])
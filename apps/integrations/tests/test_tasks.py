@@ -325,18 +325,18 @@ class TestSyncAllRepositoriesTask(TestCase):
             is_active=True,
         )
 
-        # Mock the delay method
-        mock_delay = MagicMock()
-        mock_task.delay = mock_delay
+        # Mock the apply_async method
+        mock_apply_async = MagicMock()
+        mock_task.apply_async = mock_apply_async
 
         # Call the task
         result = sync_all_repositories_task()
 
-        # Verify sync_repository_task.delay was called for each active repo
-        self.assertEqual(mock_delay.call_count, 3)
+        # Verify sync_repository_task.apply_async was called for each active repo
+        self.assertEqual(mock_apply_async.call_count, 3)
 
         # Verify the correct repo IDs were passed
-        called_repo_ids = {call[0][0] for call in mock_delay.call_args_list}
+        called_repo_ids = {call[1]["args"][0] for call in mock_apply_async.call_args_list}
         expected_repo_ids = {repo1.id, repo2.id, repo3.id}
         self.assertEqual(called_repo_ids, expected_repo_ids)
 
@@ -370,15 +370,15 @@ class TestSyncAllRepositoriesTask(TestCase):
             is_active=False,
         )
 
-        # Mock the delay method
-        mock_delay = MagicMock()
-        mock_task.delay = mock_delay
+        # Mock the apply_async method
+        mock_apply_async = MagicMock()
+        mock_task.apply_async = mock_apply_async
 
         # Call the task
         result = sync_all_repositories_task()
 
-        # Verify sync_repository_task.delay was called only once (for active repo)
-        self.assertEqual(mock_delay.call_count, 1)
+        # Verify sync_repository_task.apply_async was called only once (for active repo)
+        self.assertEqual(mock_apply_async.call_count, 1)
 
         # Verify result contains correct counts
         self.assertIsInstance(result, dict)
@@ -407,9 +407,9 @@ class TestSyncAllRepositoriesTask(TestCase):
             is_active=False,
         )
 
-        # Mock the delay method
-        mock_delay = MagicMock()
-        mock_task.delay = mock_delay
+        # Mock the apply_async method
+        mock_apply_async = MagicMock()
+        mock_task.apply_async = mock_apply_async
 
         # Call the task
         result = sync_all_repositories_task()
@@ -428,15 +428,15 @@ class TestSyncAllRepositoriesTask(TestCase):
 
         # Don't create any repos
 
-        # Mock the delay method
-        mock_delay = MagicMock()
-        mock_task.delay = mock_delay
+        # Mock the apply_async method
+        mock_apply_async = MagicMock()
+        mock_task.apply_async = mock_apply_async
 
         # Call the task
         result = sync_all_repositories_task()
 
         # Verify no tasks were dispatched
-        mock_delay.assert_not_called()
+        mock_apply_async.assert_not_called()
 
         # Verify result contains zero counts
         self.assertIsInstance(result, dict)
@@ -465,22 +465,22 @@ class TestSyncAllRepositoriesTask(TestCase):
             is_active=True,
         )
 
-        # Mock delay to raise exception for second repo only
-        mock_delay = MagicMock()
+        # Mock apply_async to raise exception for second repo only
+        mock_apply_async = MagicMock()
 
-        def delay_side_effect(repo_id):
-            if repo_id == repo2.id:
+        def apply_async_side_effect(args, countdown):
+            if args[0] == repo2.id:
                 raise Exception("Celery connection error")
             return MagicMock()
 
-        mock_delay.side_effect = delay_side_effect
-        mock_task.delay = mock_delay
+        mock_apply_async.side_effect = apply_async_side_effect
+        mock_task.apply_async = mock_apply_async
 
         # Call the task - should not raise exception
         result = sync_all_repositories_task()
 
         # Verify all repos were attempted
-        self.assertEqual(mock_delay.call_count, 3)
+        self.assertEqual(mock_apply_async.call_count, 3)
 
         # Verify result still counts the successful dispatches
         # (Implementation detail: task should track successful vs failed dispatches)
@@ -1077,6 +1077,89 @@ class TestAggregateWeeklyMetricsTasks(TestCase):
         self.assertEqual(result, 1)
 
 
+class TestReviewerCorrelationTasks(TestCase):
+    """Tests for incremental reviewer correlation Celery tasks."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+
+    @patch("apps.integrations._task_modules.metrics.calculate_reviewer_correlations")
+    def test_team_task_runs_incremental_update(self, mock_calculate):
+        from apps.integrations.tasks import update_team_reviewer_correlations_task
+
+        mock_calculate.return_value = 4
+
+        result = update_team_reviewer_correlations_task(self.team.id)
+
+        self.assertEqual(result, 4)
+        self.assertEqual(mock_calculate.call_args[0][0].id, self.team.id)
+        self.assertEqual(mock_calculate.call_args[1], {"incremental": True})
+
+    @patch("apps.integrations._task_modules.metrics.bump_team_data_version")
+    @patch("apps.integrations._task_modules.metrics.calculate_reviewer_correlations")
+    def test_team_task_invalidates_dashboard_cache_only_when_rows_written(self, mock_calculate, mock_bump):
+        from apps.integrations.tasks import update_team_reviewer_correlations_task
+
+        mock_calculate.return_value = 0
+        update_team_reviewer_correlations_task(self.team.id)
+        mock_bump.assert_not_called()
+
+        mock_calculate.return_value = 3
+        update_team_reviewer_correlations_task(self.team.id)
+        mock_bump.assert_called_once_with(self.team.id)
+
+    @patch("apps.integrations._task_modules.metrics.bump_team_data_version")
+    @patch("apps.integrations._task_modules.metrics.calculate_reviewer_correlations")
+    def test_rebuild_task_runs_full_recompute(self, mock_calculate, mock_bump):
+        from apps.integrations.tasks import rebuild_team_reviewer_correlations_task
+
+        mock_calculate.return_value = 6
+
+        result = rebuild_team_reviewer_correlations_task(self.team.id)
+
+        self.assertEqual(result, 6)
+        self.assertEqual(mock_calculate.call_args[0][0].id, self.team.id)
+        self.assertFalse(mock_calculate.call_args[1].get("incremental", False))
+        mock_bump.assert_called_once_with(self.team.id)
+
+    @patch("apps.integrations._task_modules.metrics.rebuild_team_reviewer_correlations_task")
+    def test_rebuild_all_teams_task_dispatches_teams_with_github(self, mock_task):
+        from apps.integrations.tasks import rebuild_all_teams_reviewer_correlations_task
+
+        GitHubIntegrationFactory(team=self.team)
+        TeamFactory()  # Team without GitHub integration - should be skipped
+
+        result = rebuild_all_teams_reviewer_correlations_task()
+
+        mock_task.delay.assert_called_once_with(self.team.id)
+        self.assertEqual(result, 1)
+
+    def test_rebuild_is_scheduled_weekly(self):
+        from django.conf import settings
+
+        scheduled = {config["task"]: config for config in settings.SCHEDULED_TASKS.values()}
+        config = scheduled["apps.integrations.tasks.rebuild_all_teams_reviewer_correlations_task"]
+
+        self.assertEqual(config["schedule"].day_of_week, {0})
+
+    def test_team_task_handles_missing_team(self):
+        from apps.integrations.tasks import update_team_reviewer_correlations_task
+
+        self.assertIsNone(update_team_reviewer_correlations_task(99999))
+
+    @patch("apps.integrations._task_modules.metrics.update_team_reviewer_correlations_task")
+    def test_all_teams_task_dispatches_teams_with_github(self, mock_task):
+        from apps.integrations.tasks import update_all_teams_reviewer_correlations_task
+
+        GitHubIntegrationFactory(team=self.team)
+        TeamFactory()  # Team without GitHub integration - should be skipped
+
+        result = update_all_teams_reviewer_correlations_task()
+
+        mock_task.delay.assert_called_once_with(self.team.id)
+        self.assertEqual(result, 1)
+
+
 class TestSyncGitHubMembersTaskStatusUpdates(TestCase):
     """Tests for sync_github_members_task status field updates."""
 
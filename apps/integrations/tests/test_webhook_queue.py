@@ -0,0 +1,185 @@
+"""Tests for the GitHub webhook event queue and per-PR coalescing."""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from apps.integrations.models import GitHubWebhookEvent
+from apps.integrations.services.webhook_queue import (
+    MAX_ATTEMPTS,
+    enqueue_webhook_event,
+    process_pending_webhook_events,
+    process_webhook_events,
+)
+from apps.metrics import processors
+from apps.metrics.factories import TeamFactory, TeamMemberFactory
+from apps.metrics.models import PRReview, PullRequest
+
+REPO = "acme-corp/api-server"
+PR_ID = 123456789
+
+
+def _pr_payload(action="synchronize", updated_at="2025-01-01T10:00:00Z", **overrides):
+    pr_data = {
+        "id": PR_ID,
+        "number": 42,
+        "title": "Add new feature",
+        "state": "open",
+        "merged": False,
+        "user": {"id": 12345, "login": "developer"},
+        "created_at": "2025-01-01T09:00:00Z",
+        "updated_at": updated_at,
+        "merged_at": None,
+        "additions": 150,
+        "deletions": 50,
+    }
+    pr_data.update(overrides)
+    return {"action": action, "pull_request": pr_data, "repository": {"full_name": REPO}}
+
+
+def _review_payload(review_id, state="approved", submitted_at="2025-01-01T11:00:00Z", action="submitted"):
+    return {
+        "action": action,
+        "review": {"id": review_id, "state": state, "submitted_at": submitted_at, "user": {"id": 12345}},
+        "pull_request": {"id": PR_ID},
+        "repository": {"full_name": REPO},
+    }
+
+
+class TestEnqueueWebhookEvent(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+
+    def test_stores_event_keyed_by_pr(self):
+        event = enqueue_webhook_event(self.team, "delivery-1", "pull_request", _pr_payload())
+
+        self.assertEqual(event.status, GitHubWebhookEvent.STATUS_PENDING)
+        self.assertEqual((event.github_repo, event.github_pr_id, event.action), (REPO, PR_ID, "synchronize"))
+
+    def test_redelivery_is_not_queued_twice(self):
+        enqueue_webhook_event(self.team, "delivery-1", "pull_request", _pr_payload())
+
+        self.assertIsNone(enqueue_webhook_event(self.team, "delivery-1", "pull_request", _pr_payload()))
+        self.assertEqual(GitHubWebhookEvent.objects.count(), 1)
+
+
+@patch("apps.metrics.processors._dispatch_task_safely")
+class TestProcessWebhookEvents(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        TeamMemberFactory(team=self.team, github_id="12345")
+
+    def _enqueue(self, event_type, payloads):
+        for i, payload in enumerate(payloads):
+            enqueue_webhook_event(self.team, f"{event_type}-{i}", event_type, payload)
+
+    def test_burst_is_applied_with_one_upsert(self, mock_dispatch):
+        self._enqueue(
+            "pull_request",
+            [
+                _pr_payload(updated_at="2025-01-01T10:00:00Z", title="First"),
+                _pr_payload(updated_at="2025-01-01T10:05:00Z", title="Latest", additions=300),
+                _pr_payload(action="edited", updated_at="2025-01-01T10:01:00Z", title="Stale edit"),
+            ],
+        )
+
+        with patch.object(
+            processors, "handle_pull_request_event", wraps=processors.handle_pull_request_event
+        ) as handler:
+            processed = process_webhook_events(self.team.id, REPO, PR_ID)
+
+        self.assertEqual(processed, 3)
+        handler.assert_called_once()
+        pr = PullRequest.objects.get(team=self.team, github_pr_id=PR_ID)
+        self.assertEqual((pr.title, pr.additions), ("Latest", 300))
+        self.assertFalse(GitHubWebhookEvent.objects.filter(status=GitHubWebhookEvent.STATUS_PENDING).exists())
+
+    def test_merge_in_burst_triggers_post_merge_tasks_once(self, mock_dispatch):
+        merged = {"state": "closed", "merged": True, "merged_at": "2025-01-01T12:00:00Z"}
+        self._enqueue(
+            "pull_request",
+            [
+                _pr_payload(action="closed", updated_at="2025-01-01T12:00:00Z", **merged),
+                _pr_payload(action="labeled", updated_at="2025-01-01T12:00:05Z", **merged),
+            ],
+        )
+
+        with patch("apps.integrations.services.pr_data_queue.queue_pr_data_fetch") as mock_queue:
+            process_webhook_events(self.team.id, REPO, PR_ID)
+
+        self.assertEqual(mock_dispatch.call_count, 2)  # surveys, survey comment
+        mock_queue.assert_called_once()  # complete data fetch, batched per repository
+        self.assertEqual(PullRequest.objects.get(team=self.team).state, "merged")
+
+    def test_reviews_are_upserted_once_each_after_the_pr(self, mock_dispatch):
+        self._enqueue("pull_request", [_pr_payload()])
+        self._enqueue(
+            "pull_request_review",
+            [
+                _review_payload(1, state="commented", submitted_at="2025-01-01T11:00:00Z"),
+                _review_payload(2, state="approved", submitted_at="2025-01-01T10:30:00Z"),
+                _review_payload(1, state="changes_requested", submitted_at="2025-01-01T11:00:00Z", action="edited"),
+            ],
+        )
+
+        process_webhook_events(self.team.id, REPO, PR_ID)
+
+        pr = PullRequest.objects.get(team=self.team)
+        self.assertEqual(PRReview.objects.get(github_review_id=1).state, "changes_requested")
+        self.assertEqual(PRReview.objects.filter(pull_request=pr).count(), 2)
+        self.assertEqual(pr.first_review_at.isoformat(), "2025-01-01T10:30:00+00:00")
+
+    def test_failure_keeps_events_pending_until_max_attempts(self, mock_dispatch):
+        self._enqueue("pull_request", [_pr_payload()])
+
+        with patch("apps.metrics.processors.handle_pull_request_event", side_effect=RuntimeError("boom")):
+            for _ in range(MAX_ATTEMPTS - 1):
+                self.assertEqual(process_webhook_events(self.team.id, REPO, PR_ID), 0)
+            self.assertEqual(GitHubWebhookEvent.objects.get().status, GitHubWebhookEvent.STATUS_PENDING)
+
+            process_webhook_events(self.team.id, REPO, PR_ID)
+
+        event = GitHubWebhookEvent.objects.get()
+        self.assertEqual((event.status, event.attempts, event.last_error), ("failed", MAX_ATTEMPTS, "boom"))
+
+    def test_sweep_drains_stale_events(self, mock_dispatch):
+        self._enqueue("pull_request", [_pr_payload()])
+
+        self.assertEqual(process_pending_webhook_events(older_than_seconds=3600), 0)
+        self.assertEqual(process_pending_webhook_events(older_than_seconds=0), 1)
+        self.assertTrue(PullRequest.objects.filter(team=self.team, github_pr_id=PR_ID).exists())
+
+
+class TestProcessWebhookEventsDispatch(TestCase):
+    """Post-merge tasks are sent only once the webhook transaction commits."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        TeamMemberFactory(team=self.team, github_id="12345")
+
+    def test_post_merge_tasks_are_dispatched_on_commit(self):
+        merged = {"state": "closed", "merged": True, "merged_at": "2025-01-01T12:00:00Z"}
+        enqueue_webhook_event(
+            self.team,
+            "delivery-1",
+            "pull_request",
+            _pr_payload(action="closed", updated_at="2025-01-01T12:00:00Z", **merged),
+        )
+
+        with (
+            patch("apps.integrations.tasks.send_pr_surveys_task") as mock_surveys,
+            patch("apps.integrations.tasks.post_survey_comment_task") as mock_comment,
+            patch("apps.integrations.services.pr_data_queue.queue_pr_data_fetch"),
+        ):
+            with self.captureOnCommitCallbacks() as callbacks:
+                process_webhook_events(self.team.id, REPO, PR_ID)
+
+                mock_surveys.delay.assert_not_called()
+                mock_comment.delay.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+
+        pr_id = PullRequest.objects.get(team=self.team).id
+        mock_surveys.delay.assert_called_once_with(pr_id)
+        mock_comment.delay.assert_called_once_with(pr_id)
@@ -14,6 +14,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +25,8 @@ import yaml
 
 from apps.metrics.models import PullRequest
 from apps.metrics.services.ai_detector import detect_ai_in_text
+from apps.metrics.services.llm_executor import LLMExecutor, estimate_prompt_tokens
+from apps.metrics.services.llm_response_cache import LLMResponseCache, llm_request_fingerprint
 
 # Configure LiteLLM callbacks for PostHog analytics
 # This automatically logs all LLM calls as $ai_generation events
@@ -341,6 +344,7 @@ def detect_ai_with_litellm(
     temperature: float = 0,
     max_tokens: int = 500,
     metadata: dict | None = None,
+    response_cache: LLMResponseCache | None = None,
 ) -> AIDetectionResult:
     """Detect AI usage using LiteLLM.
 
@@ -351,6 +355,7 @@ def detect_ai_with_litellm(
         temperature: Model temperature (0 for deterministic)
         max_tokens: Maximum tokens in response
         metadata: Optional metadata for PostHog tracking (pr_id, experiment_name, etc.)
+        response_cache: Optional cache; identical requests are answered from it
 
     Returns:
         AIDetectionResult with detection outcome
@@ -360,21 +365,29 @@ def detect_ai_with_litellm(
         "detection_type": "ai_pr_detection",
         **(metadata or {}),
     }
+    user_prompt = f"Analyze this PR description:\n\n{pr_body}"
 
-    response = litellm.completion(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"Analyze this PR description:\n\n{pr_body}"},
-        ],
-        temperature=temperature,
-        max_tokens=max_tokens,
-        response_format={"type": "json_object"},
-        metadata=posthog_metadata,  # Sent to PostHog
-    )
+    def complete() -> str:
+        response = litellm.completion(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            metadata=posthog_metadata,  # Sent to PostHog
+        )
+        return response.choices[0].message.content
 
-    content = response.choices[0].message.content
-    return parse_llm_response(content)
+    if response_cache is None:
+        return parse_llm_response(complete())
+
+    key = llm_request_fingerprint(
+        model, system_prompt, user_prompt, temperature=temperature, max_tokens=max_tokens, response_format="json_object"
+    )
+    return parse_llm_response(response_cache.get_or_create(key, complete))
 
 
 # Default system prompt if none provided
@@ -420,13 +433,16 @@ class ExperimentRunner:
         self,
         config_path: str | None = None,
         config: dict | None = None,
+        response_cache: LLMResponseCache | None = None,
     ):
         """Initialize runner with config file or dict.
 
         Args:
             config_path: Path to YAML config file
             config: Config dict (alternative to config_path)
+            response_cache: Optional LLM response cache shared across runs
         """
+        self.response_cache = response_cache
         if config_path:
             self.config = ExperimentConfig.from_yaml(config_path)
             self._config_dict = yaml.safe_load(Path(config_path).read_text())
@@ -449,13 +465,17 @@ class ExperimentRunner:
         pr_ids: list[int] | None = None,
         team: Any = None,
         limit: int = 100,
+        executor: LLMExecutor | None = None,
     ) -> ExperimentResult:
         """Run experiment on specified PRs.
 
+        LLM calls run concurrently within the executor's rate limits.
+
         Args:
             pr_ids: List of PR IDs to process
             team: Team model to get PRs from
             limit: Maximum PRs to process
+            executor: LLMExecutor to run calls on (defaults to LLMExecutor.from_settings())
 
         Returns:
             ExperimentResult with all detection results
@@ -473,12 +493,7 @@ class ExperimentRunner:
         else:
             raise ValueError("Must provide pr_ids or team")
 
-        results: dict[int, PRResult] = {}
-
-        for pr in prs:
-            # Run LLM detection
-            import time
-
+        def call(pr: PullRequest) -> tuple[AIDetectionResult, float]:
             start_time = time.time()
             llm_result = detect_ai_with_litellm(
                 pr_body=pr.body or "",
@@ -492,8 +507,29 @@ class ExperimentRunner:
                     "pr_number": pr.github_pr_id,
                     "repo": pr.github_repo,
                 },
+                response_cache=self.response_cache,
             )
-            latency_ms = (time.time() - start_time) * 1000
+            return llm_result, (time.time() - start_time) * 1000
+
+        prs = list(prs)
+        executor = executor or LLMExecutor.from_settings()
+        outcomes = executor.run(
+            prs,
+            call,
+            estimate_tokens=lambda pr: estimate_prompt_tokens(
+                self.system_prompt, pr.body or "", max_tokens=self.config.max_tokens
+            ),
+        )
+
+        results: dict[int, PRResult] = {}
+
+        # Keep results in PR order regardless of completion order
+        outcomes_by_pr = {outcome.item.id: outcome for outcome in outcomes}
+        for pr in prs:
+            outcome = outcomes_by_pr[pr.id]
+            if not outcome.ok:
+                raise outcome.error
+            llm_result, latency_ms = outcome.value
 
             # Run regex detection for comparison
             regex_result = detect_ai_in_text(f"{pr.title}\n\n{pr.body}")
@@ -525,4 +561,5 @@ class ExperimentRunner:
             system_prompt=self.system_prompt,
             temperature=self.config.temperature,
             max_tokens=self.config.max_tokens,
+            response_cache=self.response_cache,
         )
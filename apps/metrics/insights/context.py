@@ -0,0 +1,151 @@
+"""
+Shared metric context for insight rules.
+
+Each rule used to query the metrics it needed on its own, so one nightly run
+issued overlapping queries over the same weeks for every rule of every team.
+compute_insights() now creates one MetricContext per (team, target_date) and
+hands it to every rule; each metric is loaded once and memoized.
+
+Merged PR counts (AI adoption, reverts, hotfixes, unlinked PRs) come from a
+single scan grouped by merge day over the last PR_SCAN_DAYS days; weekly
+trends and the current/previous week windows the rules compare are summed
+from those day rows in Python.
+
+Rules declare the metrics they read in InsightRule.METRICS so that
+compute_insights() can load them up front.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+
+from apps.metrics.services.dashboard_service import (
+    _get_merged_prs_in_range,
+    get_cicd_pass_rate,
+    get_cycle_time_trend,
+    get_reviewer_correlations,
+)
+from apps.teams.models import Team
+
+logger = logging.getLogger(__name__)
+
+# Metric names rules can declare in InsightRule.METRICS
+MERGED_PR_DAYS = "merged_pr_days"
+CYCLE_TIME_TREND = "cycle_time_trend"
+CICD_PASS_RATE = "cicd_pass_rate"
+REVIEWER_CORRELATIONS = "reviewer_correlations"
+
+# Current week plus the 4 previous weeks compared by the spike rules
+PR_SCAN_DAYS = 35
+
+# Window of the 4-week trend and rate metrics
+DEFAULT_LOOKBACK_DAYS = 28
+
+_TOTAL_KEYS = ("total_prs", "revert_count", "hotfix_count", "unlinked_count")
+
+
+class MetricContext:
+    """Metrics of one team for one target date, computed once and shared by all insight rules."""
+
+    def __init__(self, team: Team, target_date: date):
+        self.team = team
+        self.target_date = target_date
+        self._cache: dict[tuple, object] = {}
+        self._scan_start: date | None = None
+        self._day_rows: dict[date, dict] = {}
+
+    def load(self, metric_names: Iterable[str]) -> None:
+        """Load declared metrics for their default windows.
+
+        A metric that fails to load is logged and skipped; rules that read it
+        will raise when they do, without affecting the other rules.
+        """
+        default_start = self.target_date - timedelta(days=DEFAULT_LOOKBACK_DAYS)
+        loaders: dict[str, Callable] = {
+            MERGED_PR_DAYS: lambda: self._merged_pr_days(self.target_date - timedelta(days=PR_SCAN_DAYS - 1)),
+            CYCLE_TIME_TREND: lambda: self.cycle_time_trend(default_start, self.target_date),
+            CICD_PASS_RATE: lambda: self.cicd_pass_rate(default_start, self.target_date),
+            REVIEWER_CORRELATIONS: self.reviewer_correlations,
+        }
+        for name in metric_names:
+            try:
+                loaders[name]()
+            except Exception as e:
+                logger.exception("Error loading insight metric %s for team %s: %s", name, self.team.id, e)
+
+    def merged_pr_totals(self, start_date: date, end_date: date) -> dict:
+        """Merged PR counts between start_date and end_date (inclusive).
+
+        Returns:
+            dict with total_prs, revert_count, hotfix_count and unlinked_count
+        """
+        totals = dict.fromkeys(_TOTAL_KEYS, 0)
+        for day, row in self._merged_pr_days(start_date).items():
+            if start_date <= day <= end_date:
+                for key in _TOTAL_KEYS:
+                    totals[key] += row[key]
+        return totals
+
+    def ai_adoption_trend(self, start_date: date, end_date: date) -> list[dict]:
+        """Weekly survey-based AI adoption, as returned by get_ai_adoption_trend().
+
+        Returns:
+            list of dicts with week (ISO week start) and value (AI percentage)
+        """
+        weeks: dict[date, list[int]] = {}
+        for day, row in self._merged_pr_days(start_date).items():
+            if start_date <= day <= end_date and row["surveyed"]:
+                counts = weeks.setdefault(day - timedelta(days=day.weekday()), [0, 0])
+                counts[0] += row["surveyed"]
+                counts[1] += row["ai_surveyed"]
+        return [
+            {"week": week.strftime("%Y-%m-%d"), "value": round(ai_count * 100.0 / total, 2)}
+            for week, (total, ai_count) in sorted(weeks.items())
+        ]
+
+    def cycle_time_trend(self, start_date: date, end_date: date) -> list[dict]:
+        """Weekly average cycle time (see get_cycle_time_trend)."""
+        return self._memoized((CYCLE_TIME_TREND, start_date, end_date), get_cycle_time_trend, start_date, end_date)
+
+    def cicd_pass_rate(self, start_date: date, end_date: date) -> dict:
+        """CI/CD run stats (see get_cicd_pass_rate)."""
+        return self._memoized((CICD_PASS_RATE, start_date, end_date), get_cicd_pass_rate, start_date, end_date)
+
+    def reviewer_correlations(self) -> list[dict]:
+        """All-time reviewer pair stats (see get_reviewer_correlations)."""
+        return self._memoized((REVIEWER_CORRELATIONS,), get_reviewer_correlations)
+
+    def _memoized(self, key: tuple, func: Callable, *args):
+        if key not in self._cache:
+            self._cache[key] = func(self.team, *args)
+        return self._cache[key]
+
+    def _merged_pr_days(self, start_date: date) -> dict[date, dict]:
+        """Per-day merged PR counts from start_date to target_date, scanned once.
+
+        A request reaching further back than the previous scan rescans from
+        the earlier date.
+        """
+        if self._scan_start is not None and start_date >= self._scan_start:
+            return self._day_rows
+
+        rows = (
+            _get_merged_prs_in_range(self.team, start_date, self.target_date)
+            .annotate(day=TruncDate("merged_at"))
+            .values("day")
+            .annotate(
+                total_prs=Count("id"),
+                surveyed=Count("id", filter=Q(survey__isnull=False)),
+                ai_surveyed=Count("id", filter=Q(survey__author_ai_assisted=True)),
+                revert_count=Count("id", filter=Q(is_revert=True)),
+                hotfix_count=Count("id", filter=Q(is_hotfix=True)),
+                unlinked_count=Count("id", filter=Q(jira_key="")),
+            )
+            .order_by()
+        )
+        self._day_rows = {row["day"]: row for row in rows}
+        self._scan_start = start_date
+        return self._day_rows
@@ -5,7 +5,7 @@ The Insight Engine provides:
 - InsightResult dataclass for rule outputs
 - InsightRule abstract base class
 - Rule registry for discovering rules
-- compute_insights() function to run all rules
+- compute_insights() function to run all rules against a shared MetricContext
 """
 
 import logging
@@ -13,6 +13,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
 
+from apps.metrics.insights.context import MetricContext
 from apps.metrics.models import DailyInsight
 from apps.teams.models import Team
 
@@ -36,9 +37,26 @@ class InsightRule(ABC):
     """Abstract base class for insight rules.
 
     Subclasses must implement the evaluate() method to analyze team data
-    and return a list of InsightResult instances.
+    and return a list of InsightResult instances. Rules read their data through
+    get_context() and list the metric names they read in METRICS.
     """
 
+    # Metric names from apps.metrics.insights.context loaded up front by compute_insights()
+    METRICS: tuple[str, ...] = ()
+
+    def __init__(self, context: MetricContext | None = None):
+        self._context = context
+
+    def get_context(self, team: Team, target_date: date) -> MetricContext:
+        """Return the shared MetricContext for (team, target_date), creating one if needed.
+
+        Rules evaluated on their own (outside compute_insights) get a private context.
+        """
+        context = self._context
+        if context is None or context.team.pk != team.pk or context.target_date != target_date:
+            context = self._context = MetricContext(team, target_date)
+        return context
+
     @abstractmethod
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate rule and return any insights found.
@@ -87,7 +105,8 @@ def compute_insights(team: Team, target_date: date) -> list[DailyInsight]:
     """Run all registered rules and save insights to database.
 
     Evaluates each registered rule against the team's data for the target date.
-    Creates DailyInsight instances for each InsightResult returned by the rules.
+    All rules share one MetricContext, so each metric is queried once, and the
+    resulting DailyInsight rows are saved with a single bulk_create.
     Handles exceptions gracefully - if a rule fails, it logs the error and continues.
 
     Args:
@@ -97,34 +116,33 @@ def compute_insights(team: Team, target_date: date) -> list[DailyInsight]:
     Returns:
         List of created DailyInsight instances
     """
-    created_insights = []
+    context = MetricContext(team, target_date)
+    context.load({name for rule_class in _rule_registry for name in rule_class.METRICS})
 
+    insights = []
     for rule_class in _rule_registry:
         try:
-            # Instantiate the rule
-            rule = rule_class()
-
-            # Call evaluate
-            results = rule.evaluate(team, target_date)
-
-            # Save each result as a DailyInsight
-            for result in results:
-                insight = DailyInsight.objects.create(
-                    team=team,
-                    date=target_date,
-                    category=result.category,
-                    priority=result.priority,
-                    title=result.title,
-                    description=result.description,
-                    metric_type=result.metric_type,
-                    metric_value=result.metric_value,
-                    comparison_period=result.comparison_period,
-                )
-                created_insights.append(insight)
-
+            results = rule_class(context=context).evaluate(team, target_date)
         except Exception as e:
             # Log the error but continue processing other rules
             logger.exception("Error evaluating rule %s: %s", rule_class.__name__, e)
             continue
 
-    return created_insights
+        insights.extend(
+            DailyInsight(
+                team=team,
+                date=target_date,
+                category=result.category,
+                priority=result.priority,
+                title=result.title,
+                description=result.description,
+                metric_type=result.metric_type,
+                metric_value=result.metric_value,
+                comparison_period=result.comparison_period,
+            )
+            for result in results
+        )
+
+    if not insights:
+        return []
+    return DailyInsight.objects.bulk_create(insights)
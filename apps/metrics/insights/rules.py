@@ -3,15 +3,8 @@
 from abc import abstractmethod
 from datetime import date, timedelta
 
+from apps.metrics.insights.context import CICD_PASS_RATE, CYCLE_TIME_TREND, MERGED_PR_DAYS, REVIEWER_CORRELATIONS
 from apps.metrics.insights.engine import InsightResult, InsightRule
-from apps.metrics.services.dashboard_service import (
-    get_ai_adoption_trend,
-    get_cicd_pass_rate,
-    get_cycle_time_trend,
-    get_revert_hotfix_stats,
-    get_reviewer_correlations,
-    get_unlinked_prs,
-)
 from apps.teams.models import Team
 
 
@@ -158,10 +151,11 @@ class AIAdoptionTrendRule(BaseTrendRule):
     """
 
     CHANGE_THRESHOLD = 10  # percentage points
+    METRICS = (MERGED_PR_DAYS,)
 
     def _get_trend_data(self, team: Team, start_date: date, end_date: date) -> list[dict]:
         """Fetch AI adoption trend data."""
-        return get_ai_adoption_trend(team, start_date, end_date)
+        return self.get_context(team, end_date).ai_adoption_trend(start_date, end_date)
 
     def _calculate_change(self, first_value: float, last_value: float) -> float | None:
         """Calculate absolute change in percentage points."""
@@ -207,10 +201,11 @@ class CycleTimeTrendRule(BaseTrendRule):
     """
 
     CHANGE_THRESHOLD = 20  # percent
+    METRICS = (CYCLE_TIME_TREND,)
 
     def _get_trend_data(self, team: Team, start_date: date, end_date: date) -> list[dict]:
         """Fetch cycle time trend data."""
-        return get_cycle_time_trend(team, start_date, end_date)
+        return self.get_context(team, end_date).cycle_time_trend(start_date, end_date)
 
     def _calculate_change(self, first_value: float, last_value: float) -> float | None:
         """Calculate percentage change, return None if first value is zero."""
@@ -266,6 +261,7 @@ class HotfixSpikeRule(InsightRule):
     """
 
     SPIKE_THRESHOLD = 3.0  # 3x multiplier
+    METRICS = (MERGED_PR_DAYS,)
 
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate hotfix spike and generate insight if threshold is met.
@@ -283,12 +279,14 @@ class HotfixSpikeRule(InsightRule):
         # Previous 4 weeks: 28 days before current week
         previous_weeks_start, previous_weeks_end = get_previous_weeks_range(target_date, num_weeks=4)
 
+        context = self.get_context(team, target_date)
+
         # Get current week stats
-        current_stats = get_revert_hotfix_stats(team, current_week_start, current_week_end)
+        current_stats = context.merged_pr_totals(current_week_start, current_week_end)
         current_hotfixes = current_stats["hotfix_count"]
 
         # Get previous 4 weeks stats
-        previous_stats = get_revert_hotfix_stats(team, previous_weeks_start, previous_weeks_end)
+        previous_stats = context.merged_pr_totals(previous_weeks_start, previous_weeks_end)
         previous_hotfixes = previous_stats["hotfix_count"]
 
         # Calculate average hotfixes per week over previous 4 weeks
@@ -328,6 +326,8 @@ class RevertSpikeRule(InsightRule):
     Generates an insight if any reverts are detected in the current week.
     """
 
+    METRICS = (MERGED_PR_DAYS,)
+
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate revert activity and generate insight if reverts detected.
 
@@ -342,7 +342,7 @@ class RevertSpikeRule(InsightRule):
         current_week_start, current_week_end = get_current_week_range(target_date)
 
         # Get current week stats
-        stats = get_revert_hotfix_stats(team, current_week_start, current_week_end)
+        stats = self.get_context(team, target_date).merged_pr_totals(current_week_start, current_week_end)
         revert_count = stats["revert_count"]
 
         # Generate insight if there are any reverts
@@ -376,6 +376,7 @@ class CIFailureRateRule(InsightRule):
     """
 
     FAILURE_THRESHOLD = 20.0  # percent
+    METRICS = (CICD_PASS_RATE,)
 
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate CI failure rate and generate insight if threshold exceeded.
@@ -392,7 +393,7 @@ class CIFailureRateRule(InsightRule):
         end_date = target_date
 
         # Get CI/CD stats
-        stats = get_cicd_pass_rate(team, start_date, end_date)
+        stats = self.get_context(team, target_date).cicd_pass_rate(start_date, end_date)
         total_runs = stats["total_runs"]
         pass_rate = float(stats["pass_rate"])
 
@@ -441,6 +442,7 @@ class RedundantReviewerRule(InsightRule):
     """
 
     MAX_PAIRS_TO_REPORT = 3
+    METRICS = (REVIEWER_CORRELATIONS,)
 
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate redundant reviewer pairs and generate insights.
@@ -452,8 +454,8 @@ class RedundantReviewerRule(InsightRule):
         Returns:
             List of InsightResult instances (up to 3, may be empty if no insights found)
         """
-        # Get reviewer correlations from dashboard service
-        correlations = get_reviewer_correlations(team)
+        # Get reviewer correlations (shared through the metric context)
+        correlations = self.get_context(team, target_date).reviewer_correlations()
 
         # Filter for redundant pairs only
         redundant_pairs = [c for c in correlations if c["is_redundant"]]
@@ -503,6 +505,7 @@ class UnlinkedPRsRule(InsightRule):
 
     LOOKBACK_WEEKS = 4
     THRESHOLD = 5
+    METRICS = (MERGED_PR_DAYS,)
 
     def evaluate(self, team: Team, target_date: date) -> list[InsightResult]:
         """Evaluate unlinked PRs and generate insight if threshold met.
@@ -518,9 +521,8 @@ class UnlinkedPRsRule(InsightRule):
         start_date = target_date - timedelta(weeks=self.LOOKBACK_WEEKS)
         end_date = target_date
 
-        # Get unlinked PRs (don't limit, we need count)
-        unlinked_prs = get_unlinked_prs(team, start_date, end_date, limit=1000)
-        count = len(unlinked_prs)
+        # Count merged PRs without a Jira key
+        count = self.get_context(team, target_date).merged_pr_totals(start_date, end_date)["unlinked_count"]
 
         # Generate insight if count meets threshold
         if count >= self.THRESHOLD:
@@ -4,7 +4,7 @@ from django.core.management.base import BaseCommand
 
 from apps.metrics.experiments.runner import detect_ai_with_litellm
 from apps.metrics.models import PullRequest
-from apps.metrics.services.ai_detector import detect_ai_in_text
+from apps.metrics.services.ai_detector import detect_ai_in_texts
 from apps.teams.models import Team
 
 # Default system prompt for LLM detection
@@ -126,12 +126,15 @@ class Command(BaseCommand):
         errors = []
         total = len(prs)
 
-        for idx, pr in enumerate(prs, start=1):
+        # Regex detection runs for the whole list in one batch
+        regex_results = [None] * total if use_llm else detect_ai_in_texts(self._detection_text(pr) for pr in prs)
+
+        for idx, (pr, regex_result) in enumerate(zip(prs, regex_results, strict=True), start=1):
             if verbose or idx % 10 == 0:
                 self.stdout.write(f"Processing {idx}/{total}...")
 
             try:
-                result = self._process_pr(pr, use_llm, model)
+                result = self._process_pr(pr, use_llm, model, regex_result)
                 if result:
                     changes.append(result)
 
@@ -149,15 +152,21 @@ class Command(BaseCommand):
         # Summary
         self._print_summary(changes, errors, dry_run, use_llm)
 
-    def _process_pr(self, pr, use_llm: bool, model: str) -> dict | None:
-        """Process a single PR and return change dict if detection changed."""
+    @staticmethod
+    def _detection_text(pr) -> str:
+        """Text scanned by regex detection."""
+        return f"{pr.title}\n\n{pr.body}"
+
+    def _process_pr(self, pr, use_llm: bool, model: str, regex_result: dict | None = None) -> dict | None:
+        """Process a single PR and return change dict if detection changed.
+
+        regex_result is the PR's precomputed detect_ai_in_texts() entry; without
+        --use-llm it is computed here when not supplied.
+        """
         # Current state
         old_ai = pr.is_ai_assisted
         old_tools = pr.ai_tools_detected or []
 
-        # New detection
-        text = f"{pr.title}\n\n{pr.body}"
-
         if use_llm:
             llm_result = detect_ai_with_litellm(
                 pr_body=pr.body or "",
@@ -171,7 +180,8 @@ class Command(BaseCommand):
             confidence = llm_result.confidence
             reasoning = llm_result.reasoning
         else:
-            regex_result = detect_ai_in_text(text)
+            if regex_result is None:
+                regex_result = detect_ai_in_texts([self._detection_text(pr)])[0]
             new_ai = regex_result["is_ai_assisted"]
             new_tools = regex_result["ai_tools"]
             confidence = 1.0 if new_ai else 0.0
@@ -0,0 +1,58 @@
+"""Management command to backfill stored file/review aggregates on PullRequest.
+
+Recomputes the columns the PR explorer filters on:
+- tech_categories: distinct non-empty PRFile.file_category values
+- reviewer_count: number of distinct reviewers
+- has_author_review: whether the author reviewed their own PR
+
+PRFile/PRReview.save() and the bulk sync writer keep these current; run this
+once after deploying the migration that adds the columns, or after writes that
+bypass save() (queryset.update, bulk_create outside the sync).
+
+Usage:
+    python manage.py backfill_pr_derived_fields
+    python manage.py backfill_pr_derived_fields --team "Acme"
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.metrics.services.dashboard_cache import bump_team_data_version
+from apps.metrics.services.pr_derived_fields import REFRESH_BATCH_SIZE, backfill_pr_derived_fields
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    """Backfill tech_categories and reviewer stats for existing PRs."""
+
+    help = "Backfill stored tech categories and reviewer stats on PullRequest"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--team",
+            type=str,
+            help="Team name to backfill (default: all teams)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REFRESH_BATCH_SIZE,
+            help=f"Number of PRs to update per statement (default: {REFRESH_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the backfill command."""
+        teams = Team.objects.all()
+        if options["team"]:
+            teams = teams.filter(name=options["team"])
+            if not teams.exists():
+                self.stderr.write(self.style.ERROR(f"Team not found: {options['team']}"))
+                return
+
+        total = 0
+        for team in teams:
+            updated = backfill_pr_derived_fields(team.id, batch_size=options["batch_size"])
+            bump_team_data_version(team.id)
+            total += updated
+            self.stdout.write(f"  {team.name}: {updated} PRs")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {total} PRs"))
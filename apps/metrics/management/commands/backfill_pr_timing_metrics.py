@@ -13,6 +13,7 @@ from django.core.management.base import BaseCommand
 
 from apps.metrics.models import PullRequest
 from apps.metrics.processors import _calculate_cycle_time_hours, _calculate_time_diff_hours
+from apps.metrics.services.pr_daily_facts import rebuild_daily_facts
 from apps.teams.models import Team
 
 
@@ -103,6 +104,10 @@ class Command(BaseCommand):
                 prs_to_update_review_time, ["first_review_at", "review_time_hours"]
             )
 
+        # bulk_update bypasses PullRequest.save(), so refresh the daily rollup
+        if not dry_run and (prs_to_update_cycle_time or prs_to_update_review_time):
+            rebuild_daily_facts(team.id)
+
         # Output results
         cycle_time_updated = len(prs_to_update_cycle_time)
         review_time_updated = len(prs_to_update_review_time)
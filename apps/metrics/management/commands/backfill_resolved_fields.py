@@ -0,0 +1,99 @@
+"""Management command to backfill materialized effective fields for existing PRs.
+
+Recomputes the resolved_* columns on PullRequest from their source fields:
+- resolved_is_ai_assisted: effective_is_ai_assisted (LLM > regex detection)
+- resolved_ai_tools: effective_ai_tools (LLM > regex detection)
+- resolved_ai_category: ai_category (code, review, both, or empty)
+- resolved_pr_type: effective_pr_type (LLM > labels > unknown)
+
+New and updated PRs are kept in sync by PullRequest.save(); run this once after
+deploying the migration that adds the columns, or after changing the logic of
+the effective_* properties.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.metrics.models import PullRequest
+from apps.metrics.models.pull_requests import EFFECTIVE_SOURCE_FIELDS, RESOLVED_FIELDS
+from apps.metrics.services.dashboard_cache import bump_team_data_version
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    """Backfill resolved_* columns for existing PRs."""
+
+    help = "Backfill materialized effective AI/type fields on PullRequest"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--team",
+            type=str,
+            help="Team name to filter PRs",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Preview changes without saving to database",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of PRs to update per batch (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the backfill command."""
+        dry_run = options["dry_run"]
+        batch_size = options["batch_size"]
+
+        # Management command intentionally accesses all PRs
+        queryset = PullRequest.objects.all()  # noqa: TEAM001
+
+        if options["team"]:
+            try:
+                team = Team.objects.get(name=options["team"])
+                queryset = queryset.filter(team=team)
+                self.stdout.write(f"Filtering to team: {team.name}")
+            except Team.DoesNotExist:
+                self.stderr.write(self.style.ERROR(f"Team not found: {options['team']}"))
+                return
+
+        # Only load the columns needed to compute the resolved values
+        queryset = queryset.only("id", "team", *EFFECTIVE_SOURCE_FIELDS, *RESOLVED_FIELDS).order_by("id")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN - no changes will be saved"))
+
+        processed = 0
+        updated = 0
+        prs_to_update = []
+        for pr in queryset.iterator(chunk_size=batch_size):
+            processed += 1
+            if pr.refresh_resolved_fields():
+                prs_to_update.append(pr)
+
+            if len(prs_to_update) >= batch_size:
+                if not dry_run:
+                    self._bulk_update(prs_to_update)
+                updated += len(prs_to_update)
+                self.stdout.write(f"  Processed {processed} PRs...")
+                prs_to_update = []
+
+        # Final batch
+        if prs_to_update and not dry_run:
+            self._bulk_update(prs_to_update)
+        updated += len(prs_to_update)
+
+        self.stdout.write(self.style.SUCCESS("=== Backfill Complete ==="))
+        self.stdout.write(f"Total PRs processed: {processed}")
+        self.stdout.write(f"PRs {'to update' if dry_run else 'updated'}: {updated}")
+
+    def _bulk_update(self, prs):
+        """Bulk update PRs with recomputed resolved values."""
+        with transaction.atomic():
+            # Management command - bulk update on known PR instances
+            PullRequest.objects.bulk_update(prs, RESOLVED_FIELDS, batch_size=500)  # noqa: TEAM001
+        for team_id in {pr.team_id for pr in prs}:
+            bump_team_data_version(team_id)
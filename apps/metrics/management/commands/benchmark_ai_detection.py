@@ -0,0 +1,161 @@
+"""
+Benchmark regex AI detection over a corpus of real PR bodies.
+
+Compares the pattern-by-pattern reference loop (how detection worked before
+PatternMatcher) with the single-text API and the batch API, and checks all
+three return identical tools for every text. The corpus is repeated --repeat
+times, so the batch API's duplicate-text memoization shows up in its number.
+
+Run it after editing ai_patterns.py to catch slow or prefilter-unfriendly
+patterns before bumping PATTERNS_VERSION.
+
+Corpus:
+- apps/metrics/scripts/oss_pr_analysis.json (OSS PRs fetched by fetch_oss_prs.py)
+- Golden test PR bodies and commit messages (apps/metrics/prompts/golden_tests.py)
+- Optionally PR bodies from the database (--team)
+
+Usage:
+    python manage.py benchmark_ai_detection
+    python manage.py benchmark_ai_detection --repeat 50
+    python manage.py benchmark_ai_detection --team Gumroad --limit 5000
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from apps.metrics.models import PullRequest
+from apps.metrics.prompts.golden_tests import GOLDEN_TESTS
+from apps.metrics.services.ai_detector import (
+    _NEGATIVE_DISCLOSURE_PATTERNS,
+    detect_ai_in_text,
+    detect_ai_in_texts,
+    get_patterns_version,
+    parse_co_authors,
+    parse_co_authors_in_messages,
+)
+from apps.metrics.services.ai_patterns import AI_CO_AUTHOR_PATTERNS, AI_SIGNATURE_PATTERNS
+from apps.teams.models import Team
+
+OSS_CORPUS_PATH = Path(__file__).resolve().parents[2] / "scripts" / "oss_pr_analysis.json"
+
+
+def _reference_matches(text: str | None, patterns: list[tuple[re.Pattern, str]], negative=()) -> list[str]:
+    """Search every pattern in order (pre-PatternMatcher behavior)."""
+    if not text:
+        return []
+    for pattern in negative:
+        text = pattern.sub("", text)
+    detected: list[str] = []
+    for pattern, ai_type in patterns:
+        if pattern.search(text) and ai_type not in detected:
+            detected.append(ai_type)
+    return detected
+
+
+def load_corpus(team: Team | None = None, limit: int = 0) -> tuple[list[str], list[str]]:
+    """Load (PR texts, commit messages) for benchmarking."""
+    texts: list[str] = []
+    messages: list[str] = []
+
+    if OSS_CORPUS_PATH.exists():
+        for entry in json.loads(OSS_CORPUS_PATH.read_text()):
+            texts.append(f"{entry.get('title', '')}\n{entry.get('body_excerpt', '')}")
+
+    for test in GOLDEN_TESTS:
+        texts.append(f"{test.pr_title}\n{test.pr_body}")
+        messages.extend(test.commit_messages)
+
+    if team is not None:
+        prs = PullRequest.objects.filter(team=team).exclude(body="").order_by("-pr_created_at")
+        if limit:
+            prs = prs[:limit]
+        texts.extend(f"{title}\n{body}" for title, body in prs.values_list("title", "body"))
+
+    return texts, messages
+
+
+class Command(BaseCommand):
+    help = "Benchmark regex AI detection against the pattern-by-pattern reference"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--team",
+            type=str,
+            help="Also include PR bodies from this team",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=0,
+            help="Max PRs to load from the database (default: all)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Times to repeat the corpus per run (default: 10)",
+        )
+
+    def handle(self, *args, **options):
+        team = None
+        if options.get("team"):
+            try:
+                team = Team.objects.get(name=options["team"])
+            except Team.DoesNotExist:
+                self.stderr.write(self.style.ERROR(f"Team '{options['team']}' not found"))
+                return
+
+        texts, messages = load_corpus(team, options["limit"])
+        repeat = max(options["repeat"], 1)
+        self.stdout.write(
+            f"Patterns v{get_patterns_version()}: {len(texts)} PR texts, {len(messages)} commit messages, x{repeat}"
+        )
+
+        signatures = [(re.compile(p, re.IGNORECASE), ai_type) for p, ai_type in AI_SIGNATURE_PATTERNS]
+        co_authors = [(re.compile(p, re.IGNORECASE), ai_type) for p, ai_type in AI_CO_AUTHOR_PATTERNS]
+        negative = [re.compile(p, re.IGNORECASE) for p in _NEGATIVE_DISCLOSURE_PATTERNS]
+
+        mismatches = self._run(
+            "PR texts",
+            texts * repeat,
+            {
+                "reference": lambda corpus: [_reference_matches(t, signatures, negative) for t in corpus],
+                "single": lambda corpus: [detect_ai_in_text(t)["ai_tools"] for t in corpus],
+                "batch": lambda corpus: [r["ai_tools"] for r in detect_ai_in_texts(corpus)],
+            },
+        )
+        mismatches += self._run(
+            "Commit messages",
+            messages * repeat,
+            {
+                "reference": lambda corpus: [_reference_matches(m, co_authors) for m in corpus],
+                "single": lambda corpus: [parse_co_authors(m)["ai_co_authors"] for m in corpus],
+                "batch": lambda corpus: [r["ai_co_authors"] for r in parse_co_authors_in_messages(corpus)],
+            },
+        )
+
+        if mismatches:
+            self.stderr.write(self.style.ERROR(f"{mismatches} results differ from the reference"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All results match the reference"))
+
+    def _run(self, label: str, corpus: list[str], implementations: dict) -> int:
+        """Time each implementation on corpus and return the number of results differing from the first."""
+        if not corpus:
+            return 0
+
+        results = {}
+        timings = []
+        for name, implementation in implementations.items():
+            start = time.perf_counter()
+            results[name] = implementation(corpus)
+            seconds = max(time.perf_counter() - start, 1e-9)
+            timings.append(f"{name} {len(corpus) / seconds:,.0f}/s")
+        self.stdout.write(f"{label}: " + ", ".join(timings))
+
+        expected, *others = results.values()
+        return sum(1 for actual in others for e, a in zip(expected, actual, strict=True) if e != a)
@@ -5,6 +5,10 @@ to measure JSON success rate and response quality.
 
 Usage:
     python manage.py compare_llm_models --limit 50
+    python manage.py compare_llm_models --limit 50 --no-cache  # Ignore .llm_cache/
+
+Responses are cached by request fingerprint, so re-running a comparison only
+calls the API for requests not seen before (cached latencies are reported as 0ms).
 """
 
 import json
@@ -20,6 +24,7 @@ from apps.metrics.services.llm_prompts import (
     PR_ANALYSIS_SYSTEM_PROMPT,
     build_llm_pr_context,
 )
+from apps.metrics.services.llm_response_cache import LLMResponseCache, llm_request_fingerprint
 
 MODELS_TO_TEST = [
     ("openai/gpt-oss-20b", "GPT OSS 20B (cheap default)"),
@@ -36,6 +41,7 @@ class ModelResult:
     latency_ms: float
     error: str | None = None
     response: dict | None = None
+    cached: bool = False
 
 
 class Command(BaseCommand):
@@ -53,6 +59,11 @@ class Command(BaseCommand):
             type=str,
             help="Comma-separated PR IDs to test (overrides --limit)",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Always call the API instead of reusing cached responses from .llm_cache/",
+        )
 
     def handle(self, *args, **options):
         api_key = os.environ.get("GROQ_API_KEY")
@@ -61,6 +72,7 @@ class Command(BaseCommand):
             return
 
         client = Groq(api_key=api_key)
+        response_cache = None if options.get("no_cache") else LLMResponseCache()
 
         # Get PRs to test
         if options.get("pr_ids"):
@@ -92,20 +104,26 @@ class Command(BaseCommand):
             self.stdout.write(f"\n[{i}/{len(prs)}] PR #{pr.id}: {pr.title[:50]}...")
             pr_context = build_llm_pr_context(pr)
 
+            all_cached = True
             for model_id, model_name in MODELS_TO_TEST:
-                result = self._test_model(client, model_id, pr.id, pr_context)
+                result = self._test_model(client, model_id, pr.id, pr_context, response_cache)
                 results[model_id].append(result)
+                all_cached = all_cached and result.cached
 
                 status = "✓" if result.success else "✗"
-                self.stdout.write(f"  {status} {model_name}: {result.latency_ms:.0f}ms")
+                source = " (cached)" if result.cached else ""
+                self.stdout.write(f"  {status} {model_name}: {result.latency_ms:.0f}ms{source}")
                 if result.error:
                     self.stdout.write(f"    Error: {result.error[:80]}")
 
-            # Rate limit protection
-            time.sleep(1)
+            # Rate limit protection (only needed if the API was called)
+            if not all_cached:
+                time.sleep(1)
 
         # Print summary
         self._print_summary(results)
+        if response_cache:
+            self.stdout.write(f"\nLLM response cache: {response_cache.stats()}")
 
     def _test_model(
         self,
@@ -113,24 +131,42 @@ class Command(BaseCommand):
         model: str,
         pr_id: int,
         pr_context: str,
+        response_cache: LLMResponseCache | None = None,
     ) -> ModelResult:
         """Test a single model on a single PR."""
         start = time.time()
+        cached = False
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": PR_ANALYSIS_SYSTEM_PROMPT},
-                    {"role": "user", "content": pr_context},
-                ],
-                response_format={"type": "json_object"},
+            key = llm_request_fingerprint(
+                model,
+                PR_ANALYSIS_SYSTEM_PROMPT,
+                pr_context,
                 temperature=0,
                 max_tokens=1500,
+                response_format="json_object",
             )
-            latency = (time.time() - start) * 1000
+            content = response_cache.get(key) if response_cache else None
+            if content is not None:
+                cached = True
+                latency = 0.0
+            else:
+                response = client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": PR_ANALYSIS_SYSTEM_PROMPT},
+                        {"role": "user", "content": pr_context},
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0,
+                    max_tokens=1500,
+                )
+                latency = (time.time() - start) * 1000
+                content = response.choices[0].message.content
+                if response_cache:
+                    # Cache raw content, including invalid JSON: that is a result too
+                    response_cache.set(key, content)
 
             # Try to parse JSON
-            content = response.choices[0].message.content
             data = json.loads(content)
 
             # Validate required fields
@@ -142,6 +178,7 @@ class Command(BaseCommand):
                         pr_id=pr_id,
                         success=False,
                         latency_ms=latency,
+                        cached=cached,
                         error="Missing ai.is_assisted field",
                         response=data,
                     )
@@ -152,6 +189,7 @@ class Command(BaseCommand):
                     pr_id=pr_id,
                     success=False,
                     latency_ms=latency,
+                    cached=cached,
                     error="Missing is_ai_assisted field",
                     response=data,
                 )
@@ -161,16 +199,18 @@ class Command(BaseCommand):
                 pr_id=pr_id,
                 success=True,
                 latency_ms=latency,
+                cached=cached,
                 response=data,
             )
 
         except json.JSONDecodeError as e:
-            latency = (time.time() - start) * 1000
+            latency = 0.0 if cached else (time.time() - start) * 1000
             return ModelResult(
                 model=model,
                 pr_id=pr_id,
                 success=False,
                 latency_ms=latency,
+                cached=cached,
                 error=f"JSON parse error: {e}",
             )
         except Exception as e:
@@ -0,0 +1,50 @@
+"""Management command to report dashboard cache hit/miss counters.
+
+Counters are kept per cached dashboard service function (see
+apps.metrics.services.dashboard_cache).
+
+Usage:
+    python manage.py dashboard_cache_stats
+    python manage.py dashboard_cache_stats --reset
+"""
+
+from django.core.management.base import BaseCommand
+
+# Importing the dashboard package registers every cached function
+import apps.metrics.services.dashboard  # noqa: F401
+from apps.metrics.services.dashboard_cache import get_dashboard_cache_stats, reset_dashboard_cache_stats
+
+
+class Command(BaseCommand):
+    """Report dashboard cache hit/miss counts per endpoint."""
+
+    help = "Report dashboard cache hit/miss counts per endpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset all counters after reporting",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the stats command."""
+        stats = get_dashboard_cache_stats()
+
+        total_hits = 0
+        total_misses = 0
+        self.stdout.write(f"{'Endpoint':<45} {'Hits':>10} {'Misses':>10} {'Hit rate':>9}")
+        for endpoint, entry in stats.items():
+            if not entry["hits"] and not entry["misses"]:
+                continue
+            total_hits += entry["hits"]
+            total_misses += entry["misses"]
+            self.stdout.write(f"{endpoint:<45} {entry['hits']:>10} {entry['misses']:>10} {entry['hit_rate']:>8}%")
+
+        total = total_hits + total_misses
+        hit_rate = f"{total_hits * 100 / total:.1f}%" if total else "n/a"
+        self.stdout.write(self.style.SUCCESS(f"Total: {total_hits} hits, {total_misses} misses ({hit_rate})"))
+
+        if options["reset"]:
+            reset_dashboard_cache_stats()
+            self.stdout.write("Counters reset")
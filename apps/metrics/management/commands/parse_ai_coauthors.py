@@ -11,9 +11,12 @@ Usage:
 from django.core.management.base import BaseCommand
 
 from apps.metrics.models import Commit
-from apps.metrics.services.ai_detector import parse_co_authors
+from apps.metrics.services.ai_detector import parse_co_authors_in_messages
 from apps.teams.models import Team
 
+# Commits read, parsed and written per batch
+BATCH_SIZE = 2000
+
 
 class Command(BaseCommand):
     help = "Parse AI co-authors from existing commit messages"
@@ -60,26 +63,22 @@ class Command(BaseCommand):
         ai_found = 0
         tools_found = {}
 
-        for commit in commits:
-            if not commit.message:
-                continue
-
-            result = parse_co_authors(commit.message)
-
-            if result["has_ai_co_authors"]:
-                ai_found += 1
-
-                # Track which tools were found
-                for tool in result["ai_co_authors"]:
-                    tools_found[tool] = tools_found.get(tool, 0) + 1
-
-                # Only save if there's a change
-                if not commit.is_ai_assisted or commit.ai_co_authors != result["ai_co_authors"]:
-                    commit.is_ai_assisted = True
-                    commit.ai_co_authors = result["ai_co_authors"]
-                    if not dry_run:
-                        commit.save(update_fields=["is_ai_assisted", "ai_co_authors"])
-                    updated += 1
+        batch = []
+        for commit in (
+            commits.exclude(message="")
+            .only("id", "message", "is_ai_assisted", "ai_co_authors")
+            .iterator(chunk_size=BATCH_SIZE)
+        ):
+            batch.append(commit)
+            if len(batch) >= BATCH_SIZE:
+                found, changed = self._process_batch(batch, tools_found, dry_run)
+                ai_found += found
+                updated += changed
+                batch = []
+        if batch:
+            found, changed = self._process_batch(batch, tools_found, dry_run)
+            ai_found += found
+            updated += changed
 
         # Summary
         self.stdout.write(f"\nProcessed {total} commits")
@@ -95,3 +94,27 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("\nDRY RUN complete - no changes saved"))
         else:
             self.stdout.write(self.style.SUCCESS(f"\nSuccessfully updated {updated} commits"))
+
+    def _process_batch(self, batch: list, tools_found: dict, dry_run: bool) -> tuple[int, int]:
+        """Parse a batch of commits and save changes in one query. Returns (ai_found, updated)."""
+        ai_found = 0
+        to_update = []
+
+        for commit, result in zip(batch, parse_co_authors_in_messages(c.message for c in batch), strict=True):
+            if not result["has_ai_co_authors"]:
+                continue
+            ai_found += 1
+
+            # Track which tools were found
+            for tool in result["ai_co_authors"]:
+                tools_found[tool] = tools_found.get(tool, 0) + 1
+
+            # Only save if there's a change
+            if not commit.is_ai_assisted or commit.ai_co_authors != result["ai_co_authors"]:
+                commit.is_ai_assisted = True
+                commit.ai_co_authors = result["ai_co_authors"]
+                to_update.append(commit)
+
+        if to_update and not dry_run:
+            Commit.objects.bulk_update(to_update, ["is_ai_assisted", "ai_co_authors"])  # noqa: TEAM001
+        return ai_found, len(to_update)
@@ -0,0 +1,60 @@
+"""Management command to rebuild the DailyPRFact rollup from raw PullRequest rows.
+
+The rollup is maintained incrementally by PullRequest.save(). Run this after
+deploying the DailyPRFact migration, or after writes that bypass save()
+(queryset.update, bulk_update, bulk_create).
+
+Usage:
+    python manage.py rebuild_pr_daily_facts
+    python manage.py rebuild_pr_daily_facts --team "Acme" --days 30
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.metrics.services.dashboard_cache import bump_team_data_version
+from apps.metrics.services.pr_daily_facts import rebuild_daily_facts
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    """Rebuild daily PR fact rollup rows."""
+
+    help = "Rebuild the DailyPRFact rollup from raw PullRequest rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--team",
+            type=str,
+            help="Team name to rebuild (default: all teams)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Only rebuild the last N days (default: all history)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the rebuild command."""
+        teams = Team.objects.all()
+        if options["team"]:
+            teams = teams.filter(name=options["team"])
+            if not teams.exists():
+                self.stderr.write(self.style.ERROR(f"Team not found: {options['team']}"))
+                return
+
+        start_date = None
+        if options["days"]:
+            start_date = timezone.localdate() - timedelta(days=options["days"])
+
+        total = 0
+        for team in teams:
+            written = rebuild_daily_facts(team.id, start_date=start_date)
+            bump_team_data_version(team.id)
+            total += written
+            self.stdout.write(f"  {team.name}: {written} fact rows")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} daily PR fact rows"))
@@ -3,6 +3,7 @@
 from django.core.management.base import BaseCommand
 
 from apps.metrics.experiments.runner import ExperimentRunner
+from apps.metrics.services.llm_response_cache import LLMResponseCache
 from apps.teams.models import Team
 
 
@@ -44,6 +45,11 @@ class Command(BaseCommand):
             type=str,
             help="Override experiment name from config",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Always call the LLM instead of reusing cached responses from .llm_cache/",
+        )
 
     def handle(self, *args, **options):
         config_path = options.get("config")
@@ -52,10 +58,11 @@ class Command(BaseCommand):
         output_dir = options["output_dir"]
         dry_run = options["dry_run"]
         experiment_name = options.get("experiment_name")
+        response_cache = None if options.get("no_cache") else LLMResponseCache()
 
         # Build config
         if config_path:
-            runner = ExperimentRunner(config_path=config_path)
+            runner = ExperimentRunner(config_path=config_path, response_cache=response_cache)
         else:
             # Default config
             runner = ExperimentRunner(
@@ -67,7 +74,8 @@ class Command(BaseCommand):
                         "temperature": 0,
                     },
                     "prompt": {"system": None},  # Uses default
-                }
+                },
+                response_cache=response_cache,
             )
 
         # Get team
@@ -93,6 +101,8 @@ class Command(BaseCommand):
         self.stdout.write("")
 
         results = runner.run(team=team, limit=limit)
+        if response_cache:
+            self.stdout.write(f"LLM response cache: {response_cache.stats()}")
 
         # Calculate and display metrics
         metrics = results.calculate_metrics()
@@ -7,6 +7,7 @@ Usage:
     python manage.py run_llm_batch --limit 500
     python manage.py run_llm_batch --limit 500 --poll  # Submit and wait for results
     python manage.py run_llm_batch --limit 500 --with-fallback  # Two-pass with auto-retry
+    python manage.py run_llm_batch --limit 500 --with-fallback --realtime-retry  # Retry pass via API calls
     python manage.py run_llm_batch --status batch_abc123  # Check status
     python manage.py run_llm_batch --results batch_abc123  # Download and save results
 
@@ -23,6 +24,7 @@ Workflow (two-pass with fallback):
     -> Pass 1: Cheap model (openai/gpt-oss-20b) for 80-95% success
     -> Pass 2: Retry failures with better model (llama-3.3-70b-versatile)
     -> Both passes use Batch API for 50% discount
+       (--realtime-retry runs pass 2 as concurrent rate-limited API calls instead)
     -> Results automatically saved to database
 """
 
@@ -78,6 +80,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Use two-pass processing: cheap model first, retry failures with better model",
         )
+        parser.add_argument(
+            "--realtime-retry",
+            action="store_true",
+            help="With --with-fallback, retry failures with real-time API calls instead of a second batch",
+        )
 
     def handle(self, *args, **options):
         import os
@@ -109,6 +116,7 @@ class Command(BaseCommand):
         poll = options.get("poll", False)
         dry_run = options.get("dry_run", False)
         with_fallback = options.get("with_fallback", False)
+        realtime_retry = options.get("realtime_retry", False)
 
         # Query PRs without LLM analysis
         qs = (
@@ -150,7 +158,7 @@ class Command(BaseCommand):
 
         # Use fallback mode if requested
         if with_fallback:
-            self._submit_batch_with_fallback(processor, prs)
+            self._submit_batch_with_fallback(processor, prs, realtime_retry=realtime_retry)
             return
 
         # Submit batch (standard mode)
@@ -170,11 +178,12 @@ class Command(BaseCommand):
         except Exception as e:
             self.stderr.write(self.style.ERROR(f"Failed to submit batch: {e}"))
 
-    def _submit_batch_with_fallback(self, processor: GroqBatchProcessor, prs: list):
+    def _submit_batch_with_fallback(self, processor: GroqBatchProcessor, prs: list, realtime_retry: bool = False):
         """Submit batch with two-pass processing: cheap model + retry with better model."""
         self.stdout.write("\n=== Two-Pass Batch Processing ===")
         self.stdout.write(f"Pass 1 model: {processor.DEFAULT_MODEL} (cheap)")
-        self.stdout.write(f"Pass 2 model: {processor.FALLBACK_MODEL} (reliable)")
+        pass2_mode = "real-time" if realtime_retry else "batch"
+        self.stdout.write(f"Pass 2 model: {processor.FALLBACK_MODEL} (reliable, {pass2_mode})")
         self.stdout.write(f"Total PRs: {len(prs)}")
 
         def on_progress(status):
@@ -188,6 +197,7 @@ class Command(BaseCommand):
                 prs,
                 poll_interval=30,
                 on_progress=on_progress,
+                realtime_retry=realtime_retry,
             )
 
             # Log results
@@ -198,6 +208,8 @@ class Command(BaseCommand):
             if stats["retry_batch_id"]:
                 self.stdout.write(f"\n--- Pass 2: Retried {stats['first_pass_failures']} failures ---")
                 self.stdout.write(f"Pass 2 batch ID: {stats['retry_batch_id']}")
+            elif realtime_retry and stats["first_pass_failures"]:
+                self.stdout.write(f"\n--- Pass 2: Retried {stats['first_pass_failures']} failures in real time ---")
 
             self.stdout.write(f"\nFinal failures: {stats['final_failures']}")
 
@@ -222,7 +234,8 @@ class Command(BaseCommand):
                 pr = PullRequest.objects.get(id=result.pr_id)  # noqa: TEAM001
                 pr.llm_summary = result.llm_summary
                 pr.llm_summary_version = result.prompt_version
-                pr.save(update_fields=["llm_summary", "llm_summary_version"])
+                pr.llm_input_hash = result.input_hash
+                pr.save(update_fields=["llm_summary", "llm_summary_version", "llm_input_hash"])
                 success_count += 1
             except PullRequest.DoesNotExist:
                 self.stdout.write(self.style.WARNING(f"  PR {result.pr_id}: Not found"))
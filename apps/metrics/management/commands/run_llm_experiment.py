@@ -6,6 +6,7 @@ from django.core.management.base import BaseCommand
 
 from apps.metrics.experiments.runner import ExperimentRunner
 from apps.metrics.models import PullRequest
+from apps.metrics.services.llm_response_cache import LLMResponseCache
 from apps.teams.models import Team
 
 
@@ -35,6 +36,11 @@ class Command(BaseCommand):
             default="dev/active/ai-detection-pr-descriptions/experiments/results",
             help="Output directory for results",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Always call the LLM instead of reusing cached responses from .llm_cache/",
+        )
 
     def handle(self, *args, **options):
         limit = options["limit"]
@@ -92,10 +98,13 @@ class Command(BaseCommand):
             "prompt": {},  # Use default prompt
         }
 
-        runner = ExperimentRunner(config=config)
+        response_cache = None if options.get("no_cache") else LLMResponseCache()
+        runner = ExperimentRunner(config=config, response_cache=response_cache)
 
         # Run experiment
         result = runner.run(pr_ids=pr_ids)
+        if response_cache:
+            self.stdout.write(f"LLM response cache: {response_cache.stats()}")
 
         # Show metrics
         metrics = result.calculate_metrics()
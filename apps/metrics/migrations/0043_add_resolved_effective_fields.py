@@ -0,0 +1,46 @@
+# Generated by Django 5.2.9 on 2026-10-16 19:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metrics', '0042_add_review_experience_fields'),
+        ('teams', '0012_add_copilot_price_tier'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pullrequest',
+            name='resolved_ai_category',
+            field=models.CharField(blank=True, default='', help_text='Materialized ai_category: code, review, both, or empty', max_length=10, verbose_name='Resolved AI category'),
+        ),
+        migrations.AddField(
+            model_name='pullrequest',
+            name='resolved_ai_tools',
+            field=models.JSONField(blank=True, default=list, help_text='Materialized effective_ai_tools (LLM > regex detection)', verbose_name='Resolved AI tools'),
+        ),
+        migrations.AddField(
+            model_name='pullrequest',
+            name='resolved_is_ai_assisted',
+            field=models.BooleanField(blank=True, default=None, help_text='Materialized effective_is_ai_assisted (LLM > regex detection)', null=True, verbose_name='Resolved AI assisted'),
+        ),
+        migrations.AddField(
+            model_name='pullrequest',
+            name='resolved_pr_type',
+            field=models.CharField(default='unknown', help_text='Materialized effective_pr_type (LLM > labels > unknown)', max_length=20, verbose_name='Resolved PR type'),
+        ),
+        migrations.AddIndex(
+            model_name='pullrequest',
+            index=models.Index(fields=['team', 'resolved_is_ai_assisted', 'merged_at'], name='pr_team_resolved_ai_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pullrequest',
+            index=models.Index(fields=['team', 'resolved_ai_category'], name='pr_team_ai_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pullrequest',
+            index=models.Index(fields=['team', 'resolved_pr_type'], name='pr_team_pr_type_idx'),
+        ),
+    ]
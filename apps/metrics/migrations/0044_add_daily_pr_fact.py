@@ -0,0 +1,49 @@
+# Generated by Django 5.2.9 on 2026-10-16 19:57
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metrics', '0043_add_resolved_effective_fields'),
+        ('teams', '0012_add_copilot_price_tier'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPRFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('github_repo', models.CharField(help_text="Repository name (e.g., 'owner/repo')", max_length=255, verbose_name='GitHub repository')),
+                ('day', models.DateField(help_text='Date the PRs were merged', verbose_name='Day')),
+                ('pr_count', models.IntegerField(default=0, help_text='Number of PRs merged on this day', verbose_name='PRs merged')),
+                ('ai_assisted_count', models.IntegerField(default=0, help_text='PRs with is_ai_assisted=True (regex detection)', verbose_name='AI-assisted PRs (pattern)')),
+                ('effective_ai_count', models.IntegerField(default=0, help_text='PRs with resolved_is_ai_assisted=True (LLM > regex detection)', verbose_name='AI-assisted PRs (effective)')),
+                ('revert_count', models.IntegerField(default=0, help_text='Number of revert PRs', verbose_name='Reverts')),
+                ('hotfix_count', models.IntegerField(default=0, help_text='Number of hotfix PRs', verbose_name='Hotfixes')),
+                ('cycle_time_sum', models.DecimalField(decimal_places=2, default=Decimal('0'), help_text='Sum of cycle_time_hours over PRs that have one', max_digits=14, verbose_name='Cycle time sum (hours)')),
+                ('cycle_time_count', models.IntegerField(default=0, help_text='Number of PRs with a cycle time', verbose_name='Cycle time count')),
+                ('review_time_sum', models.DecimalField(decimal_places=2, default=Decimal('0'), help_text='Sum of review_time_hours over PRs that have one', max_digits=14, verbose_name='Review time sum (hours)')),
+                ('review_time_count', models.IntegerField(default=0, help_text='Number of PRs with a review time', verbose_name='Review time count')),
+                ('additions_sum', models.BigIntegerField(default=0, help_text='Total lines added', verbose_name='Lines added')),
+                ('deletions_sum', models.BigIntegerField(default=0, help_text='Total lines deleted', verbose_name='Lines deleted')),
+                ('cycle_time_histogram', models.JSONField(blank=True, default=list, help_text='PR counts per cycle time bucket', verbose_name='Cycle time histogram')),
+                ('review_time_histogram', models.JSONField(blank=True, default=list, help_text='PR counts per review time bucket', verbose_name='Review time histogram')),
+                ('size_histogram', models.JSONField(blank=True, default=list, help_text='PR counts per size bucket (XS, S, M, L, XL)', verbose_name='Size histogram')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Last time this row was recomputed', verbose_name='Updated at')),
+                ('author', models.ForeignKey(help_text='The team member who authored the PRs', on_delete=django.db.models.deletion.CASCADE, related_name='daily_pr_facts', to='metrics.teammember', verbose_name='Author')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='teams.team', verbose_name='Team')),
+            ],
+            options={
+                'verbose_name': 'Daily PR Fact',
+                'verbose_name_plural': 'Daily PR Facts',
+                'ordering': ['-day', 'github_repo'],
+                'indexes': [models.Index(fields=['team', 'day'], name='daily_pr_fact_team_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('team', 'github_repo', 'day', 'author'), name='unique_team_repo_day_author')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-16 21:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metrics', '0044_add_daily_pr_fact'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pullrequest',
+            name='llm_input_hash',
+            field=models.CharField(blank=True, default='', help_text='Fingerprint of model, system prompt and rendered PR prompt behind llm_summary', max_length=64, verbose_name='LLM input hash'),
+        ),
+    ]
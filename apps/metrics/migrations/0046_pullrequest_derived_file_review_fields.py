@@ -0,0 +1,37 @@
+# Generated by Django 5.2.9 on 2026-10-16 22:10
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metrics', '0045_pullrequest_llm_input_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pullrequest',
+            name='has_author_review',
+            field=models.BooleanField(default=False, help_text='Whether the PR author reviewed their own PR', verbose_name='Has author review'),
+        ),
+        migrations.AddField(
+            model_name='pullrequest',
+            name='reviewer_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of distinct reviewers', verbose_name='Reviewer count'),
+        ),
+        migrations.AddField(
+            model_name='pullrequest',
+            name='tech_categories',
+            field=models.JSONField(blank=True, default=list, help_text='Distinct non-empty PRFile.file_category values', verbose_name='Tech categories'),
+        ),
+        migrations.AddIndex(
+            model_name='pullrequest',
+            index=models.Index(fields=['team', 'reviewer_count', 'has_author_review'], name='pr_team_self_review_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pullrequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tech_categories'], name='pr_tech_categories_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+    ]
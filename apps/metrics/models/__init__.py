@@ -10,7 +10,7 @@ Module Structure:
 - github.py: PRReview, PRCheckRun, PRFile, PRComment, Commit
 - jira.py: JiraIssue
 - surveys.py: PRSurvey, PRSurveyReview
-- aggregations.py: AIUsageDaily, WeeklyMetrics, ReviewerCorrelation
+- aggregations.py: AIUsageDaily, WeeklyMetrics, DailyPRFact, ReviewerCorrelation
 - insights.py: DailyInsight
 - deployments.py: Deployment
 - benchmarks.py: IndustryBenchmark
@@ -21,6 +21,7 @@ from .aggregations import (
     CopilotEditorDaily,
     CopilotLanguageDaily,
     CopilotSeatSnapshot,
+    DailyPRFact,
     ReviewerCorrelation,
     WeeklyMetrics,
 )
@@ -53,6 +54,7 @@ __all__ = [
     "CopilotEditorDaily",
     "CopilotLanguageDaily",
     "WeeklyMetrics",
+    "DailyPRFact",
     "ReviewerCorrelation",
     "CopilotSeatSnapshot",
     # Insights
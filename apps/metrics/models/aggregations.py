@@ -1,4 +1,4 @@
-"""Aggregation models: AIUsageDaily, WeeklyMetrics, ReviewerCorrelation."""
+"""Aggregation models: AIUsageDaily, WeeklyMetrics, DailyPRFact, ReviewerCorrelation."""
 
 from decimal import Decimal
 
@@ -222,6 +222,143 @@ class WeeklyMetrics(BaseTeamModel):
         return f"{self.member} - Week of {self.week_start}"
 
 
+class DailyPRFact(BaseTeamModel):
+    """
+    Daily rollup of merged PRs per team, repository and author.
+
+    One row per (team, repo, merge day, author) holding counts, sums and
+    histogram buckets so that weekly/monthly dashboard trends can be read
+    from a small table instead of grouping raw PullRequest rows.
+
+    Kept up to date incrementally by PullRequest.save() via
+    apps.metrics.services.pr_daily_facts. Only PRs with an author are rolled
+    up (bot PRs without a linked author are excluded from dashboards).
+    """
+
+    github_repo = models.CharField(
+        max_length=255,
+        verbose_name="GitHub repository",
+        help_text="Repository name (e.g., 'owner/repo')",
+    )
+    day = models.DateField(
+        verbose_name="Day",
+        help_text="Date the PRs were merged",
+    )
+    author = models.ForeignKey(
+        TeamMember,
+        on_delete=models.CASCADE,
+        related_name="daily_pr_facts",
+        verbose_name="Author",
+        help_text="The team member who authored the PRs",
+    )
+
+    # Counts
+    pr_count = models.IntegerField(
+        default=0,
+        verbose_name="PRs merged",
+        help_text="Number of PRs merged on this day",
+    )
+    ai_assisted_count = models.IntegerField(
+        default=0,
+        verbose_name="AI-assisted PRs (pattern)",
+        help_text="PRs with is_ai_assisted=True (regex detection)",
+    )
+    effective_ai_count = models.IntegerField(
+        default=0,
+        verbose_name="AI-assisted PRs (effective)",
+        help_text="PRs with resolved_is_ai_assisted=True (LLM > regex detection)",
+    )
+    revert_count = models.IntegerField(
+        default=0,
+        verbose_name="Reverts",
+        help_text="Number of revert PRs",
+    )
+    hotfix_count = models.IntegerField(
+        default=0,
+        verbose_name="Hotfixes",
+        help_text="Number of hotfix PRs",
+    )
+
+    # Sums (averages are sum / count)
+    cycle_time_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0"),
+        verbose_name="Cycle time sum (hours)",
+        help_text="Sum of cycle_time_hours over PRs that have one",
+    )
+    cycle_time_count = models.IntegerField(
+        default=0,
+        verbose_name="Cycle time count",
+        help_text="Number of PRs with a cycle time",
+    )
+    review_time_sum = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal("0"),
+        verbose_name="Review time sum (hours)",
+        help_text="Sum of review_time_hours over PRs that have one",
+    )
+    review_time_count = models.IntegerField(
+        default=0,
+        verbose_name="Review time count",
+        help_text="Number of PRs with a review time",
+    )
+    additions_sum = models.BigIntegerField(
+        default=0,
+        verbose_name="Lines added",
+        help_text="Total lines added",
+    )
+    deletions_sum = models.BigIntegerField(
+        default=0,
+        verbose_name="Lines deleted",
+        help_text="Total lines deleted",
+    )
+
+    # Histograms (bucket edges defined in apps.metrics.services.pr_daily_facts)
+    cycle_time_histogram = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Cycle time histogram",
+        help_text="PR counts per cycle time bucket",
+    )
+    review_time_histogram = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Review time histogram",
+        help_text="PR counts per review time bucket",
+    )
+    size_histogram = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Size histogram",
+        help_text="PR counts per size bucket (XS, S, M, L, XL)",
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Updated at",
+        help_text="Last time this row was recomputed",
+    )
+
+    class Meta:
+        ordering = ["-day", "github_repo"]
+        verbose_name = "Daily PR Fact"
+        verbose_name_plural = "Daily PR Facts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "github_repo", "day", "author"],
+                name="unique_team_repo_day_author",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["team", "day"], name="daily_pr_fact_team_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.github_repo} - {self.author} - {self.day}"
+
+
 class ReviewerCorrelation(BaseTeamModel):
     """
     Tracks agreement/disagreement patterns between pairs of reviewers.
@@ -11,6 +11,13 @@ from .pull_requests import PullRequest
 from .team import TeamMember
 
 
+def _refresh_pr_derived_fields(pr_id: int) -> None:
+    """Recompute the PR's stored file/review aggregates (DERIVED_FIELDS) after a write."""
+    from apps.metrics.services.pr_derived_fields import refresh_pr_derived_fields
+
+    refresh_pr_derived_fields([pr_id])
+
+
 class PRReview(BaseTeamModel):
     """
     A review on a pull request.
@@ -100,6 +107,19 @@ class PRReview(BaseTeamModel):
     def __str__(self):
         return f"Review on #{self.pull_request.github_pr_id} by {self.reviewer}"
 
+    def save(self, *args, **kwargs):
+        """Save the review and refresh its PR's stored reviewer stats."""
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"reviewer", "reviewer_id", "pull_request", "pull_request_id"} & set(update_fields):
+            _refresh_pr_derived_fields(self.pull_request_id)
+
+    def delete(self, *args, **kwargs):
+        """Delete the review and refresh its PR's stored reviewer stats."""
+        result = super().delete(*args, **kwargs)
+        _refresh_pr_derived_fields(self.pull_request_id)
+        return result
+
 
 class PRCheckRun(BaseTeamModel):
     """CI/CD check run for a pull request."""
@@ -717,6 +737,19 @@ class PRFile(BaseTeamModel):
     def __str__(self):
         return f"{self.filename} ({self.file_category})"
 
+    def save(self, *args, **kwargs):
+        """Save the file and refresh its PR's stored tech_categories."""
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"file_category", "pull_request", "pull_request_id"} & set(update_fields):
+            _refresh_pr_derived_fields(self.pull_request_id)
+
+    def delete(self, *args, **kwargs):
+        """Delete the file and refresh its PR's stored tech_categories."""
+        result = super().delete(*args, **kwargs)
+        _refresh_pr_derived_fields(self.pull_request_id)
+        return result
+
 
 class PRComment(BaseTeamModel):
     """
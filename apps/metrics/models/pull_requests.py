@@ -7,6 +7,42 @@ from apps.teams.models import BaseTeamModel
 
 from .team import TeamMember
 
+# Source fields that feed the effective_* properties. When any of these change,
+# the resolved_* columns below must be recomputed.
+EFFECTIVE_SOURCE_FIELDS = frozenset({"llm_summary", "is_ai_assisted", "ai_tools_detected", "labels"})
+
+# Materialized copies of the effective_* properties (kept in sync by save())
+RESOLVED_FIELDS = (
+    "resolved_is_ai_assisted",
+    "resolved_ai_tools",
+    "resolved_ai_category",
+    "resolved_pr_type",
+)
+
+# Stored aggregates of the PR's files and reviews. Owned by
+# apps.metrics.services.pr_derived_fields, never written by PullRequest.save().
+DERIVED_FIELDS = frozenset({"tech_categories", "reviewer_count", "has_author_review"})
+
+# Fields that feed the DailyPRFact rollup. When any of these change on a
+# merged PR, the affected rollup rows are recomputed after save().
+ROLLUP_SOURCE_FIELDS = (
+    "team_id",
+    "github_repo",
+    "state",
+    "merged_at",
+    "author_id",
+    "cycle_time_hours",
+    "review_time_hours",
+    "additions",
+    "deletions",
+    "is_revert",
+    "is_hotfix",
+    "is_ai_assisted",
+    "resolved_is_ai_assisted",
+)
+# update_fields names (field names and attnames) that write a rollup source
+_ROLLUP_UPDATE_FIELDS = frozenset({*ROLLUP_SOURCE_FIELDS, "team", "author"})
+
 
 class PullRequest(BaseTeamModel):
     """
@@ -215,6 +251,13 @@ class PullRequest(BaseTeamModel):
         verbose_name="LLM summary version",
         help_text="Prompt version used for LLM summary (e.g., 5.0.0)",
     )
+    llm_input_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        verbose_name="LLM input hash",
+        help_text="Fingerprint of model, system prompt and rendered PR prompt behind llm_summary",
+    )
 
     # Aggregated AI signals (from commits, reviews, files)
     has_ai_commits = models.BooleanField(
@@ -249,6 +292,56 @@ class PullRequest(BaseTeamModel):
         help_text="Detailed breakdown of each detection signal source",
     )
 
+    # Materialized effective values (LLM priority over regex/labels).
+    # Stored so dashboards can aggregate with COUNT ... FILTER instead of
+    # loading every PR into Python. Recomputed in save(); see RESOLVED_FIELDS.
+    resolved_is_ai_assisted = models.BooleanField(
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name="Resolved AI assisted",
+        help_text="Materialized effective_is_ai_assisted (LLM > regex detection)",
+    )
+    resolved_ai_tools = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Resolved AI tools",
+        help_text="Materialized effective_ai_tools (LLM > regex detection)",
+    )
+    resolved_ai_category = models.CharField(
+        max_length=10,
+        blank=True,
+        default="",
+        verbose_name="Resolved AI category",
+        help_text="Materialized ai_category: code, review, both, or empty",
+    )
+    resolved_pr_type = models.CharField(
+        max_length=20,
+        default="unknown",
+        verbose_name="Resolved PR type",
+        help_text="Materialized effective_pr_type (LLM > labels > unknown)",
+    )
+
+    # Materialized from PRFile/PRReview rows so the PR explorer can filter and
+    # display them without aggregating files and reviews per request.
+    # Refreshed when files or reviews are written; see DERIVED_FIELDS.
+    tech_categories = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Tech categories",
+        help_text="Distinct non-empty PRFile.file_category values",
+    )
+    reviewer_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Reviewer count",
+        help_text="Number of distinct reviewers",
+    )
+    has_author_review = models.BooleanField(
+        default=False,
+        verbose_name="Has author review",
+        help_text="Whether the PR author reviewed their own PR",
+    )
+
     # Jira integration
     jira_key = models.CharField(
         max_length=50,
@@ -285,6 +378,13 @@ class PullRequest(BaseTeamModel):
             models.Index(fields=["team", "state", "merged_at"], name="pr_team_state_merged_idx"),
             models.Index(fields=["team", "author", "merged_at"], name="pr_team_author_merged_idx"),
             models.Index(fields=["team", "pr_created_at"], name="pr_team_created_idx"),
+            # Materialized effective fields - AI percentage and category/type breakdowns
+            models.Index(fields=["team", "resolved_is_ai_assisted", "merged_at"], name="pr_team_resolved_ai_idx"),
+            models.Index(fields=["team", "resolved_ai_category"], name="pr_team_ai_category_idx"),
+            models.Index(fields=["team", "resolved_pr_type"], name="pr_team_pr_type_idx"),
+            # Materialized file/review aggregates - tech category and self-review filters
+            models.Index(fields=["team", "reviewer_count", "has_author_review"], name="pr_team_self_review_idx"),
+            GinIndex(fields=["tech_categories"], name="pr_tech_categories_gin_idx", opclasses=["jsonb_path_ops"]),
             # GIN indexes for JSONB fields - faster queries on AI tools and LLM summary
             # Note: These indexes already exist from migration 0020 (created via raw SQL)
             # Adding to Meta ensures Django tracks them and they're recreated on fresh DBs
@@ -296,6 +396,110 @@ class PullRequest(BaseTeamModel):
         title_part = f" {self.title[:50]}" if self.title else ""
         return f"{self.github_repo}#{self.github_pr_id}{title_part}"
 
+    def save(self, *args, **kwargs):
+        """Save the PR, recomputing resolved_* columns when their sources change.
+
+        With update_fields, the resolved columns are only recomputed (and added
+        to update_fields) if at least one source field is being written.
+
+        Updates of existing rows never write DERIVED_FIELDS: they are kept
+        current by file/review writes and the in-memory copy may be stale.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            # Deferred sources are not written by this save, so leave resolved values alone
+            if not EFFECTIVE_SOURCE_FIELDS & self.get_deferred_fields():
+                self.refresh_resolved_fields()
+            if not self._state.adding and not kwargs.get("force_insert"):
+                skipped = DERIVED_FIELDS | self.get_deferred_fields()
+                kwargs["update_fields"] = [
+                    f.name for f in self._meta.concrete_fields if not f.primary_key and f.name not in skipped
+                ]
+        elif EFFECTIVE_SOURCE_FIELDS.intersection(update_fields):
+            self.refresh_resolved_fields()
+            kwargs["update_fields"] = {*update_fields, *RESOLVED_FIELDS}
+        super().save(*args, **kwargs)
+        # Saves that only write e.g. survey or LLM metadata can't move the PR in the rollup
+        written = kwargs.get("update_fields")
+        if written is None or _ROLLUP_UPDATE_FIELDS.intersection(written):
+            self._sync_daily_facts()
+
+    def delete(self, *args, **kwargs):
+        """Delete the PR and remove its contribution from the DailyPRFact rollup."""
+        snapshot = self._rollup_snapshot()
+        result = super().delete(*args, **kwargs)
+        if snapshot is not None:
+            from apps.metrics.services.pr_daily_facts import refresh_daily_facts
+
+            refresh_daily_facts(self.team_id, [self._rollup_key(snapshot)])
+        return result
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember rollup source values at load time to detect changes on save."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rollup_snapshot = instance._rollup_snapshot()
+        return instance
+
+    def _rollup_snapshot(self) -> tuple | None:
+        """Current values of ROLLUP_SOURCE_FIELDS, or None if any are deferred."""
+        if self.get_deferred_fields().intersection(ROLLUP_SOURCE_FIELDS):
+            return None
+        return tuple(getattr(self, name) for name in ROLLUP_SOURCE_FIELDS)
+
+    @staticmethod
+    def _rollup_key(snapshot: tuple):
+        """Fact key for a rollup snapshot (None if the PR is not rolled up)."""
+        from apps.metrics.services.pr_daily_facts import fact_key_for
+
+        values = dict(zip(ROLLUP_SOURCE_FIELDS, snapshot, strict=True))
+        return fact_key_for(values["github_repo"], values["state"], values["merged_at"], values["author_id"])
+
+    def _sync_daily_facts(self) -> None:
+        """Refresh DailyPRFact rows this PR moved out of or into."""
+        snapshot = self._rollup_snapshot()
+        previous = getattr(self, "_loaded_rollup_snapshot", None)
+        if snapshot is None or snapshot == previous:
+            return
+
+        keys = [self._rollup_key(snapshot)]
+        if previous is not None:
+            keys.append(self._rollup_key(previous))
+        if any(keys):
+            from apps.metrics.services.pr_daily_facts import refresh_daily_facts
+
+            refresh_daily_facts(self.team_id, keys)
+        self._loaded_rollup_snapshot = snapshot
+
+    def get_resolved_field_values(self) -> dict:
+        """Compute the materialized values of the effective_* properties.
+
+        Returns:
+            Dict mapping each name in RESOLVED_FIELDS to its computed value
+        """
+        from apps.metrics.services.ai_categories import get_ai_category
+
+        tools = self.effective_ai_tools
+        return {
+            "resolved_is_ai_assisted": self.effective_is_ai_assisted,
+            "resolved_ai_tools": list(tools),
+            "resolved_ai_category": get_ai_category(tools) or "",
+            "resolved_pr_type": self.effective_pr_type,
+        }
+
+    def refresh_resolved_fields(self) -> bool:
+        """Recompute resolved_* columns in memory (does not save).
+
+        Returns:
+            True if any resolved value changed
+        """
+        changed = False
+        for field_name, value in self.get_resolved_field_values().items():
+            if getattr(self, field_name) != value:
+                setattr(self, field_name, value)
+                changed = True
+        return changed
+
     @property
     def github_url(self):
         """Construct GitHub URL for this PR."""
@@ -307,7 +511,7 @@ class PullRequest(BaseTeamModel):
 
         Priority order:
         1. LLM-detected categories from llm_summary.tech.categories (more accurate)
-        2. Pattern-based categories from PRFile annotations (fallback)
+        2. Pattern-based categories from PRFile rows (fallback)
 
         Returns:
             List of technology category strings (e.g., ['backend', 'frontend', 'devops'])
@@ -318,8 +522,8 @@ class PullRequest(BaseTeamModel):
             if llm_cats:
                 return llm_cats
 
-        # Fallback to pattern-based categories (from annotation or related files)
-        if hasattr(self, "tech_categories") and self.tech_categories:
+        # Fallback to pattern-based categories (stored from related files)
+        if self.tech_categories:
             return self.tech_categories
 
         # Final fallback: aggregate from related PRFile records
@@ -8,8 +8,11 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 
+from django.db import transaction
+
 from apps.integrations.services.jira_utils import extract_jira_key
 from apps.metrics.models import PRReview, PullRequest, TeamMember
+from apps.metrics.services.member_resolver import TeamMemberResolver
 
 logger = logging.getLogger(__name__)
 
@@ -84,24 +87,29 @@ def _calculate_time_diff_hours(start_time: datetime | None, end_time: datetime |
     return Decimal(str(round(time_diff.total_seconds() / 3600, 2)))
 
 
-def _get_team_member_by_github_id(team, github_user_id: str) -> TeamMember | None:
+def _get_team_member_by_github_id(
+    team, github_user_id: str, members: TeamMemberResolver | None = None
+) -> TeamMember | None:
     """
     Look up a TeamMember by their GitHub user ID.
 
     Args:
         team: Team instance to search within
         github_user_id: GitHub user ID as a string
+        members: Per-sync resolver to look up in memory instead of querying
 
     Returns:
         TeamMember instance if found, None otherwise
     """
+    if members is not None:
+        return members.by_github_id(github_user_id)
     try:
         return TeamMember.objects.get(team=team, github_id=github_user_id)
     except TeamMember.DoesNotExist:
         return None
 
 
-def _map_github_pr_to_fields(team, pr_data: dict) -> dict:
+def _map_github_pr_to_fields(team, pr_data: dict, members: TeamMemberResolver | None = None) -> dict:
     """
     Map GitHub PR data to PullRequest model fields.
 
@@ -110,6 +118,7 @@ def _map_github_pr_to_fields(team, pr_data: dict) -> dict:
     Args:
         team: Team instance this PR belongs to
         pr_data: GitHub PR data dictionary from API or webhook
+        members: Per-sync resolver for the author lookup
 
     Returns:
         Dict of field names to values for PullRequest.objects.update_or_create() defaults
@@ -125,7 +134,7 @@ def _map_github_pr_to_fields(team, pr_data: dict) -> dict:
     # Look up author by github_id
     user_data = pr_data.get("user", {})
     github_user_id = str(user_data.get("id"))
-    author = _get_team_member_by_github_id(team, github_user_id)
+    author = _get_team_member_by_github_id(team, github_user_id, members)
 
     # Parse timestamps
     pr_created_at = _parse_github_timestamp(pr_data.get("created_at"))
@@ -169,22 +178,49 @@ def _dispatch_task_safely(task_path: str, pr_id: int) -> None:
     """
     Safely dispatch a Celery task, logging errors without raising exceptions.
 
+    The task is sent when the current transaction commits (webhook bursts are
+    applied inside one), so it never reads an uncommitted PR and is dropped if
+    the transaction rolls back.
+
     Args:
         task_path: Import path for the task (e.g., "apps.integrations.tasks.send_pr_surveys_task")
         pr_id: PullRequest ID to pass to the task
     """
+    module_path, task_name = task_path.rsplit(".", 1)
     try:
         # Dynamic import of the task
-        module_path, task_name = task_path.rsplit(".", 1)
         module = __import__(module_path, fromlist=[task_name])
         task = getattr(module, task_name)
+    except Exception as e:
+        logger.error(f"Failed to dispatch {task_name} for PR {pr_id}: {e}")
+        return
+
+    def dispatch():
+        try:
+            task.delay(pr_id)
+            logger.debug(f"Dispatched {task_name} for PR {pr_id}")
+        except Exception as e:
+            # Log error but don't break webhook response
+            logger.error(f"Failed to dispatch {task_name} for PR {pr_id}: {e}")
+
+    transaction.on_commit(dispatch)
 
-        task.delay(pr_id)
-        logger.debug(f"Dispatched {task_name} for PR {pr_id}")
+
+def _queue_pr_data_fetch_safely(pr: PullRequest) -> None:
+    """
+    Queue the post-merge data fetch for a PR, logging errors without raising exceptions.
+
+    Args:
+        pr: Merged PullRequest instance
+    """
+    try:
+        # Late import: the integrations queue imports this module
+        from apps.integrations.services.pr_data_queue import queue_pr_data_fetch
+
+        queue_pr_data_fetch(pr)
     except Exception as e:
         # Log error but don't break webhook response
-        task_name = task_path.split(".")[-1]
-        logger.error(f"Failed to dispatch {task_name} for PR {pr_id}: {e}")
+        logger.error(f"Failed to queue PR data fetch for PR {pr.id}: {e}")
 
 
 def _trigger_pr_surveys_if_merged(pr: PullRequest, action: str, is_merged: bool) -> None:
@@ -194,7 +230,7 @@ def _trigger_pr_surveys_if_merged(pr: PullRequest, action: str, is_merged: bool)
     Dispatches independent tasks for surveys and data collection:
     - Slack survey messages
     - GitHub comment survey
-    - Complete PR data fetch (files, commits)
+    - Complete PR data fetch (files, commits), batched per repository
 
     Args:
         pr: PullRequest instance
@@ -204,7 +240,7 @@ def _trigger_pr_surveys_if_merged(pr: PullRequest, action: str, is_merged: bool)
     if action == "closed" and is_merged:
         _dispatch_task_safely("apps.integrations.tasks.send_pr_surveys_task", pr.id)
         _dispatch_task_safely("apps.integrations.tasks.post_survey_comment_task", pr.id)
-        _dispatch_task_safely("apps.integrations.tasks.fetch_pr_complete_data_task", pr.id)
+        _queue_pr_data_fetch_safely(pr)
 
 
 def handle_pull_request_event(team, payload: dict) -> PullRequest | None:
@@ -243,13 +279,14 @@ def handle_pull_request_event(team, payload: dict) -> PullRequest | None:
     return pr
 
 
-def handle_pull_request_review_event(team, payload: dict) -> PRReview | None:
+def handle_pull_request_review_event(team, payload: dict, members: TeamMemberResolver | None = None) -> PRReview | None:
     """
     Process pull_request_review webhook event and create PRReview record.
 
     Args:
         team: Team instance this review belongs to
         payload: GitHub webhook payload dictionary
+        members: Resolver shared across a batch of events
 
     Returns:
         PRReview instance if successful, None if PR not found
@@ -279,7 +316,7 @@ def handle_pull_request_review_event(team, payload: dict) -> PRReview | None:
     # Look up reviewer by github_id
     user_data = review_data.get("user", {})
     github_user_id = str(user_data.get("id"))
-    reviewer = _get_team_member_by_github_id(team, github_user_id)
+    reviewer = _get_team_member_by_github_id(team, github_user_id, members)
 
     # Create or update the review record
     review, created = PRReview.objects.update_or_create(
@@ -301,3 +338,69 @@ def handle_pull_request_review_event(team, payload: dict) -> PRReview | None:
         pull_request.save()
 
     return review
+
+
+def _is_merge_event(payload: dict) -> bool:
+    """Whether a pull_request payload is the event that merged the PR."""
+    return payload.get("action") == "closed" and payload.get("pull_request", {}).get("merged", False)
+
+
+def handle_pull_request_events(team, payloads: list[dict]) -> PullRequest | None:
+    """
+    Apply a burst of pull_request events for one PR with a single upsert.
+
+    Bursts (synchronize, edited, labeled, ...) only need the newest PR state, so
+    only the payload with the latest pull_request.updated_at is written. If the
+    burst contains the merge, post-merge tasks still run once even when a later
+    event (e.g. labeled) supplied the final state.
+
+    Args:
+        team: Team instance this PR belongs to
+        payloads: pull_request webhook payloads for the same PR, in delivery order
+
+    Returns:
+        PullRequest instance, or None if payloads is empty
+    """
+    if not payloads:
+        return None
+
+    # Latest state wins; delivery order breaks ties
+    _, latest = max(
+        enumerate(payloads),
+        key=lambda item: (item[1].get("pull_request", {}).get("updated_at") or "", item[0]),
+    )
+    pr = handle_pull_request_event(team, latest)
+
+    if pr is not None and not _is_merge_event(latest) and any(_is_merge_event(p) for p in payloads):
+        _trigger_pr_surveys_if_merged(pr, "closed", True)
+
+    return pr
+
+
+def handle_pull_request_review_events(team, payloads: list[dict]) -> list[PRReview]:
+    """
+    Apply a burst of pull_request_review events, upserting each review once.
+
+    The last delivered payload per review ID wins (submitted, then edited or
+    dismissed). Reviews are applied in submission order so first_review_at is
+    set from the earliest review.
+
+    Args:
+        team: Team instance these reviews belong to
+        payloads: pull_request_review webhook payloads, in delivery order
+
+    Returns:
+        List of PRReview instances that were written
+    """
+    latest_by_review: dict = {}
+    for payload in payloads:
+        latest_by_review[payload.get("review", {}).get("id")] = payload
+
+    ordered = sorted(latest_by_review.values(), key=lambda p: p.get("review", {}).get("submitted_at") or "")
+    members = TeamMemberResolver(team.id) if len(ordered) > 1 else None
+    reviews = []
+    for payload in ordered:
+        review = handle_pull_request_review_event(team, payload, members)
+        if review is not None:
+            reviews.append(review)
+    return reviews
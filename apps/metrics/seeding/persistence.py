@@ -14,6 +14,8 @@ from django.db import transaction
 
 from apps.metrics.models import Commit, PRCheckRun, PRFile, PRReview, PullRequest, TeamMember
 from apps.metrics.services.ai_detector import detect_ai_in_text, detect_ai_reviewer, parse_co_authors
+from apps.metrics.services.member_resolver import TeamMemberResolver
+from apps.metrics.services.pr_derived_fields import refresh_pr_derived_fields
 
 logger = logging.getLogger(__name__)
 
@@ -48,18 +50,7 @@ class PRPersistenceService:
         if not logins:
             return
 
-        existing = {m.github_username: m for m in TeamMember.objects.filter(team=self.team, github_username__in=logins)}
-
-        missing_logins = logins - existing.keys()
-        if missing_logins:
-            TeamMember.objects.bulk_create(
-                [TeamMember(team=self.team, github_username=login, display_name=login) for login in missing_logins],
-                ignore_conflicts=True,
-            )
-            for m in TeamMember.objects.filter(team=self.team, github_username__in=missing_logins):
-                existing[m.github_username] = m
-
-        self._member_cache.update(existing)
+        self._member_cache.update(TeamMemberResolver(self.team.id).ensure_logins(logins))
 
     def _resolve_member(self, login: str | None, github_id: int = 0) -> TeamMember | None:
         """Find or create TeamMember with in-memory cache.
@@ -131,6 +122,8 @@ class PRPersistenceService:
         self._create_commits(pr, pr_data, github_repo)
         self._create_files(pr, pr_data)
         self._create_check_runs(pr, pr_data)
+        # bulk_create skips PRReview/PRFile.save(), so refresh the stored aggregates once
+        refresh_pr_derived_fields([pr.pk])
 
         return pr
 
@@ -196,6 +189,8 @@ class PRPersistenceService:
         added["commits"] = self._create_commits(pr, pr_data, repo)
         added["files"] = self._create_files(pr, pr_data)
         added["check_runs"] = self._create_check_runs(pr, pr_data)
+        if added["reviews"] or added["files"]:
+            refresh_pr_derived_fields([pr.pk])
 
         # Update derived timing fields if they were missing
         if pr.first_review_at is None and pr_data.first_review_at:
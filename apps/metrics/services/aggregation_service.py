@@ -119,7 +119,7 @@ def compute_member_weekly_metrics(
         surveys_completed = surveys.filter(author_responded_at__isnull=False).count()
     else:
         # Use detection data (effective_is_ai_assisted) for AI metrics
-        ai_assisted_prs = sum(1 for pr in merged_prs if pr.effective_is_ai_assisted)
+        ai_assisted_prs = merged_prs.filter(resolved_is_ai_assisted=True).count()
         # Query surveys only for completion count
         surveys = PRSurvey.objects.filter(
             team=team,
@@ -6,14 +6,24 @@ Provides functions to detect AI involvement in PRs, reviews, and commits:
 - detect_ai_reviewer(username) - Identify AI reviewer bots by username
 - detect_ai_in_text(text) - Find AI tool signatures in PR/commit text
 - parse_co_authors(message) - Extract AI co-authors from commit messages
+- detect_ai_in_texts(texts) / parse_co_authors_in_messages(messages) - Batch
+  variants for backfills and sync pages
 
 All detection is case-insensitive.
 
+Text patterns run through a PatternMatcher compiled once per PATTERNS_VERSION.
+Each pattern carries the literal substrings any match must contain, so a text
+only runs the regexes whose literals it contains; consecutive patterns for the
+same tool are merged into one alternation. Results are identical to searching
+every pattern in order.
+
 Patterns are defined in ai_patterns.py for easy extension. When patterns are
 updated, increment PATTERNS_VERSION in that file to enable reprocessing.
 """
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import TypedDict
 
 from .ai_patterns import (
@@ -24,17 +34,147 @@ from .ai_patterns import (
 )
 
 # =============================================================================
-# Compile Patterns for Efficiency
+# Pattern Matching Engine
 # =============================================================================
-_COMPILED_SIGNATURE_PATTERNS = [
-    (re.compile(pattern, re.IGNORECASE), ai_type) for pattern, ai_type in AI_SIGNATURE_PATTERNS
-]
+# The regex parser is private and may change between Python versions. It is
+# only used to derive prefilter literals: without it (or if its parse tree
+# can't be read) every regex simply runs, with the same results.
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - depends on the Python version
+    sre_constants = sre_parse = None
+
+# Non-ASCII characters that IGNORECASE matches against ASCII letters. They are
+# mapped before lowercasing so literal prefilters never reject a regex match.
+_CASELESS_ASCII = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for literal prefiltering."""
+    return text.translate(_CASELESS_ASCII).lower()
+
+
+def _sequence_literals(items) -> tuple[str, ...] | None:
+    """Best set of literals of which one must occur in any match of a parsed sequence."""
+    best: tuple[str, ...] | None = None
+
+    def consider(candidate: tuple[str, ...] | None) -> None:
+        nonlocal best
+        if candidate and (best is None or min(map(len, candidate)) > min(map(len, best))):
+            best = candidate
+
+    run: list[str] = []
+    for op, av in [*items, (None, None)]:
+        if op is sre_constants.LITERAL and (chr(av).isascii() or not chr(av).isalpha()):
+            run.append(chr(av).lower())
+            continue
+        consider(("".join(run),) if run else None)
+        run = []
+        if op is sre_constants.SUBPATTERN:
+            consider(_sequence_literals(list(av[-1])))
+        elif op is sre_constants.BRANCH:
+            alternatives = [_sequence_literals(list(branch)) for branch in av[1]]
+            if all(alternatives):
+                consider(tuple(literal for alternative in alternatives for literal in alternative))
+    return best
+
+
+def required_literals(pattern: str) -> tuple[str, ...] | None:
+    """
+    Lowercase literals of which at least one occurs in every match of pattern.
 
-_COMPILED_CO_AUTHOR_PATTERNS = [
-    (re.compile(pattern, re.IGNORECASE), ai_type) for pattern, ai_type in AI_CO_AUTHOR_PATTERNS
+    Returns None when no literal can be derived, e.g. r"\\b(?:sonnet|opus)"
+    yields ("sonnet", "opus") but r"\\d+" yields None.
+    """
+    if sre_parse is None:
+        return None
+    try:
+        return _sequence_literals(list(sre_parse.parse(pattern)))
+    except (re.error, RecursionError, AttributeError, IndexError, TypeError, ValueError):
+        return None
+
+
+class PatternMatcher:
+    """
+    Ordered (pattern, tool) list compiled into literal-gated alternations.
+
+    match() returns the tools whose patterns match, in order of each tool's
+    first matching pattern - the same list as searching every pattern in turn.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, str]]):
+        # Consecutive patterns for one tool become a single rule
+        runs: list[tuple[str, list[str]]] = []
+        for pattern, ai_type in patterns:
+            if runs and runs[-1][0] == ai_type:
+                runs[-1][1].append(pattern)
+            else:
+                runs.append((ai_type, [pattern]))
+
+        self.rules: list[tuple[str, re.Pattern, tuple[str, ...] | None]] = []
+        for ai_type, run_patterns in runs:
+            literal_sets = [required_literals(pattern) for pattern in run_patterns]
+            literals = None if None in literal_sets else tuple(dict.fromkeys(lit for s in literal_sets for lit in s))
+            combined = "|".join(f"(?:{pattern})" for pattern in run_patterns)
+            self.rules.append((ai_type, re.compile(combined, re.IGNORECASE), literals))
+
+    def match(self, text: str, folded: str | None = None) -> list[str]:
+        """Tools detected in text. ``folded`` may pass a precomputed _fold(text)."""
+        if folded is None:
+            folded = _fold(text)
+        seen: dict[str, bool] = {}
+        detected: list[str] = []
+        for ai_type, regex, literals in self.rules:
+            if ai_type in detected:
+                continue
+            if literals is not None and not _contains_any(folded, literals, seen):
+                continue
+            if regex.search(text):
+                detected.append(ai_type)
+        return detected
+
+
+def _contains_any(folded: str, literals: tuple[str, ...], seen: dict[str, bool]) -> bool:
+    """Whether any literal occurs in folded text, memoizing lookups in ``seen``."""
+    for literal in literals:
+        hit = seen.get(literal)
+        if hit is None:
+            hit = seen[literal] = literal in folded
+        if hit:
+            return True
+    return False
+
+
+# Patterns for negative AI disclosures (should NOT be counted as AI usage)
+_NEGATIVE_DISCLOSURE_PATTERNS = [
+    r"no\s+ai\s+(?:was\s+)?used",
+    r"ai\s+disclosure[:\s]*none\b",
+    r"without\s+(?:any\s+)?ai",
 ]
 
 
+class _Matchers:
+    """Compiled matchers for one PATTERNS_VERSION."""
+
+    def __init__(self):
+        self.signatures = PatternMatcher(AI_SIGNATURE_PATTERNS)
+        self.co_authors = PatternMatcher(AI_CO_AUTHOR_PATTERNS)
+        self.negative_disclosures = [
+            (re.compile(pattern, re.IGNORECASE), required_literals(pattern))
+            for pattern in _NEGATIVE_DISCLOSURE_PATTERNS
+        ]
+
+
+@lru_cache(maxsize=2)
+def _matchers_for_version(version: str) -> _Matchers:
+    return _Matchers()
+
+
+def _get_matchers() -> _Matchers:
+    return _matchers_for_version(PATTERNS_VERSION)
+
+
 # =============================================================================
 # Type Definitions
 # =============================================================================
@@ -132,24 +272,23 @@ def detect_ai_reviewer(username: str | None) -> AIReviewerResult:
     return _detect_ai_bot_username(username)
 
 
-# Patterns for negative AI disclosures (should NOT be counted as AI usage)
-_NEGATIVE_DISCLOSURE_PATTERNS = [
-    re.compile(r"no\s+ai\s+(?:was\s+)?used", re.IGNORECASE),
-    re.compile(r"ai\s+disclosure[:\s]*none\b", re.IGNORECASE),
-    re.compile(r"without\s+(?:any\s+)?ai", re.IGNORECASE),
-]
-
-
-def _strip_negative_disclosures(text: str) -> str:
+def _strip_negative_disclosures(text: str) -> tuple[str, str]:
     """Remove negative disclosure phrases to prevent false positive matches.
 
     For example, "No AI was used for any part" should not trigger the
     "AI was used for" pattern.
+
+    Returns:
+        Tuple of (cleaned text, folded cleaned text)
     """
-    result = text
-    for pattern in _NEGATIVE_DISCLOSURE_PATTERNS:
-        result = pattern.sub("", result)
-    return result
+    folded = _fold(text)
+    for pattern, literals in _get_matchers().negative_disclosures:
+        if literals is not None and not any(literal in folded for literal in literals):
+            continue
+        text, count = pattern.subn("", text)
+        if count:
+            folded = _fold(text)
+    return text, folded
 
 
 def detect_ai_in_text(text: str | None) -> AITextResult:
@@ -173,13 +312,8 @@ def detect_ai_in_text(text: str | None) -> AITextResult:
 
     # Strip negative disclosure phrases to avoid false positives
     # e.g., "No AI was used for this" should not match "AI was used for"
-    cleaned_text = _strip_negative_disclosures(text)
-
-    detected_tools: list[str] = []
-
-    for pattern, ai_type in _COMPILED_SIGNATURE_PATTERNS:
-        if pattern.search(cleaned_text) and ai_type not in detected_tools:
-            detected_tools.append(ai_type)
+    cleaned_text, folded = _strip_negative_disclosures(text)
+    detected_tools = _get_matchers().signatures.match(cleaned_text, folded)
 
     return {
         "is_ai_assisted": len(detected_tools) > 0,
@@ -206,13 +340,55 @@ def parse_co_authors(message: str | None) -> CoAuthorResult:
     if not message:
         return {"has_ai_co_authors": False, "ai_co_authors": []}
 
-    detected_co_authors: list[str] = []
-
-    for pattern, ai_type in _COMPILED_CO_AUTHOR_PATTERNS:
-        if pattern.search(message) and ai_type not in detected_co_authors:
-            detected_co_authors.append(ai_type)
+    detected_co_authors = _get_matchers().co_authors.match(message)
 
     return {
         "has_ai_co_authors": len(detected_co_authors) > 0,
         "ai_co_authors": detected_co_authors,
     }
+
+
+def detect_ai_in_texts(texts: Iterable[str | None]) -> list[AITextResult]:
+    """
+    Detect AI tool signatures in many texts.
+
+    Equivalent to [detect_ai_in_text(t) for t in texts], but each distinct text
+    is matched once - templated bodies repeat heavily across a backfill.
+
+    Args:
+        texts: Texts to analyze (None and empty strings allowed)
+
+    Returns:
+        One AITextResult per input text, in input order
+    """
+    results: dict[str | None, list[str]] = {}
+    output: list[AITextResult] = []
+    for text in texts:
+        tools = results.get(text)
+        if tools is None:
+            tools = results[text] = detect_ai_in_text(text)["ai_tools"]
+        output.append({"is_ai_assisted": bool(tools), "ai_tools": list(tools)})
+    return output
+
+
+def parse_co_authors_in_messages(messages: Iterable[str | None]) -> list[CoAuthorResult]:
+    """
+    Parse AI co-authors from many commit messages.
+
+    Equivalent to [parse_co_authors(m) for m in messages], matching each
+    distinct message once.
+
+    Args:
+        messages: Commit messages to parse
+
+    Returns:
+        One CoAuthorResult per message, in input order
+    """
+    results: dict[str | None, list[str]] = {}
+    output: list[CoAuthorResult] = []
+    for message in messages:
+        co_authors = results.get(message)
+        if co_authors is None:
+            co_authors = results[message] = parse_co_authors(message)["ai_co_authors"]
+        output.append({"has_ai_co_authors": bool(co_authors), "ai_co_authors": list(co_authors)})
+    return output
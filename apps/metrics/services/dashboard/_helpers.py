@@ -7,10 +7,11 @@ They should not be imported directly by external code.
 from datetime import date
 from decimal import Decimal
 
-from django.db.models import Avg, Count, Q, QuerySet
-from django.db.models.functions import TruncMonth, TruncWeek
+from django.db.models import Count, Q, QuerySet
 
 from apps.metrics.models import PullRequest
+from apps.metrics.services.dashboard_cache import get_team_data_version
+from apps.metrics.services.pr_daily_facts import get_fact_series
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
@@ -84,7 +85,8 @@ def _calculate_ai_percentage(surveys: QuerySet) -> Decimal:
 def _calculate_ai_percentage_from_detection(prs: QuerySet[PullRequest]) -> Decimal:
     """Calculate percentage of AI-assisted PRs using detection data.
 
-    Uses effective_is_ai_assisted property which prioritizes:
+    Uses the materialized resolved_is_ai_assisted column (effective_is_ai_assisted),
+    which prioritizes:
     1. LLM detection (llm_summary.ai.is_assisted with confidence >= 0.5)
     2. Pattern detection (is_ai_assisted field)
 
@@ -94,14 +96,13 @@ def _calculate_ai_percentage_from_detection(prs: QuerySet[PullRequest]) -> Decim
     Returns:
         Decimal percentage (0.00 to 100.00)
     """
-    total_prs = prs.count()
-    if total_prs == 0:
-        return Decimal("0.00")
-
-    # Count PRs where effective_is_ai_assisted is True
-    # Since this is a property, we need to iterate
-    ai_count = sum(1 for pr in prs if pr.effective_is_ai_assisted)
-    return Decimal(str(round(ai_count * 100.0 / total_prs, 2)))
+    stats = prs.aggregate(
+        total=Count("id"),
+        ai_count=Count("id", filter=Q(resolved_is_ai_assisted=True)),
+    )
+    if stats["total"] > 0:
+        return Decimal(str(round(stats["ai_count"] * 100.0 / stats["total"], 2)))
+    return Decimal("0.00")
 
 
 def _get_github_url(pr: PullRequest) -> str:
@@ -163,8 +164,22 @@ def _avatar_url_from_github_id(github_id: str | None) -> str:
 
 
 def _get_key_metrics_cache_key(team_id: int, start_date: date, end_date: date) -> str:
-    """Generate cache key for key metrics."""
-    return f"key_metrics:{team_id}:{start_date}:{end_date}"
+    """Generate cache key for key metrics, scoped to the team's data version."""
+    return f"key_metrics:{team_id}:v{get_team_data_version(team_id)}:{start_date}:{end_date}"
+
+
+# Raw PR metric fields that have sum/count columns in DailyPRFact
+_FACT_METRIC_PREFIXES = {
+    "cycle_time_hours": "cycle_time",
+    "review_time_hours": "review_time",
+}
+
+
+def _fact_average(entry: dict, metric_field: str) -> float:
+    """Average of a PR metric field from a DailyPRFact period entry (0.0 if no data)."""
+    prefix = _FACT_METRIC_PREFIXES[metric_field]
+    count = entry[f"{prefix}_count"]
+    return float(entry[f"{prefix}_sum"] / count) if count else 0.0
 
 
 def _get_metric_trend(
@@ -172,19 +187,18 @@ def _get_metric_trend(
     start_date: date,
     end_date: date,
     metric_field: str,
-    result_key: str = "avg_metric",
     repo: str | None = None,
 ) -> list[dict]:
     """Get weekly trend for a given metric field.
 
-    Generic helper to calculate weekly averages for any numeric PR field.
+    Generic helper to calculate weekly averages for a PR timing field.
+    Reads from the DailyPRFact rollup (see pr_daily_facts.get_fact_series).
 
     Args:
         team: Team instance
         start_date: Start date (inclusive)
         end_date: End date (inclusive)
-        metric_field: Name of the PR model field to average
-        result_key: Key name for the aggregated result in the query
+        metric_field: PR field to average ("cycle_time_hours" or "review_time_hours")
         repo: Optional repository to filter by (owner/repo format)
 
     Returns:
@@ -192,31 +206,14 @@ def _get_metric_trend(
             - week (str): Week start date in ISO format (YYYY-MM-DD)
             - value (float): Average metric value for that week (0.0 if None)
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
-
-    # Group by week and calculate average metric
-    weekly_data = (
-        prs.annotate(week=TruncWeek("merged_at"))
-        .values("week")
-        .annotate(**{result_key: Avg(metric_field)})
-        .order_by("week")
-    )
-
-    result = []
-    for entry in weekly_data:
-        # Convert datetime to ISO format string for JSON serialization
-        week_str = entry["week"].strftime("%Y-%m-%d") if entry["week"] else None
-        # Convert Decimal to float for JSON serialization
-        value = float(entry[result_key]) if entry[result_key] else 0.0
-        result.append(
-            {
-                "week": week_str,
-                "value": value,
-            }
-        )
-
-    return result
+    return [
+        {
+            # Convert date to ISO format string for JSON serialization
+            "week": entry["period"].strftime("%Y-%m-%d"),
+            "value": _fact_average(entry, metric_field),
+        }
+        for entry in get_fact_series(team, start_date, end_date, period="week", repo=repo)
+    ]
 
 
 def _filter_by_date_range(
@@ -290,19 +287,18 @@ def _get_monthly_metric_trend(
     start_date: date,
     end_date: date,
     metric_field: str,
-    result_key: str = "avg_metric",
     repo: str | None = None,
 ) -> list[dict]:
     """Get monthly trend for a given metric field.
 
-    Generic helper to calculate monthly averages for any numeric PR field.
+    Generic helper to calculate monthly averages for a PR timing field.
+    Reads from the DailyPRFact rollup (see pr_daily_facts.get_fact_series).
 
     Args:
         team: Team instance
         start_date: Start date (inclusive)
         end_date: End date (inclusive)
-        metric_field: Name of the PR model field to average
-        result_key: Key name for the aggregated result in the query
+        metric_field: PR field to average ("cycle_time_hours" or "review_time_hours")
         repo: Optional repository to filter by (owner/repo format)
 
     Returns:
@@ -310,30 +306,13 @@ def _get_monthly_metric_trend(
             - month (str): Month in YYYY-MM format
             - value (float): Average metric value for that month (0.0 if None)
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
-
-    # Group by month and calculate average metric
-    monthly_data = (
-        prs.annotate(month=TruncMonth("merged_at"))
-        .values("month")
-        .annotate(**{result_key: Avg(metric_field)})
-        .order_by("month")
-    )
-
-    result = []
-    for entry in monthly_data:
-        # Convert datetime to YYYY-MM format for JSON serialization
-        month_str = entry["month"].strftime("%Y-%m") if entry["month"] else None
-        # Convert Decimal to float for JSON serialization
-        value = float(entry[result_key]) if entry[result_key] else 0.0
-        result.append(
-            {
-                "month": month_str,
-                "value": value,
-            }
-        )
-    return result
+    return [
+        {
+            "month": entry["period"].strftime("%Y-%m"),
+            "value": _fact_average(entry, metric_field),
+        }
+        for entry in get_fact_series(team, start_date, end_date, period="month", repo=repo)
+    ]
 
 
 def _is_valid_category(category: str) -> bool:
@@ -6,7 +6,7 @@ Functions for AI adoption, tool breakdown, quality comparison, and impact analys
 from datetime import date
 from decimal import Decimal
 
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, BooleanField, Case, Count, Q, Value, When
 from django.db.models.functions import TruncWeek
 
 from apps.metrics.models import PRReview, PRSurvey, PRSurveyReview
@@ -17,10 +17,12 @@ from apps.metrics.services.dashboard._helpers import (
     _filter_by_date_range,
     _get_merged_prs_in_range,
 )
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
 
+@dashboard_cached
 def get_ai_adoption_trend(
     team: Team,
     start_date: date,
@@ -71,6 +73,7 @@ def get_ai_adoption_trend(
     return result
 
 
+@dashboard_cached
 def get_ai_quality_comparison(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get quality comparison between AI-assisted and non-AI PRs.
 
@@ -102,6 +105,7 @@ def get_ai_quality_comparison(team: Team, start_date: date, end_date: date, repo
     }
 
 
+@dashboard_cached
 def get_ai_detective_leaderboard(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get AI detective leaderboard data.
 
@@ -149,6 +153,7 @@ def get_ai_detective_leaderboard(team: Team, start_date: date, end_date: date, r
     ]
 
 
+@dashboard_cached
 def get_ai_detected_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get AI detection metrics based on PR content analysis.
 
@@ -187,6 +192,7 @@ def get_ai_detected_metrics(team: Team, start_date: date, end_date: date, repo:
     }
 
 
+@dashboard_cached
 def get_ai_tool_breakdown(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get breakdown of AI tools detected in PRs.
 
@@ -232,6 +238,7 @@ def get_ai_tool_breakdown(team: Team, start_date: date, end_date: date, repo: st
     return result
 
 
+@dashboard_cached
 def get_ai_category_breakdown(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get breakdown of PRs by AI category (code vs review).
 
@@ -254,34 +261,22 @@ def get_ai_category_breakdown(team: Team, start_date: date, end_date: date, repo
         CATEGORY_BOTH,
         CATEGORY_CODE,
         CATEGORY_REVIEW,
-        get_ai_category,
     )
 
-    # Use .only() to limit fields fetched - we only need llm_summary and ai_tools_detected
-    # for effective_ai_tools property. Avoids loading large 'body' column.
-    prs = (
-        _get_merged_prs_in_range(team, start_date, end_date)
-        .filter(is_ai_assisted=True)
-        .only("id", "llm_summary", "ai_tools_detected")
-    )
+    # resolved_ai_category is the materialized category of effective_ai_tools (LLM priority)
+    prs = _get_merged_prs_in_range(team, start_date, end_date).filter(is_ai_assisted=True)
     prs = _apply_repo_filter(prs, repo)
 
-    code_count = 0
-    review_count = 0
-    both_count = 0
-
-    for pr in prs:
-        # Use effective_ai_tools for LLM priority
-        tools = pr.effective_ai_tools
-        category = get_ai_category(tools)
-        if category == CATEGORY_CODE:
-            code_count += 1
-        elif category == CATEGORY_REVIEW:
-            review_count += 1
-        elif category == CATEGORY_BOTH:
-            both_count += 1
-
-    total = prs.count()
+    stats = prs.aggregate(
+        total=Count("id"),
+        code_count=Count("id", filter=Q(resolved_ai_category=CATEGORY_CODE)),
+        review_count=Count("id", filter=Q(resolved_ai_category=CATEGORY_REVIEW)),
+        both_count=Count("id", filter=Q(resolved_ai_category=CATEGORY_BOTH)),
+    )
+    total = stats["total"]
+    code_count = stats["code_count"]
+    review_count = stats["review_count"]
+    both_count = stats["both_count"]
 
     return {
         "total_ai_prs": total,
@@ -294,6 +289,7 @@ def get_ai_category_breakdown(team: Team, start_date: date, end_date: date, repo
     }
 
 
+@dashboard_cached
 def get_ai_bot_review_stats(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get statistics about AI bot reviews.
 
@@ -347,6 +343,7 @@ def get_ai_bot_review_stats(team: Team, start_date: date, end_date: date, repo:
     }
 
 
+@dashboard_cached
 def get_ai_detection_metrics(
     team: Team, start_date: date = None, end_date: date = None, repo: str | None = None
 ) -> dict:
@@ -417,6 +414,7 @@ def get_ai_detection_metrics(
     }
 
 
+@dashboard_cached
 def get_ai_impact_stats(
     team: Team,
     start_date: date,
@@ -432,7 +430,8 @@ def get_ai_impact_stats(
         end_date: End date (inclusive)
         use_survey_data: If True, use survey data (PRSurvey.author_ai_assisted) with
             detection fallback. If False/None (default), use only detection data
-            (effective_is_ai_assisted which prioritizes LLM > pattern detection).
+            (resolved_is_ai_assisted, the materialized effective_is_ai_assisted which
+            prioritizes LLM > pattern detection).
         repo: Optional repository to filter by (owner/repo format)
 
     Returns:
@@ -447,12 +446,29 @@ def get_ai_impact_stats(
     # Default to detection data; use survey data when use_survey_data=True
     use_surveys = use_survey_data if use_survey_data is not None else False
 
-    # Get all merged PRs in range with survey data prefetched
-    prs_qs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs_qs = _apply_repo_filter(prs_qs, repo)
-    prs = list(prs_qs.prefetch_related("survey"))
+    prs = _get_merged_prs_in_range(team, start_date, end_date)
+    prs = _apply_repo_filter(prs, repo)
+
+    if use_surveys:
+        # Survey-based: survey answer wins; PRs without a survey (or without an
+        # author answer) fall back to detection (resolved_is_ai_assisted)
+        ai_q = Q(survey__author_ai_assisted=True) | Q(
+            survey__author_ai_assisted__isnull=True, resolved_is_ai_assisted=True
+        )
+    else:
+        # Detection-based: materialized effective_is_ai_assisted (LLM > pattern)
+        ai_q = Q(resolved_is_ai_assisted=True)
 
-    total_prs = len(prs)
+    # Single pass: counts and per-group cycle time averages
+    is_ai = Case(When(ai_q, then=Value(True)), default=Value(False), output_field=BooleanField())
+    stats = prs.annotate(is_ai=is_ai).aggregate(
+        total_prs=Count("id"),
+        ai_prs=Count("id", filter=Q(is_ai=True)),
+        avg_cycle_ai=Avg("cycle_time_hours", filter=Q(is_ai=True)),
+        avg_cycle_non_ai=Avg("cycle_time_hours", filter=Q(is_ai=False)),
+    )
+
+    total_prs = stats["total_prs"]
 
     if total_prs == 0:
         return {
@@ -464,56 +480,21 @@ def get_ai_impact_stats(
             "ai_prs": 0,
         }
 
-    # Separate PRs by AI status based on data source
-    ai_prs = []
-    non_ai_prs = []
-
-    for pr in prs:
-        if use_surveys:
-            # Survey-based: Use survey data with detection fallback
-            try:
-                survey = pr.survey
-                if survey.author_ai_assisted is True:
-                    ai_prs.append(pr)
-                elif survey.author_ai_assisted is False:
-                    non_ai_prs.append(pr)
-                else:
-                    # Survey exists but author_ai_assisted is None - use fallback
-                    if pr.effective_is_ai_assisted:
-                        ai_prs.append(pr)
-                    else:
-                        non_ai_prs.append(pr)
-            except PRSurvey.DoesNotExist:
-                # No survey - fall back to effective_is_ai_assisted
-                if pr.effective_is_ai_assisted:
-                    ai_prs.append(pr)
-                else:
-                    non_ai_prs.append(pr)
-        else:
-            # Detection-based: Use only effective_is_ai_assisted
-            if pr.effective_is_ai_assisted:
-                ai_prs.append(pr)
-            else:
-                non_ai_prs.append(pr)
-
-    ai_count = len(ai_prs)
+    ai_count = stats["ai_prs"]
 
     # Calculate adoption percentage
     ai_adoption_pct = Decimal(str(round(ai_count * 100.0 / total_prs, 2)))
 
-    # Calculate average cycle times (only PRs with cycle_time_hours)
-    ai_cycle_times = [pr.cycle_time_hours for pr in ai_prs if pr.cycle_time_hours is not None]
-    non_ai_cycle_times = [pr.cycle_time_hours for pr in non_ai_prs if pr.cycle_time_hours is not None]
-
+    # Average cycle times (Avg ignores PRs without cycle_time_hours)
     avg_cycle_with_ai = None
     avg_cycle_without_ai = None
     cycle_time_difference_pct = None
 
-    if ai_cycle_times:
-        avg_cycle_with_ai = Decimal(str(round(sum(ai_cycle_times) / len(ai_cycle_times), 2)))
+    if stats["avg_cycle_ai"] is not None:
+        avg_cycle_with_ai = Decimal(str(round(stats["avg_cycle_ai"], 2)))
 
-    if non_ai_cycle_times:
-        avg_cycle_without_ai = Decimal(str(round(sum(non_ai_cycle_times) / len(non_ai_cycle_times), 2)))
+    if stats["avg_cycle_non_ai"] is not None:
+        avg_cycle_without_ai = Decimal(str(round(stats["avg_cycle_non_ai"], 2)))
 
     # Calculate difference percentage if both averages are available
     if avg_cycle_with_ai is not None and avg_cycle_without_ai is not None and avg_cycle_without_ai > 0:
@@ -9,10 +9,12 @@ from decimal import Decimal
 from django.db.models import Count, Q
 
 from apps.metrics.models import Deployment, PRCheckRun
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
 
+@dashboard_cached
 def get_cicd_pass_rate(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get CI/CD pass rate metrics for a team within a date range.
 
@@ -78,6 +80,7 @@ def get_cicd_pass_rate(team: Team, start_date: date, end_date: date, repo: str |
     }
 
 
+@dashboard_cached
 def get_deployment_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get DORA-style deployment metrics for a team within a date range.
 
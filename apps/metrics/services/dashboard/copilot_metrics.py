@@ -11,9 +11,11 @@ from django.db.models.functions import TruncMonth, TruncWeek
 from django.utils import timezone
 
 from apps.metrics.models import AIUsageDaily, CopilotLanguageDaily, PullRequest
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 
 
+@dashboard_cached
 def get_copilot_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get Copilot metrics summary for a team within a date range.
 
@@ -67,6 +69,7 @@ def get_copilot_metrics(team: Team, start_date: date, end_date: date, repo: str
     }
 
 
+@dashboard_cached
 def get_copilot_trend(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get Copilot acceptance rate trend by week.
 
@@ -124,6 +127,7 @@ def get_copilot_trend(team: Team, start_date: date, end_date: date, repo: str |
     return result
 
 
+@dashboard_cached
 def get_monthly_copilot_acceptance_trend(
     team: Team, start_date: date, end_date: date, repo: str | None = None
 ) -> list[dict]:
@@ -178,6 +182,7 @@ def get_monthly_copilot_acceptance_trend(
     return result
 
 
+@dashboard_cached
 def get_weekly_copilot_acceptance_trend(
     team: Team, start_date: date, end_date: date, repo: str | None = None
 ) -> list[dict]:
@@ -212,6 +217,7 @@ def get_weekly_copilot_acceptance_trend(
     ]
 
 
+@dashboard_cached
 def get_copilot_delivery_comparison(team: Team, start_date: date, end_date: date) -> dict:
     """Compare delivery metrics between Copilot and non-Copilot users.
 
@@ -310,6 +316,7 @@ def get_copilot_delivery_comparison(team: Team, start_date: date, end_date: date
     }
 
 
+@dashboard_cached
 def get_copilot_engagement_summary(
     team: Team,
     start_date: date,
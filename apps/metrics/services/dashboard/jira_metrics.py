@@ -11,10 +11,12 @@ from django.utils import timezone
 
 from apps.metrics.models import JiraIssue, PullRequest
 from apps.metrics.services.dashboard._helpers import _get_merged_prs_in_range
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
 
+@dashboard_cached
 def get_jira_sprint_metrics(team: Team, start_date: date, end_date: date) -> dict:
     """Get sprint-level metrics from Jira issues.
 
@@ -56,6 +58,7 @@ def get_jira_sprint_metrics(team: Team, start_date: date, end_date: date) -> dic
     }
 
 
+@dashboard_cached
 def get_pr_jira_correlation(team: Team, start_date: date, end_date: date) -> dict:
     """Correlate PR metrics with Jira linkage.
 
@@ -163,6 +166,7 @@ def get_linkage_trend(team: Team, weeks: int = 4) -> list[dict]:
     return result[-weeks:] if len(result) > weeks else result
 
 
+@dashboard_cached
 def get_story_point_correlation(team: Team, start_date: date, end_date: date) -> dict:
     """Correlate story points with actual PR delivery time.
 
@@ -6,7 +6,7 @@ Core KPIs displayed at the top of the dashboard.
 from datetime import date
 
 from django.core.cache import cache
-from django.db.models import Avg
+from django.db.models import Avg, Count
 
 from apps.metrics.models import PRSurvey, PRSurveyReview
 from apps.metrics.services.dashboard._helpers import (
@@ -16,10 +16,12 @@ from apps.metrics.services.dashboard._helpers import (
     _get_key_metrics_cache_key,
     _get_merged_prs_in_range,
 )
+from apps.metrics.services.dashboard_cache import DASHBOARD_DATA_CACHE_TTL, record_cache_access
 from apps.teams.models import Team
 
-# Cache TTL for dashboard metrics (5 minutes)
-DASHBOARD_CACHE_TTL = 300
+# Cache TTL for dashboard metrics. Entries are invalidated by team data version
+# bumps (see dashboard_cache), so the TTL is only a safety net.
+DASHBOARD_CACHE_TTL = DASHBOARD_DATA_CACHE_TTL
 
 
 def get_key_metrics(
@@ -31,7 +33,7 @@ def get_key_metrics(
 ) -> dict:
     """Get key metrics for a team within a date range.
 
-    Results are cached for 5 minutes to improve dashboard performance.
+    Results are cached until the team's dashboard data version is bumped.
 
     Args:
         team: Team instance
@@ -57,6 +59,7 @@ def get_key_metrics(
     data_source = "survey" if use_surveys else "detection"
     cache_key = _get_key_metrics_cache_key(team.id, start_date, end_date) + f":{repo or 'all'}:{data_source}"
     cached_result = cache.get(cache_key)
+    record_cache_access("get_key_metrics", hit=cached_result is not None)
     if cached_result is not None:
         return cached_result
 
@@ -64,13 +67,15 @@ def get_key_metrics(
     prs = _get_merged_prs_in_range(team, start_date, end_date)
     prs = _apply_repo_filter(prs, repo)
 
-    prs_merged = prs.count()
-
-    # Calculate average cycle time
-    avg_cycle_time = prs.aggregate(avg=Avg("cycle_time_hours"))["avg"]
-
-    # Calculate average review time
-    avg_review_time = prs.aggregate(avg=Avg("review_time_hours"))["avg"]
+    # Count and timing averages in a single aggregate query
+    pr_stats = prs.aggregate(
+        prs_merged=Count("id"),
+        avg_cycle_time=Avg("cycle_time_hours"),
+        avg_review_time=Avg("review_time_hours"),
+    )
+    prs_merged = pr_stats["prs_merged"]
+    avg_cycle_time = pr_stats["avg_cycle_time"]
+    avg_review_time = pr_stats["avg_review_time"]
 
     # Calculate average quality rating from survey reviews
     reviews = PRSurveyReview.objects.filter(survey__pull_request__in=prs)
@@ -91,7 +96,6 @@ def get_key_metrics(
         "ai_assisted_pct": ai_assisted_pct,
     }
 
-    # Cache for 5 minutes
     cache.set(cache_key, result, DASHBOARD_CACHE_TTL)
 
     return result
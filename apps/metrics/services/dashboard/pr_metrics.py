@@ -6,7 +6,7 @@ Functions for PR lists, size distribution, type breakdown, and attention trackin
 from datetime import date
 from decimal import Decimal
 
-from django.db.models import Avg, Case, CharField, Count, F, Q, Value, When
+from django.db.models import Avg, Count, Q
 
 from apps.integrations.models import JiraIntegration
 from apps.metrics.models import PRSurvey, PullRequest
@@ -16,6 +16,8 @@ from apps.metrics.services.dashboard._helpers import (
     _get_github_url,
     _get_merged_prs_in_range,
 )
+from apps.metrics.services.dashboard_cache import dashboard_cached
+from apps.metrics.services.pr_daily_facts import SIZE_BUCKET_LABELS, get_fact_histograms
 from apps.teams.models import Team
 
 # PR Size Categories
@@ -26,6 +28,7 @@ PR_SIZE_M_MAX = 200
 PR_SIZE_L_MAX = 500
 
 
+@dashboard_cached
 def get_recent_prs(
     team: Team, start_date: date, end_date: date, limit: int = 10, repo: str | None = None
 ) -> list[dict]:
@@ -91,6 +94,7 @@ def get_recent_prs(
     return result
 
 
+@dashboard_cached
 def get_revert_hotfix_stats(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get revert and hotfix statistics.
 
@@ -134,6 +138,7 @@ def get_revert_hotfix_stats(team: Team, start_date: date, end_date: date, repo:
     }
 
 
+@dashboard_cached
 def get_pr_size_distribution(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get PR size distribution by category.
 
@@ -155,33 +160,15 @@ def get_pr_size_distribution(team: Team, start_date: date, end_date: date, repo:
             - category (str): Size category (XS, S, M, L, XL)
             - count (int): Number of PRs in this category
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
-
-    # Use database aggregation to count PRs by size category
-    # Annotate each PR with its size category, then count by category
-    categorized = prs.annotate(
-        total_lines=F("additions") + F("deletions"),
-        size_category=Case(
-            When(total_lines__lte=PR_SIZE_XS_MAX, then=Value("XS")),
-            When(total_lines__lte=PR_SIZE_S_MAX, then=Value("S")),
-            When(total_lines__lte=PR_SIZE_M_MAX, then=Value("M")),
-            When(total_lines__lte=PR_SIZE_L_MAX, then=Value("L")),
-            default=Value("XL"),
-            output_field=CharField(),
-        ),
-    )
-
-    # Count PRs by category
-    category_counts = categorized.values("size_category").annotate(count=Count("id"))
-
-    # Convert to dict for easy lookup
-    counts_by_category = {item["size_category"]: item["count"] for item in category_counts}
+    # Size buckets are pre-aggregated in the DailyPRFact rollup
+    # (SIZE_BUCKETS_LINES mirrors the PR_SIZE_*_MAX thresholds above)
+    size_histogram = get_fact_histograms(team, start_date, end_date, repo=repo)["size_histogram"]
 
     # Return all categories in order, with 0 for missing categories
-    return [{"category": cat, "count": counts_by_category.get(cat, 0)} for cat in ["XS", "S", "M", "L", "XL"]]
+    return [{"category": cat, "count": count} for cat, count in zip(SIZE_BUCKET_LABELS, size_histogram, strict=True)]
 
 
+@dashboard_cached
 def get_unlinked_prs(
     team: Team, start_date: date, end_date: date, limit: int = 10, repo: str | None = None
 ) -> list[dict]:
@@ -220,6 +207,7 @@ def get_unlinked_prs(
     ]
 
 
+@dashboard_cached
 def get_iteration_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get iteration metrics averages for merged PRs within a date range.
 
@@ -270,6 +258,7 @@ def get_iteration_metrics(team: Team, start_date: date, end_date: date, repo: st
     }
 
 
+@dashboard_cached
 def get_pr_type_breakdown(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> list[dict]:
@@ -326,6 +315,7 @@ def get_pr_type_breakdown(
     return result
 
 
+@dashboard_cached
 def get_monthly_pr_type_trend(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> dict[str, list[dict]]:
@@ -388,6 +378,7 @@ def get_monthly_pr_type_trend(
     return result
 
 
+@dashboard_cached
 def get_weekly_pr_type_trend(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> dict[str, list[dict]]:
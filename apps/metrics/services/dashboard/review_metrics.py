@@ -19,6 +19,7 @@ from apps.metrics.services.dashboard._helpers import (
     _compute_initials,
     _filter_by_date_range,
 )
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
@@ -38,6 +39,7 @@ def _is_bot_reviewer(username: str | None) -> bool:
     return any(pattern in username_lower for pattern in BOT_USERNAME_PATTERNS)
 
 
+@dashboard_cached
 def get_review_distribution(
     team: Team, start_date: date, end_date: date, repo: str | None = None, limit: int | None = None
 ) -> list[dict]:
@@ -97,6 +99,7 @@ def get_review_distribution(
     ]
 
 
+@dashboard_cached
 def get_reviewer_workload(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get reviewer workload with classification.
 
@@ -159,6 +162,7 @@ def get_reviewer_workload(team: Team, start_date: date, end_date: date, repo: st
     ]
 
 
+@dashboard_cached
 def get_reviewer_correlations(team: Team) -> list[dict]:
     """Get reviewer correlation data for a team.
 
@@ -196,6 +200,7 @@ def get_reviewer_correlations(team: Team) -> list[dict]:
     ]
 
 
+@dashboard_cached
 def get_response_channel_distribution(
     team: Team, start_date: date = None, end_date: date = None, repo: str | None = None
 ) -> dict:
@@ -272,6 +277,7 @@ def get_response_channel_distribution(
     }
 
 
+@dashboard_cached
 def get_response_time_metrics(
     team: Team, start_date: date = None, end_date: date = None, repo: str | None = None
 ) -> dict:
@@ -365,6 +371,7 @@ def get_response_time_metrics(
     }
 
 
+@dashboard_cached
 def detect_review_bottleneck(
     team: Team,
     start_date: date,  # noqa: ARG001
@@ -17,9 +17,11 @@ from apps.metrics.services.dashboard._helpers import (
     _get_merged_prs_in_range,
 )
 from apps.metrics.services.dashboard.review_metrics import _is_bot_reviewer
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 
 
+@dashboard_cached
 def get_team_breakdown(
     team: Team,
     start_date: date,
@@ -219,6 +221,7 @@ def get_team_breakdown(
     return result
 
 
+@dashboard_cached
 def get_team_averages(
     team: Team,
     start_date: date,
@@ -282,6 +285,7 @@ def get_team_averages(
     }
 
 
+@dashboard_cached
 def get_copilot_by_member(
     team: Team, start_date: date, end_date: date, limit: int = 5, repo: str | None = None
 ) -> list[dict]:
@@ -346,6 +350,7 @@ def get_copilot_by_member(
     return result[:limit] if limit else result
 
 
+@dashboard_cached
 def get_team_velocity(team: Team, start_date: date, end_date: date, limit: int = 5) -> list[dict]:
     """Get top contributors by PR count with average cycle time.
 
@@ -14,10 +14,12 @@ from apps.metrics.services.dashboard._helpers import (
     _get_merged_prs_in_range,
     _is_valid_category,
 )
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
 
+@dashboard_cached
 def get_file_category_breakdown(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get file change breakdown by category for a team within a date range.
 
@@ -80,6 +82,7 @@ def get_file_category_breakdown(team: Team, start_date: date, end_date: date, re
     }
 
 
+@dashboard_cached
 def get_tech_breakdown(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> list[dict]:
@@ -143,6 +146,7 @@ def get_tech_breakdown(
     return result
 
 
+@dashboard_cached
 def get_monthly_tech_trend(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> dict[str, list[dict]]:
@@ -211,6 +215,7 @@ def get_monthly_tech_trend(
     return result
 
 
+@dashboard_cached
 def get_weekly_tech_trend(
     team: Team, start_date: date, end_date: date, ai_assisted: str = "all", repo: str | None = None
 ) -> dict[str, list[dict]]:
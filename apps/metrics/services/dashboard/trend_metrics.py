@@ -3,19 +3,21 @@
 Functions for weekly/monthly trend data, sparklines, and period comparisons.
 """
 
-from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date
 from decimal import Decimal
 
-from django.db.models import Avg, Count, Q, Sum
-from django.db.models.functions import TruncMonth, TruncWeek
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncWeek
 
 from apps.metrics.services.dashboard._helpers import (
     _apply_repo_filter,
+    _fact_average,
     _get_merged_prs_in_range,
     _get_metric_trend,
     _get_monthly_metric_trend,
 )
+from apps.metrics.services.dashboard_cache import dashboard_cached
+from apps.metrics.services.pr_daily_facts import get_fact_series
 from apps.teams.models import Team
 from apps.utils.date_utils import end_of_day, start_of_day
 
@@ -26,6 +28,7 @@ MIN_SPARKLINE_SAMPLE_SIZE = 3
 MAX_TREND_PERCENTAGE = 500
 
 
+@dashboard_cached
 def get_cycle_time_trend(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get cycle time trend by week.
 
@@ -40,9 +43,10 @@ def get_cycle_time_trend(team: Team, start_date: date, end_date: date, repo: str
             - week (str): Week start date in ISO format (YYYY-MM-DD)
             - value (float): Average cycle time in hours for that week
     """
-    return _get_metric_trend(team, start_date, end_date, "cycle_time_hours", "avg_cycle_time", repo)
+    return _get_metric_trend(team, start_date, end_date, "cycle_time_hours", repo=repo)
 
 
+@dashboard_cached
 def get_review_time_trend(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get review time trend by week.
 
@@ -57,9 +61,10 @@ def get_review_time_trend(team: Team, start_date: date, end_date: date, repo: st
             - week (date): Week start date
             - value (float): Average review time in hours for that week
     """
-    return _get_metric_trend(team, start_date, end_date, "review_time_hours", "avg_review_time", repo)
+    return _get_metric_trend(team, start_date, end_date, "review_time_hours", repo=repo)
 
 
+@dashboard_cached
 def get_monthly_cycle_time_trend(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get cycle time trend by month.
 
@@ -74,9 +79,10 @@ def get_monthly_cycle_time_trend(team: Team, start_date: date, end_date: date, r
             - month (str): Month in YYYY-MM format
             - value (float): Average cycle time in hours for that month
     """
-    return _get_monthly_metric_trend(team, start_date, end_date, "cycle_time_hours", "avg_cycle_time", repo)
+    return _get_monthly_metric_trend(team, start_date, end_date, "cycle_time_hours", repo=repo)
 
 
+@dashboard_cached
 def get_monthly_review_time_trend(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get review time trend by month.
 
@@ -91,9 +97,10 @@ def get_monthly_review_time_trend(team: Team, start_date: date, end_date: date,
             - month (str): Month in YYYY-MM format
             - value (float): Average review time in hours for that month
     """
-    return _get_monthly_metric_trend(team, start_date, end_date, "review_time_hours", "avg_review_time", repo)
+    return _get_monthly_metric_trend(team, start_date, end_date, "review_time_hours", repo=repo)
 
 
+@dashboard_cached
 def get_monthly_pr_count(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get PR count by month.
 
@@ -108,26 +115,13 @@ def get_monthly_pr_count(team: Team, start_date: date, end_date: date, repo: str
             - month (str): Month in YYYY-MM format
             - value (int): Number of merged PRs for that month
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
+    # Monthly counts from the DailyPRFact rollup
+    monthly_data = get_fact_series(team, start_date, end_date, period="month", repo=repo)
 
-    # Group by month and count
-    monthly_data = (
-        prs.annotate(month=TruncMonth("merged_at")).values("month").annotate(count=Count("id")).order_by("month")
-    )
-
-    result = []
-    for entry in monthly_data:
-        month_str = entry["month"].strftime("%Y-%m") if entry["month"] else None
-        result.append(
-            {
-                "month": month_str,
-                "value": entry["count"],
-            }
-        )
-    return result
+    return [{"month": entry["period"].strftime("%Y-%m"), "value": entry["pr_count"]} for entry in monthly_data]
 
 
+@dashboard_cached
 def get_weekly_pr_count(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get PR count by week.
 
@@ -142,24 +136,13 @@ def get_weekly_pr_count(team: Team, start_date: date, end_date: date, repo: str
             - week (str): Week in YYYY-WNN format
             - value (int): Number of merged PRs for that week
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
+    # Weekly counts from the DailyPRFact rollup
+    weekly_data = get_fact_series(team, start_date, end_date, period="week", repo=repo)
 
-    # Group by week and count
-    weekly_data = prs.annotate(week=TruncWeek("merged_at")).values("week").annotate(count=Count("id")).order_by("week")
-
-    result = []
-    for entry in weekly_data:
-        week_str = entry["week"].strftime("%Y-W%W") if entry["week"] else None
-        result.append(
-            {
-                "week": week_str,
-                "value": entry["count"],
-            }
-        )
-    return result
+    return [{"week": entry["period"].strftime("%Y-W%W"), "value": entry["pr_count"]} for entry in weekly_data]
 
 
+@dashboard_cached
 def get_monthly_ai_adoption(team: Team, start_date: date, end_date: date, repo: str | None = None) -> list[dict]:
     """Get AI adoption percentage by month.
 
@@ -174,25 +157,14 @@ def get_monthly_ai_adoption(team: Team, start_date: date, end_date: date, repo:
             - month (str): Month in YYYY-MM format
             - value (float): Percentage of AI-assisted PRs (0.0 to 100.0)
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
-
-    # Group by month with AI count and total count
-    monthly_data = (
-        prs.annotate(month=TruncMonth("merged_at"))
-        .values("month")
-        .annotate(
-            total=Count("id"),
-            ai_count=Count("id", filter=Q(is_ai_assisted=True)),
-        )
-        .order_by("month")
-    )
+    # Monthly AI (pattern detection) and total counts from the DailyPRFact rollup
+    monthly_data = get_fact_series(team, start_date, end_date, period="month", repo=repo)
 
     result = []
     for entry in monthly_data:
-        month_str = entry["month"].strftime("%Y-%m") if entry["month"] else None
-        total = entry["total"]
-        ai_count = entry["ai_count"]
+        month_str = entry["period"].strftime("%Y-%m")
+        total = entry["pr_count"]
+        ai_count = entry["ai_assisted_count"]
         pct = round((ai_count / total) * 100, 2) if total > 0 else 0.0
         result.append(
             {
@@ -203,6 +175,7 @@ def get_monthly_ai_adoption(team: Team, start_date: date, end_date: date, repo:
     return result
 
 
+@dashboard_cached
 def get_trend_comparison(
     team: Team,
     metric: str,
@@ -259,6 +232,7 @@ def get_trend_comparison(
     }
 
 
+@dashboard_cached
 def get_sparkline_data(
     team: Team,
     start_date: date,
@@ -286,26 +260,23 @@ def get_sparkline_data(
             - change_pct (int): Percentage change from first to last week
             - trend (str): Direction ("up", "down", or "flat")
     """
-    prs = _get_merged_prs_in_range(team, start_date, end_date)
-    prs = _apply_repo_filter(prs, repo)
+    # Weekly counts and sums from the DailyPRFact rollup (one query for all metrics)
+    weekly_facts = get_fact_series(team, start_date, end_date, period="week", repo=repo)
 
     # Get weekly PR counts
-    pr_count_data = (
-        prs.annotate(week=TruncWeek("merged_at")).values("week").annotate(count=Count("id")).order_by("week")
-    )
-    prs_merged_values = [entry["count"] for entry in pr_count_data]
+    prs_merged_values = [entry["pr_count"] for entry in weekly_facts]
 
     # Get weekly cycle time averages
-    cycle_time_data = (
-        prs.annotate(week=TruncWeek("merged_at")).values("week").annotate(avg=Avg("cycle_time_hours")).order_by("week")
-    )
-    cycle_time_values = [float(entry["avg"]) if entry["avg"] else 0.0 for entry in cycle_time_data]
+    cycle_time_values = [_fact_average(entry, "cycle_time_hours") for entry in weekly_facts]
 
     # Get weekly AI adoption percentages
     # Default to detection data; use survey data when use_survey_data=True
     use_surveys = use_survey_data if use_survey_data is not None else False
 
     if use_surveys:
+        prs = _get_merged_prs_in_range(team, start_date, end_date)
+        prs = _apply_repo_filter(prs, repo)
+
         # Survey-based calculation (ISS-006 fix)
         # Uses PRSurvey.author_ai_assisted
         # Only counts PRs with survey responses (author_ai_assisted is not None)
@@ -334,32 +305,14 @@ def get_sparkline_data(
         ]
     else:
         # Detection-based calculation (default)
-        # Uses effective_is_ai_assisted (LLM > pattern detection)
-        # Group PRs by week and calculate AI adoption per week
-        weekly_stats = defaultdict(lambda: {"total": 0, "ai_count": 0})
-
-        for pr in prs.select_related("team"):
-            if pr.merged_at:
-                # Get Monday of the week
-                week_start = pr.merged_at.date() - timedelta(days=pr.merged_at.weekday())
-                weekly_stats[week_start]["total"] += 1
-                if pr.effective_is_ai_assisted:
-                    weekly_stats[week_start]["ai_count"] += 1
-
-        # Convert to sorted list of values
-        sorted_weeks = sorted(weekly_stats.keys())
+        # Uses effective_is_ai_assisted (LLM > pattern detection), rolled up per week
         ai_adoption_values = [
-            round((weekly_stats[week]["ai_count"] / weekly_stats[week]["total"]) * 100, 1)
-            if weekly_stats[week]["total"] > 0
-            else 0.0
-            for week in sorted_weeks
+            round((entry["effective_ai_count"] / entry["pr_count"]) * 100, 1) if entry["pr_count"] > 0 else 0.0
+            for entry in weekly_facts
         ]
 
     # Get weekly review time averages
-    review_time_data = (
-        prs.annotate(week=TruncWeek("merged_at")).values("week").annotate(avg=Avg("review_time_hours")).order_by("week")
-    )
-    review_time_values = [float(entry["avg"]) if entry["avg"] else 0.0 for entry in review_time_data]
+    review_time_values = [_fact_average(entry, "review_time_hours") for entry in weekly_facts]
 
     def _calculate_change_and_trend(
         values: list,
@@ -458,6 +411,7 @@ def get_sparkline_data(
     }
 
 
+@dashboard_cached
 def get_velocity_trend(team: Team, start_date: date, end_date: date) -> dict:
     """Get velocity trend showing story points completed per week.
 
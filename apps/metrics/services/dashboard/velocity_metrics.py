@@ -14,6 +14,7 @@ from apps.metrics.services.dashboard._helpers import (
 )
 from apps.metrics.services.dashboard.pr_metrics import PR_SIZE_L_MAX, get_open_prs_stats
 from apps.metrics.services.dashboard.review_metrics import detect_review_bottleneck
+from apps.metrics.services.dashboard_cache import dashboard_cached
 from apps.teams.models import Team
 
 # =============================================================================
@@ -39,6 +40,7 @@ AI_ADOPTION_YELLOW_THRESHOLD = 10  # >= 10% is moderate
 BOTTLENECK_THRESHOLD = 50  # > 50% triggers bottleneck warning
 
 
+@dashboard_cached
 def get_velocity_comparison(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Compare velocity metrics between current and previous period.
 
@@ -122,6 +124,7 @@ def get_velocity_comparison(team: Team, start_date: date, end_date: date, repo:
     }
 
 
+@dashboard_cached
 def get_quality_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get quality metrics for PRs in a period.
 
@@ -182,6 +185,7 @@ def get_quality_metrics(team: Team, start_date: date, end_date: date, repo: str
     }
 
 
+@dashboard_cached
 def get_team_health_metrics(team: Team, start_date: date, end_date: date, repo: str | None = None) -> dict:
     """Get team health metrics for a period.
 
@@ -262,6 +266,7 @@ def get_team_health_metrics(team: Team, start_date: date, end_date: date, repo:
     }
 
 
+@dashboard_cached
 def get_team_health_indicators(team: Team, start_date: date, end_date: date) -> dict:
     """Get team health indicators with status and trend for each metric.
 
@@ -0,0 +1,194 @@
+"""Versioned cache for dashboard service functions.
+
+Dashboard charts are opened far more often than the underlying data changes,
+so results are cached under a key that includes a per-team data version:
+
+    dashboard:{function}:{team_id}:v{version}:{args_hash}
+
+Writers that change dashboard data (repository sync completion, webhook
+processing, LLM batch writes, Copilot/Jira syncs, survey responses) call
+bump_team_data_version(). Bumping makes every existing entry for the team
+unreachable, so entries can live for hours without serving stale numbers;
+the old entries simply expire.
+
+Hit/miss counters are kept per cached function and can be read with
+get_dashboard_cache_stats() or the dashboard_cache_stats management command.
+"""
+
+import functools
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Entries are invalidated by version bumps; the TTL is only a safety net
+DASHBOARD_DATA_CACHE_TTL = 6 * 60 * 60
+
+DATA_VERSION_KEY_PREFIX = "dashboard_version"
+CACHE_KEY_PREFIX = "dashboard"
+STATS_KEY_PREFIX = "dashboard_cache_stats"
+
+_MISSING = object()
+
+# Names of functions wrapped with @dashboard_cached, used to enumerate stats
+_cached_endpoints: set[str] = set()
+
+
+def _version_key(team_id: int) -> str:
+    return f"{DATA_VERSION_KEY_PREFIX}:{team_id}"
+
+
+def get_team_data_version(team_id: int) -> int:
+    """Get the current dashboard data version for a team.
+
+    A missing version (never bumped, or evicted) is initialized from the
+    current time rather than 0, so entries written under an evicted version
+    can never be matched again.
+
+    Args:
+        team_id: ID of the team
+
+    Returns:
+        int: Current data version
+    """
+    key = _version_key(team_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key, 0)
+    return version
+
+
+def bump_team_data_version(team_id: int) -> int | None:
+    """Invalidate all cached dashboard results for a team.
+
+    Cache failures are logged and swallowed so a cache outage never breaks
+    the sync or webhook that triggered the bump.
+
+    Args:
+        team_id: ID of the team whose data changed
+
+    Returns:
+        int | None: The new version, or None if the cache was unavailable
+    """
+    key = _version_key(team_id)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Key missing - start a fresh version that cannot collide with old entries
+        version = time.time_ns()
+        cache.set(key, version, None)
+        return version
+    except Exception as e:
+        logger.warning(f"Failed to bump dashboard data version for team {team_id}: {e}")
+        return None
+
+
+def _record_access(endpoint: str, hit: bool) -> None:
+    """Increment the hit or miss counter for an endpoint."""
+    key = f"{STATS_KEY_PREFIX}:{endpoint}:{'hits' if hit else 'misses'}"
+    try:
+        cache.add(key, 0, None)
+        cache.incr(key)
+    except Exception:
+        # Counters are best-effort (DummyCache has no incr)
+        pass
+
+
+def record_cache_access(endpoint: str, hit: bool) -> None:
+    """Record a hit or miss for a manually cached endpoint.
+
+    Args:
+        endpoint: Name reported in the stats (usually the function name)
+        hit: True for a cache hit, False for a miss
+    """
+    _cached_endpoints.add(endpoint)
+    _record_access(endpoint, hit)
+
+
+def get_dashboard_cache_stats() -> dict[str, dict]:
+    """Get hit/miss counters for every cached dashboard function.
+
+    Returns:
+        dict mapping function name to dict with hits, misses and hit_rate
+        (percentage, or None when there were no accesses)
+    """
+    keys = {
+        f"{STATS_KEY_PREFIX}:{endpoint}:{kind}": (endpoint, kind)
+        for endpoint in _cached_endpoints
+        for kind in ("hits", "misses")
+    }
+    values = cache.get_many(list(keys))
+
+    stats = {endpoint: {"hits": 0, "misses": 0} for endpoint in sorted(_cached_endpoints)}
+    for key, (endpoint, kind) in keys.items():
+        stats[endpoint][kind] = values.get(key, 0)
+    for entry in stats.values():
+        total = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = round(entry["hits"] * 100 / total, 1) if total else None
+    return stats
+
+
+def reset_dashboard_cache_stats() -> None:
+    """Reset all hit/miss counters to zero."""
+    cache.delete_many([f"{STATS_KEY_PREFIX}:{e}:{kind}" for e in _cached_endpoints for kind in ("hits", "misses")])
+
+
+def _args_hash(args: tuple, kwargs: dict) -> str:
+    """Stable hash of the non-team arguments of a call."""
+    raw = repr((args, sorted(kwargs.items())))
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def dashboard_cached(func: Callable) -> Callable:
+    """Cache a dashboard service function under the team's data version.
+
+    The wrapped function must take the Team as its first argument (or as the
+    ``team`` keyword); every other argument must have a stable repr (dates,
+    strings, numbers, None). Only wrap functions whose result is fixed by
+    their arguments and the team's data: anything that reads the current time
+    (PR age, staleness flags) would be frozen until the next version bump.
+
+    Args:
+        func: Dashboard service function to wrap
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    endpoint = func.__name__
+    _cached_endpoints.add(endpoint)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if args:
+            team, rest = args[0], args[1:]
+            key_kwargs = kwargs
+        else:
+            team, rest = kwargs["team"], ()
+            key_kwargs = {k: v for k, v in kwargs.items() if k != "team"}
+
+        try:
+            version = get_team_data_version(team.id)
+            cache_key = f"{CACHE_KEY_PREFIX}:{endpoint}:{team.id}:v{version}:{_args_hash(rest, key_kwargs)}"
+            cached = cache.get(cache_key, _MISSING)
+        except Exception as e:
+            logger.warning(f"Dashboard cache unavailable for {endpoint}: {e}")
+            return func(*args, **kwargs)
+
+        if cached is not _MISSING:
+            _record_access(endpoint, hit=True)
+            return cached
+
+        _record_access(endpoint, hit=False)
+        result = func(*args, **kwargs)
+        try:
+            cache.set(cache_key, result, DASHBOARD_DATA_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to cache dashboard result for {endpoint}: {e}")
+        return result
+
+    return wrapper
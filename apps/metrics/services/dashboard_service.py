@@ -91,6 +91,4 @@ from apps.metrics.services.dashboard import (
     get_weekly_pr_type_trend,
     get_weekly_tech_trend,
 )
-
-# Cache TTL for dashboard metrics (5 minutes)
-DASHBOARD_CACHE_TTL = 300
+from apps.metrics.services.dashboard.key_metrics import DASHBOARD_CACHE_TTL
@@ -5,6 +5,7 @@ SINGLE SOURCE OF TRUTH: Jinja2 templates in apps/metrics/prompts/templates/insig
 Provides functions to:
 - get_insight_system_prompt(): Get system prompt from Jinja2 templates
 - gather_insight_data(): Collect metrics from various domains
+- gather_insight_data_for_windows(): Same for several windows from one PR scan
 - generate_insight_from_groq(): Call GROQ API with gathered data
 - Cache and fallback handling with model failover
 
@@ -19,7 +20,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from datetime import date
+from datetime import date, timedelta
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
@@ -29,15 +30,18 @@ from apps.integrations.services.copilot_metrics_prompt import get_copilot_metric
 from apps.metrics.prompts.schemas import validate_insight_response
 from apps.metrics.services.ai_patterns import BOT_USERNAME_PATTERNS
 from apps.metrics.services.dashboard_service import (
+    detect_review_bottleneck,
     get_ai_impact_stats,
     get_jira_sprint_metrics,
     get_linkage_trend,
+    get_open_prs_stats,
     get_pr_jira_correlation,
     get_quality_metrics,
     get_team_health_metrics,
     get_velocity_comparison,
     get_velocity_trend,
 )
+from apps.metrics.services.insight_windows import InsightWindowData
 from apps.metrics.types import (
     ContributorInfo,
     InsightAction,
@@ -356,6 +360,19 @@ def _get_top_contributors(team: Team, start_date: date, end_date: date, limit: i
         .order_by("-pr_count")[: limit * 3]  # Fetch extra to filter bots
     )
 
+    return _rank_contributors(author_stats, limit)
+
+
+def _rank_contributors(author_stats: list[dict], limit: int = 5) -> list[ContributorInfo]:
+    """Top human contributors from per-author PR counts (ordered by pr_count, descending).
+
+    Args:
+        author_stats: Dicts with author__github_username, author__display_name, pr_count
+        limit: Max contributors to return
+
+    Returns:
+        List of dicts with github_username, display_name, pr_count, pct_share
+    """
     # Filter out bots
     human_stats = [stat for stat in author_stats if not _is_bot_username(stat["author__github_username"])][:limit]
 
@@ -402,9 +419,6 @@ def gather_insight_data(
             - ai_impact: AI adoption rate and cycle time comparison
             - metadata: period info, team name
     """
-    # Calculate period duration
-    days = (end_date - start_date).days
-
     # Gather all domain data
     velocity = get_velocity_comparison(team, start_date, end_date, repo)
     quality = get_quality_metrics(team, start_date, end_date, repo)
@@ -414,6 +428,122 @@ def gather_insight_data(
     # Add top contributors with GitHub usernames for @mentions
     team_health["top_contributors"] = _get_top_contributors(team, start_date, end_date)
 
+    return _assemble_insight_data(
+        team,
+        start_date,
+        end_date,
+        velocity=velocity,
+        quality=quality,
+        team_health=team_health,
+        ai_impact_raw=ai_impact_raw,
+        jira_data=_gather_jira_data(team, start_date, end_date),
+        copilot_eligible=_has_copilot_seat_data(team),
+    )
+
+
+def gather_insight_data_for_windows(team: Team, end_date: date, days_list: list[int]) -> dict[int, InsightData]:
+    """Gather insight data for several windows ending on end_date in one pass.
+
+    Equivalent to calling gather_insight_data(team, end_date - timedelta(days=days),
+    end_date) for each entry of days_list, but the merged PRs of the longest
+    window and its comparison period are loaded once (InsightWindowData) and
+    every window is derived from them in memory. Window-independent data
+    (review bottleneck, open PRs, Jira linkage trend, Copilot eligibility) is
+    fetched once.
+
+    Args:
+        team: Team instance
+        end_date: Last day of every window (inclusive)
+        days_list: Window lengths in days, e.g. [7, 30, 90]
+
+    Returns:
+        {days: InsightData} for each entry of days_list
+    """
+    from apps.integrations.models import JiraIntegration
+
+    if not days_list:
+        return {}
+
+    windows = InsightWindowData(team, end_date, max(days_list))
+    bottleneck = detect_review_bottleneck(team, windows.window_start, end_date)
+    open_prs = get_open_prs_stats(team)
+    has_jira = JiraIntegration.objects.filter(team=team).exists()
+    linkage_trend = get_linkage_trend(team, weeks=4) if has_jira else None
+    copilot_eligible = _has_copilot_seat_data(team)
+
+    results = {}
+    for days in days_list:
+        start_date = end_date - timedelta(days=days)
+        team_health = {
+            **windows.team_health(start_date, end_date),
+            "bottleneck": bottleneck,
+            "open_prs": open_prs,
+            "top_contributors": _rank_contributors(windows.author_pr_counts(start_date, end_date)),
+        }
+        jira_data = None
+        if has_jira:
+            jira_data = {
+                "sprint_metrics": get_jira_sprint_metrics(team, start_date, end_date),
+                "pr_correlation": windows.pr_jira_correlation(start_date, end_date),
+                "linkage_trend": linkage_trend,
+                "velocity_trend": get_velocity_trend(team, start_date, end_date),
+            }
+        results[days] = _assemble_insight_data(
+            team,
+            start_date,
+            end_date,
+            velocity=windows.velocity_comparison(start_date, end_date),
+            quality=windows.quality_metrics(start_date, end_date),
+            team_health=team_health,
+            ai_impact_raw=windows.ai_impact_stats(start_date, end_date),
+            jira_data=jira_data,
+            copilot_eligible=copilot_eligible,
+        )
+    return results
+
+
+def _gather_jira_data(team: Team, start_date: date, end_date: date) -> dict | None:
+    """Jira metrics for the prompt, or None if the team has no Jira integration."""
+    from apps.integrations.models import JiraIntegration
+
+    if not JiraIntegration.objects.filter(team=team).exists():
+        return None
+    return {
+        "sprint_metrics": get_jira_sprint_metrics(team, start_date, end_date),
+        "pr_correlation": get_pr_jira_correlation(team, start_date, end_date),
+        "linkage_trend": get_linkage_trend(team, weeks=4),
+        "velocity_trend": get_velocity_trend(team, start_date, end_date),
+    }
+
+
+def _has_copilot_seat_data(team: Team) -> bool:
+    """Whether Copilot metrics can be included for the team.
+
+    Requirements:
+    1. team.copilot_enabled (copilot_status == "connected")
+    2. CopilotSeatSnapshot exists with 5+ seats (GitHub API requirement)
+    """
+    from apps.metrics.models import CopilotSeatSnapshot
+
+    if not team.copilot_enabled:
+        return False
+    latest_snapshot = CopilotSeatSnapshot.objects.filter(team=team).order_by("-date").first()
+    return bool(latest_snapshot and latest_snapshot.total_seats >= 5)
+
+
+def _assemble_insight_data(
+    team: Team,
+    start_date: date,
+    end_date: date,
+    *,
+    velocity: dict,
+    quality: dict,
+    team_health: dict,
+    ai_impact_raw: dict,
+    jira_data: dict | None,
+    copilot_eligible: bool,
+) -> InsightData:
+    """Combine the domain metrics of one window into the InsightData dict."""
     # Transform ai_impact to expected format
     ai_impact = {
         "ai_pr_count": ai_impact_raw.get("ai_prs", 0),
@@ -428,44 +558,25 @@ def gather_insight_data(
     metadata = {
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
-        "days": days,
+        "days": (end_date - start_date).days,
         "team_name": team.name,
     }
 
-    # Add Jira metrics if connected
-    from apps.integrations.models import JiraIntegration
-
-    jira_data = None
-    if JiraIntegration.objects.filter(team=team).exists():
-        jira_data = {
-            "sprint_metrics": get_jira_sprint_metrics(team, start_date, end_date),
-            "pr_correlation": get_pr_jira_correlation(team, start_date, end_date),
-            "linkage_trend": get_linkage_trend(team, weeks=4),
-            "velocity_trend": get_velocity_trend(team, start_date, end_date),
-        }
-
     # Add Copilot metrics for teams with real Copilot integration
-    # Requirements:
-    # 1. team.copilot_enabled (copilot_status == "connected")
-    # 2. CopilotSeatSnapshot exists with 5+ seats (GitHub API requirement)
-    from apps.metrics.models import CopilotSeatSnapshot
-
     copilot_metrics = None
-    if team.copilot_enabled:
-        latest_snapshot = CopilotSeatSnapshot.objects.filter(team=team).order_by("-date").first()
-        if latest_snapshot and latest_snapshot.total_seats >= 5:
-            copilot_metrics = get_copilot_metrics_for_prompt(
-                team=team,
-                start_date=start_date,
-                end_date=end_date,
-                include_copilot=True,
-            )
-            # Add relative waste metric (scaled by team size)
-            if copilot_metrics and copilot_metrics.get("seat_data"):
-                active_contributors = team_health.get("active_contributors", 1)
-                wasted_spend = float(copilot_metrics["seat_data"].get("wasted_spend", 0))
-                copilot_metrics["waste_per_contributor"] = round(wasted_spend / max(active_contributors, 1), 2)
-                copilot_metrics["active_contributors"] = active_contributors
+    if copilot_eligible:
+        copilot_metrics = get_copilot_metrics_for_prompt(
+            team=team,
+            start_date=start_date,
+            end_date=end_date,
+            include_copilot=True,
+        )
+        # Add relative waste metric (scaled by team size)
+        if copilot_metrics and copilot_metrics.get("seat_data"):
+            active_contributors = team_health.get("active_contributors", 1)
+            wasted_spend = float(copilot_metrics["seat_data"].get("wasted_spend", 0))
+            copilot_metrics["waste_per_contributor"] = round(wasted_spend / max(active_contributors, 1), 2)
+            copilot_metrics["active_contributors"] = active_contributors
 
     # Type ignore: dashboard_service functions return untyped dicts
     # TODO: Add types to dashboard_service.py for full type safety
@@ -0,0 +1,291 @@
+"""Insight metrics for several windows from one projection of merged PRs.
+
+generate_team_llm_insights produces 7, 30 and 90-day insights in one run.
+Gathering each window separately re-ran the velocity, quality, team health,
+AI impact, top contributor and PR-Jira queries over overlapping ranges.
+
+InsightWindowData loads the merged PRs of the longest window plus its
+comparison period once, as a compact per-PR projection, together with the
+review counts per PR. Every shorter window and its comparison period is then
+derived in memory with the same semantics as the dashboard_service functions:
+
+    get_velocity_comparison  -> velocity_comparison()
+    get_quality_metrics      -> quality_metrics()
+    get_team_health_metrics  -> team_health() (PR and review distribution)
+    get_ai_impact_stats      -> ai_impact_stats() (detection-based)
+    get_pr_jira_correlation  -> pr_jira_correlation()
+
+Usage:
+    windows = InsightWindowData(team, end_date=today, max_days=90)
+    velocity = windows.velocity_comparison(today - timedelta(days=30), today)
+"""
+
+from collections import Counter
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal, localcontext
+from functools import cached_property
+
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.metrics.models import PRReview
+from apps.metrics.services.dashboard_service import PR_SIZE_L_MAX, _get_merged_prs_in_range
+from apps.teams.models import Team
+
+_PR_FIELDS = (
+    "id",
+    "merged_at",
+    "author_id",
+    "author__github_username",
+    "author__display_name",
+    "cycle_time_hours",
+    "review_time_hours",
+    "review_rounds",
+    "additions",
+    "deletions",
+    "is_revert",
+    "is_hotfix",
+    "resolved_is_ai_assisted",
+    "jira_key",
+)
+
+# PostgreSQL numeric internals used to reproduce the scale of AVG results
+_NUMERIC_BASE_DIGITS = 4
+_NUMERIC_MIN_SIG_DIGITS = 16
+_NUMERIC_MAX_DISPLAY_SCALE = 1000
+
+
+def _avg(values: list) -> Decimal | None:
+    """Mean of the non-None values (None if there are none), like PostgreSQL AVG.
+
+    Returns a Decimal rounded to the scale PostgreSQL picks for numeric
+    division, so results (and the prompt text built from them) are identical
+    to an Avg() aggregate.
+    """
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    total = sum((Decimal(value) for value in values), Decimal(0))
+    count = Decimal(len(values))
+    scale = _numeric_div_scale(total, count)
+    with localcontext() as context:
+        context.prec = 1000
+        return (total / count).quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+
+
+def _numeric_div_scale(dividend: Decimal, divisor: Decimal) -> int:
+    """Result scale of numeric division (select_div_scale in PostgreSQL's numeric.c).
+
+    Aims for at least 16 significant digits, comparing the leading base-10000
+    digits of the operands, and never less than either operand's scale.
+    """
+
+    def leading_digit(value: Decimal) -> tuple[int, int]:
+        if not value:
+            return 0, 0
+        weight = value.adjusted() // _NUMERIC_BASE_DIGITS
+        return weight, int(abs(value).scaleb(-_NUMERIC_BASE_DIGITS * weight))
+
+    dividend_weight, dividend_digit = leading_digit(dividend)
+    divisor_weight, divisor_digit = leading_digit(divisor)
+    quotient_weight = dividend_weight - divisor_weight
+    if dividend_digit <= divisor_digit:
+        quotient_weight -= 1
+    scale = _NUMERIC_MIN_SIG_DIGITS - quotient_weight * _NUMERIC_BASE_DIGITS
+    scale = max(scale, -dividend.as_tuple().exponent, -divisor.as_tuple().exponent, 0)
+    return min(scale, _NUMERIC_MAX_DISPLAY_SCALE)
+
+
+def _pct_change(current, previous) -> float | None:
+    if previous is None or previous == 0 or current is None:
+        return None
+    return float((current - previous) / previous * 100)
+
+
+def _previous_period(start_date: date, end_date: date) -> tuple[date, date]:
+    """Period of the same length immediately preceding start_date."""
+    period_length = (end_date - start_date).days + 1
+    previous_end = start_date - timedelta(days=1)
+    return previous_end - timedelta(days=period_length - 1), previous_end
+
+
+class InsightWindowData:
+    """Merged PRs of a team up to end_date, projected once for any window of at most max_days."""
+
+    def __init__(self, team: Team, end_date: date, max_days: int):
+        self.team = team
+        self.end_date = end_date
+        # Longest window is [end - max_days, end]; its comparison period has the same length before it
+        self.window_start = end_date - timedelta(days=max_days)
+        self.scan_start = _previous_period(self.window_start, end_date)[0]
+
+    @cached_property
+    def rows(self) -> list:
+        """Merged (non-bot) PRs from scan_start to end_date, with their local merge day."""
+        prs = _get_merged_prs_in_range(self.team, self.scan_start, self.end_date)
+        return [(timezone.localdate(row.merged_at), row) for row in prs.values_list(*_PR_FIELDS, named=True).order_by()]
+
+    @cached_property
+    def review_counts(self) -> dict[int, Counter]:
+        """Review counts per reviewer for each PR merged in the longest window."""
+        prs = _get_merged_prs_in_range(self.team, self.window_start, self.end_date)
+        counts: dict[int, Counter] = {}
+        reviews = (
+            PRReview.objects.filter(team=self.team, pull_request__in=prs)  # noqa: TEAM001 - team in filters
+            .values("pull_request_id", "reviewer_id")
+            .annotate(review_count=Count("id"))
+            .order_by()
+        )
+        for row in reviews:
+            counts.setdefault(row["pull_request_id"], Counter())[row["reviewer_id"]] += row["review_count"]
+        return counts
+
+    def prs(self, start_date: date, end_date: date) -> list:
+        """Projected PRs merged between start_date and end_date (inclusive)."""
+        if start_date < self.scan_start or end_date > self.end_date:
+            raise ValueError(f"{start_date}..{end_date} is outside {self.scan_start}..{self.end_date}")
+        return [row for day, row in self.rows if start_date <= day <= end_date]
+
+    def velocity_comparison(self, start_date: date, end_date: date) -> dict:
+        """Same result as get_velocity_comparison() without a repo filter."""
+        current = self.prs(start_date, end_date)
+        previous = self.prs(*_previous_period(start_date, end_date))
+
+        def metric(field: str) -> dict:
+            current_value = _avg([getattr(pr, field) for pr in current])
+            previous_value = _avg([getattr(pr, field) for pr in previous])
+            return {
+                "current": current_value,
+                "previous": previous_value,
+                "pct_change": _pct_change(current_value, previous_value),
+            }
+
+        return {
+            "throughput": {
+                "current": len(current),
+                "previous": len(previous),
+                "pct_change": _pct_change(len(current), len(previous)),
+            },
+            "cycle_time": metric("cycle_time_hours"),
+            "review_time": metric("review_time_hours"),
+        }
+
+    def quality_metrics(self, start_date: date, end_date: date) -> dict:
+        """Same result as get_quality_metrics() without a repo filter."""
+        prs = self.prs(start_date, end_date)
+        total_prs = len(prs)
+        revert_count = sum(1 for pr in prs if pr.is_revert)
+        hotfix_count = sum(1 for pr in prs if pr.is_hotfix)
+        large_pr_count = sum(1 for pr in prs if pr.additions + pr.deletions > PR_SIZE_L_MAX)
+        avg_review_rounds = _avg([pr.review_rounds for pr in prs])
+
+        return {
+            "revert_count": revert_count,
+            "revert_rate": revert_count * 100.0 / total_prs if total_prs else 0.0,
+            "hotfix_count": hotfix_count,
+            "hotfix_rate": hotfix_count * 100.0 / total_prs if total_prs else 0.0,
+            "avg_review_rounds": float(avg_review_rounds) if avg_review_rounds is not None else None,
+            "large_pr_pct": large_pr_count * 100.0 / total_prs if total_prs else 0.0,
+        }
+
+    def team_health(self, start_date: date, end_date: date) -> dict:
+        """PR and review distribution part of get_team_health_metrics().
+
+        The bottleneck and open PR stats don't depend on the window; callers
+        add them once per team. Review counts are only loaded for the longest
+        window, so start_date must not precede it.
+        """
+        if start_date < self.window_start:
+            raise ValueError(f"Review counts start at {self.window_start}, not {start_date}")
+        prs = self.prs(start_date, end_date)
+        author_counts = Counter(pr.author_id for pr in prs)
+        top_contributor_pct = max(author_counts.values()) * 100.0 / len(prs) if prs else 0.0
+
+        reviewer_counts: Counter = Counter()
+        for pr in prs:
+            reviewer_counts.update(self.review_counts.get(pr.id, {}))
+
+        return {
+            "active_contributors": len(author_counts),
+            "pr_distribution": {
+                "top_contributor_pct": top_contributor_pct,
+                "is_concentrated": top_contributor_pct > 50.0,
+            },
+            "review_distribution": {
+                "avg_reviews_per_reviewer": (
+                    sum(reviewer_counts.values()) / len(reviewer_counts) if reviewer_counts else None
+                ),
+                "max_reviews": max(reviewer_counts.values()) if reviewer_counts else 0,
+            },
+        }
+
+    def author_pr_counts(self, start_date: date, end_date: date) -> list[dict]:
+        """Merged PRs per author, most first (ties by username)."""
+        counts: Counter = Counter()
+        names = {}
+        for pr in self.prs(start_date, end_date):
+            counts[pr.author_id] += 1
+            names[pr.author_id] = (pr.author__github_username, pr.author__display_name)
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], names[item[0]][0] or ""))
+        return [
+            {"author__github_username": names[author_id][0], "author__display_name": names[author_id][1], "pr_count": n}
+            for author_id, n in ranked
+        ]
+
+    def ai_impact_stats(self, start_date: date, end_date: date) -> dict:
+        """Same result as get_ai_impact_stats() with detection data and no repo filter."""
+        prs = self.prs(start_date, end_date)
+        if not prs:
+            return {
+                "ai_adoption_pct": Decimal("0.00"),
+                "avg_cycle_with_ai": None,
+                "avg_cycle_without_ai": None,
+                "cycle_time_difference_pct": None,
+                "total_prs": 0,
+                "ai_prs": 0,
+            }
+
+        ai_prs = [pr for pr in prs if pr.resolved_is_ai_assisted is True]
+        non_ai_prs = [pr for pr in prs if pr.resolved_is_ai_assisted is not True]
+        avg_cycle_ai = _avg([pr.cycle_time_hours for pr in ai_prs])
+        avg_cycle_non_ai = _avg([pr.cycle_time_hours for pr in non_ai_prs])
+
+        avg_cycle_with_ai = Decimal(str(round(avg_cycle_ai, 2))) if avg_cycle_ai is not None else None
+        avg_cycle_without_ai = Decimal(str(round(avg_cycle_non_ai, 2))) if avg_cycle_non_ai is not None else None
+        cycle_time_difference_pct = None
+        if avg_cycle_with_ai is not None and avg_cycle_without_ai is not None and avg_cycle_without_ai > 0:
+            diff = ((avg_cycle_with_ai - avg_cycle_without_ai) / avg_cycle_without_ai) * 100
+            cycle_time_difference_pct = Decimal(str(round(float(diff), 2)))
+
+        return {
+            "ai_adoption_pct": Decimal(str(round(len(ai_prs) * 100.0 / len(prs), 2))),
+            "avg_cycle_with_ai": avg_cycle_with_ai,
+            "avg_cycle_without_ai": avg_cycle_without_ai,
+            "cycle_time_difference_pct": cycle_time_difference_pct,
+            "total_prs": len(prs),
+            "ai_prs": len(ai_prs),
+        }
+
+    def pr_jira_correlation(self, start_date: date, end_date: date) -> dict:
+        """Same result as get_pr_jira_correlation()."""
+        prs = self.prs(start_date, end_date)
+        if not prs:
+            return {
+                "total_prs": 0,
+                "linked_count": 0,
+                "unlinked_count": 0,
+                "linkage_rate": 0,
+                "linked_avg_cycle_time": None,
+                "unlinked_avg_cycle_time": None,
+            }
+
+        linked = [pr for pr in prs if pr.jira_key != ""]
+        unlinked = [pr for pr in prs if pr.jira_key == ""]
+        return {
+            "total_prs": len(prs),
+            "linked_count": len(linked),
+            "unlinked_count": len(unlinked),
+            "linkage_rate": round(len(linked) / len(prs) * 100, 1),
+            "linked_avg_cycle_time": _avg([pr.cycle_time_hours for pr in linked]),
+            "unlinked_avg_cycle_time": _avg([pr.cycle_time_hours for pr in unlinked]),
+        }
@@ -0,0 +1,261 @@
+"""Keyset (cursor) pagination for the PR data explorer.
+
+Django's Paginator runs an exact COUNT(*) and an OFFSET scan for every page,
+and both get slower the deeper you page. KeysetPaginator instead orders by the
+active sort column plus id and fetches the next page with a WHERE clause on
+the last row seen, so page 400 costs the same index range scan as page 1.
+
+The cursor is an opaque, URL-safe token carrying the sort column, direction,
+the boundary row's (value, id) and whether it points forward or backward.
+Tokens that don't match the current sort are ignored (the page falls back to
+offset pagination), so stale links after a sort change still render.
+
+Totals come from a count the caller already has (e.g. the stats aggregate),
+otherwise from the planner's row estimate when that is above
+ESTIMATED_COUNT_THRESHOLD, and only otherwise from an exact COUNT(*).
+
+Usage:
+    paginator = KeysetPaginator(prs, "merged_at", descending=True, per_page=50)
+    page_obj = paginator.get_page(request.GET.get("page", 1), cursor=request.GET.get("cursor"))
+    page_obj.next_cursor  # pass back as ?cursor=... for the next page
+"""
+
+import base64
+import binascii
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from functools import cached_property
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+
+# Above this many (estimated) rows, show the planner estimate instead of counting
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """Planner row estimate for a queryset (PostgreSQL only), or None.
+
+    Runs EXPLAIN without executing the query, so it costs the same however
+    many rows match.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@dataclass(frozen=True)
+class _Position:
+    """Decoded cursor: the boundary row and which way to read from it."""
+
+    value: Any
+    pk: int
+    backward: bool
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class KeysetPage:
+    """One page of rows; template-compatible with django.core.paginator.Page."""
+
+    def __init__(
+        self,
+        object_list: list,
+        number: int,
+        paginator: "KeysetPaginator",
+        has_previous: bool,
+        has_next: bool,
+    ):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_other_pages(self) -> bool:
+        return self._has_previous or self._has_next
+
+    def previous_page_number(self) -> int:
+        return max(self.number - 1, 1)
+
+    def next_page_number(self) -> int:
+        return self.number + 1
+
+    @property
+    def previous_cursor(self) -> str | None:
+        """Cursor for the page before this one, or None on the first page."""
+        if not self._has_previous or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], backward=True)
+
+    @property
+    def next_cursor(self) -> str | None:
+        """Cursor for the page after this one, or None on the last page."""
+        if not self._has_next or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1], backward=False)
+
+
+class KeysetPaginator:
+    """Paginate a queryset by (sort column, id) with NULL sort values last.
+
+    Args:
+        queryset: Rows to paginate; any existing ordering is replaced
+        sort_field: Model field to order by
+        descending: Sort direction for sort_field (id follows the same direction)
+        per_page: Rows per page
+        count: Known total row count; skips counting when given
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        sort_field: str,
+        descending: bool = True,
+        per_page: int = 50,
+        count: int | None = None,
+    ):
+        self.queryset = queryset
+        self.sort_field = sort_field
+        self.descending = descending
+        self.per_page = per_page
+        self._known_count = count
+
+    @cached_property
+    def _count(self) -> tuple[int, bool]:
+        if self._known_count is not None:
+            return self._known_count, False
+        estimate = estimate_count(self.queryset)
+        if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+            return estimate, True
+        return self.queryset.count(), False
+
+    @property
+    def count(self) -> int:
+        """Total rows (exact, or the planner estimate for very large results)."""
+        return self._count[0]
+
+    @property
+    def count_is_estimate(self) -> bool:
+        return self._count[1]
+
+    @property
+    def num_pages(self) -> int:
+        return max(math.ceil(self.count / self.per_page), 1)
+
+    def _ordering(self, reverse: bool) -> tuple:
+        """ORDER BY for reading forward, or backward (reversed, NULLs first)."""
+        descending = self.descending != reverse
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        column = F(self.sort_field)
+        return (column.desc(**nulls) if descending else column.asc(**nulls)), ("-id" if descending else "id")
+
+    def _after(self, position: _Position) -> Q:
+        """Rows strictly after the boundary row in the reading order."""
+        descending = self.descending != position.backward
+        op = "lt" if descending else "gt"
+        field = self.sort_field
+        if position.value is None:
+            # NULLs sort last going forward and first going backward
+            after = Q(**{f"{field}__isnull": True, f"id__{op}": position.pk})
+            return after | Q(**{f"{field}__isnull": False}) if position.backward else after
+        after = Q(**{f"{field}__{op}": position.value}) | Q(**{field: position.value, f"id__{op}": position.pk})
+        return after if position.backward else after | Q(**{f"{field}__isnull": True})
+
+    def encode_cursor(self, row, backward: bool) -> str:
+        """Opaque token pointing just past (or before) the given row."""
+        payload = {
+            "f": self.sort_field,
+            "d": self.descending,
+            "v": _json_value(getattr(row, self.sort_field)),
+            "id": row.pk,
+            "b": backward,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, token: str | None) -> _Position | None:
+        """Decode a cursor token; None if missing, malformed or for another sort."""
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            if payload["f"] != self.sort_field or payload["d"] != self.descending:
+                return None
+            value = payload["v"]
+            if value is not None:
+                value = self.queryset.model._meta.get_field(self.sort_field).to_python(value)
+            return _Position(value=value, pk=int(payload["id"]), backward=bool(payload["b"]))
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            return None
+
+    def get_page(self, number: int | str = 1, cursor: str | None = None) -> KeysetPage:
+        """Page from a cursor, or by offset when there is no usable cursor.
+
+        number is only used for display when a cursor is given; links built
+        from a page's cursors keep every later page on the keyset path.
+        """
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+
+        position = self.decode_cursor(cursor)
+        if position is None:
+            return self._offset_page(number)
+
+        rows = list(
+            self.queryset.filter(self._after(position)).order_by(*self._ordering(position.backward))[
+                : self.per_page + 1
+            ]
+        )
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if position.backward:
+            rows.reverse()
+            return KeysetPage(rows, number if has_more else 1, self, has_previous=has_more, has_next=True)
+        return KeysetPage(rows, number, self, has_previous=True, has_next=has_more)
+
+    def _offset_page(self, number: int) -> KeysetPage:
+        """OFFSET-based page, for first loads and hand-written ?page= links."""
+        ordered = self.queryset.order_by(*self._ordering(reverse=False))
+        offset = (number - 1) * self.per_page
+        rows = list(ordered[offset : offset + self.per_page + 1])
+        if not rows and number > 1:
+            # Out of range: show the last page, like Paginator.get_page()
+            return self._offset_page(min(number - 1, self.num_pages))
+        has_next = len(rows) > self.per_page
+        return KeysetPage(rows[: self.per_page], number, self, has_previous=number > 1, has_next=has_next)
@@ -0,0 +1,397 @@
+"""Concurrent, rate-limit-aware executor for real-time LLM calls.
+
+Replaces fixed sleeps between sequential API calls. A token bucket limits
+requests/min and tokens/min, is corrected by the provider's rate-limit
+headers (Groq/OpenAI style ``x-ratelimit-*`` and ``retry-after``), and a
+thread pool keeps as many calls in flight as the quota allows.
+
+Usage:
+    executor = LLMExecutor.from_settings()
+    outcomes = executor.run(
+        prs,
+        call=lambda pr: client.chat.completions.with_raw_response.create(...),
+        parse=lambda response: json.loads(response.choices[0].message.content),
+        on_flush=save_results,
+    )
+
+Calls should return the SDK's raw response (``with_raw_response``): its
+rate-limit headers update the limiter on every success, not only on errors,
+and the executor parses it before ``parse`` runs.
+
+Workers only make API calls. on_flush and on_progress run in the calling
+thread, so they can use the Django ORM safely. Results are flushed every
+``flush_every`` completions; because callers select work by what is not yet
+persisted, an interrupted run resumes where the last flush left off.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_CONFIG = getattr(settings, "LLM_EXECUTOR_CONFIG", {})
+
+# Progress entries expire after a day (long enough to inspect a stuck run)
+PROGRESS_CACHE_TIMEOUT = 60 * 60 * 24
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parse a rate-limit reset duration such as "1m30.5s", "7.66s" or "250ms".
+
+    Returns:
+        Seconds as float, or None if the value is missing or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    multipliers = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(amount) * multipliers[unit] for amount, unit in parts)
+
+
+def _to_int(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucketLimiter:
+    """Thread-safe token bucket for requests/min and tokens/min.
+
+    Both buckets start full (one minute of quota) and refill continuously.
+    A tokens_per_minute of 0 disables the token bucket.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        wait_seconds = max(0.0, self._blocked_until - now)
+        if self._requests < 1:
+            wait_seconds = max(wait_seconds, (1 - self._requests) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute and self._tokens < tokens:
+            wait_seconds = max(wait_seconds, (tokens - self._tokens) * 60 / self.tokens_per_minute)
+        return wait_seconds
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Reserve one request (and ``tokens`` tokens), sleeping until they are available.
+
+        The reservation is taken immediately and may leave the buckets in debt,
+        so concurrent callers queue up behind each other with a single sleep
+        each instead of polling.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.tokens_per_minute:
+            # A request larger than the whole bucket only waits for a full bucket
+            tokens = min(tokens, self.tokens_per_minute)
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait_seconds = self._wait_time(tokens, now)
+            self._requests -= 1
+            if self.tokens_per_minute:
+                self._tokens -= tokens
+        if wait_seconds > 0:
+            (self._sleep or time.sleep)(wait_seconds)
+        return wait_seconds
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once a response reports its real usage."""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._tokens = min(self.tokens_per_minute, self._tokens + estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all callers for ``seconds`` (e.g. after a 429 without headers)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Align the buckets with the provider's rate-limit headers.
+
+        Remaining counts can only lower the local levels. A retry-after, or an
+        exhausted remaining count with its reset time, pauses all callers.
+        """
+        headers = {str(key).lower(): value for key, value in headers.items()}
+        remaining_requests = _to_int(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = _to_int(headers.get("x-ratelimit-remaining-tokens"))
+
+        pause_seconds = parse_reset_duration(headers.get("retry-after")) or 0.0
+        if remaining_requests == 0:
+            pause_seconds = max(pause_seconds, parse_reset_duration(headers.get("x-ratelimit-reset-requests")) or 0.0)
+        if remaining_tokens == 0:
+            pause_seconds = max(pause_seconds, parse_reset_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if remaining_requests is not None:
+                self._requests = min(self._requests, remaining_requests)
+            if self.tokens_per_minute and remaining_tokens is not None:
+                self._tokens = min(self._tokens, remaining_tokens)
+            if pause_seconds:
+                self._blocked_until = max(self._blocked_until, now + pause_seconds)
+
+
+@dataclass
+class LLMOutcome:
+    """Result of one executor item: the parsed value or the error that stopped it."""
+
+    item: Any
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ExecutorProgress:
+    """Counters for a run, also published to the cache under a progress key."""
+
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rate_limited": self.rate_limited,
+            "elapsed_seconds": round(time.time() - self.started_at, 1),
+        }
+
+
+def get_progress(progress_key: str) -> dict | None:
+    """Return the last published progress for a run, if any."""
+    return cache.get(progress_key)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    return getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def _error_headers(error: Exception) -> Mapping[str, str] | None:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    return headers if isinstance(headers, Mapping) or hasattr(headers, "items") else None
+
+
+def _unwrap_raw_response(response: Any) -> tuple[Any, Mapping[str, str] | None]:
+    """Split a ``with_raw_response`` result into the parsed response and its headers.
+
+    Other values (already parsed responses, plain results) are returned unchanged.
+    """
+    if not callable(getattr(response, "parse", None)):
+        return response, None
+    headers = getattr(response, "headers", None)
+    return response.parse(), headers if isinstance(headers, Mapping) or hasattr(headers, "items") else None
+
+
+def _total_tokens(response: Any) -> int | None:
+    usage = getattr(response, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    return total if isinstance(total, int) else None
+
+
+def estimate_prompt_tokens(*texts: str, max_tokens: int = 0) -> int:
+    """Rough token count for rate limiting: ~4 characters per token plus the output budget."""
+    return sum(len(text or "") for text in texts) // 4 + max_tokens
+
+
+class LLMExecutor:
+    """Runs LLM calls on a thread pool under a shared TokenBucketLimiter."""
+
+    def __init__(
+        self,
+        limiter: TokenBucketLimiter,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        flush_every: int = 25,
+    ):
+        self.limiter = limiter
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.flush_every = max(1, flush_every)
+
+    @classmethod
+    def from_settings(cls, requests_per_minute: int | None = None, **overrides) -> LLMExecutor:
+        """Build an executor from LLM_EXECUTOR_CONFIG.
+
+        Args:
+            requests_per_minute: Override the configured requests/min
+            **overrides: tokens_per_minute, max_workers, max_retries or flush_every
+        """
+        limiter = TokenBucketLimiter(
+            requests_per_minute=requests_per_minute or EXECUTOR_CONFIG.get("REQUESTS_PER_MINUTE", 30),
+            tokens_per_minute=overrides.pop("tokens_per_minute", EXECUTOR_CONFIG.get("TOKENS_PER_MINUTE", 0)),
+        )
+        return cls(
+            limiter,
+            max_workers=overrides.pop("max_workers", EXECUTOR_CONFIG.get("MAX_WORKERS", 4)),
+            max_retries=overrides.pop("max_retries", EXECUTOR_CONFIG.get("MAX_RETRIES", 3)),
+            flush_every=overrides.pop("flush_every", EXECUTOR_CONFIG.get("FLUSH_EVERY", 25)),
+        )
+
+    def _call_with_retry(
+        self,
+        item: Any,
+        call: Callable[[Any], Any],
+        parse: Callable[[Any], Any] | None,
+        estimated_tokens: int,
+        progress: ExecutorProgress,
+    ) -> Any:
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(estimated_tokens)
+            try:
+                response = call(item)
+            except Exception as e:
+                headers = _error_headers(e)
+                if headers is not None:
+                    self.limiter.update_from_headers(headers)
+                if not _is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                progress.rate_limited += 1
+                if headers is None or not any(str(key).lower() == "retry-after" for key in headers):
+                    self.limiter.pause(2**attempt)
+                logger.info(f"LLM rate limited, retrying (attempt {attempt + 1}/{self.max_retries})")
+                continue
+
+            response, headers = _unwrap_raw_response(response)
+            if headers is not None:
+                self.limiter.update_from_headers(headers)
+            actual_tokens = _total_tokens(response)
+            if actual_tokens is not None:
+                self.limiter.record_usage(estimated_tokens, actual_tokens)
+            return parse(response) if parse else response
+
+    def run(
+        self,
+        items: Iterable[Any],
+        call: Callable[[Any], Any],
+        *,
+        parse: Callable[[Any], Any] | None = None,
+        estimate_tokens: Callable[[Any], int] | None = None,
+        on_flush: Callable[[list[LLMOutcome]], None] | None = None,
+        on_progress: Callable[[ExecutorProgress], None] | None = None,
+        progress_key: str | None = None,
+    ) -> list[LLMOutcome]:
+        """Run ``call`` for every item concurrently within the rate limits.
+
+        Args:
+            items: Work items (e.g. PullRequest objects)
+            call: Makes the API call for one item, in a worker thread
+            parse: Converts the raw response to the stored value, in the worker
+                (errors here fail the item without retrying)
+            estimate_tokens: Token estimate per item for the tokens/min bucket
+            on_flush: Receives completed outcomes in batches, in the calling thread
+            on_progress: Receives progress after every flush, in the calling thread
+            progress_key: Cache key to publish progress under (see get_progress)
+
+        Returns:
+            All outcomes, in completion order
+        """
+        items = list(items)
+        progress = ExecutorProgress(total=len(items))
+        outcomes: list[LLMOutcome] = []
+        pending: list[LLMOutcome] = []
+
+        def flush() -> None:
+            batch = list(pending)
+            pending.clear()
+            if batch and on_flush:
+                on_flush(batch)
+            if on_progress:
+                on_progress(progress)
+            if progress_key:
+                cache.set(progress_key, progress.to_dict(), PROGRESS_CACHE_TIMEOUT)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="llm-executor")
+        try:
+            futures = {
+                pool.submit(
+                    self._call_with_retry,
+                    item,
+                    call,
+                    parse,
+                    estimate_tokens(item) if estimate_tokens else 0,
+                    progress,
+                ): item
+                for item in items
+            }
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = futures[future]
+                    try:
+                        outcome = LLMOutcome(item=item, value=future.result())
+                        progress.succeeded += 1
+                    except Exception as e:
+                        outcome = LLMOutcome(item=item, error=e)
+                        progress.failed += 1
+                    outcomes.append(outcome)
+                    pending.append(outcome)
+                if len(pending) >= self.flush_every:
+                    flush()
+        finally:
+            # Keep whatever finished, even if the run is interrupted (e.g. soft time limit)
+            pool.shutdown(wait=False, cancel_futures=True)
+            flush()
+
+        return outcomes
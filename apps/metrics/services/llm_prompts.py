@@ -14,6 +14,7 @@ To modify the prompt:
 This module also provides:
 - get_user_prompt(): Build user prompt with PR context
 - build_llm_pr_context(): Build complete context dict from PR model
+- get_llm_input_hash(): Fingerprint stored as PullRequest.llm_input_hash
 - PR_ANALYSIS_SYSTEM_PROMPT: DEPRECATED lazy loader for backward compatibility
 """
 
@@ -27,6 +28,7 @@ from typing import TYPE_CHECKING
 # Re-export PROMPT_VERSION for backward compatibility
 # The source of truth is apps/metrics/prompts/constants.py
 from apps.metrics.prompts.constants import PROMPT_VERSION  # noqa: F401
+from apps.metrics.services.llm_response_cache import llm_request_fingerprint
 from apps.metrics.types import PRContext
 
 if TYPE_CHECKING:
@@ -734,6 +736,27 @@ def build_llm_pr_context(pr: PullRequest) -> str:
     return "Analyze this pull request:\n\n" + "\n\n".join(sections)
 
 
+# Model named in llm_input_hash. Every analysis path hashes with this model,
+# whatever model it actually calls, so a summary written by one path gates the others.
+LLM_ANALYSIS_MODEL = "llama-3.3-70b-versatile"
+
+
+def get_llm_input_hash(pr_context: str, system_prompt: str | None = None) -> str:
+    """Fingerprint of the LLM input for a PR, stored as PullRequest.llm_input_hash.
+
+    The real-time task and GroqBatchProcessor both hash the same inputs, so a PR
+    analyzed by either one is skipped by both until its context or prompt changes.
+
+    Args:
+        pr_context: Output of build_llm_pr_context() for the PR
+        system_prompt: System prompt sent with the request (default: get_system_prompt())
+
+    Returns:
+        64-character hex digest
+    """
+    return llm_request_fingerprint(LLM_ANALYSIS_MODEL, system_prompt or get_system_prompt(), pr_context)
+
+
 def _get_repo_languages(pr: PullRequest) -> str:
     """Get repository languages from TrackedRepository.
 
@@ -0,0 +1,113 @@
+"""Content-addressed fingerprints and response cache for LLM calls.
+
+llm_request_fingerprint() hashes everything an LLM call depends on: model,
+system prompt, rendered user prompt and sampling parameters. It serves two
+purposes:
+
+- PullRequest.llm_input_hash stores the fingerprint behind llm_summary, so
+  re-analysis can be skipped when a PR's rendered prompt is unchanged.
+- LLMResponseCache stores response content on disk under the fingerprint, so
+  experiment and model-comparison commands never send an identical request
+  twice. It lives in .llm_cache/ (like .seeding_cache/ for GitHub data).
+
+Usage:
+    cache = LLMResponseCache()
+    key = llm_request_fingerprint(model, system_prompt, user_prompt, temperature=0)
+    content = cache.get_or_create(key, lambda: call_llm(...))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".llm_cache")
+
+
+def llm_request_fingerprint(model: str, system_prompt: str, user_prompt: str, **params) -> str:
+    """SHA-256 of an LLM request.
+
+    Args:
+        model: Model identifier
+        system_prompt: System prompt content
+        user_prompt: Rendered user prompt content
+        **params: Request parameters that change the response (temperature, max_tokens, ...)
+
+    Returns:
+        64-character hex digest
+    """
+    payload = json.dumps(
+        {"model": model, "system": system_prompt, "user": user_prompt, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """On-disk cache of LLM response content keyed by request fingerprint.
+
+    Entries never expire: the key covers every input, so a cached response is
+    valid for as long as the model is deterministic enough to be worth reusing.
+    Safe to use from several threads (writes are atomic renames).
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        """File path for a cache key (sharded by the first two hex characters)."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Return cached response content, or None on a miss."""
+        path = self.path_for(key)
+        try:
+            with open(path) as f:
+                content = json.load(f)["content"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        """Store response content for a cache key."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"content": content}, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            Path(temp_path).unlink(missing_ok=True)
+            logger.warning(f"Failed to write LLM cache entry {key}: {e}")
+
+    def get_or_create(self, key: str, call: Callable[[], str]) -> str:
+        """Return cached content for key, calling and caching on a miss.
+
+        Errors from ``call`` propagate and nothing is cached.
+        """
+        content = self.get(key)
+        if content is None:
+            content = call()
+            self.set(key, content)
+        return content
+
+    def stats(self) -> str:
+        """Short hit/miss summary for command output."""
+        return f"{self.hits} cache hits, {self.misses} misses ({self.cache_dir})"
@@ -0,0 +1,108 @@
+"""Per-sync identity resolution for TeamMember lookups.
+
+Sync code resolves every PR author, reviewer, committer and Jira assignee to a
+TeamMember. Doing that with one query per lookup costs thousands of point
+queries per repository. TeamMemberResolver loads the team's members once and
+answers lookups by GitHub login, GitHub ID, Jira account ID or email from
+memory for the rest of the run.
+
+Create one resolver per sync run and pass it down; don't keep it around
+between runs, since members added or renamed elsewhere won't show up.
+
+Usage:
+    members = TeamMemberResolver(team.id)
+    author = members.by_github_id(pr_data["user"]["id"])
+    members.ensure_logins({"alice", "bob"})  # bulk-creates missing members
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from apps.metrics.models import TeamMember
+
+
+class TeamMemberResolver:
+    """Team-scoped, in-memory index of TeamMembers.
+
+    Members are loaded lazily on the first lookup with a single query, so a
+    resolver can be created in async code and used from sync_to_async helpers.
+    When several members share a key, the one with the lowest ID wins.
+    """
+
+    def __init__(self, team_id: int):
+        self.team_id = team_id
+        self._loaded = False
+        self._by_login: dict[str, TeamMember] = {}
+        self._by_github_id: dict[str, TeamMember] = {}
+        self._by_jira_account_id: dict[str, TeamMember] = {}
+        self._by_email: dict[str, TeamMember] = {}
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        for member in TeamMember.objects.filter(team_id=self.team_id).order_by("id"):  # noqa: TEAM001
+            self._add(member)
+
+    def _add(self, member: TeamMember) -> None:
+        if member.github_username:
+            self._by_login.setdefault(member.github_username, member)
+        if member.github_id:
+            self._by_github_id.setdefault(str(member.github_id), member)
+        if member.jira_account_id:
+            self._by_jira_account_id.setdefault(member.jira_account_id, member)
+        if member.email:
+            self._by_email.setdefault(member.email.lower(), member)
+
+    def by_login(self, github_login: str | None) -> TeamMember | None:
+        """TeamMember with this GitHub username (exact match), or None."""
+        if not github_login:
+            return None
+        self._load()
+        return self._by_login.get(github_login)
+
+    def by_github_id(self, github_id: str | int | None) -> TeamMember | None:
+        """TeamMember with this GitHub user ID, or None."""
+        if not github_id:
+            return None
+        self._load()
+        return self._by_github_id.get(str(github_id))
+
+    def by_jira_account_id(self, account_id: str | None) -> TeamMember | None:
+        """TeamMember with this Jira account ID, or None."""
+        if not account_id:
+            return None
+        self._load()
+        return self._by_jira_account_id.get(account_id)
+
+    def by_email(self, email: str | None) -> TeamMember | None:
+        """TeamMember with this email (case-insensitive), or None."""
+        if not email:
+            return None
+        self._load()
+        return self._by_email.get(email.lower())
+
+    def ensure_logins(self, github_logins: Iterable[str | None]) -> dict[str, TeamMember]:
+        """Resolve GitHub logins, bulk-creating members for unknown ones.
+
+        New members get the login as display name. Costs two queries when
+        anything is missing and none otherwise (after the initial load).
+
+        Returns:
+            Dict mapping each given login to its TeamMember
+        """
+        self._load()
+        logins = {login for login in github_logins if login}
+        missing = logins - self._by_login.keys()
+        if missing:
+            TeamMember.objects.bulk_create(
+                [TeamMember(team_id=self.team_id, github_username=login, display_name=login) for login in missing],
+                ignore_conflicts=True,
+            )
+            created = TeamMember.objects.filter(  # noqa: TEAM001
+                team_id=self.team_id, github_username__in=missing
+            ).order_by("id")
+            for member in created:
+                self._add(member)
+        return {login: self._by_login[login] for login in logins if login in self._by_login}
@@ -0,0 +1,413 @@
+"""Daily PR fact rollup - incremental maintenance and period reads.
+
+DailyPRFact holds one row per (team, repo, merge day, author) with counts,
+sums and histogram buckets for merged PRs. Dashboard trend functions read
+weekly/monthly series from this table instead of grouping raw PullRequest
+rows, so a 12-month chart costs the same for a 200-PR team as for a
+200k-PR team.
+
+Maintenance:
+    PullRequest.save()/delete() call refresh_daily_facts() for the fact keys
+    a PR moved out of and into. Refreshing a key re-aggregates the raw PRs of
+    that (repo, day, author) cell, so the rollup is always exact rather than
+    delta-based. rebuild_daily_facts() recomputes a whole team (used by the
+    rebuild_pr_daily_facts management command after bulk writes).
+
+Reads:
+    get_fact_series() returns per-week or per-month sums. Completed days come
+    from the rollup; the current (partial) day is aggregated from raw rows.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q, QuerySet, Sum
+from django.db.models.functions import Trunc, TruncDate
+from django.utils import timezone
+
+from apps.metrics.models import DailyPRFact, PullRequest
+from apps.utils.date_utils import end_of_day, start_of_day
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds (inclusive); a final open-ended bucket is implied.
+CYCLE_TIME_BUCKETS_HOURS = (4, 24, 72, 168)
+REVIEW_TIME_BUCKETS_HOURS = (1, 4, 24, 72)
+# Matches PR_SIZE_*_MAX in dashboard/pr_metrics.py (XS, S, M, L, XL)
+SIZE_BUCKETS_LINES = (10, 50, 200, 500)
+SIZE_BUCKET_LABELS = ("XS", "S", "M", "L", "XL")
+
+# Summable DailyPRFact columns (everything except histograms)
+FACT_SUM_FIELDS = (
+    "pr_count",
+    "ai_assisted_count",
+    "effective_ai_count",
+    "revert_count",
+    "hotfix_count",
+    "cycle_time_sum",
+    "cycle_time_count",
+    "review_time_sum",
+    "review_time_count",
+    "additions_sum",
+    "deletions_sum",
+)
+
+# (histogram field, raw PR expression, bucket upper bounds)
+_HISTOGRAMS = (
+    ("cycle_time_histogram", "cycle_time_hours", CYCLE_TIME_BUCKETS_HOURS),
+    ("review_time_histogram", "review_time_hours", REVIEW_TIME_BUCKETS_HOURS),
+    ("size_histogram", "total_lines", SIZE_BUCKETS_LINES),
+)
+
+PERIODS = ("week", "month")
+
+
+class FactKey(NamedTuple):
+    """Identifies one DailyPRFact row within a team."""
+
+    github_repo: str
+    day: date
+    author_id: int
+
+
+def fact_key_for(github_repo: str, state: str, merged_at, author_id: int | None) -> FactKey | None:
+    """Return the fact key a PR contributes to, or None if it is not rolled up.
+
+    Only merged PRs with an author are rolled up.
+    """
+    if state != "merged" or merged_at is None or author_id is None:
+        return None
+    return FactKey(github_repo, timezone.localdate(merged_at), author_id)
+
+
+def _bucket_filters(field: str, bounds: tuple) -> list[Q]:
+    """Build one Q per histogram bucket (last bucket is open-ended)."""
+    filters = []
+    lower = None
+    for upper in bounds:
+        q = Q(**{f"{field}__lte": upper})
+        if lower is not None:
+            q &= Q(**{f"{field}__gt": lower})
+        filters.append(q)
+        lower = upper
+    filters.append(Q(**{f"{field}__gt": lower}))
+    return filters
+
+
+def _raw_aggregates() -> dict:
+    """Aggregate expressions over raw PRs producing DailyPRFact values.
+
+    The queryset must be annotated with total_lines (see _annotate_raw).
+    """
+    aggregates = {
+        "pr_count": Count("id"),
+        "ai_assisted_count": Count("id", filter=Q(is_ai_assisted=True)),
+        "effective_ai_count": Count("id", filter=Q(resolved_is_ai_assisted=True)),
+        "revert_count": Count("id", filter=Q(is_revert=True)),
+        "hotfix_count": Count("id", filter=Q(is_hotfix=True)),
+        "cycle_time_sum": Sum("cycle_time_hours"),
+        "cycle_time_count": Count("cycle_time_hours"),
+        "review_time_sum": Sum("review_time_hours"),
+        "review_time_count": Count("review_time_hours"),
+        "additions_sum": Sum("additions"),
+        "deletions_sum": Sum("deletions"),
+    }
+    for hist_field, source, bounds in _HISTOGRAMS:
+        for i, q in enumerate(_bucket_filters(source, bounds)):
+            aggregates[f"{hist_field}_{i}"] = Count("id", filter=q)
+    return aggregates
+
+
+def _annotate_raw(prs: QuerySet[PullRequest]) -> QuerySet[PullRequest]:
+    """Add the expressions _raw_aggregates() relies on."""
+    return prs.annotate(total_lines=F("additions") + F("deletions"))
+
+
+def _row_to_fact_values(row: dict) -> dict:
+    """Convert an aggregated raw row into DailyPRFact field values."""
+    values = {field: row[field] or 0 for field in FACT_SUM_FIELDS}
+    for hist_field, _source, bounds in _HISTOGRAMS:
+        values[hist_field] = [row[f"{hist_field}_{i}"] for i in range(len(bounds) + 1)]
+    return values
+
+
+def _merged_authored_prs(team_id: int) -> QuerySet[PullRequest]:
+    """Base queryset of PRs that are rolled up for a team."""
+    return PullRequest.objects.filter(team_id=team_id, state="merged", author__isnull=False)  # noqa: TEAM001
+
+
+def refresh_daily_facts(team_id: int, keys: Iterable[FactKey | None]) -> int:
+    """Recompute the given fact rows from raw PRs.
+
+    Rows whose cell no longer has any PRs are deleted. All keys are
+    re-aggregated with a single grouped query.
+
+    Args:
+        team_id: Team the keys belong to
+        keys: Fact keys to refresh (None entries are ignored)
+
+    Returns:
+        Number of fact rows written (created or updated)
+    """
+    keys = {key for key in keys if key is not None}
+    if not keys:
+        return 0
+
+    days = {key.day for key in keys}
+    prs = _merged_authored_prs(team_id).filter(
+        github_repo__in={key.github_repo for key in keys},
+        author_id__in={key.author_id for key in keys},
+        merged_at__gte=start_of_day(min(days)),
+        merged_at__lte=end_of_day(max(days)),
+    )
+    rows = (
+        _annotate_raw(prs)
+        .annotate(day=TruncDate("merged_at"))
+        .values("github_repo", "author_id", "day")
+        .annotate(**_raw_aggregates())
+        .order_by()
+    )
+
+    facts = []
+    for row in rows:
+        key = FactKey(row["github_repo"], row["day"], row["author_id"])
+        if key not in keys:
+            continue
+        keys.discard(key)
+        facts.append(
+            DailyPRFact(
+                team_id=team_id,
+                github_repo=key.github_repo,
+                day=key.day,
+                author_id=key.author_id,
+                **_row_to_fact_values(row),
+            )
+        )
+
+    with transaction.atomic():
+        if facts:
+            _upsert_facts(facts)
+        # Remaining keys have no PRs anymore
+        if keys:
+            stale = Q()
+            for key in keys:
+                stale |= Q(github_repo=key.github_repo, day=key.day, author_id=key.author_id)
+            DailyPRFact.objects.filter(stale, team_id=team_id).delete()  # noqa: TEAM001
+
+    return len(facts)
+
+
+def refresh_daily_facts_for_prs(prs: Iterable[PullRequest]) -> int:
+    """Refresh fact rows for PRs written with bulk_update (which bypasses save()).
+
+    Only PRs whose rollup source values changed since they were loaded are
+    considered; their old and new keys are refreshed per team.
+
+    Returns:
+        Number of fact rows written (created or updated)
+    """
+    keys_by_team: dict[int, set] = defaultdict(set)
+    for pr in prs:
+        snapshot = pr._rollup_snapshot()
+        previous = getattr(pr, "_loaded_rollup_snapshot", None)
+        if snapshot is None or snapshot == previous:
+            continue
+        keys_by_team[pr.team_id].add(pr._rollup_key(snapshot))
+        if previous is not None:
+            keys_by_team[pr.team_id].add(pr._rollup_key(previous))
+        pr._loaded_rollup_snapshot = snapshot
+    return sum(refresh_daily_facts(team_id, keys) for team_id, keys in keys_by_team.items())
+
+
+def _upsert_facts(facts: list[DailyPRFact]) -> None:
+    """Insert or update fact rows on the (team, repo, day, author) key."""
+    DailyPRFact.objects.bulk_create(  # noqa: TEAM001 - rows carry explicit team_id
+        facts,
+        update_conflicts=True,
+        unique_fields=["team", "github_repo", "day", "author"],
+        update_fields=[*FACT_SUM_FIELDS, *(hist for hist, _, _ in _HISTOGRAMS), "updated_at"],
+        batch_size=1000,
+    )
+
+
+def rebuild_daily_facts(team_id: int, start_date: date | None = None, end_date: date | None = None) -> int:
+    """Rebuild all fact rows for a team (optionally limited to a day range).
+
+    Use after writes that bypass PullRequest.save() (queryset.update,
+    bulk_update, bulk_create).
+
+    Args:
+        team_id: Team to rebuild
+        start_date: First day to rebuild (inclusive), or None for all history
+        end_date: Last day to rebuild (inclusive), or None for all history
+
+    Returns:
+        Number of fact rows written
+    """
+    prs = _merged_authored_prs(team_id)
+    facts_qs = DailyPRFact.objects.filter(team_id=team_id)  # noqa: TEAM001
+    if start_date:
+        prs = prs.filter(merged_at__gte=start_of_day(start_date))
+        facts_qs = facts_qs.filter(day__gte=start_date)
+    if end_date:
+        prs = prs.filter(merged_at__lte=end_of_day(end_date))
+        facts_qs = facts_qs.filter(day__lte=end_date)
+
+    rows = (
+        _annotate_raw(prs)
+        .annotate(day=TruncDate("merged_at"))
+        .values("github_repo", "author_id", "day")
+        .annotate(**_raw_aggregates())
+        .order_by()
+    )
+    facts = [
+        DailyPRFact(
+            team_id=team_id,
+            github_repo=row["github_repo"],
+            day=row["day"],
+            author_id=row["author_id"],
+            **_row_to_fact_values(row),
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        facts_qs.delete()
+        if facts:
+            _upsert_facts(facts)
+
+    logger.info(f"Rebuilt {len(facts)} daily PR facts for team {team_id}")
+    return len(facts)
+
+
+def _empty_totals() -> dict:
+    """Zeroed sums for one period."""
+    totals = dict.fromkeys(FACT_SUM_FIELDS, 0)
+    totals["cycle_time_sum"] = Decimal("0")
+    totals["review_time_sum"] = Decimal("0")
+    return totals
+
+
+def _period_start(value) -> date:
+    """Normalize a truncated date/datetime to a date."""
+    return value.date() if hasattr(value, "date") else value
+
+
+def get_fact_series(
+    team,
+    start_date: date,
+    end_date: date,
+    period: str = "week",
+    repo: str | None = None,
+) -> list[dict]:
+    """Get per-period sums of merged, authored PRs.
+
+    Completed days are read from DailyPRFact; the current partial day is
+    aggregated from raw PullRequest rows and merged in.
+
+    Args:
+        team: Team instance
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        period: "week" (Monday start) or "month"
+        repo: Optional repository to filter by (owner/repo format)
+
+    Returns:
+        list of dicts ordered by period, each with "period" (date of the
+        period start) plus every name in FACT_SUM_FIELDS. Periods without
+        merged PRs are omitted.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unsupported period: {period}")
+
+    totals: dict[date, dict] = defaultdict(_empty_totals)
+    today = timezone.localdate()
+
+    # Completed days from the rollup
+    rollup_end = min(end_date, today - timedelta(days=1))
+    if start_date <= rollup_end:
+        facts = DailyPRFact.objects.filter(team=team, day__gte=start_date, day__lte=rollup_end)
+        if repo:
+            facts = facts.filter(github_repo=repo)
+        rows = (
+            facts.annotate(period=Trunc("day", period))
+            .values("period")
+            .annotate(**{field: Sum(field) for field in FACT_SUM_FIELDS})
+            .order_by()
+        )
+        for row in rows:
+            bucket = totals[_period_start(row["period"])]
+            for field in FACT_SUM_FIELDS:
+                bucket[field] += row[field] or 0
+
+    # Current partial day from raw rows
+    if end_date >= today and start_date <= end_date:
+        prs = _merged_authored_prs(team.id).filter(
+            merged_at__gte=start_of_day(max(start_date, today)),
+            merged_at__lte=end_of_day(end_date),
+        )
+        if repo:
+            prs = prs.filter(github_repo=repo)
+        aggregates = {field: expr for field, expr in _raw_aggregates().items() if field in FACT_SUM_FIELDS}
+        rows = (
+            _annotate_raw(prs)
+            .annotate(period=Trunc("merged_at", period))
+            .values("period")
+            .annotate(**aggregates)
+            .order_by()
+        )
+        for row in rows:
+            bucket = totals[_period_start(row["period"])]
+            for field in FACT_SUM_FIELDS:
+                bucket[field] += row[field] or 0
+
+    return [{"period": period_start, **totals[period_start]} for period_start in sorted(totals)]
+
+
+def get_fact_histograms(team, start_date: date, end_date: date, repo: str | None = None) -> dict[str, list[int]]:
+    """Get summed histograms of merged, authored PRs over a date range.
+
+    Args:
+        team: Team instance
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        repo: Optional repository to filter by (owner/repo format)
+
+    Returns:
+        dict mapping cycle_time_histogram, review_time_histogram and
+        size_histogram to lists of PR counts per bucket
+    """
+    histograms = {hist: [0] * (len(bounds) + 1) for hist, _source, bounds in _HISTOGRAMS}
+    today = timezone.localdate()
+
+    def _add(hist: str, counts: list[int]) -> None:
+        for i, count in enumerate(counts[: len(histograms[hist])]):
+            histograms[hist][i] += count or 0
+
+    rollup_end = min(end_date, today - timedelta(days=1))
+    if start_date <= rollup_end:
+        facts = DailyPRFact.objects.filter(team=team, day__gte=start_date, day__lte=rollup_end)
+        if repo:
+            facts = facts.filter(github_repo=repo)
+        for row in facts.values(*histograms.keys()):
+            for hist in histograms:
+                _add(hist, row[hist])
+
+    if end_date >= today and start_date <= end_date:
+        prs = _merged_authored_prs(team.id).filter(
+            merged_at__gte=start_of_day(max(start_date, today)),
+            merged_at__lte=end_of_day(end_date),
+        )
+        if repo:
+            prs = prs.filter(github_repo=repo)
+        row = _annotate_raw(prs).aggregate(**_raw_aggregates())
+        for hist, counts in _row_to_fact_values(row).items():
+            if hist in histograms:
+                _add(hist, counts)
+
+    return histograms
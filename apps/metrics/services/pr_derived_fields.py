@@ -0,0 +1,81 @@
+"""Stored per-PR columns derived from PR files and reviews.
+
+The PR explorer used to annotate every queryset with an ArrayAgg over PRFile
+(tech_categories) and two PRReview subqueries (reviewer_count,
+has_author_review). Filtering on those annotations meant grouping thousands of
+file rows per PR on every request. They are now stored on PullRequest
+(DERIVED_FIELDS) and filtered/indexed directly.
+
+Maintenance:
+    PRFile.save()/delete() and PRReview.save()/delete() call
+    refresh_pr_derived_fields() for their PR. Writes that bypass save()
+    (bulk_create in the GraphQL bulk writer and the seeders) call it once per
+    batch of PRs. Each refresh is a single UPDATE with correlated subqueries,
+    so it is exact rather than delta-based. After other bulk writes, run the
+    backfill_pr_derived_fields management command.
+"""
+
+from collections.abc import Iterable
+
+from django.contrib.postgres.aggregates import JSONBAgg
+from django.db.models import Count, Exists, JSONField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.metrics.models import PRFile, PRReview, PullRequest
+
+# PRs refreshed per UPDATE statement in bulk backfills
+REFRESH_BATCH_SIZE = 1000
+
+
+def derived_field_expressions() -> dict:
+    """UPDATE expressions computing each derived column from files and reviews."""
+    # noqa: TEAM001 - Subqueries scoped by pull_request which is already team-filtered
+    files = PRFile.objects.filter(pull_request=OuterRef("pk")).exclude(file_category="")  # noqa: TEAM001
+    tech_categories = (
+        files.order_by()
+        .values("pull_request")
+        .annotate(categories=JSONBAgg("file_category", distinct=True, order_by="file_category"))
+        .values("categories")
+    )
+    reviews = PRReview.objects.filter(pull_request=OuterRef("pk"))  # noqa: TEAM001
+    reviewer_count = (
+        reviews.order_by().values("pull_request").annotate(count=Count("reviewer", distinct=True)).values("count")
+    )
+    return {
+        "tech_categories": Coalesce(Subquery(tech_categories), Value([], output_field=JSONField())),
+        "reviewer_count": Coalesce(Subquery(reviewer_count), 0),
+        "has_author_review": Exists(reviews.filter(reviewer=OuterRef("author"))),
+    }
+
+
+def refresh_pr_derived_fields(pr_ids: Iterable[int]) -> int:
+    """Recompute tech_categories, reviewer_count and has_author_review for PRs.
+
+    Args:
+        pr_ids: IDs of the PRs whose files or reviews changed
+
+    Returns:
+        Number of PRs updated
+    """
+    pr_ids = list({pr_id for pr_id in pr_ids if pr_id})
+    if not pr_ids:
+        return 0
+    return PullRequest.objects.filter(id__in=pr_ids).update(**derived_field_expressions())  # noqa: TEAM001
+
+
+def backfill_pr_derived_fields(team_id: int | None = None, batch_size: int = REFRESH_BATCH_SIZE) -> int:
+    """Recompute derived columns for every PR (optionally of one team) in batches.
+
+    Returns:
+        Number of PRs updated
+    """
+    prs = PullRequest.objects.order_by("id")  # noqa: TEAM001 - optional team filter below
+    if team_id is not None:
+        prs = prs.filter(team_id=team_id)
+
+    updated = 0
+    last_id = 0
+    while batch := list(prs.filter(id__gt=last_id).values_list("id", flat=True)[:batch_size]):
+        updated += refresh_pr_derived_fields(batch)
+        last_id = batch[-1]
+    return updated
@@ -0,0 +1,199 @@
+"""Streaming PR export engine for the data explorer.
+
+Exports read a narrow values_list() projection of the filtered PRs through a
+server-side cursor (QuerySet.iterator), EXPORT_CHUNK_SIZE rows at a time. Each
+chunk is transposed into columns, derived columns (author name, GitHub URL,
+defaults) are computed per column, and the chunk is written out before the
+next one is fetched, so memory stays flat however many PRs are exported.
+
+Formats:
+- csv: same columns and formatting as the original export
+- ndjson: one JSON object per PR, typed values (numbers, booleans, lists)
+
+Usage:
+    export_format = EXPORT_FORMATS["csv"]
+    chunks = iter_export_chunks(get_export_queryset(team, filters))
+    response = StreamingHttpResponse(export_format.stream(chunks), content_type=export_format.content_type)
+"""
+
+import csv
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Any
+
+from django.db.models import QuerySet
+
+from apps.metrics.services.pr_list_service import get_prs_queryset
+from apps.teams.models import Team
+
+# Rows fetched from the server-side cursor and written per step
+EXPORT_CHUNK_SIZE = 2000
+
+# (key, header) for each exported column, in output order
+EXPORT_COLUMNS = [
+    ("title", "Title"),
+    ("repository", "Repository"),
+    ("author", "Author"),
+    ("state", "State"),
+    ("cycle_time_hours", "Cycle Time (hours)"),
+    ("review_time_hours", "Review Time (hours)"),
+    ("additions", "Lines Added"),
+    ("deletions", "Lines Deleted"),
+    ("review_rounds", "Review Rounds"),
+    ("comments", "Comments"),
+    ("ai_assisted", "AI Assisted"),
+    ("ai_tools", "AI Tools"),
+    ("jira_key", "Jira Key"),
+    ("created_at", "Created At"),
+    ("merged_at", "Merged At"),
+    ("github_url", "GitHub URL"),
+]
+
+# Database columns read per PR (the only ones the export needs)
+_SOURCE_FIELDS = (
+    "title",
+    "github_repo",
+    "author__display_name",
+    "state",
+    "cycle_time_hours",
+    "review_time_hours",
+    "additions",
+    "deletions",
+    "review_rounds",
+    "total_comments",
+    "is_ai_assisted",
+    "ai_tools_detected",
+    "jira_key",
+    "pr_created_at",
+    "merged_at",
+    "github_pr_id",
+)
+
+_DECIMAL_COLUMNS = frozenset({"cycle_time_hours", "review_time_hours"})
+_DATETIME_COLUMNS = frozenset({"created_at", "merged_at"})
+
+Columns = dict[str, list[Any]]
+
+
+def get_export_queryset(team: Team, filters: dict[str, Any]) -> QuerySet:
+    """Filtered PRs as a narrow values_list() projection, newest merges first.
+
+    Skips the table's select_related() joins; only the author's display name
+    is read, through values_list().
+    """
+    return (
+        get_prs_queryset(team, filters, annotate=False)
+        .order_by("-merged_at", "-pr_created_at", "-id")
+        .values_list(*_SOURCE_FIELDS)
+    )
+
+
+def _build_columns(rows: list[tuple]) -> Columns:
+    """Transpose a chunk of source rows into export columns."""
+    (
+        title,
+        repo,
+        author,
+        state,
+        cycle_time,
+        review_time,
+        additions,
+        deletions,
+        review_rounds,
+        comments,
+        is_ai_assisted,
+        ai_tools,
+        jira_key,
+        created_at,
+        merged_at,
+        pr_number,
+    ) = zip(*rows, strict=True)
+    return {
+        "title": list(title),
+        "repository": list(repo),
+        "author": [name or "" for name in author],
+        "state": list(state),
+        "cycle_time_hours": list(cycle_time),
+        "review_time_hours": list(review_time),
+        "additions": list(additions),
+        "deletions": list(deletions),
+        "review_rounds": [value or 0 for value in review_rounds],
+        "comments": [value or 0 for value in comments],
+        "ai_assisted": list(is_ai_assisted),
+        "ai_tools": [list(tools or []) for tools in ai_tools],
+        "jira_key": [key or "" for key in jira_key],
+        "created_at": list(created_at),
+        "merged_at": list(merged_at),
+        "github_url": [f"https://github.com/{r}/pull/{n}" for r, n in zip(repo, pr_number, strict=True)],
+    }
+
+
+def iter_export_chunks(queryset: QuerySet, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Columns]:
+    """Yield export columns chunk by chunk from a server-side cursor."""
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield _build_columns(chunk)
+
+
+class Echo:
+    """An object that implements just the write method of the file-like interface."""
+
+    def write(self, value):
+        """Write the value by returning it."""
+        return value
+
+
+def _csv_values(key: str, values: list[Any]) -> list[Any]:
+    if key in _DECIMAL_COLUMNS:
+        return [str(value) if value else "" for value in values]
+    if key in _DATETIME_COLUMNS:
+        return [value.isoformat() if value else "" for value in values]
+    if key == "ai_assisted":
+        return ["Yes" if value else "No" for value in values]
+    if key == "ai_tools":
+        return [", ".join(tools) for tools in values]
+    return values
+
+
+def stream_csv(chunks: Iterable[Columns]) -> Iterator[str]:
+    """CSV text: the header, then one string per chunk."""
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for _, header in EXPORT_COLUMNS])
+    for columns in chunks:
+        formatted = [_csv_values(key, columns[key]) for key, _ in EXPORT_COLUMNS]
+        yield "".join(writer.writerow(row) for row in zip(*formatted, strict=True))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def stream_ndjson(chunks: Iterable[Columns]) -> Iterator[str]:
+    """Newline-delimited JSON: one object per PR, one string per chunk."""
+    keys = [key for key, _ in EXPORT_COLUMNS]
+    for columns in chunks:
+        rows = zip(*(columns[key] for key in keys), strict=True)
+        yield "".join(json.dumps(dict(zip(keys, row, strict=True)), default=_json_default) + "\n" for row in rows)
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """How an export format is streamed and served."""
+
+    content_type: str
+    extension: str
+    stream: Callable[[Iterable[Columns]], Iterator]
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("text/csv", "csv", stream_csv),
+    "ndjson": ExportFormat("application/x-ndjson", "ndjson", stream_ndjson),
+}
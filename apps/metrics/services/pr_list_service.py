@@ -3,8 +3,7 @@
 from datetime import date, datetime
 from typing import Any
 
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.db.models import Avg, Count, Exists, F, OuterRef, Q, QuerySet, Subquery, Sum, Value
+from django.db.models import Avg, Count, F, OuterRef, Q, QuerySet, Subquery, Sum
 
 from apps.metrics.models import PRFile, PRReview, PullRequest, TeamMember
 from apps.metrics.services.ai_categories import (
@@ -12,9 +11,6 @@ from apps.metrics.services.ai_categories import (
     CATEGORY_BOTH,
     CATEGORY_CODE,
     CATEGORY_REVIEW,
-    CODE_TOOLS,
-    MIXED_TOOLS,
-    REVIEW_TOOLS,
 )
 from apps.metrics.services.pr_filters import apply_date_range_filter, apply_issue_type_filter
 from apps.teams.models import Team
@@ -80,7 +76,21 @@ def calculate_pr_size_bucket(total_lines: int) -> str:
     return ""
 
 
-def get_prs_queryset(team: Team, filters: dict[str, Any]) -> QuerySet[PullRequest]:
+# A PR is self-reviewed if it has only one unique reviewer and that reviewer is the author
+SELF_REVIEWED_Q = Q(reviewer_count=1, has_author_review=True)
+
+
+def _annotate_for_display(qs: QuerySet[PullRequest]) -> QuerySet[PullRequest]:
+    """Add the joins the PR table displays.
+
+    Reviewer stats (reviewer_count, has_author_review) and tech_categories are
+    stored columns on PullRequest (see services/pr_derived_fields.py), so no
+    per-request aggregation over files or reviews is needed.
+    """
+    return qs.select_related("author", "team")
+
+
+def get_prs_queryset(team: Team, filters: dict[str, Any], annotate: bool = True) -> QuerySet[PullRequest]:
     """Get filtered queryset of PRs for a team.
 
     Args:
@@ -97,40 +107,16 @@ def get_prs_queryset(team: Team, filters: dict[str, Any]) -> QuerySet[PullReques
             - self_reviewed: 'yes' or 'no'
             - date_from: Start date (ISO format string)
             - date_to: End date (ISO format string)
+        annotate: Add the table's display joins (author, team). Pass False for
+            a plain filtered queryset, e.g. to stream a narrow values() projection.
 
     Returns:
         Filtered QuerySet of PullRequest objects
     """
     # noqa: TEAM001 - Explicit team filter provided
-    qs = PullRequest.objects.filter(team=team).select_related("author", "team")
-
-    # Always annotate with is_self_reviewed for display in table
-    # A PR is self-reviewed if it has only one unique reviewer and that reviewer is the author
-    # noqa: TEAM001 - Subquery scoped by pull_request which is already team-filtered
-    unique_reviewer_count = (
-        PRReview.objects.filter(pull_request=OuterRef("pk"))  # noqa: TEAM001
-        .values("pull_request")
-        .annotate(cnt=Count("reviewer", distinct=True))
-        .values("cnt")
-    )
-    has_only_author_review = Exists(
-        PRReview.objects.filter(pull_request=OuterRef("pk"), reviewer=OuterRef("author"))  # noqa: TEAM001
-    )
-    qs = qs.annotate(
-        reviewer_count=Subquery(unique_reviewer_count),
-        has_author_review=has_only_author_review,
-    )
-
-    # Annotate with technology categories from PR files
-    # noqa: TEAM001 - Prefetch through PR which is already team-filtered
-    qs = qs.annotate(
-        tech_categories=ArrayAgg(
-            "files__file_category",
-            distinct=True,
-            filter=~Q(files__file_category="") & Q(files__file_category__isnull=False),
-            default=Value([]),
-        )
-    )
+    qs = PullRequest.objects.filter(team=team)
+    if annotate:
+        qs = _annotate_for_display(qs)
 
     # Filter by repository
     if filters.get("repo"):
@@ -254,19 +240,25 @@ def get_prs_queryset(team: Team, filters: dict[str, Any]) -> QuerySet[PullReques
     elif has_jira == "no":
         qs = qs.filter(jira_key="")
 
+    # Filter by self-review (the author is the only reviewer)
+    self_reviewed = filters.get("self_reviewed")
+    if self_reviewed == "yes":
+        qs = qs.filter(SELF_REVIEWED_Q)
+    elif self_reviewed == "no":
+        qs = qs.exclude(SELF_REVIEWED_Q)
+
     # Filter by technology category (multi-select)
-    # Searches both pattern-based categories (PRFile.file_category)
+    # Searches both pattern-based categories (stored tech_categories from PRFile.file_category)
     # and LLM categories (llm_summary.tech.categories)
     tech = filters.get("tech")
     if tech:
         tech_list = tech if isinstance(tech, list) else [tech]
-        # Build OR query: match pattern categories OR LLM categories
-        pattern_q = Q(files__file_category__in=tech_list)
-        # For LLM categories, use contains lookup on JSONB array
-        llm_q = Q()
+        # Build OR query: match pattern categories OR LLM categories,
+        # using contains lookups on the JSONB arrays (GIN-indexed)
+        tech_q = Q()
         for cat in tech_list:
-            llm_q |= Q(llm_summary__tech__categories__contains=[cat])
-        qs = qs.filter(pattern_q | llm_q).distinct()
+            tech_q |= Q(tech_categories__contains=[cat]) | Q(llm_summary__tech__categories__contains=[cat])
+        qs = qs.filter(tech_q)
 
     # Filter by PR type (from LLM summary)
     if filters.get("pr_type"):
@@ -319,52 +311,17 @@ def get_pr_stats(queryset: QuerySet[PullRequest]) -> dict[str, Any]:
         total_additions=Sum("additions"),
         total_deletions=Sum("deletions"),
         ai_assisted_count=Count("id", filter=Q(is_ai_assisted=True)),
+        # AI category counts from the materialized resolved_ai_category column
+        # (effective_ai_tools with LLM priority), restricted to AI-assisted PRs
+        code_ai_count=Count("id", filter=Q(is_ai_assisted=True, resolved_ai_category=CATEGORY_CODE)),
+        review_ai_count=Count("id", filter=Q(is_ai_assisted=True, resolved_ai_category=CATEGORY_REVIEW)),
+        both_ai_count=Count("id", filter=Q(is_ai_assisted=True, resolved_ai_category=CATEGORY_BOTH)),
     )
 
     # Handle empty queryset
     if stats["total_count"] == 0:
         stats["total_additions"] = 0
         stats["total_deletions"] = 0
-        stats["ai_assisted_count"] = 0
-        stats["code_ai_count"] = 0
-        stats["review_ai_count"] = 0
-        stats["both_ai_count"] = 0
-        return stats
-
-    # Count PRs by AI category
-    # This requires Python-level evaluation because ai_category is computed
-    # from effective_ai_tools which considers LLM priority
-    from apps.metrics.services.ai_categories import get_ai_category
-
-    code_count = 0
-    review_count = 0
-    both_count = 0
-
-    # Only check AI-assisted PRs to avoid iterating all PRs
-    ai_prs = queryset.filter(is_ai_assisted=True).values_list("ai_tools_detected", "llm_summary", named=True)
-
-    for pr in ai_prs:
-        # Determine effective tools (LLM priority)
-        tools = []
-        if pr.llm_summary and pr.llm_summary.get("ai", {}).get("tools"):
-            llm_ai = pr.llm_summary.get("ai", {})
-            confidence = llm_ai.get("confidence", 0)
-            if confidence >= 0.5 and llm_ai.get("tools"):
-                tools = llm_ai["tools"]
-        if not tools and pr.ai_tools_detected:
-            tools = pr.ai_tools_detected
-
-        category = get_ai_category(tools)
-        if category == CATEGORY_CODE:
-            code_count += 1
-        elif category == CATEGORY_REVIEW:
-            review_count += 1
-        elif category == CATEGORY_BOTH:
-            both_count += 1
-
-    stats["code_ai_count"] = code_count
-    stats["review_ai_count"] = review_count
-    stats["both_ai_count"] = both_count
 
     return stats
 
@@ -466,13 +423,12 @@ def _parse_date(date_str: str) -> date | None:
 def _apply_ai_category_filter(qs: QuerySet[PullRequest], category: str) -> QuerySet[PullRequest]:
     """Apply AI category filter to queryset.
 
-    This is complex because we need to check both:
-    1. LLM-detected tools (in llm_summary.ai.tools) - takes priority
-    2. Regex-detected tools (in ai_tools_detected) - fallback
+    Reads the materialized resolved_ai_category column, which is derived from
+    effective_ai_tools (LLM-detected tools take priority over regex-detected tools).
 
     The filter logic:
-    - code: Has code tools but NOT review-only
-    - review: Has review tools but NOT code-only
+    - code: Has code tools (code-only or both)
+    - review: Has review tools (review-only or both)
     - both: Has both code AND review tools
 
     Args:
@@ -482,47 +438,12 @@ def _apply_ai_category_filter(qs: QuerySet[PullRequest], category: str) -> Query
     Returns:
         Filtered QuerySet
     """
-    # Build Q objects for tool matching
-    # We need to check both LLM tools and regex tools
-
-    # All tools that count as "code" (including mixed)
-    all_code_tools = CODE_TOOLS | MIXED_TOOLS
-
-    # Build contains queries for each tool
-    def build_tool_contains_query(tools: set[str], field: str) -> Q:
-        """Build OR query for any of the tools being present."""
-        q = Q()
-        for tool in tools:
-            q |= Q(**{f"{field}__contains": [tool]})
-        return q
-
-    # LLM tools field path
-    llm_field = "llm_summary__ai__tools"
-    # Regex tools field
-    regex_field = "ai_tools_detected"
-
-    # Build queries for LLM and regex sources
-    llm_has_code = build_tool_contains_query(all_code_tools, llm_field)
-    llm_has_review = build_tool_contains_query(REVIEW_TOOLS, llm_field)
-    regex_has_code = build_tool_contains_query(all_code_tools, regex_field)
-    regex_has_review = build_tool_contains_query(REVIEW_TOOLS, regex_field)
-
-    # Combined: has code tools from either source
-    has_code = llm_has_code | regex_has_code
-    # Combined: has review tools from either source
-    has_review = llm_has_review | regex_has_review
-
     if category == CATEGORY_CODE:
-        # Has code tools, may or may not have review tools
-        # Exclude PRs that have ONLY review tools
-        qs = qs.filter(has_code)
+        qs = qs.filter(resolved_ai_category__in=[CATEGORY_CODE, CATEGORY_BOTH])
     elif category == CATEGORY_REVIEW:
-        # Has review tools, may or may not have code tools
-        # Exclude PRs that have ONLY code tools
-        qs = qs.filter(has_review)
+        qs = qs.filter(resolved_ai_category__in=[CATEGORY_REVIEW, CATEGORY_BOTH])
     elif category == CATEGORY_BOTH:
-        # Must have both code AND review tools
-        qs = qs.filter(has_code & has_review)
+        qs = qs.filter(resolved_ai_category=CATEGORY_BOTH)
 
     return qs
 
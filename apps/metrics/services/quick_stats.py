@@ -3,7 +3,7 @@
 from datetime import timedelta
 from typing import Any
 
-from django.db.models import Avg, Prefetch
+from django.db.models import Avg, Count, Prefetch, Q
 from django.utils import timezone
 
 from apps.metrics.models import PRSurvey, PRSurveyReview, PullRequest
@@ -118,15 +118,16 @@ def get_team_quick_stats(team, days: int = 7, use_survey_data: bool = False) ->
         current_data_count = current_survey_count
         previous_data_count = previous_survey_count
     else:
-        # Use detection data (effective_is_ai_assisted) for AI metrics
-        current_pr_list = list(current_prs)
-        previous_pr_list = list(previous_prs)
+        # Use detection data (resolved_is_ai_assisted = effective_is_ai_assisted) for AI metrics
+        ai_count_expr = Count("id", filter=Q(resolved_is_ai_assisted=True))
+        current_ai_stats = current_prs.aggregate(total=Count("id"), ai=ai_count_expr)
+        previous_ai_stats = previous_prs.aggregate(total=Count("id"), ai=ai_count_expr)
 
-        current_data_count = len(current_pr_list)
-        previous_data_count = len(previous_pr_list)
+        current_data_count = current_ai_stats["total"]
+        previous_data_count = previous_ai_stats["total"]
 
-        current_ai_count = sum(1 for pr in current_pr_list if pr.effective_is_ai_assisted)
-        previous_ai_count = sum(1 for pr in previous_pr_list if pr.effective_is_ai_assisted)
+        current_ai_count = current_ai_stats["ai"]
+        previous_ai_count = previous_ai_stats["ai"]
 
         ai_assisted_percent = (current_ai_count / current_data_count) * 100 if current_data_count > 0 else 0.0
         previous_ai_percent = (previous_ai_count / previous_data_count) * 100 if previous_data_count > 0 else 0.0
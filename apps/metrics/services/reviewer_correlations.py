@@ -0,0 +1,167 @@
+"""Reviewer pair agreement statistics (ReviewerCorrelation).
+
+For every pair of reviewers who both gave a definitive review (approved or
+changes_requested) on the same PR, ReviewerCorrelation stores how many PRs
+they reviewed together and on how many their latest definitive states
+matched.
+
+Pairs are computed in PostgreSQL with a self-join over each reviewer's
+latest definitive review per PR, so nothing is expanded pair by pair in
+Python. Results are written with a batched upsert on the
+(team, reviewer_1, reviewer_2) constraint; only pairs that no longer exist
+are deleted.
+
+Maintenance:
+    rebuild_reviewer_correlations() recomputes a whole team.
+    update_reviewer_correlations() only recomputes pairs among reviewers of
+    PRs whose reviews changed since the last run (PRReview.updated_at). A
+    pair's counts only change when one of its shared PRs changes, and both
+    reviewers of such a PR are in that reviewer set, so restricting the
+    self-join to it gives exact counts for every affected pair. It runs
+    daily per team via update_team_reviewer_correlations_task; a weekly
+    rebuild_team_reviewer_correlations_task recomputes everything in case
+    reviews changed without touching updated_at.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Max
+
+from apps.metrics.models import PRReview, ReviewerCorrelation
+
+logger = logging.getLogger(__name__)
+
+DEFINITIVE_REVIEW_STATES = ("approved", "changes_requested")
+
+# The last-run watermark is the newest ReviewerCorrelation.updated_at, which
+# is written after reviews are read; re-scan this much earlier to cover
+# reviews that changed while the previous run was in progress.
+INCREMENTAL_OVERLAP = timedelta(minutes=15)
+
+_PAIR_STATS_SQL = """
+    WITH latest AS (
+        SELECT DISTINCT ON (pull_request_id, reviewer_id) pull_request_id, reviewer_id, state
+        FROM {review_table}
+        WHERE team_id = %s
+        AND state IN %s
+        AND reviewer_id IS NOT NULL
+        {reviewer_clause}
+        ORDER BY pull_request_id, reviewer_id, submitted_at DESC NULLS LAST, id DESC
+    )
+    SELECT
+        a.reviewer_id,
+        b.reviewer_id,
+        COUNT(*) AS prs_reviewed_together,
+        COUNT(*) FILTER (WHERE a.state = b.state) AS agreements
+    FROM latest a
+    JOIN latest b ON b.pull_request_id = a.pull_request_id AND b.reviewer_id > a.reviewer_id
+    GROUP BY a.reviewer_id, b.reviewer_id
+"""
+
+
+def compute_pair_stats(team_id: int, reviewer_ids: set[int] | None = None) -> dict[tuple[int, int], tuple[int, int]]:
+    """Agreement statistics per reviewer pair, from each reviewer's latest definitive review per PR.
+
+    Args:
+        team_id: Team to compute
+        reviewer_ids: Only pairs where both reviewers are in this set (None for all)
+
+    Returns:
+        {(reviewer_1_id, reviewer_2_id): (prs_reviewed_together, agreements)} with reviewer_1_id < reviewer_2_id
+    """
+    params = [team_id, DEFINITIVE_REVIEW_STATES]
+    reviewer_clause = ""
+    if reviewer_ids is not None:
+        reviewer_clause = "AND reviewer_id = ANY(%s)"
+        params.append(list(reviewer_ids))
+
+    sql = _PAIR_STATS_SQL.format(review_table=PRReview._meta.db_table, reviewer_clause=reviewer_clause)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {(r1_id, r2_id): (together, agreements) for r1_id, r2_id, together, agreements in cursor.fetchall()}
+
+
+def rebuild_reviewer_correlations(team_id: int) -> int:
+    """Recompute every reviewer pair of a team.
+
+    Returns:
+        Number of correlation records written
+    """
+    written = _write_pair_stats(team_id, compute_pair_stats(team_id))
+    logger.info(f"Rebuilt {written} reviewer correlations for team {team_id}")
+    return written
+
+
+def update_reviewer_correlations(team_id: int, since: datetime | None = None) -> int:
+    """Recompute the pairs affected by reviews changed since the last run.
+
+    Falls back to a full rebuild when the team has no correlations yet.
+
+    Args:
+        team_id: Team to update
+        since: Reviews changed at or after this time (default: last run minus INCREMENTAL_OVERLAP)
+
+    Returns:
+        Number of correlation records written
+    """
+    if since is None:
+        last_run = ReviewerCorrelation.objects.filter(team_id=team_id).aggregate(  # noqa: TEAM001
+            last_run=Max("updated_at")
+        )["last_run"]
+        if last_run is None:
+            return rebuild_reviewer_correlations(team_id)
+        since = last_run - INCREMENTAL_OVERLAP
+
+    changed_prs = PRReview.objects.filter(team_id=team_id, updated_at__gte=since).values(  # noqa: TEAM001
+        "pull_request_id"
+    )
+    reviewer_ids = set(
+        PRReview.objects.filter(  # noqa: TEAM001 - explicit team_id
+            team_id=team_id, pull_request_id__in=changed_prs, reviewer_id__isnull=False
+        )
+        .values_list("reviewer_id", flat=True)
+        .distinct()
+    )
+    if len(reviewer_ids) < 2:
+        return 0
+
+    written = _write_pair_stats(team_id, compute_pair_stats(team_id, reviewer_ids), scope=reviewer_ids)
+    logger.info(f"Updated {written} reviewer correlations for team {team_id} ({len(reviewer_ids)} reviewers)")
+    return written
+
+
+def _write_pair_stats(team_id: int, stats: dict, scope: set[int] | None = None) -> int:
+    """Upsert pair rows and delete the team's (in-scope) pairs that no longer exist."""
+    correlations = [
+        ReviewerCorrelation(
+            team_id=team_id,
+            reviewer_1_id=r1_id,
+            reviewer_2_id=r2_id,
+            prs_reviewed_together=together,
+            agreements=agreements,
+            disagreements=together - agreements,
+        )
+        for (r1_id, r2_id), (together, agreements) in stats.items()
+    ]
+    existing = ReviewerCorrelation.objects.filter(team_id=team_id)  # noqa: TEAM001 - explicit team_id
+    if scope is not None:
+        existing = existing.filter(reviewer_1_id__in=scope, reviewer_2_id__in=scope)
+    stale_ids = [
+        pk
+        for pk, r1_id, r2_id in existing.values_list("id", "reviewer_1_id", "reviewer_2_id")
+        if (r1_id, r2_id) not in stats
+    ]
+
+    with transaction.atomic():
+        if stale_ids:
+            ReviewerCorrelation.objects.filter(id__in=stale_ids).delete()  # noqa: TEAM001
+        ReviewerCorrelation.objects.bulk_create(  # noqa: TEAM001 - rows carry explicit team_id
+            correlations,
+            update_conflicts=True,
+            unique_fields=["team", "reviewer_1", "reviewer_2"],
+            update_fields=["prs_reviewed_together", "agreements", "disagreements", "updated_at"],
+            batch_size=1000,
+        )
+    return len(correlations)
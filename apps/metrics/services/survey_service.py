@@ -12,6 +12,7 @@ from apps.integrations.models import SlackIntegration
 from apps.integrations.services.ai_detection import detect_ai_coauthor
 from apps.metrics.models import PRSurvey, PRSurveyReview, PullRequest, TeamMember
 from apps.metrics.services import survey_tokens
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 
 
 class AccuracyStats(TypedDict):
@@ -82,6 +83,7 @@ def record_author_response(
     survey.author_responded_at = timezone.now()
     survey.author_response_source = response_source
     survey.save()
+    bump_team_data_version(survey.team_id)
 
 
 def create_reviewer_survey(survey: PRSurvey, reviewer: TeamMember) -> PRSurveyReview:
@@ -117,6 +119,7 @@ def record_reviewer_response(
         survey_review.guess_correct = ai_guess == survey_review.survey.author_ai_assisted
 
     survey_review.save()
+    bump_team_data_version(survey_review.team_id)
 
 
 def record_reviewer_quality_vote(
@@ -140,6 +143,7 @@ def record_reviewer_quality_vote(
     survey_review.response_source = response_source
     # ai_guess is NOT set - reviewer can optionally provide on thank you page
     survey_review.save()
+    bump_team_data_version(survey_review.team_id)
 
 
 def check_and_send_reveal(survey: PRSurvey, survey_review: PRSurveyReview) -> bool:
@@ -19,16 +19,24 @@ from apps.metrics.insights.rules import (
     UnlinkedPRsRule,
 )
 from apps.metrics.models import PullRequest
+from apps.metrics.models.pull_requests import RESOLVED_FIELDS
 from apps.metrics.prompts.constants import PROMPT_VERSION
+from apps.metrics.services.dashboard_cache import bump_team_data_version
 from apps.metrics.services.insight_llm import (
     cache_insight,
     gather_insight_data,
+    gather_insight_data_for_windows,
     generate_insight,
 )
+from apps.metrics.services.llm_executor import LLMExecutor, LLMOutcome, estimate_prompt_tokens
 from apps.metrics.services.llm_prompts import (
+    LLM_ANALYSIS_MODEL,
+    build_llm_pr_context,
+    get_llm_input_hash,
     get_system_prompt,
     get_user_prompt,
 )
+from apps.metrics.services.pr_daily_facts import refresh_daily_facts_for_prs
 from apps.teams.models import Team
 
 logger = logging.getLogger(__name__)
@@ -173,18 +181,16 @@ def generate_team_llm_insights(team_id: int, days_list: list[int] | None = None)
     generated = []
     errors = []
 
-    for days in days_list:
-        try:
-            start_date = today - timedelta(days=days)
-            end_date = today
-
-            # Gather metrics data for the team
-            data = gather_insight_data(
-                team=team,
-                start_date=start_date,
-                end_date=end_date,
-            )
+    # All windows end today, so their PR metrics come from one scan of the longest window
+    try:
+        window_data = gather_insight_data_for_windows(team=team, end_date=today, days_list=days_list)
+    except Exception as e:
+        logger.exception(f"Failed to gather insight data for team {team.name}: {e}")
+        window_data = {}
+        errors.extend({"days": days, "error": str(e)} for days in days_list)
 
+    for days, data in window_data.items():
+        try:
             # Generate insight using LLM
             insight = generate_insight(data)
 
@@ -236,14 +242,67 @@ def Groq(*args, **kwargs):
     return GroqClient(*args, **kwargs)
 
 
+def _build_llm_user_prompt(pr: PullRequest) -> str:
+    """Build the full-context user prompt for a PR (uses prefetched relations)."""
+    # Extract related data (v6.1.0) - use prefetch cache, not values_list
+    file_paths = [f.filename for f in pr.files.all()]
+    commit_messages = [c.message for c in pr.commits.all()]
+    reviewers = list(set(r.reviewer.display_name for r in pr.reviews.all() if r.reviewer and r.reviewer.display_name))
+
+    return get_user_prompt(
+        pr_body=pr.body or "",
+        pr_title=pr.title or "",
+        additions=pr.additions or 0,
+        deletions=pr.deletions or 0,
+        comment_count=pr.total_comments or 0,
+        state=pr.state or "",
+        labels=pr.labels or [],
+        is_draft=pr.is_draft or False,
+        is_hotfix=pr.is_hotfix or False,
+        is_revert=pr.is_revert or False,
+        cycle_time_hours=pr.cycle_time_hours,
+        review_time_hours=pr.review_time_hours,
+        commits_after_first_review=pr.commits_after_first_review,
+        review_rounds=pr.review_rounds,
+        # v6.1.0 - Additional context
+        file_paths=file_paths,
+        commit_messages=commit_messages,
+        reviewers=reviewers,
+        milestone=pr.milestone_title or None,
+        assignees=pr.assignees or [],
+        linked_issues=[str(i) for i in pr.linked_issues] if pr.linked_issues else [],
+        jira_key=pr.jira_key or None,
+        author_name=pr.author.display_name if pr.author else None,
+    )
+
+
+def _save_llm_summaries(prs: list[PullRequest]) -> None:
+    """Persist llm_summary and derived columns for a batch of analyzed PRs."""
+    for pr in prs:
+        pr.refresh_resolved_fields()
+    PullRequest.objects.bulk_update(  # noqa: TEAM001 - instances loaded for one team
+        prs, ["llm_summary", "llm_summary_version", "llm_input_hash", *RESOLVED_FIELDS]
+    )
+    refresh_daily_facts_for_prs(prs)
+
+
 @shared_task(bind=True, max_retries=2, default_retry_delay=300, soft_time_limit=900, time_limit=960)
-def run_llm_analysis_batch(self, team_id: int, limit: int | None = 50, rate_limit_delay: float = 2.1) -> dict:
+def run_llm_analysis_batch(self, team_id: int, limit: int | None = 50, rate_limit_delay: float | None = None) -> dict:
     """Run LLM analysis on PRs for a team to populate llm_summary.
 
     Processes PRs that either:
     - Don't have llm_summary yet
     - Have an older llm_summary_version than current PROMPT_VERSION
 
+    PRs whose llm_input_hash still matches get_llm_input_hash() (shared with
+    the batch pipeline) are not re-analyzed; their llm_summary_version is just
+    marked current.
+
+    Calls run concurrently through LLMExecutor, limited by LLM_EXECUTOR_CONFIG
+    (requests/min, tokens/min) and the provider's rate-limit headers. Results
+    are saved in batches, so a run cut short by the time limit keeps its
+    progress and the next run picks up the remaining PRs.
+
     Two-Phase Onboarding Support:
         - Phase 1: limit=None processes ALL synced PRs (~150 in 30 days)
         - Nightly batch: limit=50 (default) for incremental processing
@@ -252,7 +311,8 @@ def run_llm_analysis_batch(self, team_id: int, limit: int | None = 50, rate_limi
         self: Celery task instance (bound task)
         team_id: ID of the team to process PRs for
         limit: Maximum PRs to process. None = process all. Default: 50
-        rate_limit_delay: Seconds between API calls (default: 2.1 for 30 req/min)
+        rate_limit_delay: Optional minimum seconds between API calls, converted to
+            a requests/min limit (default: use LLM_EXECUTOR_CONFIG)
 
     Returns:
         Dict with processed count, error count, and skipped count
@@ -282,7 +342,7 @@ def run_llm_analysis_batch(self, team_id: int, limit: int | None = 50, rate_limi
     # Prefetch related data for v6.1.0 - avoid N+1 queries
     prs = list(
         qs.select_related("author")
-        .prefetch_related("files", "commits", "reviews__reviewer")
+        .prefetch_related("files", "commits", "reviews__reviewer", "comments__author")
         .order_by("-pr_created_at")[:limit]
     )
 
@@ -292,81 +352,81 @@ def run_llm_analysis_batch(self, team_id: int, limit: int | None = 50, rate_limi
 
     logger.info(f"Processing {len(prs)} PRs for team {team.name} with LLM analysis")
 
-    # Initialize Groq client
-    client = Groq(api_key=api_key)
+    system_prompt = get_system_prompt()
+    # Prompts are built here because workers must not touch the ORM
+    user_prompts = {pr.id: _build_llm_user_prompt(pr) for pr in prs}
+    input_hashes = {pr.id: get_llm_input_hash(build_llm_pr_context(pr), system_prompt) for pr in prs}
 
-    processed = 0
-    errors = 0
+    # Same input as the stored summary: the response would not change
+    unchanged = [pr for pr in prs if pr.llm_summary and pr.llm_input_hash == input_hashes[pr.id]]
+    if unchanged:
+        for pr in unchanged:
+            pr.llm_summary_version = PROMPT_VERSION
+        PullRequest.objects.bulk_update(unchanged, ["llm_summary_version"])  # noqa: TEAM001 - team-scoped instances
+        logger.info(f"Skipped {len(unchanged)} PRs with unchanged LLM input for team {team.name}")
+    unchanged_ids = {pr.id for pr in unchanged}
+    to_analyze = [pr for pr in prs if pr.id not in unchanged_ids]
+    if not to_analyze:
+        return {"processed": 0, "errors": 0, "skipped": len(prs)}
 
-    for pr in prs:
-        try:
-            # Extract related data (v6.1.0) - use prefetch cache, not values_list
-            file_paths = [f.filename for f in pr.files.all()]
-            commit_messages = [c.message for c in pr.commits.all()]
-            reviewers = list(
-                set(r.reviewer.display_name for r in pr.reviews.all() if r.reviewer and r.reviewer.display_name)
-            )
+    # Initialize Groq client
+    client = Groq(api_key=api_key)
 
-            # Build user prompt with full PR context
-            user_prompt = get_user_prompt(
-                pr_body=pr.body or "",
-                pr_title=pr.title or "",
-                additions=pr.additions or 0,
-                deletions=pr.deletions or 0,
-                comment_count=pr.total_comments or 0,
-                state=pr.state or "",
-                labels=pr.labels or [],
-                is_draft=pr.is_draft or False,
-                is_hotfix=pr.is_hotfix or False,
-                is_revert=pr.is_revert or False,
-                cycle_time_hours=pr.cycle_time_hours,
-                review_time_hours=pr.review_time_hours,
-                commits_after_first_review=pr.commits_after_first_review,
-                review_rounds=pr.review_rounds,
-                # v6.1.0 - Additional context
-                file_paths=file_paths,
-                commit_messages=commit_messages,
-                reviewers=reviewers,
-                milestone=pr.milestone_title or None,
-                assignees=pr.assignees or [],
-                linked_issues=[str(i) for i in pr.linked_issues] if pr.linked_issues else [],
-                jira_key=pr.jira_key or None,
-                author_name=pr.author.display_name if pr.author else None,
-            )
+    def call(pr: PullRequest):
+        # Raw response: its rate-limit headers keep the executor's limiter in step
+        return client.chat.completions.with_raw_response.create(
+            model=LLM_ANALYSIS_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompts[pr.id]},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0,
+            max_tokens=800,
+        )
 
-            # Call Groq API
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": get_system_prompt()},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0,
-                max_tokens=800,
-            )
+    def parse(response) -> dict:
+        return json.loads(response.choices[0].message.content)
 
-            # Parse and store response
-            content = response.choices[0].message.content
-            llm_summary = json.loads(content)
+    processed = 0
+    errors = 0
 
-            pr.llm_summary = llm_summary
+    def on_flush(outcomes: list[LLMOutcome]) -> None:
+        nonlocal processed, errors
+        analyzed = []
+        for outcome in outcomes:
+            pr = outcome.item
+            if not outcome.ok:
+                logger.warning(f"Error processing PR #{pr.github_pr_id}: {outcome.error}")
+                errors += 1
+                continue
+            pr.llm_summary = outcome.value
             pr.llm_summary_version = PROMPT_VERSION
-            pr.save(update_fields=["llm_summary", "llm_summary_version"])
-
-            processed += 1
+            pr.llm_input_hash = input_hashes[pr.id]
+            analyzed.append(pr)
             logger.debug(f"Processed PR #{pr.github_pr_id}: {pr.title[:50]}")
+        if analyzed:
+            _save_llm_summaries(analyzed)
+            processed += len(analyzed)
+
+    requests_per_minute = int(60 / rate_limit_delay) if rate_limit_delay else None
+    executor = LLMExecutor.from_settings(requests_per_minute=requests_per_minute)
+    started = time.monotonic()
+    executor.run(
+        to_analyze,
+        call,
+        parse=parse,
+        estimate_tokens=lambda pr: estimate_prompt_tokens(system_prompt, user_prompts[pr.id], max_tokens=800),
+        on_flush=on_flush,
+        progress_key=f"llm_analysis_progress:{team.id}",
+    )
 
-            # Rate limiting
-            time.sleep(rate_limit_delay)
-
-        except Exception as e:
-            logger.warning(f"Error processing PR #{pr.github_pr_id}: {e}")
-            errors += 1
-            # Back off on errors
-            time.sleep(rate_limit_delay * 2)
-
-    logger.info(f"LLM analysis complete for team {team.name}: {processed} processed, {errors} errors")
+    logger.info(
+        f"LLM analysis complete for team {team.name}: {processed} processed, {errors} errors "
+        f"in {time.monotonic() - started:.1f}s"
+    )
+    if processed:
+        bump_team_data_version(team.id)
     return {"processed": processed, "errors": errors, "skipped": len(prs) - processed - errors}
 
 
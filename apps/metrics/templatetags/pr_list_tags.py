@@ -37,19 +37,25 @@ def ai_tools_display(ai_tools_detected: list[str]) -> str:
 
 
 @register.simple_tag(takes_context=True)
-def pagination_url(context, page_number):
+def pagination_url(context, page_number, cursor=None):
     """Build pagination URL preserving current filters.
 
     Args:
         context: Template context with request
-        page_number: Page number to link to
+        page_number: Page number to link to (shown as "Page N")
+        cursor: Keyset cursor for the target page (page_obj.next_cursor or
+            page_obj.previous_cursor); without one the page is found by offset
 
     Returns:
-        URL query string with all filters and new page number
+        URL query string with all filters, the page number and cursor
     """
     request = context["request"]
     query_dict = request.GET.copy()
     query_dict["page"] = page_number
+    if cursor:
+        query_dict["cursor"] = cursor
+    else:
+        query_dict.pop("cursor", None)
     return f"?{query_dict.urlencode()}"
 
 
@@ -77,8 +83,9 @@ def sort_url(context, field):
     else:
         query_dict["order"] = "desc"
 
-    # Reset to first page on sort change
+    # Reset to first page on sort change (cursors are tied to the sort order)
     query_dict["page"] = "1"
+    query_dict.pop("cursor", None)
 
     return f"?{query_dict.urlencode()}"
 
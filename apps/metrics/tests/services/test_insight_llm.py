@@ -791,3 +791,67 @@ class TestGatherInsightDataWithJira(TestCase):
 
         self.assertIn("pr_correlation", result["jira"])
         self.assertIn("linkage_rate", result["jira"]["pr_correlation"])
+
+
+class TestGatherInsightDataForWindows(TestCase):
+    """Tests for gather_insight_data_for_windows function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from apps.metrics.factories import PRReviewFactory
+
+        self.team = TeamFactory()
+        self.alice = TeamMemberFactory(team=self.team, display_name="Alice", github_username="alice")
+        self.bob = TeamMemberFactory(team=self.team, display_name="Bob", github_username="bob")
+        self.bot = TeamMemberFactory(team=self.team, display_name="Deps", github_username="dependabot[bot]")
+        self.end_date = date(2024, 3, 31)
+
+        for day, author, cycle_time, is_revert, jira_key in [
+            (date(2024, 3, 30), self.alice, "24.0", False, "PROJ-1"),
+            (date(2024, 3, 29), self.alice, "8.0", False, ""),
+            (date(2024, 3, 27), self.bob, "12.0", True, ""),
+            (date(2024, 3, 20), self.alice, "36.0", False, ""),
+            (date(2024, 3, 10), self.bot, "2.0", False, ""),
+            (date(2024, 2, 25), self.bob, "48.0", False, "PROJ-2"),
+            (date(2024, 2, 5), self.alice, "6.0", False, ""),
+        ]:
+            pr = PullRequestFactory(
+                team=self.team,
+                author=author,
+                state="merged",
+                merged_at=timezone.make_aware(timezone.datetime(day.year, day.month, day.day, 12, 0)),
+                cycle_time_hours=Decimal(cycle_time),
+                review_time_hours=Decimal("4.0"),
+                is_revert=is_revert,
+                jira_key=jira_key,
+            )
+            PRReviewFactory(team=self.team, pull_request=pr, reviewer=self.bob if author == self.alice else self.alice)
+
+    def test_matches_gather_insight_data_per_window(self):
+        """Each window equals gather_insight_data over the same period."""
+        from datetime import timedelta
+
+        from apps.metrics.services.insight_llm import gather_insight_data, gather_insight_data_for_windows
+
+        result = gather_insight_data_for_windows(self.team, self.end_date, [7, 30])
+
+        self.assertEqual(set(result), {7, 30})
+        for days, data in result.items():
+            expected = gather_insight_data(self.team, self.end_date - timedelta(days=days), self.end_date)
+            self.assertEqual(data, expected, f"{days}-day window differs")
+
+    def test_top_contributors_exclude_bots(self):
+        """Bot authors are left out of the per-window top contributors."""
+        from apps.metrics.services.insight_llm import gather_insight_data_for_windows
+
+        result = gather_insight_data_for_windows(self.team, self.end_date, [30])
+
+        usernames = [c["github_username"] for c in result[30]["team_health"]["top_contributors"]]
+        self.assertEqual(usernames, ["alice", "bob"])
+
+    def test_empty_days_list(self):
+        """No windows means no data and no queries."""
+        from apps.metrics.services.insight_llm import gather_insight_data_for_windows
+
+        with self.assertNumQueries(0):
+            self.assertEqual(gather_insight_data_for_windows(self.team, self.end_date, []), {})
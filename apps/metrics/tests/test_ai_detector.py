@@ -8,8 +8,11 @@ These tests define the expected behavior for:
 - parse_co_authors(message) - extract AI co-authors from commit messages
 """
 
+import re
+
 from django.test import TestCase
 
+from apps.metrics.management.commands.benchmark_ai_detection import _reference_matches, load_corpus
 from apps.metrics.services.ai_detector import (
     detect_ai_author,
     detect_ai_in_text,
@@ -1127,3 +1130,80 @@ class TestSharedBotUsernamePatterns(TestCase):
             _is_bot_username("graphite-app"),
             "'graphite-app' should be caught by _is_bot_username after pattern consolidation",
         )
+
+
+class TestPatternMatcher(TestCase):
+    """Tests for the literal-prefiltered PatternMatcher behind detect_ai_in_text()."""
+
+    def test_required_literals(self):
+        """Literals are derived from literal runs and alternations."""
+        from apps.metrics.services.ai_detector import required_literals
+
+        self.assertEqual(required_literals(r"generated\s+by\s+cursor"), ("generated",))
+        self.assertEqual(required_literals(r"\b(?:sonnet|opus)\s+\d+"), ("sonnet", "opus"))
+        self.assertIsNone(required_literals(r"\d+\s+\w+"))
+
+    def test_matches_without_private_regex_parser(self):
+        """Without re._parser no literals are derived and every regex runs."""
+        from unittest.mock import patch
+
+        from apps.metrics.services.ai_detector import PatternMatcher, required_literals
+
+        with patch("apps.metrics.services.ai_detector.sre_parse", None):
+            self.assertIsNone(required_literals(r"generated\s+by\s+cursor"))
+            matcher = PatternMatcher([(r"generated\s+by\s+cursor", "cursor")])
+
+        self.assertEqual(matcher.match("Generated by Cursor"), ["cursor"])
+
+    def test_matches_reference_loop_on_corpus(self):
+        """Results match searching every pattern in order, on real PR bodies."""
+        from apps.metrics.services.ai_detector import _NEGATIVE_DISCLOSURE_PATTERNS
+        from apps.metrics.services.ai_patterns import AI_CO_AUTHOR_PATTERNS, AI_SIGNATURE_PATTERNS
+
+        signatures = [(re.compile(p, re.IGNORECASE), ai_type) for p, ai_type in AI_SIGNATURE_PATTERNS]
+        co_authors = [(re.compile(p, re.IGNORECASE), ai_type) for p, ai_type in AI_CO_AUTHOR_PATTERNS]
+        negative = [re.compile(p, re.IGNORECASE) for p in _NEGATIVE_DISCLOSURE_PATTERNS]
+        texts, messages = load_corpus()
+        texts += ["clauNo AI was usedde code", "ſonnet 4 helped", "İDE: Cursor", "Generated with Claude Code"]
+
+        for text in texts:
+            with self.subTest(text=text[:60]):
+                expected = _reference_matches(text, signatures, negative)
+                self.assertEqual(detect_ai_in_text(text)["ai_tools"], expected)
+        for message in messages:
+            with self.subTest(message=message[:60]):
+                self.assertEqual(parse_co_authors(message)["ai_co_authors"], _reference_matches(message, co_authors))
+
+    def test_reports_every_tool_in_overlapping_matches(self):
+        """Overlapping signatures for different tools are all reported."""
+        result = detect_ai_in_text("Generated with Claude Code using Claude Sonnet 4.5")
+        self.assertEqual(result["ai_tools"], ["claude_code", "claude"])
+
+
+class TestBatchDetection(TestCase):
+    """Tests for detect_ai_in_texts() and parse_co_authors_in_messages()."""
+
+    def test_detect_ai_in_texts_matches_single_calls(self):
+        """Batch results equal per-text results, in input order."""
+        from apps.metrics.services.ai_detector import detect_ai_in_texts
+
+        texts = ["Generated with Claude Code", None, "Fixed a bug", "", "Used Cursor IDE", "Generated with Claude Code"]
+
+        self.assertEqual(detect_ai_in_texts(texts), [detect_ai_in_text(t) for t in texts])
+
+    def test_duplicate_texts_get_independent_results(self):
+        """Memoized duplicates do not share mutable tool lists."""
+        from apps.metrics.services.ai_detector import detect_ai_in_texts
+
+        first, second = detect_ai_in_texts(["Used Cursor IDE", "Used Cursor IDE"])
+        first["ai_tools"].append("copilot")
+
+        self.assertEqual(second["ai_tools"], ["cursor"])
+
+    def test_parse_co_authors_in_messages(self):
+        """Batch co-author parsing equals per-message parsing."""
+        from apps.metrics.services.ai_detector import parse_co_authors_in_messages
+
+        messages = ["Fix bug\n\nCo-Authored-By: Claude <noreply@anthropic.com>", "Fix bug", None]
+
+        self.assertEqual(parse_co_authors_in_messages(messages), [parse_co_authors(m) for m in messages])
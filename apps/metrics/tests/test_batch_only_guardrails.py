@@ -2,7 +2,7 @@
 
 Policy (agreed 2026-03-26):
 1. No on-demand Groq API calls for public data — only Batch API
-2. Never reprocess already-analyzed PRs — only llm_summary IS NULL
+2. Never reprocess already-analyzed PRs whose LLM input is unchanged (llm_input_hash)
 3. Scheduled tasks must use batch processing, not individual API calls
 """
 
@@ -100,16 +100,17 @@ class TestNoOnDemandGroqInScheduledTasks(TestCase):
 
 
 class TestBatchTaskOnlyProcessesNewPRs(TestCase):
-    """Guardrail: batch task must only process PRs with null llm_summary."""
+    """Guardrail: batch task must only process new PRs or PRs whose LLM input changed."""
 
-    def test_queue_llm_analysis_batch_task_filters_null_only(self):
-        """The batch task must filter llm_summary__isnull=True."""
+    def test_queue_llm_analysis_batch_task_gates_reprocessing_on_input_hash(self):
+        """Outdated summaries must pass the llm_input_hash gate before being re-submitted."""
         from apps.integrations._task_modules.metrics import queue_llm_analysis_batch_task
 
         source = inspect.getsource(queue_llm_analysis_batch_task)
         assert "llm_summary__isnull=True" in source
-        # Must NOT have version-based reprocessing
-        assert "llm_summary_version" not in source.split("prs_to_process")[0]
+        # Version-based reprocessing only behind the input hash gate
+        submit_section = source.split("submit_batch_with_fallback")[0]
+        assert "llm_input_hash == processor.input_hash(pr)" in submit_section
 
     def test_batch_task_saves_version_metadata(self):
         """The batch task must save llm_summary_version alongside llm_summary."""
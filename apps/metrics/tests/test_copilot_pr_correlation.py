@@ -275,3 +275,61 @@ class TestCopilotPRCorrelation(TestCase):
 
         # Assert
         self.assertEqual(updated_count, 2)
+
+    def test_correlation_limited_to_date_window(self):
+        """Test that start_date/end_date restrict correlation to PRs created in the synced window."""
+        # Arrange - Copilot usage on two days, one PR on each day
+        last_week = self.today - timedelta(days=7)
+        for usage_date in (self.today, last_week):
+            AIUsageDailyFactory(team=self.team, member=self.member, date=usage_date, source="copilot")
+        pr_today = PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            pr_created_at=timezone.now().replace(hour=12, minute=0, second=0, microsecond=0),
+            is_ai_assisted=None,
+        )
+        pr_last_week = PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            pr_created_at=timezone.now().replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=7),
+            is_ai_assisted=None,
+        )
+
+        # Act
+        updated_count = correlate_prs_with_copilot_usage(
+            team=self.team, start_date=self.today - timedelta(days=1), end_date=self.today
+        )
+
+        # Assert
+        pr_today.refresh_from_db()
+        pr_last_week.refresh_from_db()
+        self.assertEqual(updated_count, 1)
+        self.assertTrue(pr_today.is_ai_assisted)
+        self.assertIsNone(pr_last_week.is_ai_assisted)
+
+    def test_correlation_counts_only_changed_prs_and_refreshes_resolved_fields(self):
+        """Test that already-correlated PRs are not counted and resolved fields follow the update."""
+        # Arrange
+        AIUsageDailyFactory(team=self.team, member=self.member, date=self.today, source="copilot")
+        pr_datetime = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        pr = PullRequestFactory(
+            team=self.team, author=self.member, pr_created_at=pr_datetime, is_ai_assisted=None, ai_tools_detected=[]
+        )
+        PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            pr_created_at=pr_datetime,
+            is_ai_assisted=True,
+            ai_tools_detected=["copilot"],
+        )
+
+        # Act
+        first_count = correlate_prs_with_copilot_usage(team=self.team)
+        second_count = correlate_prs_with_copilot_usage(team=self.team)
+
+        # Assert
+        pr.refresh_from_db()
+        self.assertEqual((first_count, second_count), (1, 0))
+        self.assertEqual(pr.ai_tools_detected, ["copilot"])
+        self.assertTrue(pr.resolved_is_ai_assisted)
+        self.assertEqual(pr.resolved_ai_tools, ["copilot"])
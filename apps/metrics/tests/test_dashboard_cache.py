@@ -0,0 +1,145 @@
+"""Tests for the versioned dashboard cache.
+
+Run with: pytest apps/metrics/tests/test_dashboard_cache.py -v
+"""
+
+from datetime import date
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.metrics.factories import PRSurveyFactory, PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.services import dashboard_service
+from apps.metrics.services.dashboard_cache import (
+    bump_team_data_version,
+    get_dashboard_cache_stats,
+    get_team_data_version,
+)
+from apps.metrics.services.survey_service import record_author_response
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestDashboardCache(TestCase):
+    """Tests for @dashboard_cached service functions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.team = TeamFactory()
+        self.member = TeamMemberFactory(team=self.team)
+        self.start_date = date(2024, 1, 1)
+        self.end_date = date(2024, 1, 31)
+        self._merge_pr()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        cache.clear()
+
+    def _merge_pr(self):
+        return PullRequestFactory(
+            team=self.team,
+            author=self.member,
+            state="merged",
+            merged_at=timezone.make_aware(timezone.datetime(2024, 1, 15, 12, 0)),
+        )
+
+    def test_cache_hit_uses_no_queries(self):
+        """A repeated call with the same arguments should not hit the database."""
+        first = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+
+        with self.assertNumQueries(0):
+            second = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+
+        self.assertEqual(first, second)
+
+    def test_different_arguments_have_separate_entries(self):
+        """Different repo filters should not share a cache entry."""
+        all_repos = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+        other_repo = dashboard_service.get_revert_hotfix_stats(
+            self.team, self.start_date, self.end_date, repo="acme/none"
+        )
+
+        self.assertEqual(all_repos["total_prs"], 1)
+        self.assertEqual(other_repo["total_prs"], 0)
+
+    def test_version_bump_invalidates_entries(self):
+        """Bumping the team data version should recompute results."""
+        before = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+        self._merge_pr()
+
+        stale = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+        bump_team_data_version(self.team.id)
+        fresh = dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+
+        self.assertEqual(before["total_prs"], 1)
+        self.assertEqual(stale["total_prs"], 1)
+        self.assertEqual(fresh["total_prs"], 2)
+
+    def test_bump_only_affects_one_team(self):
+        """Bumping one team's version should not change another team's version."""
+        other_team = TeamFactory()
+        other_version = get_team_data_version(other_team.id)
+        version = get_team_data_version(self.team.id)
+
+        bump_team_data_version(self.team.id)
+
+        self.assertNotEqual(get_team_data_version(self.team.id), version)
+        self.assertEqual(get_team_data_version(other_team.id), other_version)
+
+    def test_survey_response_bumps_version(self):
+        """Recording a survey response should invalidate the team's dashboards."""
+        survey = PRSurveyFactory(team=self.team, pull_request=self._merge_pr(), author=self.member)
+        version = get_team_data_version(self.team.id)
+
+        record_author_response(survey, ai_assisted=True)
+
+        self.assertNotEqual(get_team_data_version(self.team.id), version)
+
+    def test_time_dependent_results_are_not_cached(self):
+        """Open-PR stats depend on the current time and should be recomputed every call."""
+        dashboard_service.get_open_prs_stats(self.team)
+        PullRequestFactory(team=self.team, author=self.member, state="open", is_draft=False)
+
+        stats = dashboard_service.get_open_prs_stats(self.team)
+
+        self.assertEqual(stats["total_open"], 1)
+
+    def test_hits_and_misses_are_counted(self):
+        """Stats should report hits and misses per function."""
+        dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+        dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+
+        stats = get_dashboard_cache_stats()["get_revert_hotfix_stats"]
+
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 50.0)
+
+    def test_stats_command_reports_and_resets(self):
+        """dashboard_cache_stats should print counters and reset them."""
+        dashboard_service.get_revert_hotfix_stats(self.team, self.start_date, self.end_date)
+
+        out = StringIO()
+        call_command("dashboard_cache_stats", reset=True, stdout=out)
+
+        self.assertIn("get_revert_hotfix_stats", out.getvalue())
+        self.assertEqual(get_dashboard_cache_stats()["get_revert_hotfix_stats"]["misses"], 0)
+
+
+class TestDashboardCacheWithoutBackend(TestCase):
+    """Tests that the cache degrades to direct calls with DummyCache."""
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def test_dummy_cache_computes_every_time(self):
+        """With DummyCache, results are computed on every call without errors."""
+        team = TeamFactory()
+
+        result = dashboard_service.get_revert_hotfix_stats(team, date(2024, 1, 1), date(2024, 1, 31))
+
+        self.assertEqual(result["total_prs"], 0)
+        self.assertIsNotNone(bump_team_data_version(team.id))
@@ -0,0 +1,96 @@
+"""Tests for the shared insight MetricContext."""
+
+from datetime import date, datetime, time, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import PRSurveyFactory, PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.insights.context import MERGED_PR_DAYS, MetricContext
+from apps.metrics.insights.engine import InsightRule, clear_rules, compute_insights, register_rule
+from apps.metrics.insights.rules import get_current_week_range, get_previous_weeks_range
+from apps.metrics.services.dashboard_service import get_ai_adoption_trend, get_revert_hotfix_stats
+
+
+class TestMetricContext(TestCase):
+    """MetricContext derives the rules' PR windows from a single scan."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        self.member = TeamMemberFactory(team=self.team)
+        self.target_date = date(2024, 2, 1)
+        for days_ago, is_hotfix, is_revert, jira_key, ai in [
+            (0, True, False, "", True),
+            (3, False, True, "PROJ-1", False),
+            (10, True, False, "", None),
+            (20, False, False, "", True),
+            (30, True, True, "PROJ-2", False),
+        ]:
+            merged_at = timezone.make_aware(datetime.combine(self.target_date - timedelta(days=days_ago), time(12)))
+            pr = PullRequestFactory(
+                team=self.team,
+                author=self.member,
+                state="merged",
+                merged_at=merged_at,
+                is_hotfix=is_hotfix,
+                is_revert=is_revert,
+                jira_key=jira_key,
+            )
+            if ai is not None:
+                PRSurveyFactory(team=self.team, pull_request=pr, author_ai_assisted=ai)
+
+    def test_windows_match_dashboard_services(self):
+        context = MetricContext(self.team, self.target_date)
+        trend_start = self.target_date - timedelta(weeks=4)
+
+        for start, end in (get_current_week_range(self.target_date), get_previous_weeks_range(self.target_date, 4)):
+            totals = context.merged_pr_totals(start, end)
+            stats = get_revert_hotfix_stats(self.team, start, end)
+            self.assertEqual(
+                (totals["total_prs"], totals["revert_count"], totals["hotfix_count"]),
+                (stats["total_prs"], stats["revert_count"], stats["hotfix_count"]),
+            )
+        self.assertEqual(
+            context.ai_adoption_trend(trend_start, self.target_date),
+            get_ai_adoption_trend(self.team, trend_start, self.target_date),
+        )
+        self.assertEqual(context.merged_pr_totals(trend_start, self.target_date)["unlinked_count"], 3)
+
+    def test_pr_windows_share_one_query(self):
+        context = MetricContext(self.team, self.target_date)
+        context.load([MERGED_PR_DAYS])
+
+        with self.assertNumQueries(0):
+            context.merged_pr_totals(*get_current_week_range(self.target_date))
+            context.merged_pr_totals(*get_previous_weeks_range(self.target_date, 4))
+            context.ai_adoption_trend(self.target_date - timedelta(weeks=4), self.target_date)
+
+
+class TestComputeInsightsSharedContext(TestCase):
+    """compute_insights hands every rule the same MetricContext."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        clear_rules()
+
+    def tearDown(self):
+        clear_rules()
+
+    def test_rules_share_one_context(self):
+        contexts = []
+
+        class FirstRule(InsightRule):
+            def evaluate(self, team, target_date):
+                contexts.append(self.get_context(team, target_date))
+                return []
+
+        class SecondRule(FirstRule):
+            pass
+
+        register_rule(FirstRule)
+        register_rule(SecondRule)
+
+        compute_insights(self.team, date(2024, 2, 1))
+
+        self.assertEqual(len(contexts), 2)
+        self.assertIs(contexts[0], contexts[1])
@@ -0,0 +1,112 @@
+"""Tests for keyset (cursor) pagination of the PR explorer."""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import PullRequestFactory, TeamFactory
+from apps.metrics.models import PullRequest
+from apps.metrics.services.keyset_pagination import ESTIMATED_COUNT_THRESHOLD, KeysetPaginator
+from apps.metrics.templatetags.pr_list_tags import pagination_url, sort_url
+
+
+class TestKeysetPaginator(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        now = timezone.now()
+        # Duplicate and NULL cycle times exercise the id tie-break and NULLs-last handling
+        for i in range(7):
+            PullRequestFactory(
+                team=self.team,
+                state="merged",
+                merged_at=now - timedelta(days=i + 1),
+                cycle_time_hours=None if i in (2, 5) else Decimal(i % 3),
+            )
+        self.queryset = PullRequest.objects.filter(team=self.team)  # noqa: TEAM001
+
+    def _expected(self, descending):
+        with_time = sorted(
+            (pr for pr in self.queryset if pr.cycle_time_hours is not None),
+            key=lambda pr: (pr.cycle_time_hours, pr.id),
+            reverse=descending,
+        )
+        without_time = sorted(
+            (pr for pr in self.queryset if pr.cycle_time_hours is None), key=lambda pr: pr.id, reverse=descending
+        )
+        return [pr.id for pr in with_time + without_time]
+
+    def _walk(self, paginator):
+        pages = [paginator.get_page(1)]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_page_number(), cursor=pages[-1].next_cursor))
+        return pages
+
+    def test_forward_walk_matches_full_ordering(self):
+        for descending in (True, False):
+            paginator = KeysetPaginator(self.queryset, "cycle_time_hours", descending=descending, per_page=2)
+
+            pages = self._walk(paginator)
+
+            self.assertEqual([pr.id for page in pages for pr in page], self._expected(descending))
+            self.assertEqual([page.number for page in pages], [1, 2, 3, 4])
+            self.assertEqual(paginator.num_pages, 4)
+
+    def test_backward_walk_returns_previous_pages(self):
+        paginator = KeysetPaginator(self.queryset, "cycle_time_hours", per_page=2)
+        pages = self._walk(paginator)
+
+        page = pages[-1]
+        for expected in reversed(pages[:-1]):
+            page = paginator.get_page(page.previous_page_number(), cursor=page.previous_cursor)
+            self.assertEqual([pr.id for pr in page], [pr.id for pr in expected])
+        self.assertEqual(page.number, 1)
+        self.assertFalse(page.has_previous())
+
+    def test_cursor_page_costs_one_query_without_count(self):
+        paginator = KeysetPaginator(self.queryset, "merged_at", per_page=2, count=7)
+        cursor = paginator.get_page(1).next_cursor
+
+        with self.assertNumQueries(1):
+            page = paginator.get_page(2, cursor=cursor)
+            self.assertEqual(page.paginator.num_pages, 4)
+
+    def test_cursor_for_other_sort_falls_back_to_offset(self):
+        cursor = KeysetPaginator(self.queryset, "merged_at", per_page=2).get_page(1).next_cursor
+        paginator = KeysetPaginator(self.queryset, "cycle_time_hours", per_page=2)
+
+        for token in (cursor, "not-a-cursor"):
+            page = paginator.get_page(2, cursor=token)
+            self.assertEqual([pr.id for pr in page], self._expected(True)[2:4])
+
+    def test_out_of_range_offset_returns_last_page(self):
+        page = KeysetPaginator(self.queryset, "merged_at", per_page=2).get_page(99)
+
+        self.assertEqual((page.number, len(page)), (4, 1))
+
+    def test_large_results_use_planner_estimate(self):
+        paginator = KeysetPaginator(self.queryset, "merged_at", per_page=50)
+
+        with patch(
+            "apps.metrics.services.keyset_pagination.estimate_count", return_value=ESTIMATED_COUNT_THRESHOLD * 4
+        ):
+            self.assertEqual(paginator.count, ESTIMATED_COUNT_THRESHOLD * 4)
+            self.assertTrue(paginator.count_is_estimate)
+
+
+class TestPaginationTags(TestCase):
+    def _context(self, query):
+        return {"request": RequestFactory().get("/", query), "sort": "merged", "order": "desc"}
+
+    def test_pagination_url_sets_or_drops_cursor(self):
+        context = self._context({"repo": "org/repo", "page": "2", "cursor": "old"})
+
+        self.assertEqual(pagination_url(context, 3, "abc"), "?repo=org%2Frepo&page=3&cursor=abc")
+        self.assertEqual(pagination_url(context, 1), "?repo=org%2Frepo&page=1")
+
+    def test_sort_url_resets_page_and_cursor(self):
+        context = self._context({"page": "4", "cursor": "abc"})
+
+        self.assertEqual(sort_url(context, "lines"), "?page=1&sort=lines&order=desc")
@@ -0,0 +1,200 @@
+"""Tests for the rate-limit-aware LLM executor."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.metrics.factories import PullRequestFactory, TeamFactory
+from apps.metrics.services.llm_executor import (
+    LLMExecutor,
+    TokenBucketLimiter,
+    get_progress,
+    parse_reset_duration,
+)
+from apps.metrics.tasks import run_llm_analysis_batch
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK 429 error carrying response headers."""
+
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers)
+
+
+class TestParseResetDuration(SimpleTestCase):
+    def test_parses_provider_formats(self):
+        self.assertEqual(parse_reset_duration("7.66s"), 7.66)
+        self.assertAlmostEqual(parse_reset_duration("2m59.56s"), 179.56)
+        self.assertAlmostEqual(parse_reset_duration("250ms"), 0.25)
+        self.assertEqual(parse_reset_duration("12"), 12.0)
+
+    def test_returns_none_for_missing_or_invalid(self):
+        self.assertIsNone(parse_reset_duration(None))
+        self.assertIsNone(parse_reset_duration("soon"))
+
+
+class TestTokenBucketLimiter(SimpleTestCase):
+    def _limiter(self, rpm, tpm=0):
+        clock = FakeClock()
+        return TokenBucketLimiter(rpm, tpm, clock=clock, sleep=clock.sleep), clock
+
+    def test_burst_up_to_quota_then_paced(self):
+        limiter, clock = self._limiter(rpm=60)
+
+        for _ in range(60):
+            limiter.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(clock.sleeps, [1.0, 1.0])
+
+    def test_token_bucket_limits_large_requests(self):
+        limiter, clock = self._limiter(rpm=1000, tpm=6000)
+
+        limiter.acquire(tokens=6000)
+        limiter.acquire(tokens=3000)
+
+        self.assertEqual(clock.sleeps, [30.0])
+
+    def test_record_usage_returns_overestimated_tokens(self):
+        limiter, clock = self._limiter(rpm=1000, tpm=6000)
+
+        limiter.acquire(tokens=6000)
+        limiter.record_usage(estimated_tokens=6000, actual_tokens=1000)
+        limiter.acquire(tokens=5000)
+
+        self.assertEqual(clock.sleeps, [])
+
+    def test_headers_lower_local_levels(self):
+        limiter, clock = self._limiter(rpm=60)
+
+        limiter.update_from_headers({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "5s"})
+        limiter.acquire()
+
+        self.assertEqual(clock.sleeps, [5.0])
+
+    def test_retry_after_pauses_callers(self):
+        limiter, clock = self._limiter(rpm=60)
+
+        limiter.update_from_headers({"Retry-After": "3"})
+        limiter.acquire()
+
+        self.assertEqual(clock.sleeps, [3.0])
+
+
+class TestLLMExecutor(SimpleTestCase):
+    def _executor(self, **kwargs):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(600, clock=clock, sleep=clock.sleep)
+        return LLMExecutor(limiter, **kwargs)
+
+    def test_runs_calls_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(item):
+            barrier.wait()
+            return item * 2
+
+        outcomes = self._executor(max_workers=3).run([1, 2, 3], call)
+
+        self.assertEqual(sorted(o.value for o in outcomes), [2, 4, 6])
+
+    def test_retries_rate_limited_calls(self):
+        attempts = {"count": 0}
+
+        def call(item):
+            attempts["count"] += 1
+            if attempts["count"] == 1:
+                raise RateLimitError({"retry-after": "1"})
+            return item
+
+        outcomes = self._executor(max_workers=1, max_retries=2).run(["pr"], call)
+
+        self.assertTrue(outcomes[0].ok)
+        self.assertEqual(attempts["count"], 2)
+
+    def test_raw_response_headers_update_limiter_on_success(self):
+        raw = MagicMock()
+        raw.headers = {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"}
+        raw.parse.return_value = SimpleNamespace(usage=None, content="ok")
+        executor = self._executor(max_workers=1)
+
+        outcomes = executor.run(["pr"], lambda item: raw, parse=lambda response: response.content)
+
+        self.assertEqual(outcomes[0].value, "ok")
+        self.assertEqual(executor.limiter.acquire(), 2.0)
+
+    def test_other_errors_fail_item_without_retry(self):
+        call = MagicMock(side_effect=ValueError("bad"))
+
+        outcomes = self._executor(max_workers=1).run(["pr"], call)
+
+        self.assertFalse(outcomes[0].ok)
+        self.assertIsInstance(outcomes[0].error, ValueError)
+        call.assert_called_once()
+
+    def test_flushes_in_batches_on_calling_thread(self):
+        flushed = []
+        caller = threading.current_thread()
+
+        def on_flush(outcomes):
+            self.assertIs(threading.current_thread(), caller)
+            flushed.append(len(outcomes))
+
+        self._executor(max_workers=2, flush_every=2).run(range(5), lambda item: item, on_flush=on_flush)
+
+        self.assertEqual(sum(flushed), 5)
+        self.assertTrue(all(size <= 3 for size in flushed))
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_publishes_progress(self):
+        self._executor().run([1, 2], lambda item: item, progress_key="test-llm-progress")
+
+        progress = get_progress("test-llm-progress")
+        self.assertEqual(progress["total"], 2)
+        self.assertEqual(progress["succeeded"], 2)
+
+
+@patch("apps.metrics.tasks.time.sleep")
+class TestRunLLMAnalysisBatchPersistence(TestCase):
+    """run_llm_analysis_batch persists results in bulk, including derived columns."""
+
+    def test_updates_resolved_fields(self, mock_sleep):
+        team = TeamFactory()
+        pr = PullRequestFactory(team=team, body="Built with help", llm_summary=None, is_ai_assisted=False)
+        response = MagicMock()
+        content = '{"ai": {"is_assisted": true, "tools": ["cursor"], "confidence": 0.9}}'
+        response.choices = [MagicMock(message=MagicMock(content=content))]
+
+        with (
+            patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
+            patch("apps.metrics.tasks.Groq") as mock_groq,
+        ):
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = response
+            result = run_llm_analysis_batch(team_id=team.id, limit=10)
+
+        self.assertEqual(result["processed"], 1)
+        pr.refresh_from_db()
+        self.assertTrue(pr.resolved_is_ai_assisted)
+        self.assertEqual(pr.resolved_ai_tools, ["cursor"])
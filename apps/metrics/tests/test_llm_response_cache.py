@@ -0,0 +1,132 @@
+"""Tests for LLM request fingerprints, the response cache and fingerprint-based skipping."""
+
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.integrations.services.groq_batch import GroqBatchProcessor
+from apps.metrics.factories import PullRequestFactory, TeamFactory
+from apps.metrics.models import PullRequest
+from apps.metrics.prompts.constants import PROMPT_VERSION
+from apps.metrics.services.llm_response_cache import LLMResponseCache, llm_request_fingerprint
+from apps.metrics.tasks import run_llm_analysis_batch
+
+
+class TestLLMRequestFingerprint(SimpleTestCase):
+    def test_stable_for_identical_requests(self):
+        first = llm_request_fingerprint("model", "system", "user", temperature=0, max_tokens=800)
+        second = llm_request_fingerprint("model", "system", "user", max_tokens=800, temperature=0)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 64)
+
+    def test_changes_with_any_input(self):
+        base = llm_request_fingerprint("model", "system", "user")
+
+        self.assertNotEqual(base, llm_request_fingerprint("other-model", "system", "user"))
+        self.assertNotEqual(base, llm_request_fingerprint("model", "other system", "user"))
+        self.assertNotEqual(base, llm_request_fingerprint("model", "system", "other user"))
+        self.assertNotEqual(base, llm_request_fingerprint("model", "system", "user", temperature=1))
+
+
+class TestLLMResponseCache(SimpleTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = LLMResponseCache(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_miss_then_hit(self):
+        key = llm_request_fingerprint("model", "system", "user")
+
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(key, '{"ai": {}}')
+
+        self.assertEqual(self.cache.get(key), '{"ai": {}}')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_get_or_create_calls_once(self):
+        key = llm_request_fingerprint("model", "system", "user")
+        call = MagicMock(return_value="content")
+
+        self.assertEqual(self.cache.get_or_create(key, call), "content")
+        self.assertEqual(self.cache.get_or_create(key, call), "content")
+
+        call.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        key = llm_request_fingerprint("model", "system", "user")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_create(key, MagicMock(side_effect=RuntimeError("API down")))
+
+        self.assertIsNone(self.cache.get(key))
+
+
+@patch("apps.metrics.tasks.time.sleep")
+class TestRunLLMAnalysisBatchInputHash(TestCase):
+    """run_llm_analysis_batch skips PRs whose LLM input is unchanged."""
+
+    def setUp(self):
+        self.team = TeamFactory()
+        self.response = MagicMock()
+        self.response.choices = [MagicMock(message=MagicMock(content='{"ai": {"is_assisted": false}}'))]
+
+    def _run(self):
+        with (
+            patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
+            patch("apps.metrics.tasks.Groq") as mock_groq,
+        ):
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self.response
+            )
+            result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
+        return result, mock_groq.return_value.chat.completions.with_raw_response.create
+
+    def test_stores_input_hash(self, mock_sleep):
+        pr = PullRequestFactory(team=self.team, body="Some change", llm_summary=None)
+
+        self._run()
+
+        pr.refresh_from_db()
+        self.assertEqual(len(pr.llm_input_hash), 64)
+
+    def test_unchanged_input_is_not_reanalyzed(self, mock_sleep):
+        pr = PullRequestFactory(team=self.team, body="Some change", llm_summary=None)
+        self._run()
+        pr.refresh_from_db()
+        pr.llm_summary_version = "0.0.1"
+        pr.save(update_fields=["llm_summary_version"])
+
+        result, create = self._run()
+
+        create.assert_not_called()
+        self.assertEqual(result, {"processed": 0, "errors": 0, "skipped": 1})
+        pr.refresh_from_db()
+        self.assertEqual(pr.llm_summary_version, PROMPT_VERSION)
+
+    def test_changed_input_is_reanalyzed(self, mock_sleep):
+        pr = PullRequestFactory(team=self.team, body="Some change", llm_summary=None)
+        self._run()
+        pr.refresh_from_db()
+        pr.body = "Rewritten description"
+        pr.llm_summary_version = "0.0.1"
+        pr.save(update_fields=["body", "llm_summary_version"])
+
+        result, create = self._run()
+
+        create.assert_called_once()
+        self.assertEqual(result["processed"], 1)
+
+    def test_hash_matches_batch_processor(self, mock_sleep):
+        """A summary written by the real-time task must pass the batch pipeline's gate too."""
+        pr = PullRequestFactory(team=self.team, body="Some change", llm_summary=None)
+        self._run()
+
+        pr = PullRequest.objects.prefetch_related("files", "commits", "reviews__reviewer", "comments__author").get(
+            id=pr.id
+        )
+
+        self.assertEqual(pr.llm_input_hash, GroqBatchProcessor(api_key="test-key").input_hash(pr))
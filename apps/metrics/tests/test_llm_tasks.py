@@ -46,7 +46,7 @@ class TestRunLLMAnalysisBatchTask(TestCase):
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
         # Should not call API for already-analyzed PR
-        mock_groq.return_value.chat.completions.create.assert_not_called()
+        mock_groq.return_value.chat.completions.with_raw_response.create.assert_not_called()
         self.assertEqual(result["processed"], 0)
 
     def test_processes_prs_without_llm_summary(self, mock_sleep):
@@ -73,7 +73,9 @@ class TestRunLLMAnalysisBatchTask(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = mock_response
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                mock_response
+            )
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
         self.assertEqual(result["processed"], 1)
@@ -109,7 +111,9 @@ class TestRunLLMAnalysisBatchTask(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = mock_response
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                mock_response
+            )
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
         self.assertEqual(result["processed"], 1)
@@ -129,7 +133,7 @@ class TestRunLLMAnalysisBatchTask(TestCase):
         ):
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
-        mock_groq.return_value.chat.completions.create.assert_not_called()
+        mock_groq.return_value.chat.completions.with_raw_response.create.assert_not_called()
         self.assertEqual(result["processed"], 0)
 
     def test_respects_limit_parameter(self, mock_sleep):
@@ -147,12 +151,14 @@ class TestRunLLMAnalysisBatchTask(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = mock_response
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                mock_response
+            )
             result = run_llm_analysis_batch(team_id=self.team.id, limit=2)
 
         # Should only process 2 PRs
         self.assertEqual(result["processed"], 2)
-        self.assertEqual(mock_groq.return_value.chat.completions.create.call_count, 2)
+        self.assertEqual(mock_groq.return_value.chat.completions.with_raw_response.create.call_count, 2)
 
     def test_handles_api_errors_gracefully(self, mock_sleep):
         """API errors are caught and counted."""
@@ -162,7 +168,7 @@ class TestRunLLMAnalysisBatchTask(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.side_effect = Exception("API Error")
+            mock_groq.return_value.chat.completions.with_raw_response.create.side_effect = Exception("API Error")
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
         self.assertEqual(result["processed"], 0)
@@ -223,7 +229,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -244,7 +252,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -267,7 +277,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -294,7 +306,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -312,7 +326,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -333,7 +349,9 @@ class TestLLMTaskDataExtraction(TestCase):
             patch("apps.metrics.tasks.Groq") as mock_groq,
             patch("apps.metrics.tasks.get_user_prompt") as mock_prompt,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             mock_prompt.return_value = "mocked prompt"
             result = run_llm_analysis_batch(team_id=self.team.id, limit=10)
 
@@ -376,12 +394,14 @@ class TestLLMBatchLimitNone(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             result = run_llm_analysis_batch(team_id=self.team.id, limit=None)
 
         # Should process ALL 10 PRs
         self.assertEqual(result["processed"], 10)
-        self.assertEqual(mock_groq.return_value.chat.completions.create.call_count, 10)
+        self.assertEqual(mock_groq.return_value.chat.completions.with_raw_response.create.call_count, 10)
 
     def test_limit_none_works_with_many_prs(self, mock_sleep):
         """limit=None should handle more PRs than default limit of 50."""
@@ -393,7 +413,9 @@ class TestLLMBatchLimitNone(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             result = run_llm_analysis_batch(team_id=self.team.id, limit=None)
 
         # Should process ALL 60 PRs
@@ -409,7 +431,9 @@ class TestLLMBatchLimitNone(TestCase):
             patch.dict("os.environ", {"GROQ_API_KEY": "test-key"}),
             patch("apps.metrics.tasks.Groq") as mock_groq,
         ):
-            mock_groq.return_value.chat.completions.create.return_value = self._mock_response()
+            mock_groq.return_value.chat.completions.with_raw_response.create.return_value.parse.return_value = (
+                self._mock_response()
+            )
             result = run_llm_analysis_batch(team_id=self.team.id)  # No limit specified
 
         # Should only process 50 (default limit)
@@ -0,0 +1,50 @@
+"""Tests for the per-sync TeamMember identity resolver."""
+
+from django.test import TestCase
+
+from apps.metrics.factories import TeamFactory, TeamMemberFactory
+from apps.metrics.models import TeamMember
+from apps.metrics.services.member_resolver import TeamMemberResolver
+
+
+class TestTeamMemberResolver(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        self.member = TeamMemberFactory(
+            team=self.team,
+            github_username="alice",
+            github_id="1001",
+            jira_account_id="jira-alice",
+            email="Alice@Example.com",
+        )
+        TeamMemberFactory(team=TeamFactory(), github_username="bob", github_id="2002")
+
+    def test_resolves_every_identity_with_one_query(self):
+        members = TeamMemberResolver(self.team.id)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(members.by_login("alice"), self.member)
+            self.assertEqual(members.by_github_id(1001), self.member)
+            self.assertEqual(members.by_github_id("1001"), self.member)
+            self.assertEqual(members.by_jira_account_id("jira-alice"), self.member)
+            self.assertEqual(members.by_email("alice@example.com"), self.member)
+            self.assertIsNone(members.by_login("nobody"))
+            self.assertIsNone(members.by_github_id(None))
+
+    def test_is_team_scoped(self):
+        members = TeamMemberResolver(self.team.id)
+
+        self.assertIsNone(members.by_login("bob"))
+        self.assertIsNone(members.by_github_id("2002"))
+
+    def test_ensure_logins_bulk_creates_missing_members(self):
+        members = TeamMemberResolver(self.team.id)
+
+        resolved = members.ensure_logins(["alice", "carol", "dave", None])
+
+        self.assertEqual(set(resolved), {"alice", "carol", "dave"})
+        self.assertEqual(resolved["alice"], self.member)
+        self.assertEqual(TeamMember.objects.get(team=self.team, github_username="carol").display_name, "carol")
+        with self.assertNumQueries(0):
+            self.assertEqual(members.by_login("dave"), resolved["dave"])
+            members.ensure_logins(["alice", "carol"])
@@ -0,0 +1,176 @@
+"""Tests for the DailyPRFact rollup.
+
+Run with: pytest apps/metrics/tests/test_pr_daily_facts.py -v
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.models import DailyPRFact, PullRequest
+from apps.metrics.services.pr_daily_facts import get_fact_histograms, get_fact_series, rebuild_daily_facts
+
+
+def _merged_at(day: date, hour: int = 12) -> datetime:
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()).replace(hour=hour))
+
+
+class TestDailyFactMaintenance(TestCase):
+    """Tests that PullRequest.save()/delete() keep the rollup exact."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.team = TeamFactory()
+        self.author = TeamMemberFactory(team=self.team)
+        self.day = date(2024, 3, 5)
+
+    def _merged_pr(self, **kwargs):
+        defaults = {
+            "team": self.team,
+            "author": self.author,
+            "state": "merged",
+            "github_repo": "acme/app",
+            "merged_at": _merged_at(self.day),
+            "cycle_time_hours": Decimal("10.00"),
+            "review_time_hours": Decimal("2.00"),
+            "additions": 30,
+            "deletions": 10,
+        }
+        defaults.update(kwargs)
+        return PullRequestFactory(**defaults)
+
+    def test_create_merged_pr_writes_fact(self):
+        """Creating a merged PR should create its fact row."""
+        self._merged_pr(is_ai_assisted=True)
+        self._merged_pr(cycle_time_hours=Decimal("20.00"))
+
+        fact = DailyPRFact.objects.get(team=self.team, day=self.day, author=self.author)
+        self.assertEqual(fact.pr_count, 2)
+        self.assertEqual(fact.ai_assisted_count, 1)
+        self.assertEqual(fact.cycle_time_sum, Decimal("30.00"))
+        self.assertEqual(fact.cycle_time_count, 2)
+        self.assertEqual(fact.additions_sum, 60)
+        self.assertEqual(fact.size_histogram, [0, 2, 0, 0, 0])
+
+    def test_open_pr_is_not_rolled_up(self):
+        """Open PRs should not appear in the rollup."""
+        self._merged_pr(state="open", merged_at=None)
+
+        self.assertFalse(DailyPRFact.objects.filter(team=self.team).exists())
+
+    def test_moving_merge_day_moves_fact(self):
+        """Changing merged_at should refresh both the old and new cells."""
+        pr = self._merged_pr()
+        new_day = self.day + timedelta(days=1)
+
+        pr.merged_at = _merged_at(new_day)
+        pr.save()
+
+        self.assertFalse(DailyPRFact.objects.filter(team=self.team, day=self.day).exists())
+        self.assertEqual(DailyPRFact.objects.get(team=self.team, day=new_day).pr_count, 1)
+
+    def test_save_of_non_rollup_fields_skips_refresh(self):
+        """save(update_fields=...) without rollup sources should not re-aggregate."""
+        pr = self._merged_pr()
+        pr.title = "Renamed"
+
+        with patch("apps.metrics.services.pr_daily_facts.refresh_daily_facts") as mock_refresh:
+            pr.save(update_fields=["title"])
+            pr.state = "closed"
+            pr.save(update_fields=["state"])
+
+        mock_refresh.assert_called_once()
+
+    def test_delete_removes_fact(self):
+        """Deleting the last PR of a cell should delete the fact row."""
+        pr = self._merged_pr()
+
+        pr.delete()
+
+        self.assertFalse(DailyPRFact.objects.filter(team=self.team).exists())
+
+    def test_rebuild_fixes_bulk_writes(self):
+        """rebuild_daily_facts should pick up writes that bypassed save()."""
+        pr = self._merged_pr()
+        PullRequest.objects.filter(pk=pr.pk).update(cycle_time_hours=Decimal("50.00"))  # noqa: TEAM001 - test setup
+
+        written = rebuild_daily_facts(self.team.id)
+
+        self.assertEqual(written, 1)
+        fact = DailyPRFact.objects.get(team=self.team, day=self.day)
+        self.assertEqual(fact.cycle_time_sum, Decimal("50.00"))
+
+    def test_rebuild_command(self):
+        """rebuild_pr_daily_facts should rebuild the selected team."""
+        self._merged_pr()
+        DailyPRFact.objects.filter(team=self.team).delete()
+
+        out = StringIO()
+        call_command("rebuild_pr_daily_facts", team=self.team.name, stdout=out)
+
+        self.assertTrue(DailyPRFact.objects.filter(team=self.team).exists())
+        self.assertIn("Rebuilt 1 daily PR fact rows", out.getvalue())
+
+
+class TestDailyFactReads(TestCase):
+    """Tests for get_fact_series and get_fact_histograms."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.team = TeamFactory()
+        self.author = TeamMemberFactory(team=self.team)
+
+    def test_weekly_series_groups_by_monday(self):
+        """Weekly series should sum facts into Monday-start periods."""
+        monday = date(2024, 3, 4)
+        for offset in (0, 2, 7):
+            PullRequestFactory(
+                team=self.team,
+                author=self.author,
+                state="merged",
+                merged_at=_merged_at(monday + timedelta(days=offset)),
+                cycle_time_hours=Decimal("4.00"),
+            )
+
+        series = get_fact_series(self.team, monday, monday + timedelta(days=13), period="week")
+
+        self.assertEqual([entry["period"] for entry in series], [monday, monday + timedelta(days=7)])
+        self.assertEqual([entry["pr_count"] for entry in series], [2, 1])
+        self.assertEqual(series[0]["cycle_time_sum"], Decimal("8.00"))
+
+    def test_today_is_read_from_raw_rows(self):
+        """PRs merged today should be included even without a completed fact day."""
+        today = timezone.localdate()
+        PullRequestFactory(team=self.team, author=self.author, state="merged", merged_at=timezone.now())
+        DailyPRFact.objects.filter(team=self.team).delete()
+
+        series = get_fact_series(self.team, today - timedelta(days=30), today, period="month")
+
+        self.assertEqual(sum(entry["pr_count"] for entry in series), 1)
+
+    def test_invalid_period_raises(self):
+        """Unsupported periods should raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_fact_series(self.team, date(2024, 1, 1), date(2024, 1, 31), period="year")
+
+    def test_histograms_sum_across_days(self):
+        """Histograms should sum bucket counts across the range."""
+        for day, additions in ((date(2024, 3, 4), 5), (date(2024, 3, 5), 1000)):
+            PullRequestFactory(
+                team=self.team,
+                author=self.author,
+                state="merged",
+                merged_at=_merged_at(day),
+                additions=additions,
+                deletions=0,
+            )
+
+        histograms = get_fact_histograms(self.team, date(2024, 3, 1), date(2024, 3, 31))
+
+        self.assertEqual(histograms["size_histogram"], [1, 0, 0, 0, 1])
@@ -0,0 +1,67 @@
+"""Tests for the stored per-PR file/review aggregates."""
+
+from django.test import TestCase
+
+from apps.metrics.factories import (
+    PRFileFactory,
+    PRReviewFactory,
+    PullRequestFactory,
+    TeamFactory,
+    TeamMemberFactory,
+)
+from apps.metrics.models import PRFile, PullRequest
+from apps.metrics.services.pr_derived_fields import backfill_pr_derived_fields
+from apps.metrics.services.pr_list_service import get_prs_queryset
+
+
+class TestPrDerivedFields(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        self.author = TeamMemberFactory(team=self.team)
+        self.reviewer = TeamMemberFactory(team=self.team)
+        self.pr = PullRequestFactory(team=self.team, author=self.author)
+
+    def _stored(self):
+        return PullRequest.objects.values_list("tech_categories", "reviewer_count", "has_author_review").get(
+            pk=self.pr.pk
+        )
+
+    def test_file_and_review_writes_refresh_stored_columns(self):
+        PRFileFactory(team=self.team, pull_request=self.pr, filename="app.tsx", file_category="frontend")
+        PRFileFactory(team=self.team, pull_request=self.pr, filename="views.py", file_category="backend")
+        PRFileFactory(team=self.team, pull_request=self.pr, filename="models.py", file_category="backend")
+        PRReviewFactory(team=self.team, pull_request=self.pr, reviewer=self.author)
+        PRReviewFactory(team=self.team, pull_request=self.pr, reviewer=self.reviewer)
+        PRReviewFactory(team=self.team, pull_request=self.pr, reviewer=self.reviewer)
+
+        self.assertEqual(self._stored(), (["backend", "frontend"], 2, True))
+
+        PRFile.objects.get(filename="app.tsx").delete()
+        self.assertEqual(self._stored()[0], ["backend"])
+
+    def test_pr_save_does_not_overwrite_stored_columns(self):
+        pr = PullRequest.objects.get(pk=self.pr.pk)
+        PRFileFactory(team=self.team, pull_request=self.pr, filename="README.md", file_category="docs")
+
+        pr.title = "Renamed"
+        pr.save()
+
+        self.assertEqual(self._stored()[0], ["docs"])
+
+    def test_backfill_recomputes_bulk_written_rows(self):
+        PRFile.objects.bulk_create(
+            [PRFile(team=self.team, pull_request=self.pr, filename="ci.yml", status="added", file_category="config")]
+        )
+        self.assertEqual(self._stored()[0], [])
+
+        self.assertEqual(backfill_pr_derived_fields(self.team.id, batch_size=1), 1)
+
+        self.assertEqual(self._stored()[0], ["config"])
+
+    def test_self_reviewed_filter(self):
+        other = PullRequestFactory(team=self.team, author=self.author)
+        PRReviewFactory(team=self.team, pull_request=self.pr, reviewer=self.author)
+        PRReviewFactory(team=self.team, pull_request=other, reviewer=self.reviewer)
+
+        self.assertEqual(list(get_prs_queryset(self.team, {"self_reviewed": "yes"})), [self.pr])
+        self.assertEqual(list(get_prs_queryset(self.team, {"self_reviewed": "no"})), [other])
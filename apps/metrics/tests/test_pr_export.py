@@ -0,0 +1,59 @@
+"""Tests for the streaming PR export engine."""
+
+import csv
+import io
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.services.pr_export import (
+    get_export_queryset,
+    iter_export_chunks,
+    stream_csv,
+)
+
+
+class TestPrExport(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        self.member = TeamMemberFactory(team=self.team, display_name="Alice")
+        now = timezone.now()
+        for i in range(5):
+            PullRequestFactory(
+                team=self.team,
+                author=self.member if i % 2 == 0 else None,
+                github_repo="org/repo",
+                github_pr_id=100 + i,
+                state="merged",
+                merged_at=now - timedelta(days=i + 1),
+                cycle_time_hours=Decimal("12.50"),
+                review_time_hours=None,
+                ai_tools_detected=["cursor"] if i == 0 else [],
+                is_ai_assisted=i == 0,
+            )
+        PullRequestFactory(team=TeamFactory(), state="merged", merged_at=now - timedelta(days=1))
+
+    def test_chunks_cover_team_prs_newest_first(self):
+        chunks = list(iter_export_chunks(get_export_queryset(self.team, {}), chunk_size=2))
+
+        self.assertEqual([len(chunk["title"]) for chunk in chunks], [2, 2, 1])
+        urls = [url for chunk in chunks for url in chunk["github_url"]]
+        self.assertEqual(urls, [f"https://github.com/org/repo/pull/{100 + i}" for i in range(5)])
+        self.assertEqual(chunks[0]["author"], ["Alice", ""])
+
+    def test_csv_matches_original_formatting(self):
+        content = "".join(stream_csv(iter_export_chunks(get_export_queryset(self.team, {}))))
+
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["Cycle Time (hours)"], "12.50")
+        self.assertEqual((rows[0]["AI Assisted"], rows[0]["AI Tools"]), ("Yes", "cursor"))
+        self.assertEqual((rows[1]["AI Assisted"], rows[1]["Review Time (hours)"]), ("No", ""))
+
+    def test_applies_filters(self):
+        queryset = get_export_queryset(self.team, {"ai": "yes"})
+
+        self.assertEqual(queryset.count(), 1)
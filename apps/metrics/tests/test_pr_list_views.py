@@ -1,5 +1,6 @@
 """Tests for PR list views - Pull Requests data explorer page."""
 
+import json
 from datetime import timedelta
 
 from django.test import Client, TestCase
@@ -371,6 +372,31 @@ class TestPrListExportView(TestCase):
         # Anything under 15 means select_related is working
         self.assertLessEqual(len(context), 15, f"Too many queries: {len(context)}")
 
+    def test_export_ndjson(self):
+        """Test that format=ndjson streams one JSON object per PR."""
+        now = timezone.now()
+        PullRequestFactory(
+            team=self.team, author=self.member, title="JSON PR", state="merged", merged_at=now - timedelta(days=5)
+        )
+        url = reverse("metrics:pr_list_export")
+
+        response = self.client.get(url, {"format": "ndjson"})
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn("pull_requests.ndjson", response["Content-Disposition"])
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual((row["title"], row["author"], row["state"]), ("JSON PR", "Alice", "merged"))
+
+    def test_export_rejects_unknown_format(self):
+        """Test that an unsupported format returns 400."""
+        url = reverse("metrics:pr_list_export")
+
+        response = self.client.get(url, {"format": "xlsx"})
+
+        self.assertEqual(response.status_code, 400)
+
 
 class TestPrListSorting(TestCase):
     """Tests for PR list sorting functionality."""
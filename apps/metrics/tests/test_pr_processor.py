@@ -266,7 +266,8 @@ class TestPullRequestEventHandler(TestCase):
 
         # Mock the task (patch where it's imported, inside the function)
         with patch("apps.integrations.tasks.send_pr_surveys_task") as mock_task:
-            result = handle_pull_request_event(self.team, payload)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = handle_pull_request_event(self.team, payload)
 
             # Verify task was dispatched with correct PR ID
             mock_task.delay.assert_called_once_with(result.id)
@@ -326,7 +327,8 @@ class TestPullRequestEventHandler(TestCase):
             mock_task.delay.side_effect = Exception("Celery connection error")
 
             # Should still return the PR successfully (not raise exception)
-            result = handle_pull_request_event(self.team, payload)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = handle_pull_request_event(self.team, payload)
 
             self.assertIsNotNone(result)
             self.assertEqual(result.state, "merged")
@@ -350,7 +352,8 @@ class TestPullRequestEventHandler(TestCase):
             patch("apps.integrations.tasks.send_pr_surveys_task") as mock_slack_task,
             patch("apps.integrations.tasks.post_survey_comment_task") as mock_github_task,
         ):
-            result = handle_pull_request_event(self.team, payload)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = handle_pull_request_event(self.team, payload)
 
             # Verify both tasks were dispatched with correct PR ID
             mock_slack_task.delay.assert_called_once_with(result.id)
@@ -401,7 +404,8 @@ class TestPullRequestEventHandler(TestCase):
         ):
             mock_slack_task.delay.side_effect = Exception("Slack connection error")
 
-            result = handle_pull_request_event(self.team, payload)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = handle_pull_request_event(self.team, payload)
 
             # Verify GitHub task was still dispatched despite Slack failure
             mock_github_task.delay.assert_called_once_with(result.id)
@@ -409,8 +413,8 @@ class TestPullRequestEventHandler(TestCase):
             self.assertIsNotNone(result)
             self.assertEqual(result.state, "merged")
 
-    def test_dispatches_fetch_pr_complete_data_task_on_merge(self):
-        """Test that PR merge dispatches fetch_pr_complete_data_task to fetch files/commits."""
+    def test_queues_pr_data_fetch_on_merge(self):
+        """Test that PR merge queues the batched data fetch for files/commits."""
         from unittest.mock import patch
 
         from apps.metrics.processors import handle_pull_request_event
@@ -423,15 +427,15 @@ class TestPullRequestEventHandler(TestCase):
             merged_at="2025-01-02T15:00:00Z",
         )
 
-        # Mock the fetch_pr_complete_data_task
-        with patch("apps.integrations.tasks.fetch_pr_complete_data_task") as mock_fetch_task:
+        # Mock the PR data fetch queue
+        with patch("apps.integrations.services.pr_data_queue.queue_pr_data_fetch") as mock_queue:
             result = handle_pull_request_event(self.team, payload)
 
-            # Verify task was dispatched with correct PR ID
-            mock_fetch_task.delay.assert_called_once_with(result.id)
+            # Verify the merged PR was queued
+            mock_queue.assert_called_once_with(result)
 
-    def test_fetch_pr_complete_data_task_not_dispatched_when_not_merged(self):
-        """Test that PR close without merge does NOT dispatch fetch_pr_complete_data_task."""
+    def test_pr_data_fetch_not_queued_when_not_merged(self):
+        """Test that PR close without merge does NOT queue the data fetch."""
         from unittest.mock import patch
 
         from apps.metrics.processors import handle_pull_request_event
@@ -443,15 +447,15 @@ class TestPullRequestEventHandler(TestCase):
             merged=False,
         )
 
-        # Mock the fetch_pr_complete_data_task
-        with patch("apps.integrations.tasks.fetch_pr_complete_data_task") as mock_fetch_task:
+        # Mock the PR data fetch queue
+        with patch("apps.integrations.services.pr_data_queue.queue_pr_data_fetch") as mock_queue:
             handle_pull_request_event(self.team, payload)
 
-            # Verify task was NOT dispatched
-            mock_fetch_task.delay.assert_not_called()
+            # Verify nothing was queued
+            mock_queue.assert_not_called()
 
-    def test_fetch_pr_complete_data_task_independent_of_survey_tasks(self):
-        """Test that fetch task is dispatched even if survey tasks fail."""
+    def test_pr_data_fetch_independent_of_survey_tasks(self):
+        """Test that the data fetch is queued even if survey tasks fail."""
         from unittest.mock import patch
 
         from apps.metrics.processors import handle_pull_request_event
@@ -464,19 +468,20 @@ class TestPullRequestEventHandler(TestCase):
             merged_at="2025-01-02T15:00:00Z",
         )
 
-        # Mock survey tasks to raise errors, fetch task to succeed
+        # Mock survey tasks to raise errors, data fetch queue to succeed
         with (
             patch("apps.integrations.tasks.send_pr_surveys_task") as mock_slack_task,
             patch("apps.integrations.tasks.post_survey_comment_task") as mock_github_task,
-            patch("apps.integrations.tasks.fetch_pr_complete_data_task") as mock_fetch_task,
+            patch("apps.integrations.services.pr_data_queue.queue_pr_data_fetch") as mock_queue,
         ):
             mock_slack_task.delay.side_effect = Exception("Slack connection error")
             mock_github_task.delay.side_effect = Exception("GitHub API error")
 
-            result = handle_pull_request_event(self.team, payload)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = handle_pull_request_event(self.team, payload)
 
-            # Verify fetch task was still dispatched despite survey task failures
-            mock_fetch_task.delay.assert_called_once_with(result.id)
+            # Verify the data fetch was still queued despite survey task failures
+            mock_queue.assert_called_once_with(result)
             # Verify the webhook still returned successfully
             self.assertIsNotNone(result)
             self.assertEqual(result.state, "merged")
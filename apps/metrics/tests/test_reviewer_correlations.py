@@ -0,0 +1,89 @@
+"""Tests for set-based, incremental reviewer correlation computation."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import PRReviewFactory, PullRequestFactory, TeamFactory, TeamMemberFactory
+from apps.metrics.models import PRReview, ReviewerCorrelation
+from apps.metrics.services.reviewer_correlations import (
+    rebuild_reviewer_correlations,
+    update_reviewer_correlations,
+)
+
+
+class TestReviewerCorrelations(TestCase):
+    def setUp(self):
+        self.team = TeamFactory()
+        self.alice, self.bob, self.carol, self.dave = (TeamMemberFactory(team=self.team) for _ in range(4))
+        self.now = timezone.now()
+
+    def _review(self, pr, reviewer, state, hours_ago=1):
+        return PRReviewFactory(
+            team=self.team,
+            pull_request=pr,
+            reviewer=reviewer,
+            state=state,
+            submitted_at=self.now - timedelta(hours=hours_ago),
+        )
+
+    def _pairs(self):
+        return {
+            (c.reviewer_1_id, c.reviewer_2_id): (c.prs_reviewed_together, c.agreements, c.disagreements)
+            for c in ReviewerCorrelation.objects.filter(team=self.team)
+        }
+
+    def _key(self, a, b):
+        return (min(a.id, b.id), max(a.id, b.id))
+
+    def test_rebuild_uses_latest_definitive_review_per_reviewer(self):
+        pr = PullRequestFactory(team=self.team)
+        self._review(pr, self.alice, "changes_requested", hours_ago=5)
+        self._review(pr, self.alice, "approved", hours_ago=1)
+        self._review(pr, self.bob, "approved", hours_ago=2)
+        self._review(pr, self.carol, "commented")
+
+        self.assertEqual(rebuild_reviewer_correlations(self.team.id), 1)
+
+        self.assertEqual(self._pairs(), {self._key(self.alice, self.bob): (1, 1, 0)})
+
+    def test_incremental_update_only_touches_affected_pairs(self):
+        pr1 = PullRequestFactory(team=self.team)
+        self._review(pr1, self.alice, "approved")
+        self._review(pr1, self.bob, "approved")
+        pr2 = PullRequestFactory(team=self.team)
+        self._review(pr2, self.carol, "approved")
+        self._review(pr2, self.dave, "changes_requested")
+        rebuild_reviewer_correlations(self.team.id)
+        since = timezone.now()
+
+        # Bob flips to changes_requested on a new PR with Alice
+        pr3 = PullRequestFactory(team=self.team)
+        self._review(pr3, self.alice, "approved")
+        self._review(pr3, self.bob, "changes_requested")
+
+        self.assertEqual(update_reviewer_correlations(self.team.id, since=since), 1)
+
+        self.assertEqual(
+            self._pairs(),
+            {self._key(self.alice, self.bob): (2, 1, 1), self._key(self.carol, self.dave): (1, 0, 1)},
+        )
+
+    def test_incremental_update_removes_pairs_that_no_longer_exist(self):
+        pr = PullRequestFactory(team=self.team)
+        self._review(pr, self.alice, "approved")
+        bob_review = self._review(pr, self.bob, "approved")
+        rebuild_reviewer_correlations(self.team.id)
+
+        PRReview.objects.filter(pk=bob_review.pk).update(state="dismissed", updated_at=timezone.now())
+        update_reviewer_correlations(self.team.id, since=self.now)
+
+        self.assertEqual(self._pairs(), {})
+
+    def test_incremental_update_without_history_rebuilds(self):
+        pr = PullRequestFactory(team=self.team)
+        self._review(pr, self.alice, "approved")
+        self._review(pr, self.bob, "approved")
+
+        self.assertEqual(update_reviewer_correlations(self.team.id), 1)
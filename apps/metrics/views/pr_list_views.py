@@ -1,13 +1,16 @@
 """PR list views - Pull Requests data explorer page."""
 
-import csv
 from datetime import date, timedelta
 
-from django.core.paginator import Paginator
-from django.db.models import F
-from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.template.response import TemplateResponse
 
+from apps.metrics.services.keyset_pagination import KeysetPaginator
+from apps.metrics.services.pr_export import (
+    EXPORT_FORMATS,
+    get_export_queryset,
+    iter_export_chunks,
+)
 from apps.metrics.services.pr_list_service import (
     get_filter_options,
     get_pr_stats,
@@ -74,6 +77,7 @@ def _get_filters_from_request(request: HttpRequest, default_days: int = 30) -> d
         "size",
         "state",
         "is_draft",  # Filter by draft status ('true', 'false')
+        "self_reviewed",  # Author is the only reviewer ('yes', 'no')
         "has_jira",
         "pr_type",
         "risk_level",
@@ -146,17 +150,24 @@ def _get_sort_from_request(request: HttpRequest) -> tuple[str, str]:
 
 
 def _get_pr_list_context(
-    team, filters: dict, page_number: int = 1, sort: str = "merged", order: str = "desc", user=None
+    team,
+    filters: dict,
+    page_number: int = 1,
+    sort: str = "merged",
+    order: str = "desc",
+    user=None,
+    cursor: str | None = None,
 ) -> dict:
     """Get common context data for PR list views.
 
     Args:
         team: The team to filter PRs for
         filters: Dictionary of filter parameters
-        page_number: Page number for pagination
+        page_number: Page number for pagination (display only when a cursor is given)
         sort: Field to sort by
         order: Sort order ('asc' or 'desc')
         user: The authenticated user (for prefetching notes)
+        cursor: Keyset cursor from a previous page's pagination links
 
     Returns:
         Dictionary with prs, page_obj, stats, filters, sort, order, and user_notes
@@ -164,19 +175,19 @@ def _get_pr_list_context(
     # Get filtered queryset
     prs = get_prs_queryset(team, filters)
 
-    # Apply sorting
-    sort_field = SORT_FIELDS.get(sort, "merged_at")
-    if order == "desc":
-        prs = prs.order_by(F(sort_field).desc(nulls_last=True), "-pr_created_at")
-    else:
-        prs = prs.order_by(F(sort_field).asc(nulls_last=True), "-pr_created_at")
-
-    # Get aggregate stats
+    # Get aggregate stats; the total doubles as the paginator's count
     stats = get_pr_stats(prs)
 
-    # Paginate
-    paginator = Paginator(prs, PAGE_SIZE)
-    page_obj = paginator.get_page(page_number)
+    # Keyset-paginate by sort column + id
+    sort_field = SORT_FIELDS.get(sort, "merged_at")
+    paginator = KeysetPaginator(
+        prs,
+        sort_field,
+        descending=order == "desc",
+        per_page=PAGE_SIZE,
+        count=stats["total_count"],
+    )
+    page_obj = paginator.get_page(page_number, cursor=cursor)
 
     # Prefetch user notes for all PRs on this page (prevents N+1 queries)
     # The template tag user_note_for_pr will use this dict instead of querying
@@ -210,7 +221,9 @@ def pr_list(request: HttpRequest) -> HttpResponse:
     sort, order = _get_sort_from_request(request)
 
     # Get common context (pass user for note prefetching)
-    context = _get_pr_list_context(team, filters, page_number, sort, order, user=request.user)
+    context = _get_pr_list_context(
+        team, filters, page_number, sort, order, user=request.user, cursor=request.GET.get("cursor")
+    )
 
     # Add page-specific context
     context["active_tab"] = "pull_requests"  # For sidebar highlighting
@@ -261,7 +274,9 @@ def pr_list_table(request: HttpRequest) -> HttpResponse:
     sort, order = _get_sort_from_request(request)
 
     # Get common context (pass user for note prefetching)
-    context = _get_pr_list_context(team, filters, page_number, sort, order, user=request.user)
+    context = _get_pr_list_context(
+        team, filters, page_number, sort, order, user=request.user, cursor=request.GET.get("cursor")
+    )
 
     return TemplateResponse(
         request,
@@ -270,86 +285,39 @@ def pr_list_table(request: HttpRequest) -> HttpResponse:
     )
 
 
-class Echo:
-    """An object that implements just the write method of the file-like interface."""
-
-    def write(self, value):
-        """Write the value by returning it."""
-        return value
-
-
 @login_and_team_required
 def pr_list_export(request: HttpRequest) -> HttpResponse:
-    """Export PR list to CSV."""
+    """Export PR list as CSV (default) or NDJSON (?format=...).
+
+    Rows are streamed from a server-side cursor in fixed-size chunks, so memory
+    use does not grow with the number of PRs exported.
+    """
     team = request.team
     filters = _get_filters_from_request(request)
 
+    export_format_name = request.GET.get("format", "csv")
+    if export_format_name not in EXPORT_FORMATS:
+        return JsonResponse({"error": f"Unsupported export format: {export_format_name}"}, status=400)
+    export_format = EXPORT_FORMATS[export_format_name]
+
     # Get filtered queryset (no pagination for export)
-    prs = get_prs_queryset(team, filters).order_by("-merged_at", "-pr_created_at")
+    prs = get_export_queryset(team, filters)
 
     # Track export event
     track_event(
         request.user,
         "pr_list_exported",
         {
-            "format": "csv",
+            "format": export_format_name,
             "row_count": prs.count(),
             "has_filters": bool(filters),
             "team_slug": team.slug,
         },
     )
 
-    # CSV headers
-    headers = [
-        "Title",
-        "Repository",
-        "Author",
-        "State",
-        "Cycle Time (hours)",
-        "Review Time (hours)",
-        "Lines Added",
-        "Lines Deleted",
-        "Review Rounds",
-        "Comments",
-        "AI Assisted",
-        "AI Tools",
-        "Jira Key",
-        "Created At",
-        "Merged At",
-        "GitHub URL",
-    ]
-
-    def generate_csv():
-        """Generator for streaming CSV rows."""
-        pseudo_buffer = Echo()
-        writer = csv.writer(pseudo_buffer)
-
-        # Write header
-        yield writer.writerow(headers)
-
-        # Write data rows
-        for pr in prs.iterator():
-            yield writer.writerow(
-                [
-                    pr.title,
-                    pr.github_repo,
-                    pr.author.display_name if pr.author else "",
-                    pr.state,
-                    str(pr.cycle_time_hours) if pr.cycle_time_hours else "",
-                    str(pr.review_time_hours) if pr.review_time_hours else "",
-                    pr.additions,
-                    pr.deletions,
-                    pr.review_rounds or 0,
-                    pr.total_comments or 0,
-                    "Yes" if pr.is_ai_assisted else "No",
-                    ", ".join(pr.ai_tools_detected or []),
-                    pr.jira_key or "",
-                    pr.pr_created_at.isoformat() if pr.pr_created_at else "",
-                    pr.merged_at.isoformat() if pr.merged_at else "",
-                    pr.github_url or "",
-                ]
-            )
-
-    response = StreamingHttpResponse(generate_csv(), content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="pull_requests.csv"'
+    response = StreamingHttpResponse(
+        export_format.stream(iter_export_chunks(prs)),
+        content_type=export_format.content_type,
+    )
+    response["Content-Disposition"] = f'attachment; filename="pull_requests.{export_format.extension}"'
     return response
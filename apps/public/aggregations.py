@@ -3,25 +3,21 @@
 Pure functions that compute metrics from PullRequest data. Used by both
 the public analytics service layer and the export script.
 
-All functions use Django ORM (.values().annotate()) and never load full
-PR objects into memory — they push computation to PostgreSQL.
+Per-PR metrics for a team/repo window come from OrgBundle, which fetches a
+narrow projection of the window's merged PRs in one query and groups it in
+memory; the compute_* functions for those metrics are thin views over it.
+Nothing loads full PR objects — other metrics are ORM aggregates.
 """
 
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from functools import cached_property
+from statistics import median
 
 from django.conf import settings
-from django.db.models import (
-    Aggregate,
-    Avg,
-    Case,
-    Count,
-    F,
-    Q,
-    Value,
-    When,
-)
-from django.db.models.functions import TruncMonth
+from django.db.models import Count, Q
+from django.utils import timezone
 
 from apps.metrics.models import PullRequest
 
@@ -56,8 +52,6 @@ def _date_bounds(year=None, start_date=None, end_date=None):
     if start_date is not None and end_date is not None:
         return (start_date, end_date)
     if year is None:
-        from django.utils import timezone
-
         year = timezone.now().year
     return (datetime(year, 1, 1, tzinfo=UTC), datetime(year + 1, 1, 1, tzinfo=UTC))
 
@@ -69,8 +63,6 @@ def _data_window(team_id, months=12):
     the latest merged PR. This ensures charts show all available data
     even when it spans calendar year boundaries (e.g., Jul 2025 -> Feb 2026).
     """
-    from django.utils import timezone
-
     latest = (
         PullRequest.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
             team_id=team_id,
@@ -95,23 +87,6 @@ def _data_window(team_id, months=12):
     return (start_date, end_date)
 
 
-class PercentileCont(Aggregate):
-    """PostgreSQL PERCENTILE_CONT ordered-set aggregate function.
-
-    Usage: PercentileCont(0.5, 'cycle_time_hours') for median.
-    Generates: PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY cycle_time_hours)
-
-    Must extend Aggregate (not Func) because PERCENTILE_CONT operates
-    on a group of rows, not individual rows.
-    """
-
-    function = "PERCENTILE_CONT"
-    template = "%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)"
-
-    def __init__(self, percentile, expression, **kwargs):
-        super().__init__(expression, percentile=percentile, **kwargs)
-
-
 def _base_pr_queryset(team_id, year=None, start_date=None, end_date=None, github_repo=None, allowed_repos=None):
     """Base queryset for merged PRs with date filtering and bot exclusion.
 
@@ -148,8 +123,6 @@ def _base_pr_queryset(team_id, year=None, start_date=None, end_date=None, github
             pr_created_at__lt=datetime(year + 1, 1, 1, tzinfo=UTC),
         )
     else:
-        from django.utils import timezone
-
         year = timezone.now().year
         qs = qs.filter(
             pr_created_at__gte=datetime(year, 1, 1, tzinfo=UTC),
@@ -159,8 +132,68 @@ def _base_pr_queryset(team_id, year=None, start_date=None, end_date=None, github
     return qs
 
 
-def compute_team_summary(team_id, year=None, start_date=None, end_date=None, github_repo=None):
-    """Compute summary metrics for a team.
+# Narrow per-PR projection OrgBundle fetches once and groups in memory.
+# resolved_pr_type and tech_categories are the materialized forms of
+# effective_pr_type and the file-based half of effective_tech_categories.
+_BUNDLE_FIELDS = (
+    "pr_created_at",
+    "merged_at",
+    "author_id",
+    "author__display_name",
+    "author__github_username",
+    "is_ai_assisted",
+    "cycle_time_hours",
+    "review_time_hours",
+    "review_rounds",
+    "is_revert",
+    "is_hotfix",
+    "additions",
+    "deletions",
+    "resolved_pr_type",
+    "tech_categories",
+    "llm_summary__tech__categories",
+)
+
+
+def _month_start(value):
+    """Python equivalent of TruncMonth in the current time zone."""
+    if value is None:
+        return None
+    return timezone.localtime(value).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _group_by_month(rows, attr):
+    """Group rows by the month of a datetime attribute, in chronological order (None last)."""
+    groups = defaultdict(list)
+    for row in rows:
+        groups[_month_start(getattr(row, attr))].append(row)
+    return sorted(groups.items(), key=lambda item: (item[0] is None, item[0]))
+
+
+def _mean(values):
+    values = [value for value in values if value is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _pct(part, total, digits=1):
+    return round(part * 100.0 / total, digits) if total > 0 else 0
+
+
+def _is_filtered_cycle_time(row):
+    """Matches the cycle_time_hours__lte=MAX_CYCLE_TIME_HOURS outlier filter."""
+    return row.cycle_time_hours is not None and row.cycle_time_hours <= MAX_CYCLE_TIME_HOURS
+
+
+class OrgBundle:
+    """All per-PR public metrics for one team (or repo) and date window.
+
+    The org page used to call a dozen compute_* functions, each re-filtering
+    _base_pr_queryset with the bot exclusions and scanning the same merged PRs
+    again. OrgBundle fetches a narrow projection of those rows once (rows) and
+    derives every metric from it in memory; the compute_* functions are thin
+    views over it. Metrics are cached_property, so each is computed at most
+    once and only when read. Review and check-run metrics still need one query
+    each against their own tables.
 
     Args:
         team_id: Team ID.
@@ -168,73 +201,266 @@ def compute_team_summary(team_id, year=None, start_date=None, end_date=None, git
         start_date: Start datetime for rolling window. Takes precedence over year.
         end_date: End datetime for rolling window.
         github_repo: Optional owner/repo string for repo-level filtering.
-
-    Returns:
-        Dict with total_prs, ai_prs, ai_pct, median_cycle_time_hours,
-        median_review_time_hours, active_contributors_90d.
     """
-    qs = _base_pr_queryset(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo)
 
-    # Basic counts and averages via ORM
-    stats = qs.aggregate(
-        total_prs=Count("id"),
-        ai_prs=Count("id", filter=Q(is_ai_assisted=True)),
-    )
+    def __init__(self, team_id, year=None, start_date=None, end_date=None, github_repo=None):
+        self.team_id = team_id
+        self.year = year
+        self.start_date = start_date
+        self.end_date = end_date
+        self.github_repo = github_repo
+
+    @cached_property
+    def rows(self):
+        """The window's merged, non-bot PRs as named tuples of _BUNDLE_FIELDS (one query)."""
+        qs = _base_pr_queryset(
+            self.team_id,
+            year=self.year,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            github_repo=self.github_repo,
+        )
+        return list(qs.values_list(*_BUNDLE_FIELDS, named=True))
+
+    @cached_property
+    def summary(self):
+        """See compute_team_summary."""
+        rows = self.rows
+        total_prs = len(rows)
+        ai_prs = sum(1 for row in rows if row.is_ai_assisted)
+        ai_pct = Decimal(str(round(ai_prs * 100.0 / total_prs, 2))) if total_prs > 0 else Decimal("0")
+
+        # Medians over PRs within the cycle time outlier filter; PERCENTILE_CONT(0.5)
+        # interpolates between the two middle values exactly like statistics.median
+        filtered = [row for row in rows if _is_filtered_cycle_time(row)]
+        cycle_times = [row.cycle_time_hours for row in filtered]
+        review_times = [row.review_time_hours for row in filtered if row.review_time_hours is not None]
+        median_cycle = Decimal(str(round(float(median(cycle_times)), 2))) if cycle_times else Decimal("0")
+        median_review = Decimal(str(round(float(median(review_times)), 2))) if review_times else Decimal("0")
+
+        # Active contributors in the last 90 days of the data period
+        now = timezone.now()
+        if self.start_date is not None and self.end_date is not None:
+            # Rolling window: 90/30 days back from end of window
+            window_end = self.end_date
+        elif self.year and self.year < now.year:
+            # Historical: last 90/30 days of that year
+            window_end = datetime(self.year, 12, 31, 23, 59, 59, tzinfo=UTC)
+        else:
+            window_end = now
+        ninety_days_ago = window_end - timedelta(days=90)
+        thirty_days_ago = window_end - timedelta(days=30)
 
-    total_prs = stats["total_prs"]
-    ai_prs = stats["ai_prs"]
-    ai_pct = Decimal(str(round(ai_prs * 100.0 / total_prs, 2))) if total_prs > 0 else Decimal("0")
+        def _active_since(cutoff):
+            return len({row.author_id for row in rows if row.author_id is not None and row.pr_created_at >= cutoff})
 
-    # Median cycle time and review time via PostgreSQL percentile_cont
-    # Filter outliers for cycle time calculation
-    filtered_qs = qs.filter(cycle_time_hours__lte=MAX_CYCLE_TIME_HOURS)
-    medians = filtered_qs.aggregate(
-        median_cycle=PercentileCont(0.5, F("cycle_time_hours")),
-        median_review=PercentileCont(0.5, F("review_time_hours")),
-    )
+        return {
+            "total_prs": total_prs,
+            "ai_prs": ai_prs,
+            "ai_pct": ai_pct,
+            "median_cycle_time_hours": median_cycle,
+            "median_review_time_hours": median_review,
+            "active_contributors_90d": _active_since(ninety_days_ago),
+            "active_contributors_30d": _active_since(thirty_days_ago),
+        }
 
-    median_cycle = (
-        Decimal(str(round(float(medians["median_cycle"]), 2))) if medians["median_cycle"] is not None else Decimal("0")
-    )
-    median_review = (
-        Decimal(str(round(float(medians["median_review"]), 2)))
-        if medians["median_review"] is not None
-        else Decimal("0")
-    )
+    @cached_property
+    def monthly_trends(self):
+        """See compute_monthly_trends."""
+        results = []
+        for month, rows in _group_by_month(self.rows, "pr_created_at"):
+            total = len(rows)
+            ai = sum(1 for row in rows if row.is_ai_assisted)
+            results.append({"month": month, "total_prs": total, "ai_prs": ai, "ai_pct": _pct(ai, total)})
+        return results
+
+    @cached_property
+    def _merged_months(self):
+        return _group_by_month(self.rows, "merged_at")
+
+    @cached_property
+    def sparklines(self):
+        """See compute_monthly_sparklines."""
+        months = []
+        for _month, rows in self._merged_months:
+            total = len(rows)
+            months.append(
+                {
+                    "prs_merged": total,
+                    "avg_cycle_time": _mean(row.cycle_time_hours for row in rows if _is_filtered_cycle_time(row)),
+                    "ai_pct": _pct(sum(1 for row in rows if row.is_ai_assisted), total),
+                    "avg_review_time": _mean(row.review_time_hours for row in rows),
+                }
+            )
 
-    # Active contributors in the last 90 days of the data period
-    from django.utils import timezone
+        def _sparkline(values):
+            if not values or len(values) < 2:
+                return {"values": values, "change_pct": 0, "trend": "flat"}
+            first = values[0]
+            last = values[-1]
+            change_pct = round((last - first) / first * 100) if first and first > 0 else 0
+            if abs(change_pct) < 1:
+                trend = "flat"
+            elif change_pct > 0:
+                trend = "up"
+            else:
+                trend = "down"
+            return {"values": values, "change_pct": change_pct, "trend": trend}
 
-    now = timezone.now()
-    if start_date is not None and end_date is not None:
-        # Rolling window: 90/30 days back from end of window
-        ninety_days_ago = end_date - timedelta(days=90)
-        thirty_days_ago = end_date - timedelta(days=30)
-    elif year and year < now.year:
-        # Historical: last 90/30 days of that year
-        end_of_year = datetime(year, 12, 31, 23, 59, 59, tzinfo=UTC)
-        ninety_days_ago = end_of_year - timedelta(days=90)
-        thirty_days_ago = end_of_year - timedelta(days=30)
-    else:
-        ninety_days_ago = now - timedelta(days=90)
-        thirty_days_ago = now - timedelta(days=30)
+        return {
+            "prs_merged": _sparkline([m["prs_merged"] for m in months]),
+            "cycle_time": _sparkline(
+                [round(float(m["avg_cycle_time"]), 1) if m["avg_cycle_time"] else 0 for m in months]
+            ),
+            "ai_adoption": _sparkline([m["ai_pct"] for m in months]),
+            "review_time": _sparkline(
+                [round(float(m["avg_review_time"]), 1) if m["avg_review_time"] else 0 for m in months]
+            ),
+        }
 
-    active_contributors_90d = (
-        qs.filter(pr_created_at__gte=ninety_days_ago).values("author").distinct().exclude(author__isnull=True).count()
-    )
-    active_contributors_30d = (
-        qs.filter(pr_created_at__gte=thirty_days_ago).values("author").distinct().exclude(author__isnull=True).count()
-    )
+    @cached_property
+    def cycle_time_trend(self):
+        """See compute_monthly_cycle_time."""
+        results = []
+        for month, rows in self._merged_months:
+            avg_cycle_time = _mean(row.cycle_time_hours for row in rows if _is_filtered_cycle_time(row))
+            # Months with no PR inside the outlier filter have no row (as with a WHERE clause)
+            if any(_is_filtered_cycle_time(row) for row in rows):
+                results.append(
+                    {"month": month, "avg_cycle_time": round(float(avg_cycle_time), 1) if avg_cycle_time else 0}
+                )
+        return results
+
+    @cached_property
+    def member_breakdown(self):
+        """See compute_member_breakdown."""
+        from apps.metrics.models import PRReview
+
+        authors = defaultdict(list)
+        for row in self.rows:
+            if row.author_id is not None:
+                authors[row.author_id].append(row)
+        top_authors = sorted(authors.values(), key=len, reverse=True)[:20]
+
+        # Build a lookup of review counts per reviewer using consistent date bounds
+        dt_start, dt_end = _date_bounds(year=self.year, start_date=self.start_date, end_date=self.end_date)
+        review_counts = dict(
+            PRReview.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
+                team_id=self.team_id,
+                pull_request__state="merged",
+                pull_request__pr_created_at__gte=dt_start,
+                pull_request__pr_created_at__lt=dt_end,
+                reviewer_id__in=[rows[0].author_id for rows in top_authors],
+            )
+            .values("reviewer")
+            .annotate(reviews_given=Count("id"))
+            .values_list("reviewer", "reviews_given")
+        )
 
-    return {
-        "total_prs": total_prs,
-        "ai_prs": ai_prs,
-        "ai_pct": ai_pct,
-        "median_cycle_time_hours": median_cycle,
-        "median_review_time_hours": median_review,
-        "active_contributors_90d": active_contributors_90d,
-        "active_contributors_30d": active_contributors_30d,
-    }
+        results = []
+        for rows in top_authors:
+            author = rows[0]
+            username = author.author__github_username
+            avg_cycle_time = _mean(row.cycle_time_hours for row in rows if _is_filtered_cycle_time(row))
+            results.append(
+                {
+                    "author_id": author.author_id,
+                    "display_name": author.author__display_name,
+                    "github_username": username,
+                    "avatar_url": f"https://github.com/{username}.png?size=40" if username else "",
+                    "prs_merged": len(rows),
+                    "avg_cycle_time": round(float(avg_cycle_time), 1) if avg_cycle_time else 0,
+                    "ai_pct": _pct(sum(1 for row in rows if row.is_ai_assisted), len(rows)),
+                    "reviews_given": review_counts.get(author.author_id, 0),
+                }
+            )
+        return results
+
+    @cached_property
+    def quality_indicators(self):
+        """See compute_quality_indicators."""
+        from apps.metrics.models import PRCheckRun
+
+        rows = self.rows
+        total = len(rows)
+        avg_review_rounds = _mean(row.review_rounds for row in rows)
+
+        # CI pass rate from PRCheckRun using consistent date bounds
+        dt_start, dt_end = _date_bounds(year=self.year, start_date=self.start_date, end_date=self.end_date)
+        check_stats = PRCheckRun.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
+            team_id=self.team_id,
+            pull_request__state="merged",
+            pull_request__pr_created_at__gte=dt_start,
+            pull_request__pr_created_at__lt=dt_end,
+            status="completed",
+        ).aggregate(
+            ci_total=Count("id"),
+            ci_success=Count("id", filter=Q(conclusion="success")),
+        )
+
+        return {
+            "revert_rate": _pct(sum(1 for row in rows if row.is_revert), total),
+            "hotfix_rate": _pct(sum(1 for row in rows if row.is_hotfix), total),
+            "ci_pass_rate": _pct(check_stats["ci_success"], check_stats["ci_total"]),
+            "avg_review_rounds": round(float(avg_review_rounds), 1) if avg_review_rounds else 0,
+        }
+
+    @cached_property
+    def pr_size_distribution(self):
+        """See compute_pr_size_distribution."""
+        count_by_bucket = defaultdict(int)
+        for row in self.rows:
+            size = row.additions + row.deletions
+            count_by_bucket[next(label for label, _low, high in _SIZE_BUCKETS if high is None or size <= high)] += 1
+
+        total = len(self.rows)
+        # Always return all 5 buckets in order
+        return [
+            {"bucket": label, "count": count_by_bucket[label], "pct": _pct(count_by_bucket[label], total)}
+            for label, _low, _high in _SIZE_BUCKETS
+        ]
+
+    @cached_property
+    def tech_category_trends(self):
+        """See compute_tech_category_trends."""
+        results = []
+        for month, rows in _group_by_month(self.rows, "pr_created_at"):
+            categories = defaultdict(int)
+            for row in rows:
+                # effective_tech_categories: LLM categories, else the stored file categories
+                for category in row.llm_summary__tech__categories or row.tech_categories or []:
+                    categories[category] += 1
+            if categories:
+                results.append({"month": month, "categories": dict(categories)})
+        return results
+
+    @cached_property
+    def pr_type_trends(self):
+        """See compute_pr_type_trends."""
+        results = []
+        for month, rows in _group_by_month(self.rows, "pr_created_at"):
+            types = defaultdict(int)
+            for row in rows:
+                types[row.resolved_pr_type] += 1
+            results.append({"month": month, "types": dict(types)})
+        return results
+
+
+def compute_team_summary(team_id, year=None, start_date=None, end_date=None, github_repo=None):
+    """Compute summary metrics for a team.
+
+    Args:
+        team_id: Team ID.
+        year: Year to aggregate (defaults to current year).
+        start_date: Start datetime for rolling window. Takes precedence over year.
+        end_date: End datetime for rolling window.
+        github_repo: Optional owner/repo string for repo-level filtering.
+
+    Returns:
+        Dict with total_prs, ai_prs, ai_pct, median_cycle_time_hours,
+        median_review_time_hours, active_contributors_90d.
+    """
+    return OrgBundle(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo).summary
 
 
 def compute_monthly_trends(team_id, year=None, start_date=None, end_date=None, github_repo=None):
@@ -250,33 +476,9 @@ def compute_monthly_trends(team_id, year=None, start_date=None, end_date=None, g
     Returns:
         List of dicts with month, total_prs, ai_prs, ai_pct.
     """
-    qs = _base_pr_queryset(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo)
-
-    monthly = (
-        qs.annotate(month=TruncMonth("pr_created_at"))
-        .values("month")
-        .annotate(
-            total_prs=Count("id"),
-            ai_prs=Count("id", filter=Q(is_ai_assisted=True)),
-        )
-        .order_by("month")
-    )
-
-    results = []
-    for row in monthly:
-        total = row["total_prs"]
-        ai = row["ai_prs"]
-        pct = round(ai * 100.0 / total, 1) if total > 0 else 0
-        results.append(
-            {
-                "month": row["month"],
-                "total_prs": total,
-                "ai_prs": ai,
-                "ai_pct": pct,
-            }
-        )
-
-    return results
+    return OrgBundle(
+        team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo
+    ).monthly_trends
 
 
 def compute_ai_tools_breakdown(team_id, year=None, start_date=None, end_date=None, github_repo=None):
@@ -408,45 +610,7 @@ def compute_monthly_sparklines(team_id, year=None, start_date=None, end_date=Non
     Returns:
         Dict with 4 sparkline metric dicts.
     """
-    qs = _base_pr_queryset(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo)
-
-    monthly = (
-        qs.annotate(month=TruncMonth("merged_at"))
-        .values("month")
-        .annotate(
-            prs_merged=Count("id"),
-            avg_cycle_time=Avg("cycle_time_hours", filter=Q(cycle_time_hours__lte=MAX_CYCLE_TIME_HOURS)),
-            total_prs=Count("id"),
-            ai_prs=Count("id", filter=Q(is_ai_assisted=True)),
-            avg_review_time=Avg("review_time_hours"),
-        )
-        .order_by("month")
-    )
-
-    rows = list(monthly)
-
-    def _sparkline(values):
-        if not values or len(values) < 2:
-            return {"values": values, "change_pct": 0, "trend": "flat"}
-        first = values[0]
-        last = values[-1]
-        change_pct = round((last - first) / first * 100) if first and first > 0 else 0
-        if abs(change_pct) < 1:
-            trend = "flat"
-        elif change_pct > 0:
-            trend = "up"
-        else:
-            trend = "down"
-        return {"values": values, "change_pct": change_pct, "trend": trend}
-
-    return {
-        "prs_merged": _sparkline([r["prs_merged"] for r in rows]),
-        "cycle_time": _sparkline([round(float(r["avg_cycle_time"]), 1) if r["avg_cycle_time"] else 0 for r in rows]),
-        "ai_adoption": _sparkline(
-            [round(r["ai_prs"] * 100.0 / r["total_prs"], 1) if r["total_prs"] > 0 else 0 for r in rows]
-        ),
-        "review_time": _sparkline([round(float(r["avg_review_time"]), 1) if r["avg_review_time"] else 0 for r in rows]),
-    }
+    return OrgBundle(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo).sparklines
 
 
 def compute_monthly_cycle_time(team_id, year=None, start_date=None, end_date=None, github_repo=None):
@@ -462,24 +626,9 @@ def compute_monthly_cycle_time(team_id, year=None, start_date=None, end_date=Non
     Returns:
         List of dicts with month (datetime) and avg_cycle_time (float).
     """
-    qs = _base_pr_queryset(
+    return OrgBundle(
         team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo
-    ).filter(cycle_time_hours__lte=MAX_CYCLE_TIME_HOURS)
-
-    monthly = (
-        qs.annotate(month=TruncMonth("merged_at"))
-        .values("month")
-        .annotate(avg_cycle_time=Avg("cycle_time_hours"))
-        .order_by("month")
-    )
-
-    return [
-        {
-            "month": row["month"],
-            "avg_cycle_time": round(float(row["avg_cycle_time"]), 1) if row["avg_cycle_time"] else 0,
-        }
-        for row in monthly
-    ]
+    ).cycle_time_trend
 
 
 def compute_recent_prs(team_id, limit=10, github_repo=None):
@@ -535,56 +684,9 @@ def compute_member_breakdown(team_id, year=None, start_date=None, end_date=None,
     Returns:
         List of dicts with member stats, sorted by prs_merged desc, limit 20.
     """
-    from apps.metrics.models import PRReview
-
-    qs = _base_pr_queryset(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo)
-
-    # Per-author PR stats
-    author_stats = (
-        qs.filter(author__isnull=False)
-        .values("author", "author__display_name", "author__github_username")
-        .annotate(
-            prs_merged=Count("id"),
-            avg_cycle_time=Avg("cycle_time_hours", filter=Q(cycle_time_hours__lte=MAX_CYCLE_TIME_HOURS)),
-            ai_count=Count("id", filter=Q(is_ai_assisted=True)),
-            total_count=Count("id"),
-        )
-        .order_by("-prs_merged")[:20]
-    )
-
-    # Build a lookup of review counts per reviewer using consistent date bounds
-    dt_start, dt_end = _date_bounds(year=year, start_date=start_date, end_date=end_date)
-    review_counts = dict(
-        PRReview.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
-            team_id=team_id,
-            pull_request__state="merged",
-            pull_request__pr_created_at__gte=dt_start,
-            pull_request__pr_created_at__lt=dt_end,
-            reviewer__isnull=False,
-        )
-        .values("reviewer")
-        .annotate(reviews_given=Count("id"))
-        .values_list("reviewer", "reviews_given")
-    )
-
-    results = []
-    for row in author_stats:
-        total = row["total_count"]
-        ai_pct = round(row["ai_count"] * 100.0 / total, 1) if total > 0 else 0
-        username = row["author__github_username"]
-        results.append(
-            {
-                "author_id": row["author"],
-                "display_name": row["author__display_name"],
-                "github_username": username,
-                "avatar_url": f"https://github.com/{username}.png?size=40" if username else "",
-                "prs_merged": row["prs_merged"],
-                "avg_cycle_time": round(float(row["avg_cycle_time"]), 1) if row["avg_cycle_time"] else 0,
-                "ai_pct": ai_pct,
-                "reviews_given": review_counts.get(row["author"], 0),
-            }
-        )
-    return results
+    return OrgBundle(
+        team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo
+    ).member_breakdown
 
 
 def compute_quality_indicators(team_id, year=None, start_date=None, end_date=None, github_repo=None):
@@ -600,44 +702,9 @@ def compute_quality_indicators(team_id, year=None, start_date=None, end_date=Non
     Returns:
         Dict with revert_rate, hotfix_rate, ci_pass_rate, avg_review_rounds.
     """
-    from apps.metrics.models import PRCheckRun
-
-    qs = _base_pr_queryset(team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo)
-
-    stats = qs.aggregate(
-        total=Count("id"),
-        reverts=Count("id", filter=Q(is_revert=True)),
-        hotfixes=Count("id", filter=Q(is_hotfix=True)),
-        avg_review_rounds=Avg("review_rounds"),
-    )
-
-    total = stats["total"]
-    revert_rate = round(stats["reverts"] * 100.0 / total, 1) if total > 0 else 0
-    hotfix_rate = round(stats["hotfixes"] * 100.0 / total, 1) if total > 0 else 0
-    avg_review_rounds = round(float(stats["avg_review_rounds"]), 1) if stats["avg_review_rounds"] else 0
-
-    # CI pass rate from PRCheckRun using consistent date bounds
-    dt_start, dt_end = _date_bounds(year=year, start_date=start_date, end_date=end_date)
-    check_stats = PRCheckRun.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
-        team_id=team_id,
-        pull_request__state="merged",
-        pull_request__pr_created_at__gte=dt_start,
-        pull_request__pr_created_at__lt=dt_end,
-        status="completed",
-    ).aggregate(
-        ci_total=Count("id"),
-        ci_success=Count("id", filter=Q(conclusion="success")),
-    )
-
-    ci_total = check_stats["ci_total"]
-    ci_pass_rate = round(check_stats["ci_success"] * 100.0 / ci_total, 1) if ci_total > 0 else 0
-
-    return {
-        "revert_rate": revert_rate,
-        "hotfix_rate": hotfix_rate,
-        "ci_pass_rate": ci_pass_rate,
-        "avg_review_rounds": avg_review_rounds,
-    }
+    return OrgBundle(
+        team_id, year=year, start_date=start_date, end_date=end_date, github_repo=github_repo
+    ).quality_indicators
 
 
 def compute_review_distribution(team_id, year=None, start_date=None, end_date=None):
@@ -748,40 +815,13 @@ def compute_pr_size_distribution(team_id, start_date=None, end_date=None, github
     Returns:
         List of dicts with bucket, count, pct — always 5 entries in order.
     """
-    qs = _base_pr_queryset(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo)
-
-    # Annotate each PR with its size bucket using Case/When
-    size_expr = F("additions") + F("deletions")
-    bucket_annotation = Case(
-        When(condition=Q(**{"_size__lte": 50}), then=Value("XS")),
-        When(condition=Q(**{"_size__lte": 200}), then=Value("S")),
-        When(condition=Q(**{"_size__lte": 500}), then=Value("M")),
-        When(condition=Q(**{"_size__lte": 1000}), then=Value("L")),
-        default=Value("XL"),
-    )
-
-    counts = (
-        qs.annotate(_size=size_expr).annotate(bucket=bucket_annotation).values("bucket").annotate(count=Count("id"))
-    )
-
-    # Build lookup from DB results
-    count_by_bucket = {row["bucket"]: row["count"] for row in counts}
-    total = sum(count_by_bucket.values())
-
-    # Always return all 5 buckets in order
-    result = []
-    for label, _low, _high in _SIZE_BUCKETS:
-        count = count_by_bucket.get(label, 0)
-        pct = round(count * 100.0 / total, 1) if total > 0 else 0
-        result.append({"bucket": label, "count": count, "pct": pct})
-
-    return result
+    return OrgBundle(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo).pr_size_distribution
 
 
 def compute_tech_category_trends(team_id, start_date=None, end_date=None, github_repo=None):
     """Compute monthly technology category trends.
 
-    Uses effective_tech_categories property (LLM → file annotations fallback).
+    Uses effective_tech_categories semantics (LLM → stored file categories fallback).
     PRs without categories are skipped.
 
     Args:
@@ -794,29 +834,13 @@ def compute_tech_category_trends(team_id, start_date=None, end_date=None, github
         List of dicts with month (datetime) and categories (dict of name→count),
         sorted chronologically.
     """
-    qs = _base_pr_queryset(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo)
-    prs = qs.only("pr_created_at", "llm_summary")
-
-    # Group by month in Python (effective_tech_categories is a @property)
-    from collections import defaultdict
-
-    monthly = defaultdict(lambda: defaultdict(int))
-
-    for pr in prs:
-        cats = pr.effective_tech_categories
-        if not cats:
-            continue
-        month_key = pr.pr_created_at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        for cat in cats:
-            monthly[month_key][cat] += 1
-
-    return [{"month": month, "categories": dict(cats)} for month, cats in sorted(monthly.items())]
+    return OrgBundle(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo).tech_category_trends
 
 
 def compute_pr_type_trends(team_id, start_date=None, end_date=None, github_repo=None):
     """Compute monthly PR type distribution trends.
 
-    Uses effective_pr_type property (LLM → labels fallback → 'unknown').
+    Uses resolved_pr_type, the materialized effective_pr_type (LLM → labels → 'unknown').
 
     Args:
         team_id: Team ID.
@@ -828,16 +852,4 @@ def compute_pr_type_trends(team_id, start_date=None, end_date=None, github_repo=
         List of dicts with month (datetime) and types (dict of type→count),
         sorted chronologically.
     """
-    qs = _base_pr_queryset(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo)
-    prs = qs.only("pr_created_at", "llm_summary", "labels")
-
-    from collections import defaultdict
-
-    monthly = defaultdict(lambda: defaultdict(int))
-
-    for pr in prs:
-        pr_type = pr.effective_pr_type
-        month_key = pr.pr_created_at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        monthly[month_key][pr_type] += 1
-
-    return [{"month": month, "types": dict(types)} for month, types in sorted(monthly.items())]
+    return OrgBundle(team_id, start_date=start_date, end_date=end_date, github_repo=github_repo).pr_type_trends
@@ -16,14 +16,10 @@ from apps.metrics.models import PullRequest
 from apps.metrics.services.dashboard.ai_metrics import get_ai_impact_stats
 from apps.public.aggregations import (
     BOT_USERNAMES,
+    OrgBundle,
     _base_pr_queryset,
     compute_ai_tools_breakdown,
-    compute_monthly_cycle_time,
-    compute_monthly_trends,
-    compute_pr_size_distribution,
-    compute_pr_type_trends,
     compute_recent_prs,
-    compute_team_summary,
 )
 from apps.public.formatting import format_duration
 from apps.public.models import PublicOrgStats, PublicRepoProfile, PublicRepoStats
@@ -53,12 +49,11 @@ def build_repo_snapshot(repo_profile: PublicRepoProfile) -> PublicRepoStats:
     trend_start = now - timedelta(days=PUBLIC_TREND_WINDOW_DAYS)
 
     # Core summary metrics (30-day window)
-    summary = compute_team_summary(
-        team_id,
-        start_date=summary_start,
-        end_date=summary_end,
-        github_repo=github_repo,
-    )
+    # Each window's per-PR metrics share one scan of its merged PRs
+    summary_bundle = OrgBundle(team_id, start_date=summary_start, end_date=summary_end, github_repo=github_repo)
+    trend_bundle = OrgBundle(team_id, start_date=trend_start, end_date=trend_end, github_repo=github_repo)
+
+    summary = summary_bundle.summary
 
     # All-time PR count for this repo (no date filter — _base_pr_queryset
     # always applies date bounds, so we query directly here)
@@ -73,18 +68,8 @@ def build_repo_snapshot(repo_profile: PublicRepoProfile) -> PublicRepoStats:
     )
 
     # Trend data (90-day window)
-    monthly_trends = compute_monthly_trends(
-        team_id,
-        start_date=trend_start,
-        end_date=trend_end,
-        github_repo=github_repo,
-    )
-    cycle_time_trends = compute_monthly_cycle_time(
-        team_id,
-        start_date=trend_start,
-        end_date=trend_end,
-        github_repo=github_repo,
-    )
+    monthly_trends = trend_bundle.monthly_trends
+    cycle_time_trends = trend_bundle.cycle_time_trend
 
     # Serialize trend data (datetimes → ISO strings)
     trend_data = {
@@ -113,18 +98,8 @@ def build_repo_snapshot(repo_profile: PublicRepoProfile) -> PublicRepoStats:
         end_date=summary_end,
         github_repo=github_repo,
     )
-    pr_sizes = compute_pr_size_distribution(
-        team_id,
-        start_date=summary_start,
-        end_date=summary_end,
-        github_repo=github_repo,
-    )
-    pr_types_raw = compute_pr_type_trends(
-        team_id,
-        start_date=summary_start,
-        end_date=summary_end,
-        github_repo=github_repo,
-    )
+    pr_sizes = summary_bundle.pr_size_distribution
+    pr_types_raw = summary_bundle.pr_type_trends
     # Flatten monthly type counts into aggregate totals for the summary card
     pr_type_totals: dict[str, int] = {}
     for entry in pr_types_raw:
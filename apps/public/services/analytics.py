@@ -17,21 +17,14 @@ from apps.metrics.models import DailyInsight, PullRequest
 from apps.public.aggregations import (
     BOT_USERNAMES,
     MIN_PRS_THRESHOLD,
+    OrgBundle,
     _data_window,
     compute_ai_tools_breakdown,
     compute_industry_stats,
-    compute_member_breakdown,
-    compute_monthly_cycle_time,
-    compute_monthly_sparklines,
-    compute_monthly_trends,
-    compute_pr_size_distribution,
-    compute_pr_type_trends,
-    compute_quality_indicators,
     compute_recent_prs,
     compute_repos_analyzed,
     compute_review_distribution,
     compute_team_summary,
-    compute_tech_category_trends,
 )
 from apps.public.models import PublicOrgProfile, PublicOrgStats
 
@@ -164,7 +157,7 @@ class PublicAnalyticsService:
             }
         except PublicOrgStats.DoesNotExist:
             # Stats not yet computed — compute fresh using rolling window
-            raw = compute_team_summary(team_id, start_date=start_date, end_date=end_date)
+            raw = OrgBundle(team_id, start_date=start_date, end_date=end_date).summary
             # All-time PR count for data significance (not year-filtered)
             total_prs_all_time = (
                 PullRequest.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
@@ -186,18 +179,20 @@ class PublicAnalyticsService:
             }
 
         # On-the-fly aggregations — rolling 12-month window for cross-year data
-        monthly_trends = compute_monthly_trends(team_id, start_date=start_date, end_date=end_date)
+        # Per-PR metrics share one scan of the window's merged PRs
+        bundle = OrgBundle(team_id, start_date=start_date, end_date=end_date)
+        monthly_trends = bundle.monthly_trends
         ai_tools = compute_ai_tools_breakdown(team_id, start_date=start_date, end_date=end_date)
-        sparklines = compute_monthly_sparklines(team_id, start_date=start_date, end_date=end_date)
-        cycle_time_trend = compute_monthly_cycle_time(team_id, start_date=start_date, end_date=end_date)
+        sparklines = bundle.sparklines
+        cycle_time_trend = bundle.cycle_time_trend
         recent_prs = compute_recent_prs(team_id, limit=10)
-        member_breakdown = compute_member_breakdown(team_id, start_date=start_date, end_date=end_date)
-        quality_indicators = compute_quality_indicators(team_id, start_date=start_date, end_date=end_date)
+        member_breakdown = bundle.member_breakdown
+        quality_indicators = bundle.quality_indicators
         review_distribution = compute_review_distribution(team_id, start_date=start_date, end_date=end_date)
         repos_analyzed = compute_repos_analyzed(team_id, start_date=start_date, end_date=end_date)
-        pr_size_distribution = compute_pr_size_distribution(team_id, start_date=start_date, end_date=end_date)
-        tech_category_trends = compute_tech_category_trends(team_id, start_date=start_date, end_date=end_date)
-        pr_type_trends = compute_pr_type_trends(team_id, start_date=start_date, end_date=end_date)
+        pr_size_distribution = bundle.pr_size_distribution
+        tech_category_trends = bundle.tech_category_trends
+        pr_type_trends = bundle.pr_type_trends
 
         # Latest insight (last 30 days, single most important, updated weekly)
         thirty_days_ago = (timezone.now() - timedelta(days=30)).date()
@@ -0,0 +1,216 @@
+"""Bootstrap confidence intervals for public report statistics.
+
+The annual report export used to build each bootstrap resample with
+random.choice and statistics.mean in a Python loop (1000 resamples per
+team, category and metric). Here all resamples of a sample are drawn as one
+(n_bootstrap, n) NumPy index matrix and averaged along its rows, in chunks
+of at most MAX_RESAMPLE_CELLS cells so large samples don't exhaust memory.
+
+Resampling is seeded (DEFAULT_SEED), so regenerating the report gives the
+same intervals. Both percentile and BCa (bias-corrected and accelerated)
+intervals are supported; BCa corrects for the skew of cycle/review time
+distributions. Independent CI jobs (per team, category or metric) can be
+spread over a process pool with map_in_processes.
+
+Usage:
+    lower, upper = bootstrap_mean_ci(values, method=BCA)
+    lower, upper = bootstrap_delta_ci(ai_values, baseline_values)
+    results = map_in_processes(bootstrap_delta_ci, [(a, b), (c, d)])
+"""
+
+import statistics
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+DEFAULT_BOOTSTRAP_SAMPLES = 1000
+DEFAULT_CONFIDENCE = 0.95
+# Fixed seed so regenerated reports publish identical intervals
+DEFAULT_SEED = 20250101
+# Max cells of the (resamples x sample size) index matrix held at once
+MAX_RESAMPLE_CELLS = 4_000_000
+
+PERCENTILE = "percentile"
+BCA = "bca"
+
+
+def bootstrap_means(
+    data: Sequence[float], n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """Means of n_bootstrap resamples (with replacement) of data.
+
+    Args:
+        data: Sample values
+        n_bootstrap: Number of resamples
+        rng: Random generator from _make_rng (defaults to one seeded with DEFAULT_SEED)
+
+    Returns:
+        Array of n_bootstrap resample means
+    """
+    rng = rng if rng is not None else _make_rng(DEFAULT_SEED)
+    values = np.asarray(data, dtype=float)
+    n = len(values)
+    means = np.empty(n_bootstrap)
+    rows_per_chunk = max(1, MAX_RESAMPLE_CELLS // n)
+    for start in range(0, n_bootstrap, rows_per_chunk):
+        stop = min(start + rows_per_chunk, n_bootstrap)
+        means[start:stop] = values[rng.integers(0, n, size=(stop - start, n))].mean(axis=1)
+    return means
+
+
+def bootstrap_mean_ci(
+    data: Sequence[float],
+    n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    method: str = PERCENTILE,
+    seed: int | None = DEFAULT_SEED,
+) -> tuple[float | None, float | None]:
+    """Bootstrap confidence interval for the mean.
+
+    Args:
+        data: Sample values
+        n_bootstrap: Number of resamples
+        confidence: Confidence level (0.95 for a 95% CI)
+        method: PERCENTILE or BCA
+        seed: Resampling seed (None for a fresh random seed)
+
+    Returns:
+        (lower, upper), or (None, None) with fewer than 2 values
+    """
+    if len(data) < 2:
+        return (None, None)
+
+    distribution = bootstrap_means(data, n_bootstrap, _make_rng(seed))
+    if method == BCA:
+        values = np.asarray(data, dtype=float)
+        jackknife = (values.sum() - values) / (len(values) - 1)
+        return _bca_interval(float(values.mean()), distribution, jackknife, confidence)
+    return _percentile_interval(distribution, confidence)
+
+
+def bootstrap_delta_ci(
+    treatment: Sequence[float],
+    control: Sequence[float],
+    n_bootstrap: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    method: str = PERCENTILE,
+    seed: int | None = DEFAULT_SEED,
+) -> tuple[float | None, float | None]:
+    """Bootstrap confidence interval for the percentage difference between means.
+
+    The statistic is (mean(treatment) - mean(control)) / mean(control) * 100;
+    resamples whose control mean is 0 are dropped.
+
+    Args:
+        treatment: Values for the treatment group (e.g. AI-assisted PRs)
+        control: Values for the control group (e.g. non-AI PRs)
+        n_bootstrap: Number of resamples
+        confidence: Confidence level (0.95 for a 95% CI)
+        method: PERCENTILE or BCA
+        seed: Resampling seed (None for a fresh random seed)
+
+    Returns:
+        (lower_pct, upper_pct), or (None, None) with fewer than 2 values per group
+    """
+    if len(treatment) < 2 or len(control) < 2:
+        return (None, None)
+
+    rng = _make_rng(seed)
+    treatment_means = bootstrap_means(treatment, n_bootstrap, rng)
+    control_means = bootstrap_means(control, n_bootstrap, rng)
+    nonzero = control_means != 0
+    distribution = _delta_pct(treatment_means[nonzero], control_means[nonzero])
+    if not len(distribution):
+        return (None, None)
+
+    if method == BCA:
+        treatment_values = np.asarray(treatment, dtype=float)
+        control_values = np.asarray(control, dtype=float)
+        treatment_mean = float(treatment_values.mean())
+        control_mean = float(control_values.mean())
+        if control_mean == 0:
+            return _percentile_interval(distribution, confidence)
+        # Two-sample jackknife: leave out one value from either group
+        treatment_loo = (treatment_values.sum() - treatment_values) / (len(treatment_values) - 1)
+        control_loo = (control_values.sum() - control_values) / (len(control_values) - 1)
+        control_loo = control_loo[control_loo != 0]
+        jackknife = np.concatenate([_delta_pct(treatment_loo, control_mean), _delta_pct(treatment_mean, control_loo)])
+        return _bca_interval(_delta_pct(treatment_mean, control_mean), distribution, jackknife, confidence)
+    return _percentile_interval(distribution, confidence)
+
+
+def pearson_correlation(x: Sequence[float], y: Sequence[float]) -> float | None:
+    """Pearson r between two equal-length series, or None if either has zero variance."""
+    try:
+        return statistics.correlation(x, y)
+    except statistics.StatisticsError:
+        return None
+
+
+def map_in_processes(func: Callable, jobs: Iterable[tuple], max_workers: int | None = None) -> list:
+    """Run func(*args) for each job tuple, in a process pool when there is more than one.
+
+    func must be a module-level (picklable) function. Results keep the order
+    of jobs. With a fixed seed each job's result doesn't depend on which
+    worker ran it.
+
+    Args:
+        func: Function to call, e.g. bootstrap_delta_ci
+        jobs: Positional argument tuples, one per call
+        max_workers: Pool size (default: CPU count); 1 runs in-process
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2 or max_workers == 1:
+        return [func(*args) for args in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *zip(*jobs, strict=True)))
+
+
+def _make_rng(seed: int | None) -> np.random.Generator:
+    return np.random.default_rng(seed)
+
+
+def _delta_pct(treatment_mean, control_mean):
+    """Percentage difference; works elementwise on arrays."""
+    return (treatment_mean - control_mean) / control_mean * 100
+
+
+def _quantile(sorted_values: np.ndarray, q: float) -> float:
+    """Value at rank int(n * q) of a sorted distribution (clamped to the ends)."""
+    return float(sorted_values[min(max(int(len(sorted_values) * q), 0), len(sorted_values) - 1)])
+
+
+def _percentile_interval(distribution: np.ndarray, confidence: float) -> tuple[float, float]:
+    ordered = np.sort(distribution)
+    alpha = (1 - confidence) / 2
+    return (_quantile(ordered, alpha), _quantile(ordered, 1 - alpha))
+
+
+def _bca_interval(
+    estimate: float, distribution: np.ndarray, jackknife: np.ndarray, confidence: float
+) -> tuple[float, float]:
+    """BCa interval: percentile levels shifted by bias (z0) and acceleration (a).
+
+    z0 comes from the share of resamples below the point estimate, a from the
+    skewness of the jackknife estimates (Efron & Tibshirani, ch. 14).
+    """
+    normal = NormalDist()
+    below = float(np.mean(distribution < estimate))
+    if below <= 0 or below >= 1:
+        # Point estimate outside the bootstrap distribution; no usable bias correction
+        return _percentile_interval(distribution, confidence)
+    z0 = normal.inv_cdf(below)
+
+    deviations = jackknife.mean() - jackknife
+    spread = float(np.sum(deviations**2)) ** 1.5
+    acceleration = float(np.sum(deviations**3)) / (6 * spread) if spread else 0.0
+
+    ordered = np.sort(distribution)
+    alpha = (1 - confidence) / 2
+    bounds = []
+    for level in (alpha, 1 - alpha):
+        z = z0 + normal.inv_cdf(level)
+        bounds.append(_quantile(ordered, normal.cdf(z0 + z / (1 - acceleration * z))))
+    return (bounds[0], bounds[1])
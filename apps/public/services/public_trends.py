@@ -5,7 +5,6 @@ separate ORM queries. Aligns weekly data for dual-axis Chart.js rendering.
 """
 
 import logging
-import statistics
 from datetime import date
 
 from apps.metrics.services.dashboard.ai_metrics import get_ai_adoption_trend
@@ -17,6 +16,7 @@ from apps.public.constants import (
     CORRELATION_STRONG_POSITIVE,
     MIN_CORRELATION_WEEKS,
 )
+from apps.public.services.bootstrap import pearson_correlation
 from apps.teams.models import Team
 
 logger = logging.getLogger(__name__)
@@ -103,11 +103,8 @@ def compute_weekly_correlation(
     ai = ai_values[:n]
     delivery = delivery_values[:n]
 
-    try:
-        return statistics.correlation(ai, delivery)
-    except statistics.StatisticsError:
-        # Zero-variance series (e.g., all 0% AI adoption)
-        return None
+    # None for zero-variance series (e.g., all 0% AI adoption)
+    return pearson_correlation(ai, delivery)
 
 
 def classify_correlation(r: float) -> str:
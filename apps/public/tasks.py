@@ -2,17 +2,23 @@
 
 Daily pipeline:
 1. sync_public_oss_repositories_task (3 AM) — fetch fresh PR data for flagship repos
-2. compute_public_stats_task (7 AM) — recompute PublicOrgStats + PublicRepoStats
-3. clear_public_cache — clears Redis cache after stats refresh
+2. compute_public_stats_task (7 AM) — plan and dispatch the stats pipeline:
+   per-org PublicOrgStats subtasks, then per-repo PublicRepoStats subtasks,
+   skipping orgs/repos with no new merged PRs since last_computed_at
+3. finalize_public_stats_task — clears Redis + edge cache once all subtasks finish
 
 The sync task runs before customer sync (4 AM) using separate PAT tokens.
 """
 
 import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
 from decimal import Decimal
 
-from celery import shared_task
+from celery import chord, shared_task
 from django.core.cache import cache
+from django.db.models import Max
+from django.db.models.functions import Greatest
 from django.utils import timezone
 
 from apps.metrics.models import PullRequest
@@ -62,112 +68,204 @@ def _best_data_year(team_id, fallback=None):
     return timezone.now().year
 
 
-@shared_task(soft_time_limit=600, time_limit=660)
-def compute_public_stats_task():
-    """Recompute PublicOrgStats for all public organizations.
+# Quiet orgs/repos are still recomputed this often so their rolling
+# 30/90-day windows don't go stale indefinitely.
+PUBLIC_STATS_MAX_AGE = timedelta(days=7)
 
-    Iterates over all public org profiles, computes fresh metrics
-    via aggregation functions, and updates the PublicOrgStats table.
-    Then clears the public cache so pages serve fresh data.
 
-    Safe to run multiple times — uses update_or_create for idempotency.
+@dataclass
+class PublicStatsPlan:
+    """Org and repo profiles whose public stats need recomputing."""
+
+    org_ids: list[int] = field(default_factory=list)
+    repo_ids: list[int] = field(default_factory=list)
+    skipped_orgs: int = 0
+    skipped_repos: int = 0
+
+
+def _latest_merged_activity(team_ids, by_repo: bool = False) -> dict:
+    """Latest merge or first-sync time of merged PRs, per team or per (team, repo).
+
+    One grouped query for all teams. created_at catches PRs merged before the
+    last computation but only synced after it (backfills, late syncs).
     """
-    logger.info("Starting public stats computation")
-    now = timezone.now()
+    keys = ("team_id", "github_repo") if by_repo else ("team_id",)
+    rows = (
+        PullRequest.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
+            team_id__in=team_ids,
+            state="merged",
+        )
+        .values(*keys)
+        .annotate(latest=Greatest(Max("merged_at"), Max("created_at")))
+        .values_list(*keys, "latest")
+    )
+    return {tuple(row[:-1]): row[-1] for row in rows}
 
-    profiles = PublicOrgProfile.objects.filter(
-        is_public=True,
-    ).select_related("team")
 
-    computed = 0
-    errors = 0
+def _is_stale(last_computed_at, latest_activity, now) -> bool:
+    if last_computed_at is None or now - last_computed_at >= PUBLIC_STATS_MAX_AGE:
+        return True
+    return latest_activity is not None and latest_activity > last_computed_at
 
-    for profile in profiles:
-        try:
-            # Determine the best year for aggregation: use the year with the most
-            # merged PRs, since seeded data may span 2025 or 2026
-            year = _best_data_year(profile.team_id, fallback=now.year)
-
-            summary = compute_team_summary(profile.team_id, year=year)
-            ai_tools = compute_ai_tools_breakdown(profile.team_id, year=year)
-
-            # total_prs uses ALL-TIME count (not year-filtered) because it
-            # gates directory visibility via MIN_PRS_THRESHOLD and represents
-            # overall data significance, not a time-bound metric.
-            total_prs_all_time = (
-                PullRequest.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
-                    team_id=profile.team_id,
-                    state="merged",
-                )
-                .exclude(author__github_username__endswith="[bot]")
-                .exclude(author__github_username__in=BOT_USERNAMES)
-                .count()
-            )
-
-            PublicOrgStats.objects.update_or_create(
-                org_profile=profile,
-                defaults={
-                    "total_prs": total_prs_all_time,
-                    "ai_assisted_pct": summary["ai_pct"],
-                    "median_cycle_time_hours": summary["median_cycle_time_hours"],
-                    "median_review_time_hours": summary["median_review_time_hours"],
-                    "active_contributors_90d": summary["active_contributors_90d"],
-                    "top_ai_tools": ai_tools,
-                    "last_computed_at": now,
-                },
-            )
-            computed += 1
-            logger.debug(f"Computed stats for {profile.display_name}: {summary['total_prs']} PRs")
-        except Exception:
-            errors += 1
-            logger.exception(f"Failed to compute stats for {profile.display_name}")
 
-    # Compute org-level trend and impact data (review 1A)
+def plan_public_stats_refresh(force: bool = False) -> PublicStatsPlan:
+    """Pick the public orgs and repos with new merged PRs since last_computed_at.
+
+    Repos of a recomputed org are always included, since their snapshots hold
+    deltas relative to the org's stats.
+
+    Args:
+        force: Recompute everything regardless of activity
+
+    Returns:
+        PublicStatsPlan with the profile IDs to recompute and skip counts
+    """
+    now = timezone.now()
+    plan = PublicStatsPlan()
+
+    orgs = list(PublicOrgProfile.objects.filter(is_public=True).values_list("id", "team_id", "stats__last_computed_at"))
+    repos = list(
+        PublicRepoProfile.objects.snapshot_eligible().values_list(
+            "id", "team_id", "github_repo", "stats__last_computed_at"
+        )
+    )
+    if not force:
+        org_activity = _latest_merged_activity({team_id for _, team_id, _ in orgs})
+        repo_activity = _latest_merged_activity({team_id for _, team_id, _, _ in repos}, by_repo=True)
+
+    recomputed_team_ids = set()
+    for org_id, team_id, last_computed_at in orgs:
+        if force or _is_stale(last_computed_at, org_activity.get((team_id,)), now):
+            plan.org_ids.append(org_id)
+            recomputed_team_ids.add(team_id)
+        else:
+            plan.skipped_orgs += 1
+    for repo_id, team_id, github_repo, last_computed_at in repos:
+        # Repo snapshots store deltas against the org stats, so every repo of a
+        # recomputed org is rebuilt even if the repo itself had no activity
+        if (
+            force
+            or team_id in recomputed_team_ids
+            or _is_stale(last_computed_at, repo_activity.get((team_id, github_repo)), now)
+        ):
+            plan.repo_ids.append(repo_id)
+        else:
+            plan.skipped_repos += 1
+    return plan
+
+
+def _compute_org_stats(profile: PublicOrgProfile) -> None:
+    """Recompute and store every PublicOrgStats field for one org."""
     from apps.metrics.services.dashboard.ai_metrics import get_ai_impact_stats
     from apps.public.services.public_trends import build_combined_trend
     from apps.public.views.helpers import get_public_trend_date_range
 
+    now = timezone.now()
+
+    # Determine the best year for aggregation: use the year with the most
+    # merged PRs, since seeded data may span 2025 or 2026
+    year = _best_data_year(profile.team_id, fallback=now.year)
+
+    summary = compute_team_summary(profile.team_id, year=year)
+    ai_tools = compute_ai_tools_breakdown(profile.team_id, year=year)
+
+    # total_prs uses ALL-TIME count (not year-filtered) because it
+    # gates directory visibility via MIN_PRS_THRESHOLD and represents
+    # overall data significance, not a time-bound metric.
+    total_prs_all_time = (
+        PullRequest.objects.filter(  # noqa: TEAM001 - cross-team for public analytics
+            team_id=profile.team_id,
+            state="merged",
+        )
+        .exclude(author__github_username__endswith="[bot]")
+        .exclude(author__github_username__in=BOT_USERNAMES)
+        .count()
+    )
+
+    # Org-level trend and impact data (review 1A)
     _days, trend_start, trend_end = get_public_trend_date_range()
+    try:
+        combined = build_combined_trend(profile.team, trend_start, trend_end)
+    except Exception:
+        logger.warning("Failed org combined trend for %s", profile.display_name, exc_info=True)
+        combined = {}
 
-    for profile in profiles:
-        try:
-            org_stats = PublicOrgStats.objects.get(org_profile=profile)
-
-            try:
-                combined = build_combined_trend(profile.team, trend_start, trend_end)
-            except Exception:
-                logger.warning("Failed org combined trend for %s", profile.display_name, exc_info=True)
-                combined = {}
-
-            try:
-                impact = get_ai_impact_stats(profile.team, trend_start, trend_end)
-                impact = {k: float(v) if isinstance(v, Decimal) else v for k, v in impact.items()}
-            except Exception:
-                logger.warning("Failed org AI impact for %s", profile.display_name, exc_info=True)
-                impact = {}
-
-            org_stats.combined_trend_data = combined
-            org_stats.ai_impact_data = impact
-            org_stats.save(update_fields=["combined_trend_data", "ai_impact_data", "updated_at"])
-        except PublicOrgStats.DoesNotExist:
-            pass
-        except Exception:
-            logger.exception("Failed to compute org trend/impact for %s", profile.display_name)
-
-    # Build repo-level snapshots for ALL public repos (not just flagship)
+    try:
+        impact = get_ai_impact_stats(profile.team, trend_start, trend_end)
+        impact = {k: float(v) if isinstance(v, Decimal) else v for k, v in impact.items()}
+    except Exception:
+        logger.warning("Failed org AI impact for %s", profile.display_name, exc_info=True)
+        impact = {}
+
+    PublicOrgStats.objects.update_or_create(
+        org_profile=profile,
+        defaults={
+            "total_prs": total_prs_all_time,
+            "ai_assisted_pct": summary["ai_pct"],
+            "median_cycle_time_hours": summary["median_cycle_time_hours"],
+            "median_review_time_hours": summary["median_review_time_hours"],
+            "active_contributors_90d": summary["active_contributors_90d"],
+            "top_ai_tools": ai_tools,
+            "combined_trend_data": combined,
+            "ai_impact_data": impact,
+            "last_computed_at": now,
+        },
+    )
+    logger.debug(f"Computed stats for {profile.display_name}: {summary['total_prs']} PRs")
+
+
+@shared_task(soft_time_limit=300, time_limit=360)
+def compute_public_org_stats_task(profile_id: int) -> dict:
+    """Recompute PublicOrgStats for one public org (fan-out subtask).
+
+    Never raises, so one failing org doesn't stop the pipeline's fan-in.
+
+    Returns:
+        {"kind": "org", "id": profile_id, "ok": bool}
+    """
+    try:
+        profile = PublicOrgProfile.objects.select_related("team").get(pk=profile_id)
+        _compute_org_stats(profile)
+        return {"kind": "org", "id": profile_id, "ok": True}
+    except Exception:
+        logger.exception("Failed to compute stats for public org profile %s", profile_id)
+        return {"kind": "org", "id": profile_id, "ok": False}
+
+
+@shared_task(soft_time_limit=300, time_limit=360)
+def build_public_repo_snapshot_task(repo_profile_id: int) -> dict:
+    """Build the PublicRepoStats snapshot for one public repo (fan-out subtask).
+
+    Never raises, so one failing repo doesn't stop the pipeline's fan-in.
+
+    Returns:
+        {"kind": "repo", "id": repo_profile_id, "ok": bool}
+    """
     from apps.public.repo_snapshot_service import build_repo_snapshot
 
-    repo_snapshots = 0
-    repo_errors = 0
+    try:
+        repo_profile = PublicRepoProfile.objects.select_related("org_profile", "team").get(pk=repo_profile_id)
+        build_repo_snapshot(repo_profile)
+        return {"kind": "repo", "id": repo_profile_id, "ok": True}
+    except Exception:
+        logger.exception("Failed to build snapshot for public repo profile %s", repo_profile_id)
+        return {"kind": "repo", "id": repo_profile_id, "ok": False}
+
+
+@shared_task(soft_time_limit=120, time_limit=180)
+def dispatch_public_repo_snapshots_task(org_results, repo_ids, skipped_orgs=0, skipped_repos=0):
+    """Second fan-out: repo snapshots, after org stats (used for repo vs org deltas)."""
+    finalize = finalize_public_stats_task.s(
+        org_results=org_results, skipped_orgs=skipped_orgs, skipped_repos=skipped_repos
+    )
+    if not repo_ids:
+        return finalize.delay([]).id
+    return chord([build_public_repo_snapshot_task.si(repo_id) for repo_id in repo_ids])(finalize).id
 
-    for repo_profile in PublicRepoProfile.objects.snapshot_eligible():
-        try:
-            build_repo_snapshot(repo_profile)
-            repo_snapshots += 1
-        except Exception:
-            repo_errors += 1
-            logger.exception(f"Failed to build snapshot for {repo_profile.display_name}")
 
+@shared_task(soft_time_limit=120, time_limit=180)
+def finalize_public_stats_task(repo_results, org_results=(), skipped_orgs=0, skipped_repos=0) -> dict:
+    """Fan-in: clear the public caches once every subtask has finished."""
     # Clear public cache after all stats are updated
     _clear_public_cache()
 
@@ -176,20 +274,79 @@ def compute_public_stats_task():
 
     purge_all_cache()
 
+    summary = {
+        "computed": sum(1 for result in org_results if result["ok"]),
+        "errors": sum(1 for result in org_results if not result["ok"]),
+        "repo_snapshots": sum(1 for result in repo_results if result["ok"]),
+        "repo_errors": sum(1 for result in repo_results if not result["ok"]),
+        "skipped_orgs": skipped_orgs,
+        "skipped_repos": skipped_repos,
+    }
     logger.info(
-        "Public stats computation complete. Orgs: %d, Repo snapshots: %d, Errors: %d/%d",
-        computed,
-        repo_snapshots,
-        errors,
-        repo_errors,
+        "Public stats computation complete. Orgs: %d, Repo snapshots: %d, Errors: %d/%d, Skipped: %d/%d",
+        summary["computed"],
+        summary["repo_snapshots"],
+        summary["errors"],
+        summary["repo_errors"],
+        skipped_orgs,
+        skipped_repos,
     )
+    return summary
+
+
+@shared_task(soft_time_limit=120, time_limit=180)
+def compute_public_stats_task(force: bool = False) -> dict:
+    """Recompute PublicOrgStats and PublicRepoStats for changed public orgs/repos.
+
+    Plans the refresh (orgs/repos with no new merged PRs since last_computed_at
+    are skipped), then dispatches a fan-out/fan-in pipeline:
 
-    return {
-        "computed": computed,
-        "errors": errors,
-        "repo_snapshots": repo_snapshots,
-        "repo_errors": repo_errors,
+        chord(org subtasks) -> chord(repo snapshot subtasks) -> finalize (cache purge)
+
+    Repo snapshots run after org stats because they compare each repo with its
+    org. Safe to run multiple times — subtasks use update_or_create.
+
+    Args:
+        force: Recompute every public org and repo regardless of activity
+    """
+    plan = plan_public_stats_refresh(force=force)
+    logger.info(
+        "Starting public stats computation: %d orgs, %d repos (%d/%d unchanged)",
+        len(plan.org_ids),
+        len(plan.repo_ids),
+        plan.skipped_orgs,
+        plan.skipped_repos,
+    )
+    result = {
+        "orgs": len(plan.org_ids),
+        "repos": len(plan.repo_ids),
+        "skipped_orgs": plan.skipped_orgs,
+        "skipped_repos": plan.skipped_repos,
     }
+    if not plan.org_ids and not plan.repo_ids:
+        return {**result, "status": "unchanged"}
+
+    repo_stage = dispatch_public_repo_snapshots_task.s(
+        plan.repo_ids, skipped_orgs=plan.skipped_orgs, skipped_repos=plan.skipped_repos
+    )
+    if plan.org_ids:
+        async_result = chord([compute_public_org_stats_task.si(org_id) for org_id in plan.org_ids])(repo_stage)
+    else:
+        async_result = repo_stage.delay([])
+    return {**result, "status": "dispatched", "task_id": async_result.id}
+
+
+def run_public_stats_refresh(force: bool = False) -> dict:
+    """Run the whole public stats pipeline in-process (for tests and commands).
+
+    Same planning and subtasks as compute_public_stats_task, executed serially.
+    """
+    plan = plan_public_stats_refresh(force=force)
+    org_results = [compute_public_org_stats_task(org_id) for org_id in plan.org_ids]
+    repo_results = [build_public_repo_snapshot_task(repo_id) for repo_id in plan.repo_ids]
+    return finalize_public_stats_task(
+        repo_results, org_results=org_results, skipped_orgs=plan.skipped_orgs, skipped_repos=plan.skipped_repos
+    )
 
 
 def _clear_public_cache():
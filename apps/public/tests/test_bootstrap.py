@@ -0,0 +1,59 @@
+import random
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.public.services import bootstrap
+from apps.public.services.bootstrap import (
+    BCA,
+    _make_rng,
+    bootstrap_delta_ci,
+    bootstrap_mean_ci,
+    bootstrap_means,
+    map_in_processes,
+    pearson_correlation,
+)
+
+
+class BootstrapTests(SimpleTestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        # Right-skewed like cycle times: mean 20h vs 25h
+        self.treatment = [rng.expovariate(1 / 20) for _ in range(300)]
+        self.control = [rng.expovariate(1 / 25) for _ in range(400)]
+        self.mean = sum(self.treatment) / len(self.treatment)
+
+    def test_mean_ci_brackets_the_mean_and_is_reproducible(self):
+        for method in ("percentile", BCA):
+            lower, upper = bootstrap_mean_ci(self.treatment, method=method)
+
+            assert lower < self.mean < upper
+            assert bootstrap_mean_ci(self.treatment, method=method) == (lower, upper)
+
+    def test_resample_means_are_drawn_in_bounded_chunks(self):
+        means = bootstrap_means(self.treatment, 1000, _make_rng(1))
+
+        with mock.patch.object(bootstrap, "MAX_RESAMPLE_CELLS", len(self.treatment) * 64):
+            chunked = bootstrap_means(self.treatment, 1000, _make_rng(1))
+
+        assert means.shape == chunked.shape == (1000,)
+        assert min(self.treatment) <= means.min() and means.max() <= max(self.treatment)
+        assert abs(chunked.mean() - self.mean) < 1
+
+    def test_delta_ci_is_negative_for_faster_treatment(self):
+        lower, upper = bootstrap_delta_ci(self.treatment, self.control, method=BCA)
+
+        assert lower < upper < 0
+
+    def test_too_few_values_return_none(self):
+        assert bootstrap_mean_ci([1.0]) == (None, None)
+        assert bootstrap_delta_ci([1.0, 2.0], [3.0]) == (None, None)
+        assert bootstrap_delta_ci([1.0, 2.0], [0.0, 0.0]) == (None, None)
+
+    def test_correlation_of_constant_series_is_none(self):
+        assert pearson_correlation([0.0, 0.0, 0.0], [1.0, 2.0, 3.0]) is None
+
+    def test_map_in_processes_matches_in_process_results(self):
+        jobs = [(self.treatment, self.control), (self.control, self.treatment)]
+
+        assert map_in_processes(bootstrap_delta_ci, jobs, max_workers=2) == [bootstrap_delta_ci(*job) for job in jobs]
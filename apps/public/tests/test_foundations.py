@@ -1,5 +1,6 @@
 from datetime import timedelta
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
@@ -48,7 +49,7 @@ class PublicFoundationTests(SimpleTestCase):
 
 
 class ComputeStatsTaskRepoSnapshotTests(TestCase):
-    """Integration test: compute_public_stats_task must also build repo snapshots."""
+    """Integration test: the public stats pipeline must also build repo snapshots."""
 
     @classmethod
     def setUpTestData(cls):
@@ -90,10 +91,10 @@ class ComputeStatsTaskRepoSnapshotTests(TestCase):
             )
 
     def test_compute_stats_task_builds_repo_snapshots(self):
-        """compute_public_stats_task must also build PublicRepoStats for flagship repos."""
+        """The public stats pipeline must also build PublicRepoStats for flagship repos."""
         assert not PublicRepoStats.objects.filter(repo_profile=self.repo_profile).exists()
 
-        result = public_tasks.compute_public_stats_task()
+        result = public_tasks.run_public_stats_refresh()
 
         assert result["repo_snapshots"] >= 1
         assert PublicRepoStats.objects.filter(repo_profile=self.repo_profile).exists()
@@ -101,3 +102,63 @@ class ComputeStatsTaskRepoSnapshotTests(TestCase):
         snapshot = PublicRepoStats.objects.get(repo_profile=self.repo_profile)
         assert snapshot.total_prs_in_window > 0
         assert snapshot.last_computed_at is not None
+
+    def test_unchanged_org_and_repo_are_skipped(self):
+        public_tasks.run_public_stats_refresh()
+
+        plan = public_tasks.plan_public_stats_refresh()
+
+        assert (plan.org_ids, plan.repo_ids) == ([], [])
+        assert (plan.skipped_orgs, plan.skipped_repos) == (1, 1)
+        assert public_tasks.compute_public_stats_task()["status"] == "unchanged"
+
+    def test_new_merged_pr_or_max_age_triggers_recompute(self):
+        public_tasks.run_public_stats_refresh()
+        now = timezone.now()
+        PullRequest.objects.create(
+            team=self.team,
+            github_repo="pipeline-org/flagship",
+            github_pr_id=9100,
+            title="Late PR",
+            state="merged",
+            pr_created_at=now - timedelta(hours=2),
+            merged_at=now,
+            author=self.member,
+        )
+
+        plan = public_tasks.plan_public_stats_refresh()
+        assert (plan.org_ids, plan.repo_ids) == ([self.org_profile.id], [self.repo_profile.id])
+
+        public_tasks.run_public_stats_refresh()
+        PublicRepoStats.objects.update(last_computed_at=now - public_tasks.PUBLIC_STATS_MAX_AGE)
+        assert public_tasks.plan_public_stats_refresh().repo_ids == [self.repo_profile.id]
+
+    def test_quiet_repo_of_recomputed_org_is_recomputed(self):
+        public_tasks.run_public_stats_refresh()
+        now = timezone.now()
+        PullRequest.objects.create(
+            team=self.team,
+            github_repo="pipeline-org/other",
+            github_pr_id=9200,
+            title="PR in another repo",
+            state="merged",
+            pr_created_at=now - timedelta(hours=2),
+            merged_at=now,
+            author=self.member,
+        )
+
+        plan = public_tasks.plan_public_stats_refresh()
+
+        # The flagship repo had no activity, but its deltas are relative to the org stats
+        assert (plan.org_ids, plan.repo_ids) == ([self.org_profile.id], [self.repo_profile.id])
+
+    def test_compute_stats_task_dispatches_org_chord_then_repo_stage(self):
+        with patch("apps.public.tasks.chord") as mock_chord:
+            result = public_tasks.compute_public_stats_task(force=True)
+
+        assert result["status"] == "dispatched"
+        org_signatures = list(mock_chord.call_args.args[0])
+        assert [sig.args for sig in org_signatures] == [(self.org_profile.id,)]
+        repo_stage = mock_chord.return_value.call_args.args[0]
+        assert repo_stage.task == "apps.public.tasks.dispatch_public_repo_snapshots_task"
+        assert repo_stage.args == ([self.repo_profile.id],)
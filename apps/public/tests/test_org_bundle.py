@@ -0,0 +1,95 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.metrics.factories import TeamFactory, TeamMemberFactory
+from apps.metrics.models import PullRequest
+from apps.public.aggregations import OrgBundle
+
+
+class OrgBundleTests(TestCase):
+    """OrgBundle derives the per-PR public metrics from a single scan."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.team = TeamFactory()
+        cls.alice = TeamMemberFactory(team=cls.team, github_username="alice")
+        cls.bob = TeamMemberFactory(team=cls.team, github_username="bob")
+        cls.bot = TeamMemberFactory(team=cls.team, github_username="dependabot[bot]")
+        now = timezone.now()
+        prs = [
+            # (author, days ago, cycle time, review time, size, ai, llm categories, file categories, labels)
+            (cls.alice, 5, "10", "2", 30, True, ["backend"], [], ["bug"]),
+            (cls.alice, 6, "20", "4", 150, False, None, ["frontend"], []),
+            (cls.bob, 7, "30", None, 700, True, None, [], ["documentation"]),
+            (cls.bob, 8, "500", "8", 5000, False, None, [], []),
+            (cls.bot, 9, "1", "1", 1, False, None, [], []),
+        ]
+        for i, (author, days_ago, cycle, review, size, ai, llm_cats, file_cats, labels) in enumerate(prs):
+            created = now - timedelta(days=days_ago)
+            PullRequest.objects.create(
+                team=cls.team,
+                github_repo="org/repo",
+                github_pr_id=7000 + i,
+                title=f"PR {i}",
+                state="merged",
+                author=author,
+                pr_created_at=created,
+                merged_at=created + timedelta(hours=1),
+                cycle_time_hours=Decimal(cycle),
+                review_time_hours=Decimal(review) if review else None,
+                additions=size,
+                deletions=0,
+                is_ai_assisted=ai,
+                is_revert=i == 0,
+                llm_summary={"tech": {"categories": llm_cats}} if llm_cats else None,
+                tech_categories=file_cats,
+                labels=labels,
+            )
+        cls.bundle_args = {"start_date": now - timedelta(days=30), "end_date": now + timedelta(days=1)}
+
+    def test_pr_metrics_come_from_one_query(self):
+        bundle = OrgBundle(self.team.id, **self.bundle_args)
+
+        with self.assertNumQueries(1):
+            summary = bundle.summary
+            trends = bundle.monthly_trends
+            sizes = bundle.pr_size_distribution
+            types = bundle.pr_type_trends
+            bundle.sparklines  # noqa: B018
+            bundle.cycle_time_trend  # noqa: B018
+
+        # Bot PR excluded; 500h cycle time excluded from medians
+        assert (summary["total_prs"], summary["ai_prs"], summary["ai_pct"]) == (4, 2, Decimal("50.0"))
+        assert summary["median_cycle_time_hours"] == Decimal("20.0")
+        assert summary["median_review_time_hours"] == Decimal("3.0")
+        assert summary["active_contributors_30d"] == 2
+        assert sum(row["total_prs"] for row in trends) == 4
+        assert [(row["bucket"], row["count"]) for row in sizes] == [("XS", 1), ("S", 1), ("M", 0), ("L", 1), ("XL", 1)]
+        type_totals = {}
+        for row in types:
+            for pr_type, count in row["types"].items():
+                type_totals[pr_type] = type_totals.get(pr_type, 0) + count
+        assert type_totals == {"bugfix": 1, "docs": 1, "unknown": 2}
+
+    def test_tech_categories_prefer_llm_then_stored_file_categories(self):
+        trends = OrgBundle(self.team.id, **self.bundle_args).tech_category_trends
+
+        totals = {}
+        for row in trends:
+            for category, count in row["categories"].items():
+                totals[category] = totals.get(category, 0) + count
+        assert totals == {"backend": 1, "frontend": 1}
+
+    def test_member_breakdown_and_quality_indicators(self):
+        bundle = OrgBundle(self.team.id, **self.bundle_args)
+
+        members = {row["github_username"]: row for row in bundle.member_breakdown}
+        quality = bundle.quality_indicators
+
+        assert set(members) == {"alice", "bob"}
+        assert (members["alice"]["prs_merged"], members["alice"]["avg_cycle_time"]) == (2, 15.0)
+        assert members["bob"]["avg_cycle_time"] == 30.0
+        assert quality["revert_rate"] == 25.0
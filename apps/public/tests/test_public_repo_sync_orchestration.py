@@ -464,9 +464,9 @@ class ComputeStatsSnapshotTests(TestCase):
             is_public=True,
         )
 
-        from apps.public.tasks import compute_public_stats_task
+        from apps.public.tasks import run_public_stats_refresh
 
-        compute_public_stats_task()
+        run_public_stats_refresh()
 
         # build_repo_snapshot should have been called with our non-flagship repo
         called_profiles = [call.args[0] for call in mock_snapshot.call_args_list]
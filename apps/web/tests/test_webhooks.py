@@ -9,6 +9,13 @@ from django.test import TestCase
 from django.urls import reverse
 
 from apps.integrations.factories import GitHubIntegrationFactory, TrackedRepositoryFactory
+from apps.integrations.models import GitHubWebhookEvent
+from apps.integrations.services.webhook_queue import process_pending_webhook_events
+
+
+def _drain_webhook_queue():
+    """Process every queued event, as the Celery workers would."""
+    return process_pending_webhook_events(older_than_seconds=0)
 
 
 class TestGitHubWebhook(TestCase):
@@ -78,8 +85,8 @@ class TestGitHubWebhook(TestCase):
         self.assertIn("signature", response.json().get("error", "").lower())
 
     @patch("apps.metrics.processors.handle_pull_request_event")
-    def test_endpoint_returns_200_for_valid_payload_with_valid_signature(self, mock_handler):
-        """Test that webhook accepts valid payload with correct signature."""
+    def test_endpoint_returns_202_for_valid_payload_with_valid_signature(self, mock_handler):
+        """Test that webhook accepts and queues valid payload with correct signature."""
         payload = self._create_webhook_payload()
         payload_bytes = json.dumps(payload).encode()
         signature = self._create_valid_signature(payload_bytes, self.github_integration.webhook_secret)
@@ -92,7 +99,10 @@ class TestGitHubWebhook(TestCase):
             HTTP_X_GITHUB_DELIVERY="72d3162e-cc78-11e3-81ab-4c9367dc0958",
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(GitHubWebhookEvent.objects.count(), 1)
+        # The handler runs in the worker, not in the request
+        mock_handler.assert_not_called()
 
     @patch("apps.metrics.processors.handle_pull_request_review_event")
     @patch("apps.metrics.processors.handle_pull_request_event")
@@ -103,6 +113,7 @@ class TestGitHubWebhook(TestCase):
         signature = self._create_valid_signature(payload_bytes, self.github_integration.webhook_secret)
 
         # Test with different event types (each needs unique delivery ID for replay protection)
+        expected_status = {"pull_request": 202, "push": 200, "pull_request_review": 202}
         for i, event_type in enumerate(["pull_request", "push", "pull_request_review"]):
             with self.subTest(event_type=event_type):
                 response = self.client.post(
@@ -113,8 +124,8 @@ class TestGitHubWebhook(TestCase):
                     HTTP_X_GITHUB_DELIVERY=f"72d3162e-cc78-11e3-81ab-4c9367dc095{i}",
                     HTTP_X_HUB_SIGNATURE_256=signature,
                 )
-                self.assertEqual(response.status_code, 200)
-                # The response should acknowledge the event was processed
+                self.assertEqual(response.status_code, expected_status[event_type])
+                # The response should acknowledge the event was received
                 response_data = response.json()
                 self.assertEqual(response_data.get("event"), event_type)
 
@@ -133,12 +144,14 @@ class TestGitHubWebhook(TestCase):
             HTTP_X_GITHUB_DELIVERY="72d3162e-cc78-11e3-81ab-4c9367dc0958",
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
         # Verify response is minimal (no internal IDs leaked for security)
         response_data = response.json()
-        self.assertEqual(response_data.get("status"), "processed")
+        self.assertEqual(response_data.get("status"), "queued")
         self.assertNotIn("team_id", response_data)  # Security: no internal IDs
-        # Verify handler was called with correct team
+        # Verify the event was queued for the correct team and handled for it
+        self.assertEqual(GitHubWebhookEvent.objects.get().team, self.github_integration.team)
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         call_args = mock_handler.call_args
         self.assertEqual(call_args[0][0], self.github_integration.team)
@@ -185,7 +198,7 @@ class TestGitHubWebhook(TestCase):
                 HTTP_X_GITHUB_DELIVERY=delivery_id,
                 HTTP_X_HUB_SIGNATURE_256=signature,
             )
-            self.assertEqual(response1.status_code, 200)
+            self.assertEqual(response1.status_code, 202)
 
             # Second request with same delivery ID should be rejected
             response2 = self.client.post(
@@ -272,8 +285,9 @@ class TestGitHubWebhookEventDispatch(TestCase):
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
 
-        self.assertEqual(response.status_code, 200)
-        # Verify handler was called with team and payload
+        self.assertEqual(response.status_code, 202)
+        # Verify handler was called with team and payload once the queue drains
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         call_args = mock_handler.call_args
         self.assertEqual(call_args[0][0], self.github_integration.team)  # team argument
@@ -309,8 +323,9 @@ class TestGitHubWebhookEventDispatch(TestCase):
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
 
-        self.assertEqual(response.status_code, 200)
-        # Verify handler was called with team and payload
+        self.assertEqual(response.status_code, 202)
+        # Verify handler was called with team and payload once the queue drains
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         call_args = mock_handler.call_args
         self.assertEqual(call_args[0][0], self.github_integration.team)  # team argument
@@ -334,7 +349,9 @@ class TestGitHubWebhookEventDispatch(TestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        # Verify handlers were NOT called
+        # Verify nothing was queued and handlers were NOT called
+        self.assertFalse(GitHubWebhookEvent.objects.exists())
+        _drain_webhook_queue()
         mock_pr_handler.assert_not_called()
         mock_review_handler.assert_not_called()
 
@@ -368,7 +385,9 @@ class TestGitHubWebhookEventDispatch(TestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        # Verify handlers were NOT called
+        # Verify nothing was queued and handlers were NOT called
+        self.assertFalse(GitHubWebhookEvent.objects.exists())
+        _drain_webhook_queue()
         mock_pr_handler.assert_not_called()
         mock_review_handler.assert_not_called()
 
@@ -437,7 +456,8 @@ class TestGitHubWebhookMultiTeam(TestCase):
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
 
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         # Verify the handler was called with team1's team
         call_args = mock_handler.call_args
@@ -459,7 +479,8 @@ class TestGitHubWebhookMultiTeam(TestCase):
             HTTP_X_HUB_SIGNATURE_256=signature,
         )
 
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         # Verify the handler was called with team2's team
         call_args = mock_handler.call_args
@@ -516,7 +537,8 @@ class TestGitHubWebhookMultiTeam(TestCase):
         )
 
         # Should succeed and route to team3
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 202)
+        _drain_webhook_queue()
         mock_handler.assert_called_once()
         call_args = mock_handler.call_args
         self.assertEqual(call_args[0][0], integration3.team)
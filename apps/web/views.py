@@ -22,11 +22,11 @@ from apps.integrations.models import TrackedRepository
 from apps.integrations.services.github_webhooks import validate_webhook_signature
 from apps.integrations.services.integration_flags import is_integration_enabled
 from apps.integrations.services.status import get_team_integration_status, get_team_sync_status
+from apps.integrations.services.webhook_queue import QUEUED_EVENT_TYPES, enqueue_webhook_event
 from apps.integrations.webhooks.github_app import (
     handle_installation_event,
     handle_installation_repositories_event,
 )
-from apps.metrics import processors
 from apps.metrics.models import PRSurveyReview, TeamMember
 from apps.metrics.services.quick_stats import get_team_quick_stats
 from apps.metrics.services.survey_service import record_author_response, record_reviewer_response
@@ -236,7 +236,11 @@ class HealthCheck(MainView):
 def github_webhook(request):
     """Handle GitHub webhook events.
 
-    Validates the webhook signature and processes events from tracked repositories.
+    Validates the webhook signature and queues pull_request and
+    pull_request_review events from tracked repositories, returning 202.
+    Celery workers apply queued events, coalescing bursts for the same PR into
+    one upsert (see apps.integrations.services.webhook_queue). Other event
+    types are acknowledged and ignored.
     Includes replay protection using the X-GitHub-Delivery header.
     Rate limited to 100 requests per minute per IP.
 
@@ -313,22 +317,26 @@ def github_webhook(request):
     event_type = request.META.get("HTTP_X_GITHUB_EVENT", "unknown")
     team = tracked_repo.integration.team
 
-    # Dispatch to appropriate handler based on event type
-    if event_type == "pull_request":
-        processors.handle_pull_request_event(team, payload)
-    elif event_type == "pull_request_review":
-        processors.handle_pull_request_review_event(team, payload)
+    # Queue metrics events for background processing; the unique delivery ID
+    # also catches redeliveries that outlive the replay cache
+    if event_type in QUEUED_EVENT_TYPES:
+        if enqueue_webhook_event(team, delivery_id, event_type, payload) is None:
+            logger.warning(f"Duplicate webhook delivery detected: {delivery_id}")
+            return JsonResponse({"error": "Duplicate delivery"}, status=409)
+        response_status, http_status = "queued", 202
+    else:
+        response_status, http_status = "ignored", 200
 
-    # Mark webhook as processed (replay protection)
+    # Mark webhook as received (replay protection)
     cache.set(cache_key, True, WEBHOOK_REPLAY_CACHE_TIMEOUT)
 
     # Return minimal success response (avoid leaking internal IDs)
     return JsonResponse(
         {
-            "status": "processed",
+            "status": response_status,
             "event": event_type,
         },
-        status=200,
+        status=http_status,
     )
 
 
@@ -24,7 +24,6 @@ Statistical Note:
 
 import csv
 import os
-import random
 import statistics
 import sys
 from datetime import datetime
@@ -40,10 +39,19 @@ django.setup()
 
 from django.db import connection  # noqa: E402
 
+from apps.public.services.bootstrap import (  # noqa: E402
+    PERCENTILE,
+    bootstrap_delta_ci,
+    bootstrap_mean_ci,
+    map_in_processes,
+)
+
 # Configuration
 MIN_PRS_THRESHOLD = 500  # Teams must have at least this many PRs
 MAX_CYCLE_TIME_HOURS = 200  # Filter outliers > 200h (reduces skew from 13.9x to 6.8x)
 YEAR = 2025
+CI_METHOD = PERCENTILE  # Bootstrap CI method (BCA corrects for the right skew of cycle/review times)
+CI_WORKERS = None  # Processes for independent CI jobs (None = CPU count, 1 = in-process)
 OUTPUT_DIR = Path(__file__).parent.parent / "data"
 
 # Tracking for transparency
@@ -77,24 +85,10 @@ def calculate_bootstrap_ci(data: list, n_bootstrap: int = 1000, confidence: floa
     Returns:
         Tuple of (lower_bound, upper_bound) for the confidence interval
     """
-    if not data or len(data) < 2:
+    lower, upper = bootstrap_mean_ci(data, n_bootstrap=n_bootstrap, confidence=confidence, method=CI_METHOD)
+    if lower is None:
         return (None, None)
-
-    n = len(data)
-    bootstrap_means = []
-
-    for _ in range(n_bootstrap):
-        # Sample with replacement
-        sample = [random.choice(data) for _ in range(n)]
-        bootstrap_means.append(statistics.mean(sample))
-
-    # Sort and find percentiles
-    bootstrap_means.sort()
-    alpha = (1 - confidence) / 2
-    lower_idx = int(n_bootstrap * alpha)
-    upper_idx = int(n_bootstrap * (1 - alpha))
-
-    return (round(bootstrap_means[lower_idx], 1), round(bootstrap_means[upper_idx], 1))
+    return (round(lower, 1), round(upper, 1))
 
 
 def calculate_delta_ci(
@@ -111,33 +105,27 @@ def calculate_delta_ci(
     Returns:
         Tuple of (lower_pct, upper_pct) for the percentage difference CI
     """
-    if not treatment_data or not control_data or len(treatment_data) < 2 or len(control_data) < 2:
+    lower, upper = bootstrap_delta_ci(
+        treatment_data, control_data, n_bootstrap=n_bootstrap, confidence=confidence, method=CI_METHOD
+    )
+    if lower is None:
         return (None, None)
+    return (round(lower, 0), round(upper, 0))
 
-    bootstrap_deltas = []
-
-    for _ in range(n_bootstrap):
-        # Sample with replacement from each group
-        treatment_sample = [random.choice(treatment_data) for _ in range(len(treatment_data))]
-        control_sample = [random.choice(control_data) for _ in range(len(control_data))]
-
-        treatment_mean = statistics.mean(treatment_sample)
-        control_mean = statistics.mean(control_sample)
 
-        if control_mean != 0:
-            delta_pct = ((treatment_mean - control_mean) / control_mean) * 100
-            bootstrap_deltas.append(delta_pct)
+def calculate_team_cycle_cis(ai_cycle: list, non_ai_cycle: list) -> tuple:
+    """Bootstrap CIs for one team's AI vs non-AI cycle times.
 
-    if not bootstrap_deltas:
-        return (None, None)
-
-    # Sort and find percentiles
-    bootstrap_deltas.sort()
-    alpha = (1 - confidence) / 2
-    lower_idx = int(len(bootstrap_deltas) * alpha)
-    upper_idx = int(len(bootstrap_deltas) * (1 - alpha))
+    Module-level so map_in_processes can run one team per worker.
 
-    return (round(bootstrap_deltas[lower_idx], 0), round(bootstrap_deltas[upper_idx], 0))
+    Returns:
+        Tuple of (ai_ci, non_ai_ci, delta_ci), each a (lower, upper) tuple
+    """
+    return (
+        calculate_bootstrap_ci(ai_cycle),
+        calculate_bootstrap_ci(non_ai_cycle),
+        calculate_delta_ci(ai_cycle, non_ai_cycle),
+    )
 
 
 def export_team_summary():
@@ -575,6 +563,7 @@ def export_category_metrics():
     # Calculate deltas with confidence intervals
     baseline = results["none"]
     print("  Calculating bootstrap confidence intervals (1000 samples)...")
+    ci_jobs = []
     for cat in ["code", "review"]:
         if cat in results and baseline["avg_cycle_hours"]:
             # Get raw values for this category
@@ -590,15 +579,15 @@ def export_category_metrics():
                 0,
             )
 
-            # Bootstrap CIs for cycle time delta
-            cycle_ci = calculate_delta_ci(cat_cycle, baseline_cycle)
-            results[cat]["cycle_delta_ci_lower"] = cycle_ci[0]
-            results[cat]["cycle_delta_ci_upper"] = cycle_ci[1]
+            # Bootstrap CIs for cycle and review time deltas
+            ci_jobs.append((cat, "cycle", cat_cycle, baseline_cycle))
+            ci_jobs.append((cat, "review", cat_review, baseline_review))
 
-            # Bootstrap CIs for review time delta
-            review_ci = calculate_delta_ci(cat_review, baseline_review)
-            results[cat]["review_delta_ci_lower"] = review_ci[0]
-            results[cat]["review_delta_ci_upper"] = review_ci[1]
+    # Independent resampling jobs run in parallel worker processes
+    cis = map_in_processes(calculate_delta_ci, [job[2:] for job in ci_jobs], max_workers=CI_WORKERS)
+    for (cat, metric, _treatment, _control), (ci_lower, ci_upper) in zip(ci_jobs, cis, strict=True):
+        results[cat][f"{metric}_delta_ci_lower"] = ci_lower
+        results[cat][f"{metric}_delta_ci_upper"] = ci_upper
 
     # Write CSV
     output_file = OUTPUT_DIR / "category_metrics.csv"
@@ -763,6 +752,7 @@ def export_within_team_analysis():
     This analysis compares AI vs non-AI PRs within the same team,
     filtering for teams with at least 10 PRs in BOTH groups to ensure
     statistical validity. Also filters outliers (>MAX_CYCLE_TIME_HOURS).
+    Bootstrap CIs are computed per team, one worker job per team.
     """
     print("Exporting within_team_comparison.csv...")
 
@@ -806,6 +796,38 @@ def export_within_team_analysis():
         )
         rows = cursor.fetchall()
 
+    # Fetch raw cycle times (same filters) for the per-team bootstrap CIs
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT t.name, pr.is_ai_assisted, pr.cycle_time_hours
+            FROM teams_team t
+            JOIN metrics_pullrequest pr ON pr.team_id = t.id
+            WHERE pr.pr_created_at >= %s
+            AND pr.pr_created_at < %s
+            AND pr.team_id = ANY(%s)
+            AND pr.state = 'merged'
+            AND pr.cycle_time_hours IS NOT NULL
+            AND pr.cycle_time_hours <= %s
+        """,
+            [f"{YEAR}-01-01", f"{YEAR + 1}-01-01", team_ids, MAX_CYCLE_TIME_HOURS],
+        )
+        team_cycles = {row[0]: {True: [], False: []} for row in rows}
+        for team, is_ai, cycle in cursor.fetchall():
+            if team in team_cycles:
+                team_cycles[team][bool(is_ai)].append(float(cycle))
+
+    # One independent resampling job per team, spread over worker processes
+    print(f"  Calculating bootstrap confidence intervals for {len(rows)} teams...")
+    team_cis = map_in_processes(
+        calculate_team_cycle_cis,
+        [(team_cycles[row[0]][True], team_cycles[row[0]][False]) for row in rows],
+        max_workers=CI_WORKERS,
+    )
+    rows = [
+        (*row, *ai_ci, *non_ai_ci, *delta_ci) for row, (ai_ci, non_ai_ci, delta_ci) in zip(rows, team_cis, strict=True)
+    ]
+
     # Write CSV
     output_file = OUTPUT_DIR / "within_team_comparison.csv"
     with open(output_file, "w", newline="") as f:
@@ -819,6 +841,12 @@ def export_within_team_analysis():
                 "non_ai_cycle_hours",
                 "cycle_delta_pct",
                 "ai_result",
+                "ai_cycle_ci_lower",
+                "ai_cycle_ci_upper",
+                "non_ai_cycle_ci_lower",
+                "non_ai_cycle_ci_upper",
+                "cycle_delta_ci_lower",
+                "cycle_delta_ci_upper",
             ]
         )
         for row in rows:
@@ -850,6 +878,12 @@ def export_within_team_analysis():
                 "non_ai_cycle_hours": float(row[4]) if row[4] else None,
                 "cycle_delta_pct": float(row[5]) if row[5] else None,
                 "ai_result": row[6],
+                "ai_cycle_ci_lower": row[7],
+                "ai_cycle_ci_upper": row[8],
+                "non_ai_cycle_ci_lower": row[9],
+                "non_ai_cycle_ci_upper": row[10],
+                "cycle_delta_ci_lower": row[11],
+                "cycle_delta_ci_upper": row[12],
             }
             for row in rows
         ],
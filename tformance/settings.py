@@ -399,6 +399,10 @@ GITHUB_API_CONFIG = {
     "FALLBACK_TO_REST": env.bool("GITHUB_FALLBACK_REST", default=True),
     # Rate limit threshold - switch to REST when GraphQL points < this
     "GRAPHQL_RATE_LIMIT_THRESHOLD": env.int("GITHUB_GRAPHQL_RATE_LIMIT_THRESHOLD", default=100),
+    # Send REST GETs with If-None-Match/If-Modified-Since and replay cached bodies on 304
+    "CONDITIONAL_REQUESTS": env.bool("GITHUB_CONDITIONAL_REQUESTS", default=True),
+    # Share each installation's GraphQL points across workers; sync tasks reschedule instead of sleeping
+    "SHARED_GRAPHQL_BUDGET": env.bool("GITHUB_SHARED_GRAPHQL_BUDGET", default=True),
 }
 
 # Historical sync configuration for onboarding
@@ -416,6 +420,23 @@ HISTORICAL_SYNC_CONFIG = {
     "RETRY_DELAY_SECONDS": env.int("SYNC_RETRY_DELAY", default=30),
     # Groq batch polling interval in seconds
     "GROQ_POLL_INTERVAL": env.int("SYNC_GROQ_POLL_INTERVAL", default=5),
+    # Repositories of one GitHub installation synced concurrently (1 = sequential)
+    "MAX_CONCURRENT_REPOS": env.int("SYNC_MAX_CONCURRENT_REPOS", default=4),
+}
+
+# Real-time LLM calls (apps.metrics.services.llm_executor)
+# Limits apply per run; provider rate-limit headers can only tighten them.
+LLM_EXECUTOR_CONFIG = {
+    # Requests per minute (Groq free tier: 30)
+    "REQUESTS_PER_MINUTE": env.int("LLM_REQUESTS_PER_MINUTE", default=30),
+    # Tokens per minute (0 = no token limit)
+    "TOKENS_PER_MINUTE": env.int("LLM_TOKENS_PER_MINUTE", default=0),
+    # Concurrent in-flight requests
+    "MAX_WORKERS": env.int("LLM_MAX_WORKERS", default=4),
+    # Retries on 429 responses
+    "MAX_RETRIES": env.int("LLM_MAX_RETRIES", default=3),
+    # Results persisted per batch (also the most work lost on interruption)
+    "FLUSH_EVERY": env.int("LLM_FLUSH_EVERY", default=25),
 }
 
 # GitHub App (PRIMARY - for PRs, members, repos)
@@ -617,6 +638,7 @@ CELERY_TASK_ROUTES = {
     "apps.integrations.tasks.sync_jira_project_task": {"queue": "sync"},
     "apps.integrations.tasks.sync_copilot_metrics_task": {"queue": "sync"},
     "apps.integrations.tasks.fetch_pr_complete_data_task": {"queue": "sync"},
+    "apps.integrations.tasks.fetch_pr_data_batch_task": {"queue": "sync"},
     "apps.metrics.tasks.send_weekly_insight_emails": {"queue": "sync"},
     # LLM tasks (rate limited) -> 'llm' queue
     "apps.metrics.tasks.run_all_teams_llm_batch": {"queue": "llm"},
@@ -626,9 +648,17 @@ CELERY_TASK_ROUTES = {
     "apps.metrics.tasks.compute_all_team_insights": {"queue": "compute"},
     "apps.integrations.tasks.aggregate_team_weekly_metrics_task": {"queue": "compute"},
     "apps.integrations.tasks.aggregate_all_teams_weekly_metrics_task": {"queue": "compute"},
+    "apps.integrations.tasks.update_team_reviewer_correlations_task": {"queue": "compute"},
+    "apps.integrations.tasks.update_all_teams_reviewer_correlations_task": {"queue": "compute"},
+    "apps.integrations.tasks.rebuild_team_reviewer_correlations_task": {"queue": "compute"},
+    "apps.integrations.tasks.rebuild_all_teams_reviewer_correlations_task": {"queue": "compute"},
     # Public tasks
     "apps.public.tasks.sync_public_oss_repositories_task": {"queue": "sync"},
     "apps.public.tasks.compute_public_stats_task": {"queue": "compute"},
+    "apps.public.tasks.compute_public_org_stats_task": {"queue": "compute"},
+    "apps.public.tasks.build_public_repo_snapshot_task": {"queue": "compute"},
+    "apps.public.tasks.dispatch_public_repo_snapshots_task": {"queue": "compute"},
+    "apps.public.tasks.finalize_public_stats_task": {"queue": "compute"},
 }
 
 # Add tasks to this dict and run `python manage.py bootstrap_celery_tasks` to create them
@@ -663,6 +693,16 @@ SCHEDULED_TASKS = {
         "schedule": schedules.crontab(minute=0, hour=1, day_of_week=1),  # Monday 1 AM UTC
         "expire_seconds": 60 * 60 * 2,  # 2 hour expiry
     },
+    "update-reviewer-correlations-daily": {
+        "task": "apps.integrations.tasks.update_all_teams_reviewer_correlations_task",
+        "schedule": schedules.crontab(minute=30, hour=5),  # 5:30 AM UTC (before daily insights)
+        "expire_seconds": 60 * 60,  # 1 hour expiry
+    },
+    "rebuild-reviewer-correlations-weekly": {
+        "task": "apps.integrations.tasks.rebuild_all_teams_reviewer_correlations_task",
+        "schedule": schedules.crontab(minute=30, hour=2, day_of_week=0),  # Sunday 2:30 AM UTC
+        "expire_seconds": 60 * 60 * 2,  # 2 hour expiry
+    },
     "compute-daily-insights": {
         "task": "apps.metrics.tasks.compute_all_team_insights",
         "schedule": schedules.crontab(minute=0, hour=6),  # 6 AM UTC (after data syncs)
@@ -703,6 +743,16 @@ SCHEDULED_TASKS = {
         "schedule": timedelta(minutes=10),  # Every 10 minutes
         "expire_seconds": 60 * 5,  # 5 minute expiry
     },
+    "sweep-webhook-events": {
+        "task": "apps.integrations.tasks.process_pending_webhook_events_task",
+        "schedule": timedelta(minutes=1),  # Every minute (events normally drain within seconds)
+        "expire_seconds": 60,  # 1 minute expiry
+    },
+    "sweep-pr-data-fetches": {
+        "task": "apps.integrations.tasks.requeue_stale_pr_data_fetches_task",
+        "schedule": timedelta(minutes=5),  # Every 5 minutes (batches normally run 30s after a merge)
+        "expire_seconds": 60 * 5,  # 5 minute expiry
+    },
     "sync-copilot-metrics-daily": {
         "task": "apps.integrations.tasks.sync_all_copilot_metrics",
         "schedule": schedules.crontab(minute=45, hour=4),  # 4:45 AM UTC (after GitHub, before LLM)